@@ -13,15 +13,37 @@ DETAIL LOG (~5000 lines):
   - Every link update
   - Full phase-by-phase breakdown
 
-Logs auto-rotate when they exceed their limits.
+Logging calls only format the line and queue it; a background thread
+appends queued lines in batches (one open per file per batch).
+
+Logs rotate by size: when a log passes its byte budget it is renamed to
+`<name>.1` (older segments shift up, the oldest is removed) and a fresh
+file is started. Nothing is ever re-read or rewritten.
+
+The queue is bounded. Past `sample_above` of capacity only every
+`detail_sample_every`-th detail line is kept; at capacity detail lines are
+dropped. Summary lines are never dropped. Drops, sampling and flush
+latency are counted in `stats()` and reported to the summary log.
 """
 
+import atexit
+import os
 import time
 import json
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
-from threading import Lock
+from threading import Condition, Lock, Thread
+
+# Rough line size used to turn the line budgets into byte budgets
+AVG_LINE_BYTES = 120
+
+# Queue length that wakes the writer before its flush interval
+WAKE_BATCH = 512
+
+SUMMARY = "summary"
+DETAIL = "detail"
 
 
 @dataclass
@@ -29,11 +51,43 @@ class LogConfig:
     summary_max_lines: int = 500
     detail_max_lines: int = 5000
     log_dir: Path = field(default_factory=lambda: Path("engine/data/logs"))
+    # Byte budget per segment; defaults to max_lines * AVG_LINE_BYTES
+    summary_max_bytes: Optional[int] = None
+    detail_max_bytes: Optional[int] = None
+    # Rotated segments kept next to the live file (<name>.1 ... <name>.N)
+    segments: int = 1
+    queue_size: int = 10000
+    sample_above: float = 0.5
+    detail_sample_every: int = 10
+    flush_interval: float = 0.25
+
+    def max_bytes(self, tier: str) -> int:
+        if tier == SUMMARY:
+            return self.summary_max_bytes or self.summary_max_lines * AVG_LINE_BYTES
+        return self.detail_max_bytes or self.detail_max_lines * AVG_LINE_BYTES
+
+
+@dataclass
+class LogStats:
+    """Writer counters since the logger was created."""
+    queued: int = 0
+    written: int = 0
+    dropped: int = 0       # detail lines refused at capacity
+    sampled_out: int = 0   # detail lines skipped while sampling
+    rotations: int = 0
+    flushes: int = 0
+    write_errors: int = 0
+    last_flush_ms: float = 0.0
+    max_flush_ms: float = 0.0
+    max_lag_ms: float = 0.0  # oldest line's wait in the queue
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.__dict__)
 
 
 class ActivityLogger:
     """
-    Two-tier activity logger with auto-rotation.
+    Two-tier activity logger with a background writer and segment rotation.
 
     Usage:
         logger = get_activity_logger()
@@ -45,6 +99,9 @@ class ActivityLogger:
         # Detail events (every operation)
         logger.energy_transfer("actor_john", "moment_talk", 0.15, "draw phase")
         logger.decay("narrative_feud", 0.95, 0.90, "5% decay rate")
+
+        logger.flush()   # wait until everything queued is on disk
+        logger.stats()   # drops, sampling, flush latency
     """
 
     def __init__(self, config: Optional[LogConfig] = None):
@@ -53,67 +110,202 @@ class ActivityLogger:
 
         self.summary_path = self.config.log_dir / "health_summary.log"
         self.detail_path = self.config.log_dir / "health_detail.log"
+        self._paths = {SUMMARY: self.summary_path, DETAIL: self.detail_path}
 
         self._lock = Lock()
-        self._summary_lines = 0
-        self._detail_lines = 0
-
-        # Count existing lines
-        self._count_existing_lines()
-
-    def _count_existing_lines(self):
-        """Count lines in existing log files."""
-        if self.summary_path.exists():
-            self._summary_lines = sum(1 for _ in open(self.summary_path))
-        if self.detail_path.exists():
-            self._detail_lines = sum(1 for _ in open(self.detail_path))
-
-    def _rotate_if_needed(self, path: Path, current_lines: int, max_lines: int) -> int:
-        """Rotate log file if it exceeds max lines. Returns new line count."""
-        if current_lines <= max_lines:
-            return current_lines
-
-        # Keep last half of max_lines
-        keep_lines = max_lines // 2
-
+        self._wakeup = Condition(self._lock)
+        self._drained = Condition(self._lock)
+        self._queue: Deque[Tuple[str, float, str]] = deque()
+        self._detail_queued = 0
+        self._sample_counter = 0
+        self._writing = False
+        self._closed = False
+        self._thread: Optional[Thread] = None
+        self._stats = LogStats()
+        self._reported_losses = 0
+
+        # Only the writer thread touches the sizes
+        self._sizes = {tier: self._file_size(path) for tier, path in self._paths.items()}
+        self._ts_cache: Tuple[int, str] = (-1, "")
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
         try:
-            with open(path, 'r') as f:
-                lines = f.readlines()
+            return path.stat().st_size
+        except OSError:
+            return 0
 
-            # Keep only the last keep_lines
-            lines = lines[-keep_lines:]
-
-            with open(path, 'w') as f:
-                f.write(f"--- LOG ROTATED at {self._ts()} (kept last {keep_lines} lines) ---\n")
-                f.writelines(lines)
+    def _ts(self, when: Optional[float] = None) -> str:
+        """Timestamp for log entries."""
+        when = time.time() if when is None else when
+        second = int(when)
+        if second != self._ts_cache[0]:
+            self._ts_cache = (second, time.strftime("%H:%M:%S", time.localtime(when)))
+        return self._ts_cache[1]
 
-            return len(lines) + 1
-        except Exception:
-            return current_lines
+    # =========================================================================
+    # QUEUE
+    # =========================================================================
 
-    def _ts(self) -> str:
-        """Timestamp for log entries."""
-        return time.strftime("%H:%M:%S")
+    def _enqueue(self, tier: str, line: str) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            capacity = self.config.queue_size
+            if tier == DETAIL:
+                if self._detail_queued >= capacity:
+                    self._stats.dropped += 1
+                    return
+                if self._detail_queued >= capacity * self.config.sample_above:
+                    self._sample_counter += 1
+                    if self._sample_counter % self.config.detail_sample_every:
+                        self._stats.sampled_out += 1
+                        return
+                self._detail_queued += 1
+            self._queue.append((tier, time.time(), line))
+            self._stats.queued += 1
+            if self._thread is None:
+                self._start_writer()
+            if len(self._queue) >= WAKE_BATCH:
+                self._wakeup.notify()
 
     def _write_summary(self, line: str):
-        """Write to summary log with rotation."""
-        with self._lock:
-            self._summary_lines = self._rotate_if_needed(
-                self.summary_path, self._summary_lines, self.config.summary_max_lines
-            )
-            with open(self.summary_path, 'a') as f:
-                f.write(f"[{self._ts()}] {line}\n")
-            self._summary_lines += 1
+        """Queue a line for the summary log."""
+        self._enqueue(SUMMARY, line)
 
     def _write_detail(self, line: str):
-        """Write to detail log with rotation."""
+        """Queue a line for the detail log."""
+        self._enqueue(DETAIL, line)
+
+    def _start_writer(self) -> None:
+        self._thread = Thread(target=self._run, name="activity-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until every queued line is written. False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
         with self._lock:
-            self._detail_lines = self._rotate_if_needed(
-                self.detail_path, self._detail_lines, self.config.detail_max_lines
-            )
-            with open(self.detail_path, 'a') as f:
-                f.write(f"[{self._ts()}] {line}\n")
-            self._detail_lines += 1
+            if self._thread is None:
+                return True
+            self._wakeup.notify()
+            while self._queue or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._drained.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        """Write what is queued and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wakeup.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Writer counters plus the current queue depth."""
+        with self._lock:
+            data = self._stats.to_dict()
+            data["queue_depth"] = len(self._queue)
+        return data
+
+    # =========================================================================
+    # WRITER THREAD
+    # =========================================================================
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._queue and not self._closed:
+                    self._wakeup.wait(self.config.flush_interval)
+                if not self._queue:
+                    self._drained.notify_all()
+                    if self._closed:
+                        return
+                    continue
+                batch = list(self._queue)
+                self._queue.clear()
+                self._detail_queued = 0
+                self._writing = True
+                losses = self._stats.dropped + self._stats.sampled_out
+                new_losses = losses - self._reported_losses
+                self._reported_losses = losses
+
+            if new_losses:
+                batch.append((SUMMARY, time.time(), (
+                    f"⚠ LOG BACKPRESSURE: {new_losses} detail lines dropped or sampled out"
+                )))
+            started = time.perf_counter()
+            written, errors, rotations = self._write_batch(batch)
+            flush_ms = (time.perf_counter() - started) * 1000
+            lag_ms = (time.time() - batch[0][1]) * 1000
+
+            with self._lock:
+                stats = self._stats
+                stats.written += written
+                stats.write_errors += errors
+                stats.rotations += rotations
+                stats.flushes += 1
+                stats.last_flush_ms = flush_ms
+                stats.max_flush_ms = max(stats.max_flush_ms, flush_ms)
+                stats.max_lag_ms = max(stats.max_lag_ms, lag_ms)
+                self._writing = False
+                if not self._queue:
+                    self._drained.notify_all()
+
+    def _write_batch(self, batch: List[Tuple[str, float, str]]) -> Tuple[int, int, int]:
+        """Append a batch, rotating between chunks. Returns (written, errors, rotations)."""
+        written = errors = rotations = 0
+        for tier in (SUMMARY, DETAIL):
+            chunk: List[bytes] = []
+            chunk_bytes = 0
+            budget = self.config.max_bytes(tier)
+            for line_tier, when, line in batch:
+                if line_tier != tier:
+                    continue
+                data = f"[{self._ts(when)}] {line}\n".encode("utf-8")
+                if chunk and self._sizes[tier] + chunk_bytes + len(data) > budget:
+                    errors += self._append(tier, chunk, chunk_bytes)
+                    written += len(chunk)
+                    chunk, chunk_bytes = [], 0
+                if self._sizes[tier] and self._sizes[tier] + len(data) > budget:
+                    rotations += self._rotate(tier)
+                chunk.append(data)
+                chunk_bytes += len(data)
+            if chunk:
+                errors += self._append(tier, chunk, chunk_bytes)
+                written += len(chunk)
+        return written, errors, rotations
+
+    def _append(self, tier: str, chunk: List[bytes], chunk_bytes: int) -> int:
+        try:
+            with open(self._paths[tier], "ab") as f:
+                f.write(b"".join(chunk))
+        except OSError:
+            return 1
+        self._sizes[tier] += chunk_bytes
+        return 0
+
+    def _rotate(self, tier: str) -> int:
+        """Shift <name>.1..N up one and rename the live file to <name>.1."""
+        path = self._paths[tier]
+        try:
+            for index in range(self.config.segments, 1, -1):
+                older = path.with_name(f"{path.name}.{index - 1}")
+                if older.exists():
+                    os.replace(older, path.with_name(f"{path.name}.{index}"))
+            if self.config.segments > 0:
+                os.replace(path, path.with_name(f"{path.name}.1"))
+            else:
+                path.unlink()
+        except OSError:
+            pass
+        self._sizes[tier] = self._file_size(path)
+        return 1
 
     # =========================================================================
     # SUMMARY LOG METHODS (explained, aggregated)
@@ -181,6 +373,21 @@ class ActivityLogger:
         """Log phase start."""
         self._write_detail(f"── Phase {phase}: {name} ──")
 
+    def phase_profile(
+        self,
+        phase: int,
+        name: str,
+        wall_ms: float,
+        queries: int,
+        rows_read: int,
+        rows_written: int
+    ):
+        """Log phase timing and query counters (from TickProfiler)."""
+        self._write_detail(
+            f"  ⏱ phase {phase} {name}: {wall_ms:.1f}ms, {queries} queries, "
+            f"{rows_read} rows read, {rows_written} rows written"
+        )
+
     def energy_transfer(
         self,
         source_id: str,
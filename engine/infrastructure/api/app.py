@@ -31,7 +31,9 @@ from pydantic import BaseModel
 from engine.infrastructure.orchestration import Orchestrator
 from engine.moment_graph import MomentTraversal, MomentQueries, MomentSurface
 from engine.physics.graph import GraphQueries, GraphOps, add_mutation_listener
+from engine.physics.graph.graph_connections import get_connection_manager
 from engine.infrastructure.api.moments import create_moments_router
+from engine.infrastructure.api.playthrough_registry import get_playthrough_registry
 from engine.infrastructure.api.playthroughs import create_playthroughs_router
 from engine.infrastructure.api.tempo import create_tempo_router
 from engine.infrastructure.api.graphs import create_graphs_router
@@ -78,6 +80,7 @@ class ActionRequest(BaseModel):
     action: str
     player_id: str = "char_player"
     location: Optional[str] = None
+    moment_id: Optional[str] = None  # Moment the clicked word came from (speculative hits)
     stream: bool = False  # If true, returns SSE stream instead of JSON
 
 
@@ -113,7 +116,8 @@ def create_app(
     graph_name: str = "blood_ledger",
     host: str = "localhost",
     port: int = 6379,
-    playthroughs_dir: str = "playthroughs"
+    playthroughs_dir: str = "playthroughs",
+    speculative_narration: bool = False
 ) -> FastAPI:
     """
     Create the FastAPI application.
@@ -123,6 +127,7 @@ def create_app(
         host: FalkorDB host
         port: FalkorDB port
         playthroughs_dir: Directory for playthrough data
+        speculative_narration: Pre-generate narrator output for likely clicks
 
     Returns:
         Configured FastAPI app
@@ -148,6 +153,8 @@ def create_app(
     _playthroughs_dir = Path(playthroughs_dir)
     _graph_queries: Optional[GraphQueries] = None
     _graph_ops: Optional[GraphOps] = None
+    # Per-playthrough query bundles, shared with the moments router
+    _playthrough_registry = get_playthrough_registry(host, port, _playthroughs_dir)
 
     # Register mutation listener to broadcast to debug SSE clients
     def _mutation_event_handler(event: Dict[str, Any]):
@@ -170,7 +177,8 @@ def create_app(
                 graph_name=pt_graph_name,
                 host=host,
                 port=port,
-                playthroughs_dir=playthroughs_dir
+                playthroughs_dir=playthroughs_dir,
+                speculative=speculative_narration
             )
         return _orchestrators[playthrough_id]
 
@@ -187,15 +195,11 @@ def create_app(
 
     def get_playthrough_queries(playthrough_id: str) -> GraphQueries:
         """Get graph queries instance for a specific playthrough."""
-        from engine.physics.graph import get_playthrough_graph_name
-        pt_graph_name = get_playthrough_graph_name(playthrough_id)
-        return GraphQueries(graph_name=pt_graph_name, host=host, port=port)
+        return _playthrough_registry.get(playthrough_id).graph_queries
 
     def get_moment_queries(playthrough_id: str) -> MomentQueries:
         """Get moment queries instance for a specific playthrough."""
-        from engine.physics.graph import get_playthrough_graph_name
-        pt_graph_name = get_playthrough_graph_name(playthrough_id)
-        return MomentQueries(graph_name=pt_graph_name, host=host, port=port)
+        return _playthrough_registry.get(playthrough_id).queries
 
     def get_graph_ops() -> GraphOps:
         """Get graph ops instance."""
@@ -269,6 +273,9 @@ def create_app(
             details["graph_write"] = "error"
             errors["graph_write"] = str(exc)
 
+        details["falkordb_pools"] = get_connection_manager().stats()
+        details["playthrough_registry"] = _playthrough_registry.stats()
+
         if errors:
             raise HTTPException(
                 status_code=503,
@@ -326,13 +333,24 @@ def create_app(
             result = orchestrator.process_action(
                 player_action=request.action,
                 player_id=request.player_id,
-                player_location=request.location
+                player_location=request.location,
+                moment_id=request.moment_id
             )
             return result
         except Exception as e:
             logger.error(f"Action processing failed: {e}")
             raise HTTPException(status_code=500, detail=str(e))
 
+    @app.get("/api/speculation/{playthrough_id}")
+    async def get_speculation_stats(playthrough_id: str):
+        """Speculative narrator hit rate and wasted-generation counters."""
+        if playthrough_id not in _orchestrators:
+            return {"enabled": speculative_narration, "playthrough_id": playthrough_id}
+        return {
+            "playthrough_id": playthrough_id,
+            **_orchestrators[playthrough_id].speculation_stats()
+        }
+
     @app.get("/api/playthrough/{playthrough_id}")
     async def get_playthrough(playthrough_id: str):
         """Get playthrough status and info."""
@@ -455,6 +473,15 @@ def create_app(
                 present_chars=present_ids
             )
 
+            # Pre-generate narrator output for likely clicks while the player reads
+            if speculative_narration:
+                try:
+                    get_orchestrator(playthrough_id).speculate(
+                        view, player_id=player_id, player_location=resolved_location_id
+                    )
+                except Exception as e:
+                    logger.warning(f"Speculation scheduling failed: {e}")
+
             return view
         except HTTPException:
             raise
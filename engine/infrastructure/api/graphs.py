@@ -24,6 +24,7 @@ from pydantic import BaseModel
 from falkordb import FalkorDB
 
 from engine.physics.graph import GraphQueries
+from engine.physics.graph.graph_connections import get_connection_manager
 
 
 logger = logging.getLogger(__name__)
@@ -73,10 +74,10 @@ def create_graphs_router(
     router = APIRouter(prefix="/api/graph", tags=["graphs"])
 
     def get_db() -> FalkorDB:
-        """Get FalkorDB connection."""
+        """Get the shared, pooled FalkorDB client."""
         db_host = os.environ.get("FALKORDB_HOST", host)
         db_port = int(os.environ.get("FALKORDB_PORT", port))
-        return FalkorDB(host=db_host, port=db_port)
+        return get_connection_manager().client(db_host, db_port)
 
     def clone_graph(db: FalkorDB, source_name: str, target_name: str) -> Dict[str, int]:
         """
@@ -15,14 +15,13 @@ import logging
 from typing import List, Optional, Dict, Any, AsyncGenerator
 from pathlib import Path
 
-import yaml
-
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from engine.moment_graph import MomentTraversal, MomentQueries, MomentSurface
-from engine.physics.graph import GraphQueries, get_playthrough_graph_name
+from engine.physics.graph import GraphQueries
+from .playthrough_registry import get_playthrough_registry
 from .sse_broadcast import (
     broadcast_moment_event,
     register_sse_client,
@@ -33,21 +32,6 @@ from .sse_broadcast import (
 logger = logging.getLogger(__name__)
 
 
-def _resolve_graph_name(playthrough_id: str, playthroughs_dir: Optional[Path]) -> str:
-    """Resolve the graph name for a playthrough, honoring configured directories."""
-    if playthroughs_dir:
-        player_file = playthroughs_dir / playthrough_id / "player.yaml"
-        if player_file.exists():
-            try:
-                data = yaml.safe_load(player_file.read_text()) or {}
-                graph_name = data.get("graph_name")
-                if graph_name:
-                    return graph_name
-            except Exception as exc:
-                logger.warning(f"Failed to read graph name for {playthrough_id}: {exc}")
-    return get_playthrough_graph_name(playthrough_id)
-
-
 def _get_queries(
     playthrough_id: str,
     host: str,
@@ -55,8 +39,7 @@ def _get_queries(
     playthroughs_dir: Optional[Path] = None
 ) -> MomentQueries:
     """Get MomentQueries for a specific playthrough."""
-    graph_name = _resolve_graph_name(playthrough_id, playthroughs_dir)
-    return MomentQueries(graph_name=graph_name, host=host, port=port)
+    return get_playthrough_registry(host, port, playthroughs_dir).get(playthrough_id).queries
 
 
 def _get_traversal(
@@ -66,8 +49,7 @@ def _get_traversal(
     playthroughs_dir: Optional[Path] = None
 ) -> MomentTraversal:
     """Get MomentTraversal for a specific playthrough."""
-    graph_name = _resolve_graph_name(playthrough_id, playthroughs_dir)
-    return MomentTraversal(graph_name=graph_name, host=host, port=port)
+    return get_playthrough_registry(host, port, playthroughs_dir).get(playthrough_id).traversal
 
 
 def _get_surface(
@@ -77,8 +59,7 @@ def _get_surface(
     playthroughs_dir: Optional[Path] = None
 ) -> MomentSurface:
     """Get MomentSurface for a specific playthrough."""
-    graph_name = _resolve_graph_name(playthrough_id, playthroughs_dir)
-    return MomentSurface(graph_name=graph_name, host=host, port=port)
+    return get_playthrough_registry(host, port, playthroughs_dir).get(playthrough_id).surface
 
 
 def _get_graph_queries(
@@ -88,8 +69,7 @@ def _get_graph_queries(
     playthroughs_dir: Optional[Path] = None
 ) -> GraphQueries:
     """Get GraphQueries for a specific playthrough."""
-    graph_name = _resolve_graph_name(playthrough_id, playthroughs_dir)
-    return GraphQueries(graph_name=graph_name, host=host, port=port)
+    return get_playthrough_registry(host, port, playthroughs_dir).get(playthrough_id).graph_queries
 
 # =============================================================================
 # REQUEST/RESPONSE MODELS
@@ -0,0 +1,207 @@
+"""
+Playthrough Registry — per-playthrough query objects, cached across requests.
+
+Each playthrough gets one PlaythroughServices bundle (MomentQueries,
+MomentTraversal, MomentSurface, GraphQueries, built lazily). Bundles live
+in a bounded LRU: the least recently used bundle is dropped past
+`max_size`, and bundles idle for `idle_ttl` seconds are dropped on the
+next access.
+
+Graph names are resolved from player.yaml once and cached together with
+the file's mtime; a changed, created or deleted player.yaml re-resolves
+(and replaces the bundle if the graph name changed).
+
+Used by:
+- moments.py (moment router helpers)
+- app.py (get_playthrough_queries / get_moment_queries)
+"""
+
+# DOCS: docs/infrastructure/api/IMPLEMENTATION_Api.md
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import yaml
+
+from engine.moment_graph import MomentTraversal, MomentQueries, MomentSurface
+from engine.physics.graph import (
+    GraphQueries,
+    get_playthrough_graph_name,
+    get_playthrough_player_file,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE = 64
+DEFAULT_IDLE_TTL = 900.0  # seconds
+
+
+def resolve_graph_name(playthrough_id: str, playthroughs_dir: Optional[Path]) -> str:
+    """Resolve the graph name for a playthrough, honoring configured directories."""
+    if playthroughs_dir:
+        player_file = playthroughs_dir / playthrough_id / "player.yaml"
+        if player_file.exists():
+            try:
+                data = yaml.safe_load(player_file.read_text()) or {}
+                graph_name = data.get("graph_name")
+                if graph_name:
+                    return graph_name
+            except Exception as exc:
+                logger.warning(f"Failed to read graph name for {playthrough_id}: {exc}")
+    return get_playthrough_graph_name(playthrough_id)
+
+
+def _mtime(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class PlaythroughServices:
+    """Query objects for one playthrough's graph, created on first use."""
+
+    def __init__(self, playthrough_id: str, graph_name: str, host: str, port: int):
+        self.playthrough_id = playthrough_id
+        self.graph_name = graph_name
+        self.host = host
+        self.port = port
+        self.last_used = 0.0
+        self._lock = threading.Lock()
+        self._built: Dict[str, Any] = {}
+
+    def _get(self, key: str, factory: Callable[..., Any]) -> Any:
+        with self._lock:
+            if key not in self._built:
+                self._built[key] = factory(graph_name=self.graph_name, host=self.host, port=self.port)
+            return self._built[key]
+
+    @property
+    def queries(self) -> MomentQueries:
+        return self._get("queries", MomentQueries)
+
+    @property
+    def traversal(self) -> MomentTraversal:
+        return self._get("traversal", MomentTraversal)
+
+    @property
+    def surface(self) -> MomentSurface:
+        return self._get("surface", MomentSurface)
+
+    @property
+    def graph_queries(self) -> GraphQueries:
+        return self._get("graph_queries", GraphQueries)
+
+
+class PlaythroughRegistry:
+    """Bounded LRU of PlaythroughServices with idle eviction."""
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        playthroughs_dir: Optional[Path] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        idle_ttl: float = DEFAULT_IDLE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.host = host
+        self.port = port
+        self.playthroughs_dir = Path(playthroughs_dir) if playthroughs_dir else None
+        self.max_size = max(1, max_size)
+        self.idle_ttl = idle_ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._bundles: "OrderedDict[str, PlaythroughServices]" = OrderedDict()
+        # playthrough_id -> (player.yaml mtimes, graph_name)
+        self._names: Dict[str, Tuple[Tuple[Optional[int], ...], str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _metadata_signature(self, playthrough_id: str) -> Tuple[Optional[int], ...]:
+        files = [get_playthrough_player_file(playthrough_id)]
+        if self.playthroughs_dir:
+            files.insert(0, self.playthroughs_dir / playthrough_id / "player.yaml")
+        return tuple(_mtime(path) for path in files)
+
+    def graph_name(self, playthrough_id: str) -> str:
+        """Cached resolve_graph_name; re-resolves when player.yaml changes."""
+        signature = self._metadata_signature(playthrough_id)
+        cached = self._names.get(playthrough_id)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        graph_name = resolve_graph_name(playthrough_id, self.playthroughs_dir)
+        self._names[playthrough_id] = (signature, graph_name)
+        return graph_name
+
+    def get(self, playthrough_id: str) -> PlaythroughServices:
+        """The playthrough's bundle, creating it (and evicting others) as needed."""
+        graph_name = self.graph_name(playthrough_id)
+        now = self.clock()
+        with self._lock:
+            self._evict_idle(now)
+            bundle = self._bundles.get(playthrough_id)
+            if bundle is not None and bundle.graph_name == graph_name:
+                self.hits += 1
+                self._bundles.move_to_end(playthrough_id)
+            else:
+                self.misses += 1
+                bundle = PlaythroughServices(playthrough_id, graph_name, self.host, self.port)
+                self._bundles[playthrough_id] = bundle
+                self._bundles.move_to_end(playthrough_id)
+                while len(self._bundles) > self.max_size:
+                    self._bundles.popitem(last=False)
+                    self.evictions += 1
+            bundle.last_used = now
+            return bundle
+
+    def _evict_idle(self, now: float) -> None:
+        # Oldest first: stop at the first bundle still in use
+        while self._bundles:
+            oldest = next(iter(self._bundles.values()))
+            if now - oldest.last_used < self.idle_ttl:
+                break
+            self._bundles.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, playthrough_id: Optional[str] = None) -> None:
+        """Forget one playthrough's bundle and graph name (or everything)."""
+        with self._lock:
+            if playthrough_id is None:
+                self._bundles.clear()
+                self._names.clear()
+            else:
+                self._bundles.pop(playthrough_id, None)
+                self._names.pop(playthrough_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._bundles),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_registries: Dict[Tuple[str, int, Optional[str]], PlaythroughRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_playthrough_registry(
+    host: str = "localhost",
+    port: int = 6379,
+    playthroughs_dir: Optional[Path] = None,
+) -> PlaythroughRegistry:
+    """Shared registry for a (host, port, playthroughs_dir) configuration."""
+    key = (host, int(port), str(Path(playthroughs_dir).resolve()) if playthroughs_dir else None)
+    with _registries_lock:
+        if key not in _registries:
+            _registries[key] = PlaythroughRegistry(host, port, playthroughs_dir)
+        return _registries[key]
@@ -17,6 +17,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from engine.physics.graph import GraphQueries, GraphOps
+from engine.physics.graph.graph_ops_events import emit_event
 from engine.models.base import MomentStatus
 from engine.models.links import LinkType
 
@@ -695,6 +696,11 @@ class CanonHolder:
 
         if not result:
             return (False, "Failed to create recall moment")
+        # Created outside GraphOps.add_moment: tell presence indexes ourselves
+        emit_event("presence_changed", {
+            "graph": getattr(self.graph_queries, "graph_name", None),
+            "moment_id": recall_id
+        })
 
         # Link recall moment to original via RECALLS relationship
         link_query = """
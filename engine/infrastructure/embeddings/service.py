@@ -132,9 +132,11 @@ class EmbeddingService:
         Returns:
             Embedding vector
         """
-        node_type = node.get('type', '')
-        text = self._node_to_text(node, node_type)
-        return self.embed(text)
+        return self.embed(self.node_text(node))
+
+    def node_text(self, node: Dict[str, Any]) -> str:
+        """Embeddable text for a node (what embed_node embeds); use with embed_batch."""
+        return self._node_to_text(node, node.get('type', ''))
 
     def _node_to_text(self, node: Dict[str, Any], node_type: str) -> str:
         """Convert node to embeddable text."""
@@ -18,5 +18,6 @@ Usage:
 from .orchestrator import Orchestrator
 from .narrator import NarratorService
 from .world_runner import WorldRunnerService
+from .speculative import SpeculativeNarrator
 
-__all__ = ['Orchestrator', 'NarratorService', 'WorldRunnerService']
+__all__ = ['Orchestrator', 'NarratorService', 'WorldRunnerService', 'SpeculativeNarrator']
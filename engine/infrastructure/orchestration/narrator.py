@@ -2,7 +2,9 @@
 Narrator Service
 
 Calls agent CLI to generate scenes.
-Uses --continue for persistent session across playthrough.
+Uses --continue for persistent session across playthrough. Scenes served
+from elsewhere (speculative generations) are recorded and replayed at the
+top of the next prompt, so the session still sees every turn the player got.
 
 DOCS: docs/agents/narrator/
 """
@@ -10,13 +12,22 @@ DOCS: docs/agents/narrator/
 import json
 import logging
 import subprocess
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from .agent_cli import extract_claude_text, parse_claude_json_output, run_agent
 
 logger = logging.getLogger(__name__)
 
+# Scene id of _fallback_response(), returned instead of raising on CLI failure
+FALLBACK_SCENE_ID = "scene_fallback"
+
+
+def is_fallback_response(output: Dict[str, Any]) -> bool:
+    """True if `output` is the fallback scene, not a real narrator generation."""
+    scene = (output or {}).get("scene")
+    return not output or (isinstance(scene, dict) and scene.get("id") == FALLBACK_SCENE_ID)
+
 
 class NarratorService:
     """
@@ -27,7 +38,8 @@ class NarratorService:
     def __init__(
         self,
         working_dir: str = None,
-        timeout: int = 600  # 10 minutes for complex scene generation
+        timeout: int = 600,  # 10 minutes for complex scene generation
+        add_dir: str = "../.."
     ):
         # Default to agents/narrator relative to project root
         if working_dir:
@@ -39,7 +51,10 @@ class NarratorService:
             self.working_dir = str(project_root / "agents" / "narrator")
 
         self.timeout = timeout
+        self.add_dir = add_dir
         self.session_started = False
+        # Turns the player was served without this session generating them
+        self.served: List[Dict[str, Any]] = []
 
         logger.info(f"[NarratorService] Initialized, working_dir={self.working_dir}")
 
@@ -62,12 +77,25 @@ class NarratorService:
         """
         # Build prompt
         prompt = self._build_prompt(scene_context, world_injection, instruction)
+        replayed = len(self.served)
 
         # Call agent CLI
         result = self._call_claude(prompt)
 
+        # Replayed turns are in the session once a call got through
+        if not is_fallback_response(result):
+            del self.served[:replayed]
+
         return result
 
+    def record_served(self, instruction: str, output: Dict[str, Any]) -> None:
+        """Record a turn served outside this session; the next prompt replays it."""
+        self.served.append({
+            "instruction": instruction,
+            "scene": output.get("scene"),
+            "time_elapsed": output.get("time_elapsed"),
+        })
+
     def _build_prompt(
         self,
         scene_context: Dict[str, Any],
@@ -81,9 +109,19 @@ class NarratorService:
             "NARRATOR INSTRUCTION",
             "=" * 20,
             "",
+        ]
+
+        if self.served:
+            parts.extend([
+                "ALREADY_SERVED (turns the player saw since your last reply, in order; continue from them):",
+                yaml.dump(self.served, default_flow_style=False),
+                "",
+            ])
+
+        parts.extend([
             "SCENE_CONTEXT:",
             yaml.dump(scene_context, default_flow_style=False),
-        ]
+        ])
 
         if world_injection:
             parts.extend([
@@ -126,7 +164,7 @@ class NarratorService:
                 timeout=self.timeout,
                 continue_session=self.session_started,
                 output_format="json",
-                add_dir="../..",
+                add_dir=self.add_dir,
             )
             self.session_started = True
 
@@ -170,7 +208,7 @@ class NarratorService:
         """Return a minimal fallback response using SceneTree schema."""
         return {
             "scene": {
-                "id": "scene_fallback",
+                "id": FALLBACK_SCENE_ID,
                 "location": {
                     "place": "place_unknown",
                     "name": "Unknown",
@@ -200,4 +238,5 @@ class NarratorService:
     def reset_session(self):
         """Reset the narrator session (for new playthrough)."""
         self.session_started = False
+        self.served = []
         logger.info("[NarratorService] Session reset")
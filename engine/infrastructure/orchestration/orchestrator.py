@@ -12,6 +12,7 @@ This is the entry point for the game engine.
 
 import json
 import logging
+import shutil
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from datetime import datetime
@@ -19,8 +20,9 @@ from datetime import datetime
 from engine.physics.graph import GraphOps, GraphQueries
 from engine.physics import GraphTick
 from engine.health import get_health_service
-from .narrator import NarratorService
+from .narrator import NarratorService, is_fallback_response
 from .world_runner import WorldRunnerService
+from .speculative import SpeculativeNarrator, graph_version
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +38,10 @@ class Orchestrator:
         graph_name: str = "blood_ledger",
         host: str = "localhost",
         port: int = 6379,
-        playthroughs_dir: str = "playthroughs"
+        playthroughs_dir: str = "playthroughs",
+        speculative: bool = False,
+        speculative_top_k: int = 3,
+        speculative_working_dir: Optional[str] = None
     ):
         # Playthrough
         self.playthrough_id = playthrough_id
@@ -52,6 +57,22 @@ class Orchestrator:
         self.world_runner = WorldRunnerService(graph_ops=self.write, graph_queries=self.read)
         self.tick_engine = GraphTick(graph_name=graph_name, host=host, port=port)
 
+        # Speculative pre-generation for likely clicks (opt-in).
+        # Speculative calls never use --continue; point them at a separate
+        # working dir so they don't become the session the narrator resumes.
+        self.speculator: Optional[SpeculativeNarrator] = None
+        if speculative:
+            spec_dir = self._speculative_dir(speculative_working_dir)
+            # The live narrator's "../.." is the project root
+            project_root = str(Path(self.narrator.working_dir).resolve().parent.parent)
+            self.speculator = SpeculativeNarrator(
+                generate=lambda **kw: NarratorService(
+                    working_dir=spec_dir, add_dir=project_root
+                ).generate(**kw),
+                top_k=speculative_top_k,
+                is_failure=is_fallback_response
+            )
+
         # State
         self.last_tick_time: Optional[datetime] = None
 
@@ -65,7 +86,8 @@ class Orchestrator:
         self,
         player_action: str,
         player_id: str = "char_player",
-        player_location: str = None
+        player_location: str = None,
+        moment_id: str = None
     ) -> Dict[str, Any]:
         """
         Process a player action through the full loop.
@@ -74,13 +96,15 @@ class Orchestrator:
             player_action: What the player did (clicked word, free input, etc.)
             player_id: Player character ID
             player_location: Current location (or lookup from graph)
+            moment_id: Moment the clicked word belongs to; enables speculative hits
 
         Returns:
             Full narrator output: {dialogue, mutations, scene, time_elapsed}
 
         The Loop:
-        1. Build scene context
-        2. Call Narrator with context + any world_injection
+        1. Load any world_injection
+        2. Reuse a speculative generation for this click, or build scene
+           context and call Narrator with context + world_injection
         3. Parse response, apply mutations
         4. Run graph tick based on time_elapsed (only for significant actions)
         5. If flips detected, call World Runner
@@ -95,19 +119,34 @@ class Orchestrator:
             player_location = self._get_player_location(player_id)
             logger.info(f"[Orchestrator] Resolved location to: {player_location}")
 
-        # 1. Build scene context
-        scene_context = self._build_scene_context(player_id, player_location)
-        logger.info(f"[Orchestrator] Scene context has {len(scene_context.get('present', []))} characters present")
-
-        # 2. Load world_injection if exists
+        # 1. Load world_injection if exists
         world_injection = self._load_world_injection()
-
-        # 3. Call Narrator
-        narrator_output = self.narrator.generate(
-            scene_context=scene_context,
-            world_injection=world_injection,
-            instruction=f"Player action: {player_action}"
-        )
+        instruction = f"Player action: {player_action}"
+
+        # 2. Reuse a speculative generation for this click, else call Narrator
+        narrator_output = None
+        if self.speculator and moment_id and not world_injection:
+            narrator_output = self.speculator.lookup(
+                self.playthrough_id,
+                moment_id,
+                player_action,
+                graph_version(self._get_world_tick())
+            )
+            if narrator_output is not None:
+                logger.info(f"[Orchestrator] Speculative hit for {moment_id}/{player_action}")
+                # Generated outside the live --continue session: replayed
+                # into the narrator's next prompt so the conversation has it
+                self.narrator.record_served(instruction, narrator_output)
+
+        if narrator_output is None:
+            # Scene context is only needed for a live generation
+            scene_context = self._build_scene_context(player_id, player_location)
+            logger.info(f"[Orchestrator] Scene context has {len(scene_context.get('present', []))} characters present")
+            narrator_output = self.narrator.generate(
+                scene_context=scene_context,
+                world_injection=world_injection,
+                instruction=instruction
+            )
 
         # Clear consumed world_injection
         if world_injection:
@@ -166,6 +205,57 @@ class Orchestrator:
         # 7. Return full output
         return narrator_output
 
+    def speculate(
+        self,
+        view: Dict[str, Any],
+        player_id: str = "char_player",
+        player_location: str = None
+    ) -> int:
+        """
+        Schedule narrator pre-generation for the likeliest clicks in a view.
+
+        Called after get_current_view() while the player reads. Returns the
+        number of generations scheduled (0 when speculation is disabled or
+        a world injection is pending, since that would change the output).
+        """
+        if not self.speculator or self._world_injection_path().exists():
+            return 0
+
+        location = player_location or (view.get("location") or {}).get("id")
+        if not location:
+            location = self._get_player_location(player_id)
+
+        keys = self.speculator.speculate(
+            playthrough_id=self.playthrough_id,
+            view=view,
+            version=graph_version(self._get_world_tick()),
+            build_context=lambda: self._build_scene_context(player_id, location)
+        )
+        return len(keys)
+
+    def _speculative_dir(self, working_dir: Optional[str]) -> str:
+        """
+        Working dir for speculative narrator calls, never the live narrator's.
+
+        Defaults to a directory under the playthrough. The narrator's
+        instruction files are copied in so speculative scenes follow them.
+        """
+        spec_dir = Path(working_dir) if working_dir else self.playthrough_dir / "speculative_narrator"
+        live_dir = Path(self.narrator.working_dir)
+        if spec_dir.resolve() == live_dir.resolve():
+            raise ValueError("speculative_working_dir must differ from the narrator's working dir")
+        spec_dir.mkdir(parents=True, exist_ok=True)
+        for name in ("CLAUDE.md", "AGENTS.md"):
+            if (live_dir / name).is_file():
+                shutil.copyfile(live_dir / name, spec_dir / name)
+        return str(spec_dir)
+
+    def speculation_stats(self) -> Dict[str, Any]:
+        """Hit rate and wasted-generation counters for speculative mode."""
+        if not self.speculator:
+            return {"enabled": False}
+        return {"enabled": True, **self.speculator.stats.to_dict()}
+
     def process_action_streaming(
         self,
         player_action: str,
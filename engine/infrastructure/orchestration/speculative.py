@@ -0,0 +1,325 @@
+"""
+Speculative Narrator
+
+Pre-generates narrator output for the most probable next clicks while the
+player is reading. The narrator is the slow part of /api/action; if we have
+already generated the response for the word the player clicks, the action
+returns as soon as mutations are applied.
+
+Candidates come from the current view: each click transition out of an
+active moment, scored by the origin moment's weight times the CAN_LEAD_TO
+weight_transfer. Results live in a TTL cache keyed by
+(playthrough_id, moment_id, click, graph_version), so any graph mutation
+or tick advance makes older speculations unreachable.
+
+Speculation is opt-in and never blocks the hot path: scene context and
+generation both run on a small background pool, and new work is dropped
+while the pool is busy.
+"""
+
+# DOCS: docs/agents/narrator/
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from engine.physics.graph.graph_ops_events import add_mutation_listener
+
+logger = logging.getLogger(__name__)
+
+SpeculationKey = Tuple[str, str, str, str]
+
+
+# =============================================================================
+# GRAPH VERSION
+# =============================================================================
+
+# Bumped on every completed apply(). Conservative: any graph mutation in the
+# process invalidates every speculation, which is cheaper than a stale scene.
+_mutation_epoch = 0
+_epoch_lock = threading.Lock()
+
+
+def _on_mutation(event: Dict[str, Any]) -> None:
+    global _mutation_epoch
+    if event.get("type") in ("apply_complete", "movement"):
+        with _epoch_lock:
+            _mutation_epoch += 1
+
+
+add_mutation_listener(_on_mutation)
+
+
+def graph_version(world_tick: Optional[int]) -> str:
+    """Build the version component of a speculation key."""
+    return f"{world_tick if world_tick is not None else '-'}:{_mutation_epoch}"
+
+
+# =============================================================================
+# CANDIDATE RANKING
+# =============================================================================
+
+@dataclass
+class ClickCandidate:
+    """A click the player is likely to make next."""
+    moment_id: str
+    word: str
+    target_id: str
+    score: float
+
+
+def rank_click_candidates(view: Dict[str, Any], k: int = 3) -> List[ClickCandidate]:
+    """
+    Rank likely next clicks from a get_current_view() payload.
+
+    Score = origin moment weight × transition weight_transfer. Each required
+    word of a click transition is a separate candidate; duplicates keep the
+    highest score.
+    """
+    weights = {
+        m.get("id"): float(m.get("weight") or 0.0)
+        for m in view.get("moments", [])
+        if m.get("status") == "active"
+    }
+
+    best: Dict[Tuple[str, str], ClickCandidate] = {}
+    for t in view.get("transitions", []):
+        if (t.get("trigger") or "click") != "click":
+            continue
+        origin = t.get("from_id")
+        if origin not in weights:
+            continue
+        transfer = t.get("weight_transfer")
+        score = weights[origin] * float(transfer if transfer is not None else 0.3)
+        for word in t.get("require_words") or []:
+            key = (origin, word.lower())
+            current = best.get(key)
+            if current is None or score > current.score:
+                best[key] = ClickCandidate(
+                    moment_id=origin,
+                    word=word.lower(),
+                    target_id=t.get("to_id"),
+                    score=score,
+                )
+
+    ranked = sorted(best.values(), key=lambda c: c.score, reverse=True)
+    return ranked[:k]
+
+
+# =============================================================================
+# TTL CACHE
+# =============================================================================
+
+@dataclass
+class _Entry:
+    value: Dict[str, Any]
+    expires_at: float
+
+
+@dataclass
+class SpeculationStats:
+    """Counters for judging whether speculation pays for itself."""
+    scheduled: int = 0
+    generated: int = 0
+    skipped_busy: int = 0
+    failed: int = 0
+    hits: int = 0
+    misses: int = 0
+    wasted: int = 0  # generated, then expired or evicted without a hit
+    generation_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "scheduled": self.scheduled,
+            "generated": self.generated,
+            "skipped_busy": self.skipped_busy,
+            "failed": self.failed,
+            "hits": self.hits,
+            "misses": self.misses,
+            "wasted": self.wasted,
+            "hit_rate": round(self.hit_rate, 3),
+            "generation_seconds": round(self.generation_seconds, 3),
+        }
+
+
+class SpeculationCache:
+    """Bounded TTL cache of narrator outputs keyed by SpeculationKey."""
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 64):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stats = SpeculationStats()
+        self._entries: Dict[SpeculationKey, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def put(self, key: SpeculationKey, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._expire(time.monotonic())
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                oldest = min(self._entries, key=lambda k: self._entries[k].expires_at)
+                self._drop(oldest)
+            self._entries[key] = _Entry(value=value, expires_at=time.monotonic() + self.ttl_seconds)
+
+    def get(self, key: SpeculationKey) -> Optional[Dict[str, Any]]:
+        """Pop a fresh entry. Each speculation serves at most one action."""
+        with self._lock:
+            self._expire(time.monotonic())
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            return entry.value
+
+    def __contains__(self, key: SpeculationKey) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.expires_at > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+
+    def _expire(self, now: float) -> None:
+        for key in [k for k, e in self._entries.items() if e.expires_at <= now]:
+            self._drop(key)
+
+    def _drop(self, key: SpeculationKey) -> None:
+        # Hits pop their entry in get(), so anything dropped here was unused.
+        self._entries.pop(key)
+        self.stats.wasted += 1
+
+
+# =============================================================================
+# SPECULATIVE NARRATOR
+# =============================================================================
+
+class _SharedContext:
+    """build_context() run once, by the first worker that needs it."""
+
+    def __init__(self, build: Callable[[], Dict[str, Any]]):
+        self._build = build
+        self._value: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Dict[str, Any]:
+        with self._lock:
+            if self._value is None:
+                self._value = self._build()
+            return self._value
+
+
+class SpeculativeNarrator:
+    """
+    Runs narrator generations for likely clicks on idle capacity.
+
+    `generate` must be independent of the live narrator session: a
+    speculative call that is never used must not leak into the conversation
+    the narrator continues with --continue. Orchestrator passes a separate
+    NarratorService for this.
+
+    `is_failure` recognises outputs a generator returns instead of raising
+    (NarratorService's fallback scene); those count as failed and are never
+    cached, so a player is not served them for a click.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[..., Dict[str, Any]],
+        top_k: int = 3,
+        ttl_seconds: float = 300.0,
+        max_workers: int = 1,
+        max_entries: int = 64,
+        is_failure: Callable[[Dict[str, Any]], bool] = lambda output: not output,
+    ):
+        self.generate = generate
+        self.is_failure = is_failure
+        self.top_k = top_k
+        self.cache = SpeculationCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="speculative-narrator"
+        )
+        self._in_flight: set = set()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> SpeculationStats:
+        return self.cache.stats
+
+    def speculate(
+        self,
+        playthrough_id: str,
+        view: Dict[str, Any],
+        version: str,
+        build_context: Callable[[], Dict[str, Any]],
+        instruction_for: Callable[[str], str] = lambda word: f"Player action: {word}",
+    ) -> List[SpeculationKey]:
+        """
+        Schedule generations for the top-k clicks in `view`.
+
+        Returns the keys that were scheduled. Candidates already cached or
+        in flight are skipped; when every worker is busy the rest are
+        dropped rather than queued, so speculation never grows a backlog.
+        """
+        scheduled: List[SpeculationKey] = []
+        # Built on the first worker that needs it, off the caller's thread
+        context = _SharedContext(build_context)
+
+        for candidate in rank_click_candidates(view, self.top_k):
+            key = (playthrough_id, candidate.moment_id, candidate.word, version)
+            with self._lock:
+                if key in self._in_flight or key in self.cache:
+                    continue
+                if len(self._in_flight) >= self._max_workers:
+                    self.stats.skipped_busy += 1
+                    continue
+                self._in_flight.add(key)
+
+            self.stats.scheduled += 1
+            self._executor.submit(self._run, key, context, instruction_for(candidate.word))
+            scheduled.append(key)
+
+        return scheduled
+
+    def lookup(
+        self,
+        playthrough_id: str,
+        moment_id: str,
+        click: str,
+        version: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Return a pre-generated narrator output, or None on miss."""
+        return self.cache.get((playthrough_id, moment_id, click.lower(), version))
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.cache.clear()
+
+    def _run(self, key: SpeculationKey, context: "_SharedContext", instruction: str) -> None:
+        started = time.monotonic()
+        try:
+            output = self.generate(scene_context=context.get(), instruction=instruction)
+            if self.is_failure(output):
+                raise RuntimeError("generator returned a fallback response")
+            self.cache.put(key, output)
+            self.stats.generated += 1
+        except Exception as e:
+            self.stats.failed += 1
+            logger.warning(f"[SpeculativeNarrator] Generation failed for {key}: {e}")
+        finally:
+            self.stats.generation_seconds += time.monotonic() - started
+            with self._lock:
+                self._in_flight.discard(key)
@@ -329,7 +329,8 @@ class WorldRunnerService:
         self,
         max_ticks: int = 100,
         location_id: str = None,
-        player_id: str = "char_player"
+        player_id: str = "char_player",
+        fast_forward: bool = False
     ) -> Dict[str, Any]:
         """
         Run ticks until a moment completes (becomes visible to player).
@@ -341,6 +342,7 @@ class WorldRunnerService:
             max_ticks: Maximum ticks to run before giving up
             location_id: Current player location (for filtering visible moments)
             player_id: Player actor ID
+            fast_forward: Simulate in memory and write back once (see tick_fast_forward)
 
         Returns:
             Dict with:
@@ -351,6 +353,9 @@ class WorldRunnerService:
         """
         from engine.physics.tick_v1_2 import GraphTickV1_2
 
+        if fast_forward:
+            return self._fast_forward_until_visible(max_ticks, location_id, player_id)
+
         # Create tick runner
         tick_runner = GraphTickV1_2(
             graph_queries=self.graph_queries,
@@ -364,7 +369,7 @@ class WorldRunnerService:
 
         for tick_num in range(max_ticks):
             # Run one tick
-            result = tick_runner.run()
+            result = tick_runner.run(player_id=player_id)
             ticks_run += 1
             final_result = result
 
@@ -419,6 +424,37 @@ class WorldRunnerService:
             "stopped_reason": stopped_reason
         }
 
+    def _fast_forward_until_visible(
+        self,
+        max_ticks: int,
+        location_id: str,
+        player_id: str
+    ) -> Dict[str, Any]:
+        """run_until_visible on the in-memory fast-forward engine."""
+        from engine.physics.tick_fast_forward import FastForwardTick, stop_on_completion
+
+        ff = FastForwardTick(graph_queries=self.graph_queries, graph_ops=self.graph_ops)
+        result = ff.run(
+            max_ticks=max_ticks,
+            stop_when=stop_on_completion(location_id),
+            player_id=player_id
+        )
+
+        stopped_reason = result.stopped_reason
+        if stopped_reason == "stop_condition":
+            stopped_reason = "moment_completed_at_location" if location_id else "moment_completed"
+
+        logger.info(f"[WorldRunner] run_until_visible (fast-forward): {result.ticks_run} ticks, "
+                    f"{len(result.triggered)} completions, {result.queries_issued} queries, reason={stopped_reason}")
+
+        return {
+            "ticks_run": result.ticks_run,
+            "completed_moments": result.triggered,
+            "final_tick_result": result.final_tick_result,
+            "stopped_reason": stopped_reason,
+            "tick_log": result.tick_results
+        }
+
     def run_until_disrupted(
         self,
         max_ticks: int = 100,
@@ -29,6 +29,7 @@ def create_indexes(r: redis.Redis, graph_name: str):
         "CREATE INDEX FOR (n:Space) ON (n.id)",
         "CREATE INDEX FOR (n:Thing) ON (n.id)",
         "CREATE INDEX FOR (n:Narrative) ON (n.id)",
+        "CREATE INDEX FOR (n:Moment) ON (n.id)",
 
         # Type indexes (filtering)
         "CREATE INDEX FOR (n:Actor) ON (n.type)",
@@ -84,7 +85,7 @@ def load_initial_state(graph_name: str, host: str, port: int):
                         for item in raw_items:
                             item["type"] = node_type
                             nodes.append(item)
-                        result = graph.apply(data={"nodes": nodes, "links": []})
+                        result = graph.apply(data={"nodes": nodes, "links": []}, bulk=True)
                         if result.success:
                             logger.info(f"  Loaded {len(result.persisted)} {node_type}s")
                         else:
@@ -112,7 +113,7 @@ def load_initial_state(graph_name: str, host: str, port: int):
                         for item in raw_items:
                             item["type"] = link_type
                             links.append(item)
-                        result = graph.apply(data={"nodes": [], "links": links})
+                        result = graph.apply(data={"nodes": [], "links": links}, bulk=True)
                         if result.success:
                             logger.info(f"  Loaded {len(result.persisted)} {link_type} links")
                         else:
@@ -129,7 +130,7 @@ def load_initial_state(graph_name: str, host: str, port: int):
         return False
 
     logger.info(f"Loading initial state from: {init_file}")
-    result = graph.apply(path=str(init_file))
+    result = graph.apply(path=str(init_file), bulk=True)
 
     if result.success:
         logger.info(f"Loaded {len(result.persisted)} items successfully")
@@ -0,0 +1,230 @@
+"""
+Presence Index — precomputed presence gating for the current view.
+
+A moment is visible only when every target it is ATTACHED_TO with
+presence_required=true is present. Evaluating that in Cypher means an
+OPTIONAL MATCH, collect and ALL() over every moment in the graph on every
+view request. The index keeps the gating structure in memory instead:
+
+- `_by_target`: required target id -> moments that require it
+- `_required`: moment id -> its required targets (the per-moment counter is
+  the size of that set)
+- `_ungated`: moments with no requirement
+
+`candidates(present)` is the ungated set plus every moment whose hit count
+over the present targets' posting lists reaches its number of requirements.
+The view query fetches only those ids, so its cost follows the visible set
+rather than the number of moments in the graph.
+
+Maintenance: built from one query, then kept current by GraphOps
+`presence_changed` events (emitted by add_moment and add_attached_to for
+this graph). Moments and attachments the index hasn't seen (raw Cypher,
+another process) are caught by `matches_graph`: the graph's Moment and
+ATTACHED_TO counts (count-store lookups, not scans) must equal the counts at
+the last build plus the writes seen since; any difference forces a rebuild.
+A presence_required flag flipped elsewhere leaves the counts unchanged and
+is picked up by the rebuild after NGRAM_PRESENCE_INDEX_TTL seconds. Stale
+entries for deleted moments are harmless: the view query only fetches
+moments that still exist.
+
+The index tracks structure only; status and location filters stay in the
+view query.
+"""
+
+# DOCS: docs/engine/moment-graph-engine/PATTERNS_Instant_Traversal_Moment_Graph.md
+
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+from engine.physics.graph.graph_ops_events import add_mutation_listener
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = float(os.getenv("NGRAM_PRESENCE_INDEX_TTL", "60"))
+
+BUILD_QUERY = """
+MATCH (m:Moment)
+OPTIONAL MATCH (m)-[r:ATTACHED_TO]->(target)
+RETURN m.id AS id, collect([target.id, r.presence_required = true]) AS attached
+"""
+
+# Separate queries so each is answered from the label/relationship-type count
+MOMENT_COUNT_QUERY = "MATCH (m:Moment) RETURN count(m) AS n"
+ATTACHED_COUNT_QUERY = "MATCH ()-[r:ATTACHED_TO]->() RETURN count(r) AS n"
+
+
+def _count(read: Any, cypher: str) -> int:
+    rows = read.query(cypher)
+    if not rows:
+        return 0
+    row = rows[0]
+    return int(row.get('n', 0) if isinstance(row, dict) else row[0])
+
+
+class PresenceIndex:
+    """Inverted index from required targets to the moments they gate."""
+
+    def __init__(self, graph_name: str = "", clock: Callable[[], float] = time.monotonic):
+        self.graph_name = graph_name
+        self.clock = clock
+        self.built_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._required: Dict[str, FrozenSet[str]] = {}
+        self._by_target: Dict[str, Set[str]] = {}
+        self._ungated: Set[str] = set()
+        # Every ATTACHED_TO target per moment, required or not, so a repeated
+        # (MERGEd) write isn't counted twice
+        self._attached: Dict[str, Set[str]] = {}
+        # Expected graph (moments, attachments): counts at build + writes since
+        self._counts: Optional[Tuple[int, int]] = None
+
+    # -------------------------------------------------------------------------
+    # Building and maintenance
+    # -------------------------------------------------------------------------
+
+    def rebuild(self, read: Any) -> None:
+        """Replace the index with the graph's current gating structure."""
+        # Counted first: a write landing between the two queries shows up as
+        # a mismatch on the next check instead of being missed
+        counts = (_count(read, MOMENT_COUNT_QUERY), _count(read, ATTACHED_COUNT_QUERY))
+        rows = read.query(BUILD_QUERY)
+        required: Dict[str, FrozenSet[str]] = {}
+        attached: Dict[str, Set[str]] = {}
+        for row in rows:
+            if isinstance(row, dict):
+                moment_id, pairs = row.get('id'), row.get('attached')
+            else:
+                moment_id, pairs = row[0], row[1]
+            if not moment_id:
+                continue
+            pairs = [(t, flag) for t, flag in pairs or [] if t]
+            attached[moment_id] = {t for t, _ in pairs}
+            required[moment_id] = frozenset(t for t, flag in pairs if flag)
+
+        by_target: Dict[str, Set[str]] = {}
+        for moment_id, targets in required.items():
+            for target in targets:
+                by_target.setdefault(target, set()).add(moment_id)
+        with self._lock:
+            self._required = required
+            self._by_target = by_target
+            self._ungated = {m for m, targets in required.items() if not targets}
+            self._attached = attached
+            self._counts = counts
+            self.built_at = self.clock()
+        logger.debug(f"[PresenceIndex] {self.graph_name}: {len(required)} moments, {len(by_target)} targets")
+
+    def is_stale(self, ttl: float) -> bool:
+        return self.built_at is None or self.clock() - self.built_at >= ttl
+
+    def matches_graph(self, read: Any) -> bool:
+        """False if the graph gained or lost moments or attachments the index hasn't seen."""
+        counts = (_count(read, MOMENT_COUNT_QUERY), _count(read, ATTACHED_COUNT_QUERY))
+        with self._lock:
+            return counts == self._counts
+
+    def invalidate(self) -> None:
+        """Force a rebuild on next use."""
+        self.built_at = None
+
+    def _seen(self, moment_id: str, target_id: Optional[str] = None) -> None:
+        """Count a write the graph now holds (caller holds the lock)."""
+        if moment_id not in self._required:
+            self._required[moment_id] = frozenset()
+            self._ungated.add(moment_id)
+            self._bump(1, 0)
+        if target_id is not None:
+            attached = self._attached.setdefault(moment_id, set())
+            if target_id not in attached:
+                attached.add(target_id)
+                self._bump(0, 1)
+
+    def _bump(self, moments: int, attachments: int) -> None:
+        if self._counts is not None:
+            self._counts = (self._counts[0] + moments, self._counts[1] + attachments)
+
+    def add_moment(self, moment_id: str) -> None:
+        """A moment exists; it is ungated until a requirement is added."""
+        with self._lock:
+            self._seen(moment_id)
+
+    def set_requirement(self, moment_id: str, target_id: str, required: bool = True) -> None:
+        """Add or remove one presence requirement (an ATTACHED_TO write)."""
+        with self._lock:
+            self._seen(moment_id, target_id)
+            targets = self._required[moment_id]
+            updated = targets | {target_id} if required else targets - {target_id}
+            if updated == targets:
+                return
+            self._required[moment_id] = updated
+            if required:
+                self._by_target.setdefault(target_id, set()).add(moment_id)
+            else:
+                posting = self._by_target.get(target_id)
+                if posting is not None:
+                    posting.discard(moment_id)
+                    if not posting:
+                        del self._by_target[target_id]
+            if updated:
+                self._ungated.discard(moment_id)
+            else:
+                self._ungated.add(moment_id)
+
+    def apply_event(self, data: Dict[str, Any]) -> None:
+        """Apply a `presence_changed` mutation event."""
+        moment_id = data.get('moment_id')
+        if not moment_id:
+            return
+        target_id = data.get('target_id')
+        if target_id:
+            self.set_requirement(moment_id, target_id, bool(data.get('presence_required')))
+        else:
+            self.add_moment(moment_id)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def candidates(self, present: Iterable[str]) -> Set[str]:
+        """Moments whose presence requirements are all in `present` (ungated included)."""
+        with self._lock:
+            hits: Dict[str, int] = {}
+            for target in set(present):
+                for moment_id in self._by_target.get(target, ()):
+                    hits[moment_id] = hits.get(moment_id, 0) + 1
+            passing = {m for m, n in hits.items() if n == len(self._required[m])}
+            return passing | self._ungated
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "moments": len(self._required),
+                "gated": len(self._required) - len(self._ungated),
+                "targets": len(self._by_target),
+            }
+
+
+# Indexes receiving presence_changed events, by graph name
+_indexes: "weakref.WeakSet[PresenceIndex]" = weakref.WeakSet()
+
+
+def register(index: PresenceIndex) -> PresenceIndex:
+    """Keep `index` current with this process's GraphOps writes to its graph."""
+    _indexes.add(index)
+    return index
+
+
+def _on_mutation(event: Dict[str, Any]) -> None:
+    if event.get("type") != "presence_changed":
+        return
+    data = event.get("data") or {}
+    for index in list(_indexes):
+        if index.graph_name == data.get("graph"):
+            index.apply_event(data)
+
+
+add_mutation_listener(_on_mutation)
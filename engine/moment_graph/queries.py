@@ -11,6 +11,8 @@ import json
 import logging
 from typing import List, Dict, Any, Optional, Set
 
+from engine.moment_graph.presence_index import DEFAULT_TTL as PRESENCE_INDEX_TTL
+from engine.moment_graph.presence_index import PresenceIndex, register
 from engine.physics.graph.graph_queries import GraphQueries
 
 logger = logging.getLogger(__name__)
@@ -30,6 +32,9 @@ class MomentQueries:
         port: int = 6379
     ):
         self.read = GraphQueries(graph_name=graph_name, host=host, port=port)
+        # Presence gating for get_current_view, kept current by GraphOps writes
+        self.presence = register(PresenceIndex(graph_name))
+        self.presence_ttl = PRESENCE_INDEX_TTL
 
     def get_current_view(
         self,
@@ -75,24 +80,42 @@ class MomentQueries:
 
         # 2. Query: Get moments that pass presence gating
         # Statuses: 'active', 'possible' (live), 'completed' (history)
-        cypher = """
-        MATCH (m:Moment)
-        WHERE m.status IN ['possible', 'active', 'completed']
-
-        // Presence gating: Get all presence-required attachments
-        OPTIONAL MATCH (m)-[r:ATTACHED_TO]->(target)
-        WHERE r.presence_required = true
-        WITH m, collect(target.id) AS required_targets
-
-        // Location match for spoken moments
-        OPTIONAL MATCH (m)-[:AT]->(at:Space {id: $location_id})
-        WITH m, required_targets, at
-
-        // Filter: all required must be in present set (or no requirements)
-        // For 'completed' moments, ensure they are at the current location
-        WHERE (size(required_targets) = 0 OR ALL(req IN required_targets WHERE req IN $present_set))
-          AND (m.status <> 'completed' OR at IS NOT NULL)
-
+        candidates = self._presence_candidates(present_set)
+        if candidates is not None:
+            # Gating already done by the presence index: fetch only the
+            # moments it lets through, by id
+            cypher = """
+            UNWIND $candidates AS moment_id
+            MATCH (m:Moment {id: moment_id})
+            WHERE m.status IN ['possible', 'active', 'completed']
+
+            // Location match for spoken moments
+            OPTIONAL MATCH (m)-[:AT]->(at:Space {id: $location_id})
+            WITH m, at
+
+            // For 'completed' moments, ensure they are at the current location
+            WHERE m.status <> 'completed' OR at IS NOT NULL
+            """
+        else:
+            cypher = """
+            MATCH (m:Moment)
+            WHERE m.status IN ['possible', 'active', 'completed']
+
+            // Presence gating: Get all presence-required attachments
+            OPTIONAL MATCH (m)-[r:ATTACHED_TO]->(target)
+            WHERE r.presence_required = true
+            WITH m, collect(target.id) AS required_targets
+
+            // Location match for spoken moments
+            OPTIONAL MATCH (m)-[:AT]->(at:Space {id: $location_id})
+            WITH m, required_targets, at
+
+            // Filter: all required must be in present set (or no requirements)
+            // For 'completed' moments, ensure they are at the current location
+            WHERE (size(required_targets) = 0 OR ALL(req IN required_targets WHERE req IN $present_set))
+              AND (m.status <> 'completed' OR at IS NOT NULL)
+            """
+        cypher += """
         // Get speaker via SAID or CAN_SPEAK
         OPTIONAL MATCH (speaker:Actor)-[:CAN_SPEAK]->(m)
         WHERE speaker.id IN $present_set
@@ -122,6 +145,7 @@ class MomentQueries:
         try:
             results = self.read.query(cypher, {
                 "present_set": list(present_set),
+                "candidates": list(candidates or ()),
                 "location_id": location_id,
                 "limit": limit + history_limit
             })
@@ -167,6 +191,22 @@ class MomentQueries:
             "active_count": len(active_ids)
         }
 
+    def _presence_candidates(self, present_set: Set[str]) -> Optional[Set[str]]:
+        """
+        IDs of moments whose presence requirements are all in `present_set`.
+
+        Answered by the presence index, rebuilt first when stale or when the
+        graph holds moments or attachments it hasn't seen. None if the index
+        can't be built; the view query then gates in Cypher.
+        """
+        try:
+            if self.presence.is_stale(self.presence_ttl) or not self.presence.matches_graph(self.read):
+                self.presence.rebuild(self.read)
+        except Exception as e:
+            logger.warning(f"[MomentQueries] Presence index rebuild failed: {e}")
+            return None
+        return self.presence.candidates(present_set)
+
     def _get_transitions(self, moment_ids: List[str]) -> List[Dict]:
         """Get CAN_LEAD_TO links from given moments."""
         if not moment_ids:
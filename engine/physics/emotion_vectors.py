@@ -0,0 +1,256 @@
+"""
+Emotion Vectors — Vectorized Emotion Algebra
+
+Emotions are stored on nodes and links as `[[name, intensity], ...]` lists.
+The list helpers in tick_v1_2 build dicts and match strings on every call,
+which is most of the cost of the flow phases once the graph is in memory.
+
+Here emotions are interned into an EmotionVocabulary (name -> fixed index)
+and held as float32 vectors, one slot per vocabulary entry. The algebra then
+becomes array operations, with batched forms over many links at once:
+
+    proximity        weighted Jaccard  Σ min(a, b) / Σ max(a, b)
+    blend            axpy with diminishing returns  e + rate·i·(1 − e)
+    weighted average (w @ V) / Σ w
+
+Semantics match the list helpers in tick_v1_2 (same baselines, same top-k
+cap). A vector cannot tell an emotion listed at intensity 0 from one not
+listed at all, but the baselines can: `[["joy", 0.0]]` is a non-empty list,
+so its proximity to `[["joy", 0.5]]` is 0.0, not the 0.2 empty baseline.
+Where that matters, a boolean presence mask (`to_mask`) travels with the
+vector; without one, non-zero slots count as present. Indices are never
+reassigned, so vectors built earlier stay valid as the vocabulary grows;
+shorter vectors are zero-padded (masks with False).
+
+Converters (`to_vector` / `to_mask` / `to_list`) keep the list format as
+the storage and API format.
+
+DOCS: docs/physics/algorithms/ALGORITHM_Physics_Schema_v1.2_Energy_Physics.md
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+DTYPE = np.float32
+
+# Baselines from tick_v1_2
+PROXIMITY_BASELINE = 0.2
+INTENSITY_BASELINE = 0.5
+
+
+# =============================================================================
+# VOCABULARY
+# =============================================================================
+
+class EmotionVocabulary:
+    """Interned emotion names with stable indices."""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[str] = []
+        self.index: Dict[str, int] = {}
+        for name in names:
+            self.intern(name)
+
+    @classmethod
+    def from_lists(cls, emotion_lists: Iterable[List[List]]) -> "EmotionVocabulary":
+        """Build a vocabulary covering every name in the given emotion lists."""
+        vocab = cls()
+        for emotions in emotion_lists:
+            for e in emotions or []:
+                if len(e) == 2:
+                    vocab.intern(e[0])
+        return vocab
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def intern(self, name: str) -> int:
+        idx = self.index.get(name)
+        if idx is None:
+            idx = self.index[name] = len(self.names)
+            self.names.append(name)
+        return idx
+
+    def to_vector(self, emotions: Optional[List[List]]) -> np.ndarray:
+        """Convert `[[name, intensity], ...]`. Duplicate names: last wins, like dict()."""
+        pairs = [(self.intern(e[0]), float(e[1])) for e in emotions or [] if len(e) == 2]
+        vec = np.zeros(len(self.names), dtype=DTYPE)
+        for idx, intensity in pairs:
+            vec[idx] = intensity
+        return vec
+
+    def to_mask(self, emotions: Optional[List[List]]) -> np.ndarray:
+        """Slots the list names, whatever their intensity."""
+        slots = [self.intern(e[0]) for e in emotions or [] if len(e) == 2]
+        mask = np.zeros(len(self.names), dtype=bool)
+        mask[slots] = True
+        return mask
+
+    def to_matrix(self, emotion_lists: Sequence[Optional[List[List]]]) -> np.ndarray:
+        """Stack many emotion lists into an (n, vocabulary) matrix."""
+        vectors = [self.to_vector(e) for e in emotion_lists]
+        return stack(vectors, len(self.names))
+
+    def to_masks(self, emotion_lists: Sequence[Optional[List[List]]]) -> np.ndarray:
+        """Stack many presence masks into an (n, vocabulary) matrix."""
+        masks = [self.to_mask(e) for e in emotion_lists]
+        return stack(masks, len(self.names), dtype=bool)
+
+    def to_list(self, vec: np.ndarray, max_emotions: Optional[int] = None) -> List[List]:
+        """Convert back to `[[name, intensity], ...]`, strongest first, zeros dropped."""
+        nonzero = np.flatnonzero(vec)
+        order = nonzero[np.argsort(-vec[nonzero], kind='stable')]
+        if max_emotions is not None:
+            order = order[:max_emotions]
+        return [[self.names[i], float(vec[i])] for i in order]
+
+
+# =============================================================================
+# SHAPE HELPERS
+# =============================================================================
+
+def pad(vec: np.ndarray, size: int) -> np.ndarray:
+    """Zero-pad a vector (or matrix rows) to `size` slots."""
+    missing = size - vec.shape[-1]
+    if missing <= 0:
+        return vec
+    widths = [(0, 0)] * (vec.ndim - 1) + [(0, missing)]
+    return np.pad(vec, widths)
+
+
+def stack(vectors: Sequence[np.ndarray], size: Optional[int] = None, dtype=DTYPE) -> np.ndarray:
+    """Stack vectors (or masks) of possibly different lengths into one matrix."""
+    width = max([size or 0] + [v.shape[-1] for v in vectors])
+    if not vectors:
+        return np.zeros((0, width), dtype=dtype)
+    return np.stack([pad(v, width) for v in vectors]).astype(dtype, copy=False)
+
+
+def _align(a: np.ndarray, b: np.ndarray):
+    size = max(a.shape[-1], b.shape[-1])
+    return pad(a, size), pad(b, size)
+
+
+def _present(values: np.ndarray, present: Optional[np.ndarray]) -> np.ndarray:
+    """The presence mask for `values`, defaulting to its non-zero slots."""
+    return values != 0 if present is None else pad(present, values.shape[-1])
+
+
+# =============================================================================
+# ALGEBRA
+# =============================================================================
+
+def avg_intensity(vectors: np.ndarray, present: Optional[np.ndarray] = None) -> np.ndarray:
+    """Mean intensity of the present slots per row; INTENSITY_BASELINE for empty rows."""
+    vectors = np.atleast_2d(vectors)
+    counts = np.atleast_2d(_present(vectors, present)).sum(axis=-1)
+    sums = vectors.sum(axis=-1, dtype=np.float64)
+    return np.where(counts > 0, sums / np.maximum(counts, 1), INTENSITY_BASELINE)
+
+
+def proximity(
+    a: np.ndarray,
+    b: np.ndarray,
+    a_present: Optional[np.ndarray] = None,
+    b_present: Optional[np.ndarray] = None,
+) -> float:
+    """Weighted Jaccard similarity of two vectors (emotion_proximity)."""
+    rows_present = None if a_present is None else a_present[np.newaxis, :]
+    return float(proximity_rows(a[np.newaxis, :], b, rows_present, b_present)[0])
+
+
+def proximity_rows(
+    rows: np.ndarray,
+    target: np.ndarray,
+    rows_present: Optional[np.ndarray] = None,
+    target_present: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Proximity of every row of `rows` to one target vector."""
+    rows, target = _align(rows, target)
+    rows_present = _present(rows, rows_present)
+    target_present = _present(target, target_present)
+    inter = np.minimum(rows, target).sum(axis=-1, dtype=np.float64)
+    union = np.maximum(rows, target).sum(axis=-1, dtype=np.float64)
+    empty = (union == 0) | ~rows_present.any(axis=-1) | (not target_present.any())
+    return np.where(empty, PROXIMITY_BASELINE, inter / np.where(union == 0, 1.0, union))
+
+
+def proximity_matrix(
+    a: np.ndarray,
+    b: np.ndarray,
+    a_present: Optional[np.ndarray] = None,
+    b_present: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Pairwise proximity, shape (len(a), len(b))."""
+    a, b = _align(a, b)
+    a_present, b_present = _present(a, a_present), _present(b, b_present)
+    lo = np.minimum(a[:, np.newaxis, :], b[np.newaxis, :, :]).sum(axis=-1, dtype=np.float64)
+    hi = np.maximum(a[:, np.newaxis, :], b[np.newaxis, :, :]).sum(axis=-1, dtype=np.float64)
+    empty = (hi == 0) | ~a_present.any(axis=-1)[:, np.newaxis] | ~b_present.any(axis=-1)[np.newaxis, :]
+    return np.where(empty, PROXIMITY_BASELINE, lo / np.where(hi == 0, 1.0, hi))
+
+
+def proximity_pairs(
+    a: np.ndarray,
+    b: np.ndarray,
+    a_present: Optional[np.ndarray] = None,
+    b_present: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Proximity of a[k] to b[k] for every row k (sparse pair lists)."""
+    a, b = _align(a, b)
+    a_present, b_present = _present(a, a_present), _present(b, b_present)
+    inter = np.minimum(a, b).sum(axis=-1, dtype=np.float64)
+    union = np.maximum(a, b).sum(axis=-1, dtype=np.float64)
+    empty = (union == 0) | ~a_present.any(axis=-1) | ~b_present.any(axis=-1)
+    return np.where(empty, PROXIMITY_BASELINE, inter / np.where(union == 0, 1.0, union))
+
+
+def blend(
+    existing: np.ndarray,
+    incoming: np.ndarray,
+    blend_rate: float,
+    max_emotions: int = 7
+) -> np.ndarray:
+    """
+    Blend incoming into existing (blend_emotions).
+
+    e + rate·i·(1 − e) covers both cases of the list helper: for an absent
+    emotion e = 0 and the update is rate·i. Only the `max_emotions`
+    strongest survive; on a tie at the cap the lower vocabulary index wins.
+    """
+    existing, incoming = _align(existing, incoming)
+    if not incoming.any():
+        return existing
+    scaled = incoming * DTYPE(blend_rate)
+    result = np.where(incoming != 0, existing + scaled * (1 - existing), existing).astype(DTYPE)
+    return _cap(result, max_emotions)
+
+
+def _cap(vec: np.ndarray, max_emotions: int) -> np.ndarray:
+    nonzero = np.flatnonzero(vec)
+    if len(nonzero) <= max_emotions:
+        return vec
+    keep = nonzero[np.argsort(-vec[nonzero], kind='stable')[:max_emotions]]
+    capped = np.zeros_like(vec)
+    capped[keep] = vec[keep]
+    return capped
+
+
+def weighted_average(vectors: np.ndarray, weights: Sequence[Optional[float]]) -> np.ndarray:
+    """
+    Weighted average of link emotion vectors (get_weighted_average_emotions).
+
+    Missing or zero weights count as 1.0, and every link counts towards the
+    total weight even if it carries no emotions.
+    """
+    if len(vectors) == 0:
+        return np.zeros(vectors.shape[-1] if vectors.ndim == 2 else 0, dtype=DTYPE)
+    w = np.array([x or 1.0 for x in weights], dtype=np.float64)
+    total = w.sum()
+    if total == 0:
+        return np.zeros(vectors.shape[-1], dtype=DTYPE)
+    return ((w @ vectors) / total).astype(DTYPE)
@@ -22,6 +22,11 @@ See docs/engine/GRAPH_OPERATIONS_GUIDE.md for full usage guide.
 from pathlib import Path
 
 
+def get_playthrough_player_file(playthrough_id: str) -> Path:
+    """player.yaml for a playthrough in the default playthroughs directory."""
+    return Path(__file__).parent.parent.parent / "playthroughs" / playthrough_id / "player.yaml"
+
+
 def get_playthrough_graph_name(playthrough_id: str) -> str:
     """
     Get the graph name for a playthrough.
@@ -36,8 +41,7 @@ def get_playthrough_graph_name(playthrough_id: str) -> str:
         Graph name to use with GraphOps/GraphQueries
     """
     import yaml
-    playthroughs_dir = Path(__file__).parent.parent.parent / "playthroughs"
-    player_file = playthroughs_dir / playthrough_id / "player.yaml"
+    player_file = get_playthrough_player_file(playthrough_id)
     if player_file.exists():
         try:
             data = yaml.safe_load(player_file.read_text())
@@ -59,6 +63,6 @@ __all__ = [
     'GraphOps', 'get_graph', 'ApplyResult', 'WriteError',
     'add_mutation_listener', 'remove_mutation_listener',
     'GraphQueries', 'get_queries', 'QueryError',
-    'get_playthrough_graph_name',
+    'get_playthrough_graph_name', 'get_playthrough_player_file',
     'GraphClient'
 ]
@@ -0,0 +1,222 @@
+"""
+Graph Connections
+
+Process-wide FalkorDB connection manager. Every GraphOps / GraphQueries
+built without an explicit `db` shares one client per (host, port), backed
+by a bounded blocking pool, and one graph handle per graph name.
+
+- Pool size: NGRAM_FALKORDB_POOL_SIZE (default 32); callers past the
+  limit wait up to NGRAM_FALKORDB_POOL_TIMEOUT seconds for a connection.
+- Health checks: idle connections are PINGed before reuse once they have
+  been idle for HEALTH_CHECK_INTERVAL seconds; `ping()` checks on demand.
+- Reconnect: connection and timeout errors retry with exponential backoff
+  (RETRIES attempts); `reset()` drops every pooled connection.
+- Metrics: `stats()` reports checked out, idle, waiting and errors per pool.
+
+Usage:
+    from engine.physics.graph.graph_connections import get_connection_manager
+
+    connections = get_connection_manager()
+    graph = connections.graph("blood_ledger")
+    connections.stats()
+
+DOCS: docs/physics/graph/PATTERNS_Graph.md
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import redis
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+from redis.retry import Retry
+from falkordb import FalkorDB
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = int(os.getenv("NGRAM_FALKORDB_POOL_SIZE", "32"))
+POOL_TIMEOUT = float(os.getenv("NGRAM_FALKORDB_POOL_TIMEOUT", "20.0"))
+HEALTH_CHECK_INTERVAL = 30
+RETRIES = 3
+BACKOFF_BASE = 0.05
+BACKOFF_CAP = 2.0
+
+
+class MeteredConnectionPool(redis.BlockingConnectionPool):
+    """BlockingConnectionPool that counts checkouts, waiters and failures."""
+
+    def __init__(self, *args, **kwargs):
+        self._meter_lock = threading.Lock()
+        self._checked_out: set = set()
+        self.waiting = 0
+        self.errors = 0
+        super().__init__(*args, **kwargs)
+
+    def get_connection(self, *args, **kwargs):
+        with self._meter_lock:
+            self.waiting += 1
+        try:
+            connection = super().get_connection(*args, **kwargs)
+        except Exception:
+            with self._meter_lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._meter_lock:
+                self.waiting -= 1
+        with self._meter_lock:
+            self._checked_out.add(id(connection))
+        return connection
+
+    def release(self, connection) -> None:
+        # Also called on connections that failed to connect inside get_connection
+        with self._meter_lock:
+            self._checked_out.discard(id(connection))
+        super().release(connection)
+
+    @property
+    def checked_out(self) -> int:
+        return len(self._checked_out)
+
+    def stats(self) -> Dict[str, int]:
+        opened = len(self._connections)
+        with self._meter_lock:
+            checked_out = len(self._checked_out)
+            return {
+                "max_connections": self.max_connections,
+                "open": opened,
+                "checked_out": checked_out,
+                "idle": max(0, opened - checked_out),
+                "waiting": self.waiting,
+                "errors": self.errors,
+            }
+
+
+class ConnectionManager:
+    """One pooled FalkorDB client per (host, port), one handle per graph."""
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_POOL_SIZE,
+        timeout: float = POOL_TIMEOUT,
+        health_check_interval: int = HEALTH_CHECK_INTERVAL,
+        retries: int = RETRIES,
+    ):
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.retries = retries
+        self._lock = threading.Lock()
+        self._pools: Dict[Tuple[str, int], MeteredConnectionPool] = {}
+        self._clients: Dict[Tuple[str, int], FalkorDB] = {}
+        self._graphs: Dict[Tuple[str, int, str], Any] = {}
+        self._ping_failures: Dict[Tuple[str, int], int] = {}
+
+    def _make_pool(self, host: str, port: int) -> MeteredConnectionPool:
+        return MeteredConnectionPool(
+            host=host,
+            port=port,
+            max_connections=self.max_connections,
+            timeout=self.timeout,
+            decode_responses=True,
+            health_check_interval=self.health_check_interval,
+            retry=Retry(ExponentialBackoff(cap=BACKOFF_CAP, base=BACKOFF_BASE), self.retries),
+            retry_on_error=[RedisConnectionError, RedisTimeoutError],
+        )
+
+    def client(self, host: str = "localhost", port: int = 6379) -> FalkorDB:
+        """Shared client for (host, port); raises if the server is unreachable."""
+        key = (host, int(port))
+        with self._lock:
+            db = self._clients.get(key)
+        if db is not None:
+            return db
+        # FalkorDB() talks to the server (INFO), so connect outside the lock
+        pool = self._make_pool(*key)
+        try:
+            db = FalkorDB(host=host, port=port, connection_pool=pool)
+        except Exception:
+            pool.disconnect()
+            raise
+        with self._lock:
+            if key in self._clients:
+                pool.disconnect()
+                return self._clients[key]
+            self._pools[key] = pool
+            self._clients[key] = db
+        logger.info(f"[GraphConnections] Pool for {host}:{port} (max {self.max_connections})")
+        return db
+
+    def graph(self, graph_name: str, host: str = "localhost", port: int = 6379):
+        """Shared graph handle for `graph_name` on (host, port)."""
+        key = (host, int(port), graph_name)
+        with self._lock:
+            handle = self._graphs.get(key)
+        if handle is not None:
+            return handle
+        handle = self.client(host, port).select_graph(graph_name)
+        with self._lock:
+            return self._graphs.setdefault(key, handle)
+
+    def ping(self, host: str = "localhost", port: int = 6379) -> bool:
+        """Health check: PING through the pool (retries and reconnects as queries do)."""
+        key = (host, int(port))
+        try:
+            self.client(host, port).connection.ping()
+        except Exception as exc:
+            with self._lock:
+                self._ping_failures[key] = self._ping_failures.get(key, 0) + 1
+            logger.warning(f"[GraphConnections] {host}:{port} unhealthy: {exc}")
+            return False
+        return True
+
+    def reset(self, host: Optional[str] = None, port: Optional[int] = None) -> None:
+        """Drop pooled connections (all pools, or one); the next query reconnects."""
+        with self._lock:
+            pools = [
+                pool for (h, p), pool in self._pools.items()
+                if host is None or (h == host and (port is None or p == int(port)))
+            ]
+        for pool in pools:
+            pool.disconnect()
+            pool.reset()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Pool metrics keyed by "host:port"."""
+        with self._lock:
+            items = list(self._pools.items())
+            graphs = [key for key in self._graphs]
+            ping_failures = dict(self._ping_failures)
+        result = {}
+        for (host, port), pool in items:
+            data = pool.stats()
+            data["graphs"] = sorted(name for h, p, name in graphs if (h, p) == (host, port))
+            data["ping_failures"] = ping_failures.get((host, port), 0)
+            result[f"{host}:{port}"] = data
+        return result
+
+    def close(self) -> None:
+        """Disconnect every pool and forget all clients and handles."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+            self._clients.clear()
+            self._graphs.clear()
+        for pool in pools:
+            pool.disconnect()
+
+
+_manager: Optional[ConnectionManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_connection_manager() -> ConnectionManager:
+    """The process-wide ConnectionManager."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = ConnectionManager()
+        return _manager
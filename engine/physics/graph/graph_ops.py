@@ -49,6 +49,7 @@ from engine.physics.graph.graph_ops_read_only_interface import (
     GraphReadOps,
     get_graph_reader,
 )
+from engine.physics.graph.graph_connections import get_connection_manager
 
 logger = logging.getLogger(__name__)
 
@@ -74,14 +75,20 @@ class GraphOps(MomentOperationsMixin, ApplyOperationsMixin, LinkCreationMixin):
         self,
         graph_name: str = "blood_ledger",
         host: str = "localhost",
-        port: int = 6379
+        port: int = 6379,
+        db: Optional[FalkorDB] = None,
     ):
         self.graph_name = graph_name
 
-        # Connect using FalkorDB client
+        # Connect through the caller's client, or the process-wide pooled one
         try:
-            self.db = FalkorDB(host=host, port=port)
-            self.graph = self.db.select_graph(graph_name)
+            if db is not None:
+                self.db = db
+                self.graph = db.select_graph(graph_name)
+            else:
+                connections = get_connection_manager()
+                self.db = connections.client(host, port)
+                self.graph = connections.graph(graph_name, host, port)
             logger.info(f"[GraphOps] Connected to {graph_name}")
         except Exception as e:
             raise WriteError(
@@ -98,6 +105,9 @@ Error: {e}"""
 
     def _query(self, cypher: str, params: Dict[str, Any] = None) -> List:
         """Execute a Cypher query."""
+        sink = self._query_sink()
+        if sink is not None:
+            return sink(cypher, params)
         try:
             result = self.graph.query(cypher, params or {})
             return result.result_set if result.result_set else []
@@ -629,6 +639,8 @@ Error: {e}"""
         SET n += $props
         """
         self._query(cypher, {"id": id, "props": props})
+        # Keeps presence indexes (moment_graph.presence_index) current
+        _emit_event("presence_changed", {"graph": self.graph_name, "moment_id": id})
 
         # Create SAID link if speaker (dialogue or player action)
         if speaker:
@@ -14,13 +14,24 @@ Docs:
 """
 
 import json
+import re
 import yaml
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, Callable, List, Optional, Set, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# (ops, recorder) while a bulk apply captures that instance's statements.
+# Context-local, so other threads sharing the instance still write directly.
+_CAPTURE: ContextVar[Optional[Tuple[Any, Callable[..., List]]]] = ContextVar(
+    "graph_ops_capture", default=None
+)
+
 
 class ApplyOperationsMixin:
     """
@@ -28,6 +39,7 @@ class ApplyOperationsMixin:
 
     This mixin handles:
     - Loading and applying mutation files (YAML/JSON)
+    - Bulk apply: validate up front, write grouped UNWIND queries
     - Extracting arguments from mutation dicts
     - Validating links and detecting orphaned nodes
     - Applying updates to nodes
@@ -39,7 +51,14 @@ class ApplyOperationsMixin:
     # APPLY METHOD (Main API)
     # =========================================================================
 
-    def apply(self, path: str = None, data: Dict = None, playthrough: str = "default"):
+    def apply(
+        self,
+        path: str = None,
+        data: Dict = None,
+        playthrough: str = "default",
+        bulk: bool = False,
+        embed: bool = False,
+    ):
         """
         Apply mutations from a YAML/JSON file or dict.
 
@@ -47,6 +66,10 @@ class ApplyOperationsMixin:
             path: Path to mutation file (YAML or JSON)
             data: Dict with mutations (alternative to file)
             playthrough: Playthrough folder name (for image generation)
+            bulk: Validate everything first, then write nodes and links
+                grouped by statement with UNWIND (for seeding and large batches)
+            embed: With bulk, embed nodes that have no embedding (one
+                embed_batch call) so they get a duplicate check too
 
         Returns:
             ApplyResult with persisted, rejected, and errors
@@ -130,6 +153,77 @@ class ApplyOperationsMixin:
 
         # Get existing node IDs for connectivity check
         existing_ids = self._get_existing_node_ids()
+
+        # 1-2. Nodes and links
+        if bulk:
+            new_node_ids, linked_ids = self._apply_bulk(data, result, existing_ids, embed)
+        else:
+            new_node_ids, linked_ids = self._apply_items(data, result, existing_ids)
+
+        # 3. Check for orphaned new nodes
+        orphaned = new_node_ids - linked_ids - existing_ids
+        if bulk:
+            has_links = self._nodes_with_links(orphaned)
+        else:
+            # Check if it links to existing nodes (not captured above)
+            has_links = {node_id for node_id in orphaned if self._node_has_links(node_id)}
+        for node_id in orphaned - has_links:
+            result.errors.append({
+                'item': node_id,
+                'message': f'{node_id} has no links (orphaned)',
+                'fix': 'Add at least one link connecting this node to the graph'
+            })
+
+        # 4. Process updates
+        for update in data.get('updates', []):
+            try:
+                if 'node' in update:
+                    self._apply_node_update(update)
+                    result.persisted.append(f"update:{update.get('node')}")
+            except WriteError as e:
+                result.errors.append({
+                    'item': str(update),
+                    'message': e.message,
+                    'fix': e.fix
+                })
+
+        # 5. Process movements
+        for move in data.get('movements', []):
+            try:
+                char_id = move.get('character')
+                to_place = move.get('to')
+                visible = move.get('visible', True)
+                self.move_character(char_id, to_place, 1.0 if visible else 0.0)
+                result.persisted.append(f"move:{char_id}->{to_place}")
+
+                # Emit movement event with ALL fields
+                _emit_event("movement", move)
+
+            except WriteError as e:
+                result.errors.append({
+                    'item': f"move:{move.get('character')}",
+                    'message': e.message,
+                    'fix': e.fix
+                })
+
+        # Emit apply_complete event
+        _emit_event("apply_complete", {
+            "source": path or "direct",
+            "persisted_count": len(result.persisted),
+            "rejected_count": len(result.rejected),
+            "error_count": len(result.errors),
+            "duplicate_count": len(result.duplicates),
+            "success": result.success
+        })
+
+        logger.info(f"[GraphOps] Applied: {len(result.persisted)} persisted, {len(result.rejected)} rejected")
+        return result
+
+    def _apply_items(self, data: Dict, result, existing_ids: Set[str]) -> Tuple[Set[str], Set[str]]:
+        """Write nodes, then links, one add_* call (and query) at a time."""
+        from engine.physics.graph.graph_ops_types import WriteError
+        from engine.physics.graph.graph_ops_events import emit_event as _emit_event
+
         new_node_ids: Set[str] = set()
         linked_ids: Set[str] = set()
 
@@ -139,13 +233,7 @@ class ApplyOperationsMixin:
             node_id = node.get('id')
             embedding = node.get('embedding')
 
-            if not node_type or not node_id:
-                result.errors.append({
-                    'item': str(node),
-                    'message': 'Node missing type or id',
-                    'fix': 'Every node needs: type (character/place/thing/narrative/moment) and id'
-                })
-                result.rejected.append(str(node))
+            if not self._check_node_fields(node, result):
                 continue
 
             # Check for duplicates if embedding provided
@@ -153,39 +241,17 @@ class ApplyOperationsMixin:
                 label = node_type.capitalize()
                 similar = self.check_duplicate(label, embedding)
                 if similar:
-                    result.duplicates.append({
-                        'new_node': node_id,
-                        'new_name': node.get('name', node_id),
-                        'similar_to': similar.id,
-                        'similar_name': similar.name,
-                        'similarity': similar.similarity,
-                        'action': 'skipped',
-                        'fix': f"Update existing node '{similar.id}' or use force=True to create anyway"
-                    })
-                    result.rejected.append(node_id)
+                    self._record_duplicate(node, similar, result)
                     continue
 
             new_node_ids.add(node_id)
 
             try:
-                if node_type == 'character':
-                    self.add_character(**self._extract_character_args(node))
-                elif node_type == 'place':
-                    self.add_place(**self._extract_place_args(node))
-                elif node_type == 'thing':
-                    self.add_thing(**self._extract_thing_args(node))
-                elif node_type == 'narrative':
-                    self.add_narrative(**self._extract_narrative_args(node))
-                elif node_type == 'moment':
-                    self.add_moment(**self._extract_moment_args(node))
-                else:
-                    result.errors.append({
-                        'item': node_id,
-                        'message': f'Invalid node type: {node_type}',
-                        'fix': 'Valid types: character, place, thing, narrative, moment'
-                    })
-                    result.rejected.append(node_id)
+                write = self._node_writer(node)
+                if write is None:
+                    self._reject_node_type(node, result)
                     continue
+                write()
 
                 result.persisted.append(node_id)
 
@@ -193,177 +259,22 @@ class ApplyOperationsMixin:
                 _emit_event("node_created", node)
 
             except WriteError as e:
-                result.errors.append({
-                    'item': node_id,
-                    'message': e.message,
-                    'fix': e.fix
-                })
-                result.rejected.append(node_id)
-
-                # Emit error event
-                _emit_event("node_error", {
-                    "id": node_id,
-                    "type": node_type,
-                    "error": e.message
-                })
+                self._record_node_error(node, e, result)
 
         # 2. Process links
         for link in data.get('links', []):
-            link_type = link.get('type')
             link_id = self._link_id(link)
 
             try:
-                if link_type == 'belief':
-                    char_id = link.get('character')
-                    narr_id = link.get('narrative')
-                    self._validate_link_targets(char_id, narr_id, existing_ids, new_node_ids)
-                    linked_ids.add(char_id)
-                    linked_ids.add(narr_id)
-                    self.add_belief(**self._extract_belief_args(link))
-
-                elif link_type == 'present':
-                    char_id = link.get('from')
-                    place_id = link.get('to')
-                    self._validate_link_targets(char_id, place_id, existing_ids, new_node_ids)
-                    linked_ids.add(char_id)
-                    linked_ids.add(place_id)
-                    self.add_presence(**self._extract_presence_args(link))
-
-                elif link_type in ('carries', 'carries_hidden'):
-                    char_id = link.get('from')
-                    thing_id = link.get('to')
-                    self._validate_link_targets(char_id, thing_id, existing_ids, new_node_ids)
-                    linked_ids.add(char_id)
-                    linked_ids.add(thing_id)
-                    self.add_possession(**self._extract_possession_args(link))
-
-                elif link_type == 'geography':
-                    from_id = link.get('from')
-                    to_id = link.get('to')
-                    self._validate_link_targets(from_id, to_id, existing_ids, new_node_ids)
-                    linked_ids.add(from_id)
-                    linked_ids.add(to_id)
-                    self.add_geography(**self._extract_geography_args(link))
-
-                elif link_type == 'narrative_link':
-                    from_id = link.get('from')
-                    to_id = link.get('to')
-                    self._validate_link_targets(from_id, to_id, existing_ids, new_node_ids)
-                    linked_ids.add(from_id)
-                    linked_ids.add(to_id)
-                    self.add_narrative_link(**self._extract_narrative_link_args(link))
-
-                elif link_type == 'located':
-                    thing_id = link.get('from')
-                    place_id = link.get('to')
-                    self._validate_link_targets(thing_id, place_id, existing_ids, new_node_ids)
-                    linked_ids.add(thing_id)
-                    linked_ids.add(place_id)
-                    self.add_thing_location(**self._extract_thing_location_args(link))
-
-                elif link_type == 'said':
-                    char_id = link.get('character')
-                    moment_id = link.get('moment')
-                    self._validate_link_targets(char_id, moment_id, existing_ids, new_node_ids)
-                    linked_ids.add(char_id)
-                    linked_ids.add(moment_id)
-                    self.add_said(char_id, moment_id)
-
-                elif link_type == 'moment_at':
-                    moment_id = link.get('moment')
-                    place_id = link.get('place')
-                    self._validate_link_targets(moment_id, place_id, existing_ids, new_node_ids)
-                    linked_ids.add(moment_id)
-                    linked_ids.add(place_id)
-                    self.add_moment_at(moment_id, place_id)
-
-                elif link_type == 'moment_then':
-                    from_id = link.get('from')
-                    to_id = link.get('to')
-                    self._validate_link_targets(from_id, to_id, existing_ids, new_node_ids)
-                    linked_ids.add(from_id)
-                    linked_ids.add(to_id)
-                    self.add_moment_then(from_id, to_id)
-
-                elif link_type == 'narrative_from':
-                    narr_id = link.get('narrative')
-                    moment_id = link.get('moment')
-                    self._validate_link_targets(narr_id, moment_id, existing_ids, new_node_ids)
-                    linked_ids.add(narr_id)
-                    linked_ids.add(moment_id)
-                    self.add_narrative_from_moment(narr_id, moment_id)
-
-                elif link_type == 'can_speak':
-                    char_id = link.get('character')
-                    moment_id = link.get('moment')
-                    self._validate_link_targets(char_id, moment_id, existing_ids, new_node_ids)
-                    linked_ids.add(char_id)
-                    linked_ids.add(moment_id)
-                    self.add_can_speak(
-                        char_id,
-                        moment_id,
-                        weight=link.get('weight', 1.0)
-                    )
-
-                elif link_type == 'attached_to':
-                    moment_id = link.get('moment')
-                    target_id = link.get('target')
-                    self._validate_link_targets(moment_id, target_id, existing_ids, new_node_ids)
-                    linked_ids.add(moment_id)
-                    linked_ids.add(target_id)
-                    self.add_attached_to(
-                        moment_id,
-                        target_id,
-                        presence_required=link.get('presence_required', False),
-                        persistent=link.get('persistent', True),
-                        dies_with_target=link.get('dies_with_target', False)
-                    )
-
-                elif link_type == 'can_lead_to':
-                    from_id = link.get('from')
-                    to_id = link.get('to')
-                    self._validate_link_targets(from_id, to_id, existing_ids, new_node_ids)
-                    linked_ids.add(from_id)
-                    linked_ids.add(to_id)
-                    self.add_can_lead_to(
-                        from_id,
-                        to_id,
-                        trigger=link.get('trigger', 'player'),
-                        weight_transfer=link.get('weight_transfer', 0.3),
-                        require_words=link.get('require_words'),
-                        bidirectional=link.get('bidirectional', False),
-                        wait_ticks=link.get('wait_ticks'),
-                        consumes_origin=link.get('consumes_origin', True)
-                    )
-
-                elif link_type == 'contains':
-                    parent_id = link.get('from') or link.get('parent')
-                    child_id = link.get('to') or link.get('child')
-                    self._validate_link_targets(parent_id, child_id, existing_ids, new_node_ids)
-                    linked_ids.add(parent_id)
-                    linked_ids.add(child_id)
-                    self.add_contains(parent_id, child_id)
-
-                elif link_type == 'about':
-                    moment_id = link.get('from') or link.get('moment')
-                    target_id = link.get('to') or link.get('target')
-                    self._validate_link_targets(moment_id, target_id, existing_ids, new_node_ids)
-                    linked_ids.add(moment_id)
-                    linked_ids.add(target_id)
-                    self.add_about(
-                        moment_id,
-                        target_id,
-                        weight=link.get('weight', 0.5)
-                    )
-
-                else:
-                    result.errors.append({
-                        'item': link_id,
-                        'message': f'Invalid link type: {link_type}',
-                        'fix': 'Valid types: belief, present, carries, carries_hidden, located, geography, narrative_link, said, moment_at, moment_then, narrative_from, can_speak, attached_to, can_lead_to, contains, about'
-                    })
-                    result.rejected.append(link_id)
+                writer = self._link_writer(link)
+                if writer is None:
+                    self._reject_link_type(link, result)
                     continue
+                from_id, to_id, write = writer
+                self._validate_link_targets(from_id, to_id, existing_ids, new_node_ids)
+                linked_ids.add(from_id)
+                linked_ids.add(to_id)
+                write()
 
                 result.persisted.append(link_id)
 
@@ -371,75 +282,99 @@ class ApplyOperationsMixin:
                 _emit_event("link_created", {**link, "_link_id": link_id})
 
             except WriteError as e:
-                result.errors.append({
-                    'item': link_id,
-                    'message': e.message,
-                    'fix': e.fix
-                })
-                result.rejected.append(link_id)
+                self._record_link_error(link, e, result)
 
-                # Emit error event
-                _emit_event("link_error", {
-                    "id": link_id,
-                    "type": link_type,
-                    "error": e.message
-                })
+        return new_node_ids, linked_ids
 
-        # 3. Check for orphaned new nodes
-        orphaned = new_node_ids - linked_ids - existing_ids
-        for node_id in orphaned:
-            # Check if it links to existing nodes (not captured above)
-            if not self._node_has_links(node_id):
-                result.errors.append({
-                    'item': node_id,
-                    'message': f'{node_id} has no links (orphaned)',
-                    'fix': 'Add at least one link connecting this node to the graph'
-                })
+    def _query_sink(self) -> Optional[Callable[..., List]]:
+        """Recorder for this instance's statements during a bulk capture, else None."""
+        capture = _CAPTURE.get()
+        return capture[1] if capture is not None and capture[0] is self else None
 
-        # 4. Process updates
-        for update in data.get('updates', []):
-            try:
-                if 'node' in update:
-                    self._apply_node_update(update)
-                    result.persisted.append(f"update:{update.get('node')}")
-            except WriteError as e:
-                result.errors.append({
-                    'item': str(update),
-                    'message': e.message,
-                    'fix': e.fix
-                })
+    def _apply_bulk(self, data: Dict, result, existing_ids: Set[str], embed: bool) -> Tuple[Set[str], Set[str]]:
+        """
+        Validate every node and link, then write them in grouped UNWIND queries.
 
-        # 5. Process movements
-        for move in data.get('movements', []):
-            try:
-                char_id = move.get('character')
-                to_place = move.get('to')
-                visible = move.get('visible', True)
-                self.move_character(char_id, to_place, 1.0 if visible else 0.0)
-                result.persisted.append(f"move:{char_id}->{to_place}")
+        The add_* methods run as usual but their statements are captured
+        instead of executed. Node MERGEs are written first, then everything
+        that MATCHes (links), each distinct statement as one UNWIND per
+        BULK_CHUNK rows. A failed chunk is replayed row by row so errors
+        stay attached to the item that caused them.
+        """
+        from engine.physics.graph.graph_ops_types import WriteError
+        from engine.physics.graph.graph_ops_events import emit_event as _emit_event
 
-                # Emit movement event with ALL fields
-                _emit_event("movement", move)
+        nodes = [dict(node) for node in data.get('nodes', [])]
+        if embed:
+            self._embed_missing(nodes)
+
+        new_node_ids: Set[str] = set()
+        linked_ids: Set[str] = set()
+        batch = _WriteBatch()
+        accepted: List[Tuple[str, Dict]] = []  # (item id, event payload) in input order
+        duplicates = _DuplicateIndex(self)
 
+        # 1. Validate and capture nodes
+        for node in nodes:
+            if not self._check_node_fields(node, result):
+                continue
+            node_id = node['id']
+            embedding = node.get('embedding')
+            if embedding:
+                similar = duplicates.check(node['type'].capitalize(), node_id, node.get('name', node_id), embedding)
+                if similar:
+                    self._record_duplicate(node, similar, result)
+                    continue
+            new_node_ids.add(node_id)
+            write = self._node_writer(node)
+            if write is None:
+                self._reject_node_type(node, result)
+                continue
+            try:
+                with batch.capture(self, node_id):
+                    write()
             except WriteError as e:
-                result.errors.append({
-                    'item': f"move:{move.get('character')}",
-                    'message': e.message,
-                    'fix': e.fix
-                })
+                self._record_node_error(node, e, result)
+                continue
+            accepted.append((node_id, ("node_created", node)))
 
-        # Emit apply_complete event
-        _emit_event("apply_complete", {
-            "source": path or "direct",
-            "persisted_count": len(result.persisted),
-            "rejected_count": len(result.rejected),
-            "error_count": len(result.errors),
-            "duplicate_count": len(result.duplicates),
-            "success": result.success
-        })
+        # 2. Validate and capture links
+        for link in data.get('links', []):
+            link_id = self._link_id(link)
+            writer = self._link_writer(link)
+            if writer is None:
+                self._reject_link_type(link, result)
+                continue
+            from_id, to_id, write = writer
+            try:
+                self._validate_link_targets(from_id, to_id, existing_ids, new_node_ids)
+                with batch.capture(self, link_id):
+                    write()
+            except WriteError as e:
+                self._record_link_error(link, e, result)
+                continue
+            linked_ids.add(from_id)
+            linked_ids.add(to_id)
+            accepted.append((link_id, ("link_created", {**link, "_link_id": link_id})))
+
+        # 3. Write
+        failed = batch.flush(self._query)
+
+        for item_id, (event, payload) in accepted:
+            if item_id in failed:
+                error = failed[item_id]
+                if event == "node_created":
+                    self._record_node_error(payload, error, result)
+                else:
+                    self._record_link_error(payload, error, result)
+                continue
+            result.persisted.append(item_id)
+            _emit_event(event, payload)
 
-        logger.info(f"[GraphOps] Applied: {len(result.persisted)} persisted, {len(result.rejected)} rejected")
-        return result
+        logger.info(
+            f"[GraphOps] Bulk apply: {len(accepted)} items in {batch.query_count} queries"
+        )
+        return new_node_ids, linked_ids
 
     # =========================================================================
     # APPLY HELPERS
@@ -516,6 +451,211 @@ class ApplyOperationsMixin:
         else:
             return f"link:{link_type}"
 
+    # =========================================================================
+    # ITEM DISPATCH AND REPORTING
+    # =========================================================================
+
+    def _node_writer(self, node: Dict) -> Optional[Callable[[], Any]]:
+        """The add_* call for a node, or None for an unknown type."""
+        node_type = node.get('type')
+        if node_type == 'character':
+            return lambda: self.add_character(**self._extract_character_args(node))
+        if node_type == 'place':
+            return lambda: self.add_place(**self._extract_place_args(node))
+        if node_type == 'thing':
+            return lambda: self.add_thing(**self._extract_thing_args(node))
+        if node_type == 'narrative':
+            return lambda: self.add_narrative(**self._extract_narrative_args(node))
+        if node_type == 'moment':
+            return lambda: self.add_moment(**self._extract_moment_args(node))
+        return None
+
+    def _link_writer(self, link: Dict) -> Optional[Tuple[str, str, Callable[[], Any]]]:
+        """(endpoint, endpoint, add_* call) for a link, or None for an unknown type."""
+        link_type = link.get('type')
+        if link_type == 'belief':
+            return (link.get('character'), link.get('narrative'),
+                    lambda: self.add_belief(**self._extract_belief_args(link)))
+        if link_type == 'present':
+            return (link.get('from'), link.get('to'),
+                    lambda: self.add_presence(**self._extract_presence_args(link)))
+        if link_type in ('carries', 'carries_hidden'):
+            return (link.get('from'), link.get('to'),
+                    lambda: self.add_possession(**self._extract_possession_args(link)))
+        if link_type == 'geography':
+            return (link.get('from'), link.get('to'),
+                    lambda: self.add_geography(**self._extract_geography_args(link)))
+        if link_type == 'narrative_link':
+            return (link.get('from'), link.get('to'),
+                    lambda: self.add_narrative_link(**self._extract_narrative_link_args(link)))
+        if link_type == 'located':
+            return (link.get('from'), link.get('to'),
+                    lambda: self.add_thing_location(**self._extract_thing_location_args(link)))
+        if link_type == 'said':
+            char_id, moment_id = link.get('character'), link.get('moment')
+            return char_id, moment_id, lambda: self.add_said(char_id, moment_id)
+        if link_type == 'moment_at':
+            moment_id, place_id = link.get('moment'), link.get('place')
+            return moment_id, place_id, lambda: self.add_moment_at(moment_id, place_id)
+        if link_type == 'moment_then':
+            from_id, to_id = link.get('from'), link.get('to')
+            return from_id, to_id, lambda: self.add_moment_then(from_id, to_id)
+        if link_type == 'narrative_from':
+            narr_id, moment_id = link.get('narrative'), link.get('moment')
+            return narr_id, moment_id, lambda: self.add_narrative_from_moment(narr_id, moment_id)
+        if link_type == 'can_speak':
+            char_id, moment_id = link.get('character'), link.get('moment')
+            return char_id, moment_id, lambda: self.add_can_speak(
+                char_id,
+                moment_id,
+                weight=link.get('weight', 1.0)
+            )
+        if link_type == 'attached_to':
+            moment_id, target_id = link.get('moment'), link.get('target')
+            return moment_id, target_id, lambda: self.add_attached_to(
+                moment_id,
+                target_id,
+                presence_required=link.get('presence_required', False),
+                persistent=link.get('persistent', True),
+                dies_with_target=link.get('dies_with_target', False)
+            )
+        if link_type == 'can_lead_to':
+            from_id, to_id = link.get('from'), link.get('to')
+            return from_id, to_id, lambda: self.add_can_lead_to(
+                from_id,
+                to_id,
+                trigger=link.get('trigger', 'player'),
+                weight_transfer=link.get('weight_transfer', 0.3),
+                require_words=link.get('require_words'),
+                bidirectional=link.get('bidirectional', False),
+                wait_ticks=link.get('wait_ticks'),
+                consumes_origin=link.get('consumes_origin', True)
+            )
+        if link_type == 'contains':
+            parent_id = link.get('from') or link.get('parent')
+            child_id = link.get('to') or link.get('child')
+            return parent_id, child_id, lambda: self.add_contains(parent_id, child_id)
+        if link_type == 'about':
+            moment_id = link.get('from') or link.get('moment')
+            target_id = link.get('to') or link.get('target')
+            return moment_id, target_id, lambda: self.add_about(
+                moment_id,
+                target_id,
+                weight=link.get('weight', 0.5)
+            )
+        return None
+
+    def _check_node_fields(self, node: Dict, result) -> bool:
+        if node.get('type') and node.get('id'):
+            return True
+        result.errors.append({
+            'item': str(node),
+            'message': 'Node missing type or id',
+            'fix': 'Every node needs: type (character/place/thing/narrative/moment) and id'
+        })
+        result.rejected.append(str(node))
+        return False
+
+    def _record_duplicate(self, node: Dict, similar, result) -> None:
+        node_id = node['id']
+        result.duplicates.append({
+            'new_node': node_id,
+            'new_name': node.get('name', node_id),
+            'similar_to': similar.id,
+            'similar_name': similar.name,
+            'similarity': similar.similarity,
+            'action': 'skipped',
+            'fix': f"Update existing node '{similar.id}' or use force=True to create anyway"
+        })
+        result.rejected.append(node_id)
+
+    def _reject_node_type(self, node: Dict, result) -> None:
+        result.errors.append({
+            'item': node['id'],
+            'message': f"Invalid node type: {node.get('type')}",
+            'fix': 'Valid types: character, place, thing, narrative, moment'
+        })
+        result.rejected.append(node['id'])
+
+    def _reject_link_type(self, link: Dict, result) -> None:
+        link_id = self._link_id(link)
+        result.errors.append({
+            'item': link_id,
+            'message': f"Invalid link type: {link.get('type')}",
+            'fix': 'Valid types: belief, present, carries, carries_hidden, located, geography, narrative_link, said, moment_at, moment_then, narrative_from, can_speak, attached_to, can_lead_to, contains, about'
+        })
+        result.rejected.append(link_id)
+
+    def _record_node_error(self, node: Dict, error, result) -> None:
+        from engine.physics.graph.graph_ops_events import emit_event as _emit_event
+
+        result.errors.append({
+            'item': node['id'],
+            'message': error.message,
+            'fix': error.fix
+        })
+        result.rejected.append(node['id'])
+
+        # Emit error event
+        _emit_event("node_error", {
+            "id": node['id'],
+            "type": node.get('type'),
+            "error": error.message
+        })
+
+    def _record_link_error(self, link: Dict, error, result) -> None:
+        from engine.physics.graph.graph_ops_events import emit_event as _emit_event
+
+        link_id = link.get('_link_id') or self._link_id(link)
+        result.errors.append({
+            'item': link_id,
+            'message': error.message,
+            'fix': error.fix
+        })
+        result.rejected.append(link_id)
+
+        # Emit error event
+        _emit_event("link_error", {
+            "id": link_id,
+            "type": link.get('type'),
+            "error": error.message
+        })
+
+    # =========================================================================
+    # BULK HELPERS
+    # =========================================================================
+
+    def _embed_missing(self, nodes: List[Dict]) -> None:
+        """Fill in `embedding` for nodes without one, in one embed_batch call."""
+        from engine.infrastructure.embeddings.service import get_embedding_service
+
+        missing = [node for node in nodes if node.get('type') and node.get('id') and not node.get('embedding')]
+        if not missing:
+            return
+        try:
+            service = get_embedding_service()
+            vectors = service.embed_batch([service.node_text(node) for node in missing])
+        except Exception as e:
+            logger.warning(f"[GraphOps] Bulk embedding failed, skipping duplicate checks: {e}")
+            return
+        for node, vector in zip(missing, vectors):
+            node['embedding'] = vector
+
+    def _nodes_with_links(self, node_ids: Set[str]) -> Set[str]:
+        """Which of `node_ids` have at least one link (one query)."""
+        if not node_ids:
+            return set()
+        cypher = """
+        UNWIND $ids AS id
+        MATCH (n {id: id})-[]-()
+        RETURN DISTINCT n.id
+        """
+        try:
+            rows = self._query(cypher, {"ids": sorted(node_ids)})
+            return {row[0] for row in rows}
+        except Exception:
+            return set()
+
     # =========================================================================
     # EXTRACTION HELPERS
     # =========================================================================
@@ -570,8 +710,8 @@ class ApplyOperationsMixin:
             'content': node.get('content', ''),
             'type': node.get('narrative_type', node.get('type', 'memory')),
             'interpretation': node.get('interpretation'),
-            'about_characters': about.get('characters') or node.get('about_characters'),
-            'about_places': about.get('places') or node.get('about_places'),
+            'about_actors': about.get('characters') or node.get('about_characters'),
+            'about_spaces': about.get('places') or node.get('about_places'),
             'about_things': about.get('things') or node.get('about_things'),
             'about_relationship': about.get('relationship') or node.get('about_relationship'),
             'tone': node.get('tone'),
@@ -683,3 +823,146 @@ class ApplyOperationsMixin:
             # TODO: Proper modifier handling
 
         # Add other update types as needed
+
+
+# =============================================================================
+# BULK WRITE BATCH
+# =============================================================================
+
+# Rows per UNWIND query
+BULK_CHUNK = 500
+
+_PARAM = re.compile(r"\$(\w+)")
+
+
+def _unwind(cypher: str) -> str:
+    """Rewrite a single-row statement to run once per element of $rows."""
+    return "UNWIND $rows AS row\n" + _PARAM.sub(r"row.\1", cypher.strip())
+
+
+class _WriteBatch:
+    """
+    Statements captured from add_* calls, grouped by Cypher text.
+
+    Each captured (cypher, params) row remembers the item (node or link id)
+    that produced it, so a failed write can be reported against that item.
+    """
+
+    def __init__(self):
+        self.groups: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+        self.query_count = 0
+
+    @contextmanager
+    def capture(self, ops, item_id: str):
+        """Record this context's ops._query calls instead of running them (add_* don't read)."""
+        rows: List[Tuple[str, Dict[str, Any]]] = []
+
+        def record(cypher: str, params: Dict[str, Any] = None) -> List:
+            rows.append((cypher, dict(params or {})))
+            return []
+
+        token = _CAPTURE.set((ops, record))
+        try:
+            yield
+        finally:
+            _CAPTURE.reset(token)
+        # Only a fully captured item is written
+        for cypher, params in rows:
+            self.groups.setdefault(cypher, []).append((item_id, params))
+
+    def _ordered(self) -> List[str]:
+        # Node MERGEs before anything that MATCHes them; otherwise first-seen order
+        statements = list(self.groups)
+        return [s for s in statements if "MATCH" not in s] + [s for s in statements if "MATCH" in s]
+
+    def flush(self, query: Callable[..., List]) -> Dict[str, Any]:
+        """Run every group; returns {item_id: WriteError} for rows that failed."""
+        from engine.physics.graph.graph_ops_types import WriteError
+
+        failed: Dict[str, Any] = {}
+        for cypher in self._ordered():
+            rows = self.groups[cypher]
+            unwind = _unwind(cypher)
+            for start in range(0, len(rows), BULK_CHUNK):
+                chunk = rows[start:start + BULK_CHUNK]
+                try:
+                    self.query_count += 1
+                    query(unwind, {"rows": [params for _, params in chunk]})
+                    continue
+                except WriteError:
+                    pass
+                # Find the rows that failed
+                for item_id, params in chunk:
+                    if item_id in failed:
+                        continue
+                    try:
+                        self.query_count += 1
+                        query(cypher, params)
+                    except WriteError as e:
+                        failed[item_id] = e
+        self.groups.clear()
+        return failed
+
+
+class _DuplicateIndex:
+    """
+    Embedding duplicate check for a bulk apply.
+
+    Loads each label's stored embeddings once (instead of one scan per
+    node) and also compares against nodes accepted earlier in the batch,
+    which the per-item path sees because they were already written.
+    """
+
+    def __init__(self, ops):
+        self.ops = ops
+        self._ids: Dict[str, List[Tuple[str, str]]] = {}
+        self._vectors: Dict[str, List[np.ndarray]] = {}
+
+    def _load(self, label: str) -> None:
+        self._ids[label] = []
+        self._vectors[label] = []
+        cypher = f"""
+        MATCH (n:{label})
+        WHERE n.embedding IS NOT NULL
+        RETURN n.id, n.name, n.embedding
+        """
+        try:
+            rows = self.ops._query(cypher)
+        except Exception as e:
+            logger.warning(f"Error finding similar nodes: {e}")
+            return
+        for row in rows or []:
+            if len(row) >= 3 and row[2]:
+                vector = json.loads(row[2]) if isinstance(row[2], str) else row[2]
+                self._add(label, row[0], row[1], vector)
+
+    def _add(self, label: str, node_id: str, name: str, vector) -> None:
+        v = np.asarray(vector, dtype=float)
+        norm = np.linalg.norm(v)
+        self._ids[label].append((node_id, name))
+        self._vectors[label].append(v / norm if norm else v)
+
+    def check(self, label: str, node_id: str, name: str, embedding, threshold: float = None):
+        """Most similar node above threshold, else None (and remember this one)."""
+        from engine.physics.graph.graph_ops_types import SimilarNode, SIMILARITY_THRESHOLD
+
+        threshold = SIMILARITY_THRESHOLD if threshold is None else threshold
+        if label not in self._ids:
+            self._load(label)
+        vector = np.asarray(embedding, dtype=float)
+        norm = np.linalg.norm(vector)
+        best = None
+        if norm and self._vectors[label]:
+            sims = np.stack(self._vectors[label]) @ (vector / norm)
+            idx = int(np.argmax(sims))
+            if sims[idx] >= threshold:
+                best_id, best_name = self._ids[label][idx]
+                best = SimilarNode(
+                    id=best_id,
+                    name=best_name,
+                    node_type=label.lower(),
+                    similarity=float(sims[idx])
+                )
+        if best is None:
+            self._add(label, node_id, name, embedding)
+        return best
@@ -13,7 +13,8 @@ Usage:
 
 Listeners receive events with:
 - type: 'node_created', 'node_updated', 'link_created', 'link_updated',
-        'movement', 'apply_start', 'apply_complete', 'apply_error'
+        'movement', 'apply_start', 'apply_complete', 'apply_error',
+        'presence_changed' (add_moment / add_attached_to, with the graph name)
 - timestamp: ISO timestamp
 - data: Event-specific data
 """
@@ -36,7 +37,8 @@ def add_mutation_listener(callback: Callable[[Dict[str, Any]], None]) -> None:
 
     The callback receives a dict with:
         - type: 'node_created', 'node_updated', 'link_created', 'link_updated',
-                'movement', 'apply_start', 'apply_complete', 'apply_error'
+                'movement', 'apply_start', 'apply_complete', 'apply_error',
+                'presence_changed'
         - timestamp: ISO timestamp
         - data: Event-specific data
     """
@@ -17,6 +17,8 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, List
 
+from engine.physics.graph.graph_ops_events import emit_event
+
 logger = logging.getLogger(__name__)
 
 
@@ -189,6 +191,12 @@ class LinkCreationMixin:
             "persistent": persistent,
             "dies_with_target": dies_with_target
         })
+        emit_event("presence_changed", {
+            "graph": self.graph_name,
+            "moment_id": moment_id,
+            "target_id": target_id,
+            "presence_required": presence_required
+        })
         logger.debug(f"[GraphOps] Added attached_to: {moment_id} -> {target_id}")
 
     def add_can_lead_to(
@@ -32,6 +32,7 @@ import logging
 from typing import Dict, Any, List, Optional
 from falkordb import FalkorDB
 
+from engine.physics.graph.graph_connections import get_connection_manager
 from engine.physics.graph.graph_query_utils import (
     SYSTEM_FIELDS,
     view_to_scene_tree,
@@ -67,11 +68,13 @@ class GraphQueries(MomentQueryMixin, SearchQueryMixin):
         self,
         graph_name: str = "blood_ledger",
         host: str = "localhost",
-        port: int = 6379
+        port: int = 6379,
+        db: Optional[FalkorDB] = None,
     ):
         self.graph_name = graph_name
         self.host = host
         self.port = port
+        self.db = db
         self._connect()
 
     ENERGY_BOOST_PER_READ = 0.05
@@ -96,10 +99,14 @@ class GraphQueries(MomentQueryMixin, SearchQueryMixin):
             logger.debug("[GraphQueries] Energy injection failed (%s:%s): %s", label, node_id, exc.message)
 
     def _connect(self):
-        """Connect to FalkorDB."""
+        """Connect to FalkorDB (reusing a client passed as `db`, else the shared pool)."""
         try:
-            self.db = FalkorDB(host=self.host, port=self.port)
-            self.graph = self.db.select_graph(self.graph_name)
+            if self.db is not None:
+                self.graph = self.db.select_graph(self.graph_name)
+            else:
+                connections = get_connection_manager()
+                self.db = connections.client(self.host, self.port)
+                self.graph = connections.graph(self.graph_name, self.host, self.port)
             logger.info(f"[GraphQueries] Connected to {self.graph_name}")
         except Exception as e:
             raise QueryError(
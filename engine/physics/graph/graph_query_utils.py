@@ -248,6 +248,43 @@ def calculate_link_resistance(
     return 1.0 / product
 
 
+def resistance_graph(edges: List[Dict[str, Any]]) -> Dict[str, List[tuple]]:
+    """
+    Bidirectional adjacency {node: [(neighbor, resistance), ...]} for Dijkstra.
+
+    Edges are dicts as taken by dijkstra_with_resistance. Callers that search
+    the same edges many times build this once and keep it current with
+    add_resistance_edge.
+    """
+    graph: Dict[str, List[tuple]] = {}
+    for edge in edges:
+        add_resistance_edge(graph, edge)
+    return graph
+
+
+def add_resistance_edge(graph: Dict[str, List[tuple]], edge: Dict[str, Any]) -> None:
+    """Add one edge, both directions, to a resistance_graph adjacency."""
+    node_a = edge.get('node_a')
+    node_b = edge.get('node_b')
+    conductivity = edge.get('conductivity', 1.0)
+    weight = edge.get('weight', 1.0)
+    emotion_factor = edge.get('emotion_factor', 1.0)
+
+    if not node_a or not node_b:
+        return
+
+    resistance = calculate_link_resistance(conductivity, weight, emotion_factor)
+
+    # Bidirectional
+    if node_a not in graph:
+        graph[node_a] = []
+    if node_b not in graph:
+        graph[node_b] = []
+
+    graph[node_a].append((node_b, resistance))
+    graph[node_b].append((node_a, resistance))
+
+
 def dijkstra_with_resistance(
     edges: List[Dict[str, Any]],
     start: str,
@@ -275,30 +312,35 @@ def dijkstra_with_resistance(
             - hops: Number of edges traversed
         Or None if no path found within max_hops
     """
-    import heapq
+    return _dijkstra(resistance_graph(edges), start, end, max_hops)
 
-    # Build adjacency list with resistances
-    graph: Dict[str, List[tuple]] = {}
-    for edge in edges:
-        node_a = edge.get('node_a')
-        node_b = edge.get('node_b')
-        conductivity = edge.get('conductivity', 1.0)
-        weight = edge.get('weight', 1.0)
-        emotion_factor = edge.get('emotion_factor', 1.0)
 
-        if not node_a or not node_b:
-            continue
+def shortest_resistances(
+    graph: Dict[str, List[tuple]],
+    start: str,
+    max_hops: int = 5
+) -> Dict[str, float]:
+    """
+    Total resistance from start to every node reachable within max_hops.
 
-        resistance = calculate_link_resistance(conductivity, weight, emotion_factor)
+    One search over a resistance_graph adjacency. Each value equals the
+    total_resistance dijkstra_with_resistance returns for that end node:
+    the search expands nodes in the same order and a node's value is fixed
+    when it is first popped.
+    """
+    resistances: Dict[str, float] = {}
+    _dijkstra(graph, start, None, max_hops, resistances)
+    return resistances
 
-        # Bidirectional
-        if node_a not in graph:
-            graph[node_a] = []
-        if node_b not in graph:
-            graph[node_b] = []
 
-        graph[node_a].append((node_b, resistance))
-        graph[node_b].append((node_a, resistance))
+def _dijkstra(
+    graph: Dict[str, List[tuple]],
+    start: str,
+    end: Optional[str],
+    max_hops: int,
+    settled: Optional[Dict[str, float]] = None
+) -> Optional[Dict[str, Any]]:
+    import heapq
 
     if start not in graph:
         return None
@@ -321,6 +363,8 @@ def dijkstra_with_resistance(
         if node in visited:
             continue
         visited.add(node)
+        if settled is not None:
+            settled[node] = resistance
 
         if hops >= max_hops:
             continue
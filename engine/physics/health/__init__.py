@@ -9,15 +9,18 @@ DOCS: docs/physics/HEALTH_Energy_Physics.md
 from .checker import (
     HealthStatus,
     HealthResult,
+    HealthRunner,
     run_all_checks,
     run_check,
 )
-from .base import BaseChecker
+from .base import BaseChecker, IncrementalChecker
 
 __all__ = [
     "HealthStatus",
     "HealthResult",
+    "HealthRunner",
     "run_all_checks",
     "run_check",
     "BaseChecker",
+    "IncrementalChecker",
 ]
@@ -11,7 +11,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +57,8 @@ class BaseChecker(ABC):
     name: str = "base"
     validation_ids: List[str] = []
     priority: str = "med"  # high, med, low
+    # False for checkers that only read recorded instrumentation
+    uses_graph: bool = True
 
     def __init__(self, graph_queries=None, graph_ops=None):
         """
@@ -68,6 +70,8 @@ class BaseChecker(ABC):
         """
         self.read = graph_queries
         self.write = graph_ops
+        # Shared aggregates for one run (snapshot.GraphSnapshot), set by the runner
+        self.snapshot = None
 
     @abstractmethod
     def check(self) -> HealthResult:
@@ -118,3 +122,68 @@ class BaseChecker(ABC):
             details=details or {},
             validation_ids=self.validation_ids,
         )
+
+
+class IncrementalChecker(BaseChecker):
+    """
+    Checker that keeps running aggregates from tick deltas.
+
+    The first check() scans the graph (`_scan`) and keeps the result as
+    state. Each `apply_delta(delta)` (a tick_delta.TickDelta) updates that
+    state in place (`_apply`), and check() evaluates it without touching
+    the graph. Every `full_scan_every` applied deltas the graph is scanned
+    again; the difference between the running state and the scan is
+    reported as `drift` in the result details.
+
+    Without deltas every check() is a full scan, as for BaseChecker.
+    """
+
+    full_scan_every: int = 50
+
+    def __init__(self, graph_queries=None, graph_ops=None, full_scan_every: Optional[int] = None):
+        super().__init__(graph_queries, graph_ops)
+        if full_scan_every is not None:
+            self.full_scan_every = full_scan_every
+        self._state: Optional[Dict[str, Any]] = None
+        self._deltas_since_scan = 0
+        self.full_scans = 0
+
+    def apply_delta(self, delta) -> None:
+        """Fold one tick's changes into the running state."""
+        if self._state is None:
+            return  # nothing to update until the first scan
+        self._apply(self._state, delta)
+        self._deltas_since_scan += 1
+
+    def _current_state(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Running state if fresh enough, else a full scan. Returns (state, source info)."""
+        if self._state is not None and 0 < self._deltas_since_scan < self.full_scan_every:
+            return self._state, {"source": "incremental", "ticks_since_scan": self._deltas_since_scan}
+
+        scanned = self._scan()
+        info: Dict[str, Any] = {"source": "full_scan"}
+        if self._state is not None and self._deltas_since_scan:
+            info["drift"] = self._drift(self._state, scanned)
+        self._state = scanned
+        self._deltas_since_scan = 0
+        self.full_scans += 1
+        return scanned, info
+
+    @abstractmethod
+    def _scan(self) -> Dict[str, Any]:
+        """Aggregate state from the graph."""
+
+    @abstractmethod
+    def _apply(self, state: Dict[str, Any], delta) -> None:
+        """Update state in place with one tick's delta."""
+
+    def _drift(self, running: Dict[str, Any], scanned: Dict[str, Any]) -> Dict[str, Any]:
+        """Scanned minus running, for numeric fields that differ."""
+        drift = {}
+        for key, value in scanned.items():
+            old = running.get(key)
+            if isinstance(value, (int, float)) and isinstance(old, (int, float)):
+                difference = round(value - old, 6)
+                if difference:
+                    drift[key] = difference
+        return drift
@@ -17,6 +17,12 @@ Options:
     --graph NAME    Graph name (default: blood_ledger)
     --host HOST     Redis host (default: localhost)
     --port PORT     Redis port (default: 6379)
+    --budget SECS   Time budget per checker (default: 5)
+    --watch SECS    Re-run `all` every SECS seconds (one JSON line per run with --json)
+
+`all` takes one shared graph snapshot (two aggregate queries), hands it to
+every checker, runs the graph checkers concurrently and reports a checker
+that overruns its time budget as UNKNOWN.
 
 DOCS: docs/physics/HEALTH_Energy_Physics.md
 """
@@ -25,12 +31,15 @@ import argparse
 import json
 import logging
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from datetime import datetime
 from enum import Enum
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
 from .base import HealthStatus, HealthResult, BaseChecker
+from .snapshot import take_snapshot
 from .checkers import (
     EnergyConservationChecker,
     NoNegativeEnergyChecker,
@@ -43,7 +52,7 @@ logger = logging.getLogger(__name__)
 
 
 # Re-export for convenience
-__all__ = ["HealthStatus", "HealthResult", "run_all_checks", "run_check"]
+__all__ = ["HealthStatus", "HealthResult", "HealthRunner", "run_all_checks", "run_check"]
 
 
 # Registry of available checkers
@@ -59,6 +68,18 @@ CHECKERS = {
     "moment_lifecycle": MomentLifecycleChecker,  # alias
 }
 
+# Unique checker classes run by `all` (no aliases)
+ALL_CHECKERS = {
+    "energy_conservation": EnergyConservationChecker,
+    "no_negative": NoNegativeEnergyChecker,
+    "link_state": LinkStateChecker,
+    "tick_integrity": TickIntegrityChecker,
+    "moment_lifecycle": MomentLifecycleChecker,
+}
+
+# Seconds a checker may take before it is reported UNKNOWN
+DEFAULT_BUDGET_SECONDS = 5.0
+
 
 @dataclass
 class AggregateResult:
@@ -67,6 +88,8 @@ class AggregateResult:
     checks: List[HealthResult]
     timestamp: datetime
     summary: Dict[str, int]
+    elapsed_ms: float = 0.0
+    snapshot: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -74,6 +97,8 @@ class AggregateResult:
             "checks": [c.to_dict() for c in self.checks],
             "timestamp": self.timestamp.isoformat(),
             "summary": self.summary,
+            "elapsed_ms": round(self.elapsed_ms, 3),
+            "snapshot": self.snapshot,
         }
 
 
@@ -123,50 +148,14 @@ def run_check(
         return checker.check()
     except Exception as e:
         logger.exception(f"Checker {checker_name} failed")
-        return HealthResult(
-            checker_name=checker_name,
-            status=HealthStatus.UNKNOWN,
-            message=f"Checker crashed: {e}",
-        )
+        return _crashed(checker_name, f"Checker crashed: {e}")
 
 
-def run_all_checks(
-    graph_name: str = "test",
-    host: str = "localhost",
-    port: int = 6379
-) -> AggregateResult:
-    """
-    Run all health checks.
+def _crashed(name: str, message: str) -> HealthResult:
+    return HealthResult(checker_name=name, status=HealthStatus.UNKNOWN, message=message)
 
-    Returns:
-        AggregateResult with all check outcomes
-    """
-    graph = get_graph_connection(graph_name, host, port)
-
-    # Unique checker classes (avoid running aliases)
-    unique_checkers = {
-        "energy_conservation": EnergyConservationChecker,
-        "no_negative": NoNegativeEnergyChecker,
-        "link_state": LinkStateChecker,
-        "tick_integrity": TickIntegrityChecker,
-        "moment_lifecycle": MomentLifecycleChecker,
-    }
 
-    results = []
-    for name, checker_class in unique_checkers.items():
-        checker = checker_class(graph_queries=graph)
-        try:
-            result = checker.check()
-        except Exception as e:
-            logger.exception(f"Checker {name} failed")
-            result = HealthResult(
-                checker_name=name,
-                status=HealthStatus.UNKNOWN,
-                message=f"Checker crashed: {e}",
-            )
-        results.append(result)
-
-    # Calculate aggregate status
+def _aggregate(results: List[HealthResult]) -> AggregateResult:
     statuses = [r.status for r in results]
     if HealthStatus.ERROR in statuses:
         aggregate_status = HealthStatus.ERROR
@@ -194,6 +183,118 @@ def run_all_checks(
     )
 
 
+class HealthRunner:
+    """
+    Runs a fixed set of checkers against one graph connection.
+
+    Each run takes one GraphSnapshot, hands it to every checker, runs the
+    graph checkers concurrently and the rest inline. A checker that has
+    not finished within its budget is reported UNKNOWN (its thread is left
+    to finish in the background). Checkers persist across runs, so
+    incremental state and recorded phases/transitions carry over.
+    """
+
+    def __init__(
+        self,
+        graph=None,
+        checkers: Optional[Dict[str, BaseChecker]] = None,
+        budget: float = DEFAULT_BUDGET_SECONDS,
+        budgets: Optional[Dict[str, float]] = None,
+    ):
+        self.graph = graph
+        self.checkers = checkers if checkers is not None else {
+            name: cls(graph_queries=graph) for name, cls in ALL_CHECKERS.items()
+        }
+        self.budget = budget
+        self.budgets = budgets or {}
+
+    def run(self) -> AggregateResult:
+        started = time.perf_counter()
+        snapshot = take_snapshot(self.graph)
+        for checker in self.checkers.values():
+            checker.snapshot = snapshot
+
+        results: Dict[str, HealthResult] = {}
+        graph_checks = {n: c for n, c in self.checkers.items() if c.uses_graph}
+        pool = ThreadPoolExecutor(max_workers=max(1, len(graph_checks)), thread_name_prefix="health")
+        checks_started = time.perf_counter()
+        try:
+            futures = {name: pool.submit(checker.check) for name, checker in graph_checks.items()}
+            for name, checker in self.checkers.items():
+                if name not in futures:
+                    results[name] = self._run_inline(name, checker)
+            for name, future in futures.items():
+                budget = self.budgets.get(name, self.budget)
+                remaining = budget - (time.perf_counter() - checks_started)
+                try:
+                    results[name] = future.result(timeout=max(0.0, remaining))
+                except FutureTimeout:
+                    future.cancel()
+                    results[name] = _crashed(name, f"Exceeded time budget ({budget:.1f}s)")
+                except Exception as e:
+                    logger.exception(f"Checker {name} failed")
+                    results[name] = _crashed(name, f"Checker crashed: {e}")
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            for checker in self.checkers.values():
+                checker.snapshot = None
+
+        aggregate = _aggregate([results[name] for name in self.checkers])
+        aggregate.elapsed_ms = (time.perf_counter() - started) * 1000
+        aggregate.snapshot = snapshot.summary() if snapshot else None
+        return aggregate
+
+    @staticmethod
+    def _run_inline(name: str, checker: BaseChecker) -> HealthResult:
+        try:
+            return checker.check()
+        except Exception as e:
+            logger.exception(f"Checker {name} failed")
+            return _crashed(name, f"Checker crashed: {e}")
+
+
+def run_all_checks(
+    graph_name: str = "test",
+    host: str = "localhost",
+    port: int = 6379,
+    budget: float = DEFAULT_BUDGET_SECONDS,
+) -> AggregateResult:
+    """
+    Run all health checks.
+
+    Returns:
+        AggregateResult with all check outcomes
+    """
+    graph = get_graph_connection(graph_name, host, port)
+    return HealthRunner(graph, budget=budget).run()
+
+
+def watch(
+    runner: HealthRunner,
+    interval: float,
+    as_json: bool = False,
+    verbose: bool = False,
+    iterations: Optional[int] = None,
+) -> AggregateResult:
+    """Re-run `runner` every `interval` seconds until interrupted; returns the last result."""
+    result = None
+    count = 0
+    try:
+        while iterations is None or count < iterations:
+            result = runner.run()
+            count += 1
+            if as_json:
+                print(json.dumps(result.to_dict()), flush=True)
+            else:
+                print_aggregate(result, verbose)
+                print(f"  checked at {datetime.now():%H:%M:%S} in {result.elapsed_ms:.0f}ms", flush=True)
+            if iterations is None or count < iterations:
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    return result
+
+
 def print_result(result: HealthResult, verbose: bool = False):
     """Print a health result to console."""
     # Status emoji
@@ -253,6 +354,12 @@ def main():
     parser.add_argument("--graph", default=None, help="Graph name (default: test or blood_ledger)")
     parser.add_argument("--host", default="localhost", help="Redis host")
     parser.add_argument("--port", type=int, default=6379, help="Redis port")
+    parser.add_argument(
+        "--budget", type=float, default=DEFAULT_BUDGET_SECONDS, help="Seconds allowed per checker"
+    )
+    parser.add_argument(
+        "--watch", type=float, default=None, metavar="SECS", help="Re-run all checks every SECS seconds"
+    )
 
     args = parser.parse_args()
 
@@ -274,8 +381,15 @@ def main():
         print(f"Using graph: {graph_name}")
 
     # Run checks
+    if args.watch is not None:
+        if args.check != "all":
+            parser.error("--watch runs all checks")
+        runner = HealthRunner(get_graph_connection(graph_name, args.host, args.port), budget=args.budget)
+        watch(runner, args.watch, as_json=args.json, verbose=args.verbose)
+        sys.exit(0)
+
     if args.check == "all":
-        result = run_all_checks(graph_name, args.host, args.port)
+        result = run_all_checks(graph_name, args.host, args.port, budget=args.budget)
 
         if args.json:
             print(json.dumps(result.to_dict(), indent=2))
@@ -3,18 +3,21 @@ Energy Conservation Checker
 
 Verifies V-ENERGY-BOUNDED and V-ENERGY-CONSERVED invariants.
 
+Fed tick deltas (apply_delta), it keeps node/link energy totals running
+and only rescans the graph every `full_scan_every` ticks.
+
 DOCS: docs/physics/HEALTH_Energy_Physics.md#indicator-energy_balance
 """
 
 import logging
 from typing import Dict, Any, Optional
 
-from ..base import BaseChecker, HealthResult
+from ..base import HealthResult, IncrementalChecker
 
 logger = logging.getLogger(__name__)
 
 
-class EnergyConservationChecker(BaseChecker):
+class EnergyConservationChecker(IncrementalChecker):
     """
     Verify total system energy stays bounded and conserved.
 
@@ -43,19 +46,19 @@ class EnergyConservationChecker(BaseChecker):
             return self.unknown("No graph connection available")
 
         try:
-            # Get total energy across all nodes
-            node_energy = self._get_total_node_energy()
-            link_energy = self._get_total_link_energy()
+            state, source = self._current_state()
+            node_energy = state["node_energy"]
+            link_energy = state["link_energy"]
             total_energy = node_energy + link_energy
 
             # Get expected bounds based on graph size
-            actor_count, moment_count = self._get_counts()
+            actor_count, moment_count = state["actor_count"], state["moment_count"]
             expected_max = self._calculate_expected_max(actor_count, moment_count)
 
             if expected_max == 0:
                 return self.ok(
                     "Empty graph - no energy to check",
-                    details={"total_energy": 0, "actors": 0, "moments": 0}
+                    details={"total_energy": 0, "actors": 0, "moments": 0, **source}
                 )
 
             # Calculate ratio
@@ -69,7 +72,10 @@ class EnergyConservationChecker(BaseChecker):
                 "ratio": round(ratio, 4),
                 "actor_count": actor_count,
                 "moment_count": moment_count,
+                **source,
             }
+            if state.get("last_tick_phases"):
+                details["last_tick_phases"] = state["last_tick_phases"]
 
             # Check bounds
             if ratio < self.MIN_RATIO:
@@ -97,6 +103,28 @@ class EnergyConservationChecker(BaseChecker):
             logger.exception(f"[{self.name}] Check failed")
             return self.unknown(f"Check failed: {e}")
 
+    def _scan(self) -> Dict[str, Any]:
+        snap = self.snapshot
+        if snap is not None:
+            return {
+                "node_energy": snap.node_energy,
+                "link_energy": snap.link_energy,
+                "actor_count": snap.actor_count,
+                "moment_count": snap.moment_count,
+            }
+        actor_count, moment_count = self._get_counts()
+        return {
+            "node_energy": self._get_total_node_energy(),
+            "link_energy": self._get_total_link_energy(),
+            "actor_count": actor_count,
+            "moment_count": moment_count,
+        }
+
+    def _apply(self, state: Dict[str, Any], delta) -> None:
+        state["node_energy"] += delta.node_energy_change
+        state["link_energy"] += delta.link_energy_change
+        state["last_tick_phases"] = delta.to_dict()["phase_energy"]
+
     def _get_total_node_energy(self) -> float:
         """Sum energy across all nodes."""
         try:
@@ -3,13 +3,16 @@ Link State Checker
 
 Verifies V-LINK-ALIVE and V-LINK-BOUNDED invariants.
 
+Fed tick deltas (apply_delta), it takes the tick's hot/cold census (or
+applies threshold crossings) and only rescans every `full_scan_every` ticks.
+
 DOCS: docs/physics/HEALTH_Energy_Physics.md#indicator-link_hot_cold_ratio
 """
 
 import logging
-from typing import Tuple
+from typing import Any, Dict, Tuple
 
-from ..base import BaseChecker, HealthResult
+from ..base import HealthResult, IncrementalChecker
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +20,7 @@ logger = logging.getLogger(__name__)
 COLD_THRESHOLD = 0.01
 
 
-class LinkStateChecker(BaseChecker):
+class LinkStateChecker(IncrementalChecker):
     """
     Verify healthy ratio of hot to cold links.
 
@@ -43,12 +46,13 @@ class LinkStateChecker(BaseChecker):
             return self.unknown("No graph connection available")
 
         try:
-            hot_count, cold_count, total_count = self._count_hot_cold_links()
+            state, source = self._current_state()
+            hot_count, cold_count, total_count = state["hot"], state["cold"], state["total"]
 
             if total_count == 0:
                 return self.ok(
                     "No links to check",
-                    details={"total_links": 0}
+                    details={"total_links": 0, **source}
                 )
 
             ratio = hot_count / total_count
@@ -59,6 +63,7 @@ class LinkStateChecker(BaseChecker):
                 "total_links": total_count,
                 "hot_ratio": round(ratio, 4),
                 "threshold": COLD_THRESHOLD,
+                **source,
             }
 
             # Check for dead world
@@ -94,6 +99,24 @@ class LinkStateChecker(BaseChecker):
             logger.exception(f"[{self.name}] Check failed")
             return self.unknown(f"Check failed: {e}")
 
+    def _scan(self) -> Dict[str, Any]:
+        snap = self.snapshot
+        if snap is not None:
+            return {"hot": snap.hot_links, "cold": snap.cold_links, "total": snap.total_links}
+        hot, cold, total = self._count_hot_cold_links()
+        return {"hot": hot, "cold": cold, "total": total}
+
+    def _apply(self, state: Dict[str, Any], delta) -> None:
+        if delta.hot_links is not None:
+            # The tick took a census; links it created afterwards start cold
+            state["hot"] = delta.hot_links
+            state["cold"] = delta.cold_links + delta.links_created
+        else:
+            heated = delta.links_heated - delta.links_cooled_off
+            state["hot"] += heated
+            state["cold"] += delta.links_created - heated
+        state["total"] = state["hot"] + state["cold"]
+
     def _count_hot_cold_links(self) -> Tuple[int, int, int]:
         """
         Count hot and cold links.
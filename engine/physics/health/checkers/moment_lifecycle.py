@@ -116,6 +116,8 @@ class MomentLifecycleChecker(BaseChecker):
 
     def _find_invalid_states(self) -> List[Dict[str, Any]]:
         """Find moments with invalid status values."""
+        if self.snapshot is not None:
+            return list(self.snapshot.invalid_moment_states)
         valid_states_str = "', '".join(self.VALID_STATES)
         try:
             result = self.read.query(f"""
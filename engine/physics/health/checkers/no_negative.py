@@ -3,18 +3,21 @@ No Negative Energy Checker
 
 Verifies V-ENERGY-NON-NEGATIVE invariant.
 
+Fed tick deltas (apply_delta), it tracks negatives among the nodes each
+tick wrote and only rescans every `full_scan_every` ticks.
+
 DOCS: docs/physics/HEALTH_Energy_Physics.md#indicator-no_negative_energy
 """
 
 import logging
 from typing import List, Dict, Any
 
-from ..base import BaseChecker, HealthResult
+from ..base import HealthResult, IncrementalChecker
 
 logger = logging.getLogger(__name__)
 
 
-class NoNegativeEnergyChecker(BaseChecker):
+class NoNegativeEnergyChecker(IncrementalChecker):
     """
     Verify no node or link has negative energy.
 
@@ -34,11 +37,9 @@ class NoNegativeEnergyChecker(BaseChecker):
             return self.unknown("No graph connection available")
 
         try:
-            # Check node energies
-            negative_nodes = self._find_negative_node_energies()
-
-            # Check link energies
-            negative_links = self._find_negative_link_energies()
+            state, source = self._current_state()
+            negative_nodes = list(state["nodes"].values())
+            negative_links = state["links"]
 
             total_violations = len(negative_nodes) + len(negative_links)
 
@@ -46,6 +47,7 @@ class NoNegativeEnergyChecker(BaseChecker):
                 "negative_nodes": negative_nodes[:10],  # First 10
                 "negative_links": negative_links[:10],
                 "total_violations": total_violations,
+                **source,
             }
 
             if total_violations > 0:
@@ -56,13 +58,40 @@ class NoNegativeEnergyChecker(BaseChecker):
             else:
                 return self.ok(
                     "All energy values non-negative",
-                    details={"checked_nodes": True, "checked_links": True}
+                    details={"checked_nodes": True, "checked_links": True, **source}
                 )
 
         except Exception as e:
             logger.exception(f"[{self.name}] Check failed")
             return self.unknown(f"Check failed: {e}")
 
+    def _scan(self) -> Dict[str, Any]:
+        snap = self.snapshot
+        if snap is not None:
+            return {
+                "nodes": {n["id"]: dict(n) for n in snap.negative_nodes},
+                "links": list(snap.negative_links),
+            }
+        nodes = {n["id"]: n for n in self._find_negative_node_energies()}
+        return {"nodes": nodes, "links": self._find_negative_link_energies()}
+
+    def _apply(self, state: Dict[str, Any], delta) -> None:
+        nodes = state["nodes"]
+        for node_id in delta.resolved():
+            nodes.pop(node_id, None)
+        for node_id, energy in delta.negatives().items():
+            nodes[node_id] = {"id": node_id, "type": delta.node_types.get(node_id), "energy": energy}
+
+    def _drift(self, running: Dict[str, Any], scanned: Dict[str, Any]) -> Dict[str, Any]:
+        drift = {}
+        nodes = len(scanned["nodes"]) - len(running["nodes"])
+        links = len(scanned["links"]) - len(running["links"])
+        if nodes:
+            drift["negative_nodes"] = nodes
+        if links:
+            drift["negative_links"] = links
+        return drift
+
     def _find_negative_node_energies(self) -> List[Dict[str, Any]]:
         """Find nodes with negative energy."""
         try:
@@ -27,6 +27,7 @@ class TickIntegrityChecker(BaseChecker):
     name = "tick_integrity"
     validation_ids = ["V-TICK-ORDER", "V-TICK-COMPLETE"]
     priority = "high"
+    uses_graph = False
 
     # Expected phase order
     EXPECTED_PHASES = [
@@ -0,0 +1,114 @@
+"""
+Shared Graph Snapshot
+
+One pass over nodes and one over links, collecting every aggregate the
+graph checkers need:
+
+- node energy total, actor and moment counts   (energy_conservation)
+- link energy total, hot/cold/total links       (energy_conservation, link_state)
+- negative node and link energies               (no_negative_energy)
+- moments in invalid states                     (moment_lifecycle)
+
+The runner takes one snapshot per run and hands it to every checker
+(`checker.snapshot`); checkers without one query the graph themselves.
+
+DOCS: docs/physics/HEALTH_Energy_Physics.md
+"""
+
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .checkers.link_state import COLD_THRESHOLD
+from .checkers.moment_lifecycle import MomentLifecycleChecker
+
+# Violations kept per kind, matching the checkers' own LIMIT
+MAX_LISTED = 100
+
+
+@dataclass
+class GraphSnapshot:
+    """Aggregates shared by the graph checkers of one run."""
+    node_energy: float = 0.0
+    link_energy: float = 0.0
+    actor_count: int = 0
+    moment_count: int = 0
+    hot_links: int = 0
+    cold_links: int = 0
+    total_links: int = 0
+    negative_nodes: List[Dict[str, Any]] = field(default_factory=list)
+    negative_links: List[Dict[str, Any]] = field(default_factory=list)
+    invalid_moment_states: List[Dict[str, Any]] = field(default_factory=list)
+    taken_at: float = 0.0
+    query_ms: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Scalar fields, for aggregate output."""
+        data = asdict(self)
+        for key in ("negative_nodes", "negative_links", "invalid_moment_states"):
+            data[key] = len(data[key])
+        data["query_ms"] = round(self.query_ms, 3)
+        return data
+
+
+def _node_query() -> str:
+    valid = "', '".join(sorted(MomentLifecycleChecker.VALID_STATES))
+    return f"""
+    MATCH (n)
+    RETURN
+        sum(coalesce(n.energy, 0)) AS node_energy,
+        sum(CASE WHEN labels(n)[0] = 'Actor' THEN 1 ELSE 0 END) AS actors,
+        sum(CASE WHEN labels(n)[0] = 'Moment' THEN 1 ELSE 0 END) AS moments,
+        collect(CASE WHEN n.energy < 0 THEN [n.id, labels(n)[0], n.energy] END) AS negative,
+        collect(CASE WHEN 'Moment' IN labels(n) AND n.status IS NOT NULL
+                     AND NOT n.status IN ['{valid}'] THEN [n.id, n.status] END) AS invalid_states
+    """
+
+
+LINK_QUERY = f"""
+MATCH (a)-[r]->(b)
+WHERE r.energy IS NOT NULL
+RETURN
+    sum(r.energy) AS link_energy,
+    sum(CASE WHEN r.energy * coalesce(r.weight, 1.0) > {COLD_THRESHOLD} THEN 1 ELSE 0 END) AS hot,
+    count(r) AS total,
+    collect(CASE WHEN r.energy < 0 THEN [a.id, b.id, type(r), r.energy] END) AS negative
+"""
+
+
+def take_snapshot(read) -> Optional[GraphSnapshot]:
+    """Two aggregate queries; None if either fails (checkers fall back to their own)."""
+    if read is None:
+        return None
+    started = time.perf_counter()
+    try:
+        nodes = (read.query(_node_query()) or [{}])[0]
+        links = (read.query(LINK_QUERY) or [{}])[0]
+    except Exception:
+        return None
+
+    hot = int(links.get("hot", 0) or 0)
+    total = int(links.get("total", 0) or 0)
+    return GraphSnapshot(
+        node_energy=float(nodes.get("node_energy", 0) or 0),
+        link_energy=float(links.get("link_energy", 0) or 0),
+        actor_count=int(nodes.get("actors", 0) or 0),
+        moment_count=int(nodes.get("moments", 0) or 0),
+        hot_links=hot,
+        cold_links=total - hot,
+        total_links=total,
+        negative_nodes=[
+            {"id": i, "type": t, "energy": e}
+            for i, t, e in (nodes.get("negative") or [])[:MAX_LISTED]
+        ],
+        negative_links=[
+            {"from": a, "to": b, "type": t, "energy": e}
+            for a, b, t, e in (links.get("negative") or [])[:MAX_LISTED]
+        ],
+        invalid_moment_states=[
+            {"id": i, "status": s}
+            for i, s in (nodes.get("invalid_states") or [])[:MAX_LISTED]
+        ],
+        taken_at=time.time(),
+        query_ms=(time.perf_counter() - started) * 1000,
+    )
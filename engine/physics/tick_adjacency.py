@@ -0,0 +1,355 @@
+"""
+Schema v1.2 — Per-Tick Adjacency Snapshot
+
+GraphTickV1_2's helpers (`_get_hot_links_to_moment`,
+`_get_hot_links_from_moment`, `_get_hot_links_to_actors`,
+`_get_moment_emotions`, `_get_narrative_emotions`,
+`_get_shared_narratives`) used to issue one small Cypher query per moment
+or narrative per phase, re-reading the same neighbourhoods several times a
+tick. The snapshot reads every link once, with both endpoints' attributes,
+the first time a tick needs adjacency, and answers those helpers from
+memory.
+
+Layout is CSR: links are numbered, and `out_ptr`/`out_links` (by source)
+and `in_ptr`/`in_links` (by target) hold each node's link numbers as one
+contiguous slice. Link attributes are kept as read (None stays None, so the
+callers' `or 1.0` defaults apply unchanged); `heat` is the
+`coalesce(r.energy, 0) * coalesce(r.weight, 1)` sort key the queries used.
+
+The tick keeps the snapshot current with its own writes: node energy
+through `set_energy`, crystallized links through `add_link` (kept beside
+the CSR arrays rather than rebuilding them). Link energy/strength/emotions
+are not persisted by traversal, so link attributes never go stale within a
+tick. Nodes without links are not in the snapshot; every helper answers
+for them as their query would (no links, no emotions).
+
+Emotions are also available as vectors over a per-snapshot
+EmotionVocabulary (see emotion_vectors), built on first use: one row and
+presence mask per link, so a whole group of links gets its proximities to
+a moment or narrative in one call. Link dicts carry their link number
+under `link` for that lookup.
+
+Usage:
+    snapshot = AdjacencySnapshot.load(read)
+    links = snapshot.hot_links_to_moment("moment_1", TOP_N_LINKS)
+    snapshot.set_energy("char_aldric", 1.4)
+
+DOCS: docs/physics/tick-runner/PATTERNS_Tick_Runner.md
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from engine.physics.emotion_vectors import (
+    EmotionVocabulary,
+    avg_intensity,
+    pad,
+    proximity_rows,
+    weighted_average,
+)
+
+DRAW_LINK_TYPES = ('EXPRESSES', 'CAN_SPEAK', 'SAID')
+
+LINKS_QUERY = """
+MATCH (a)-[r]->(b)
+WHERE a.id IS NOT NULL AND b.id IS NOT NULL
+RETURN type(r) AS type,
+       a.id AS source, labels(a)[0] AS source_label,
+       a.energy AS source_energy, a.weight AS source_weight, a.emotions AS source_emotions,
+       b.id AS target, labels(b)[0] AS target_label,
+       b.energy AS target_energy, b.weight AS target_weight, b.emotions AS target_emotions,
+       r.energy AS energy, r.weight AS weight, r.conductivity AS conductivity,
+       r.strength AS strength, r.emotions AS emotions
+"""
+
+
+def _heat(energy: Optional[float], weight: Optional[float]) -> float:
+    return (energy if energy is not None else 0.0) * (weight if weight is not None else 1.0)
+
+
+def _csr(keys: np.ndarray, size: int):
+    """(ptr, order): rows of `keys` grouped by key, in their original order."""
+    order = np.argsort(keys, kind='stable')
+    ptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=size), out=ptr[1:])
+    return ptr, order
+
+
+class AdjacencySnapshot:
+    """In-links and out-links per node, with link and endpoint attributes."""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+        self.index: Dict[str, int] = {}
+        self.ids: List[str] = []
+        self.labels: List[str] = []
+        self.weights: List[Optional[float]] = []
+        self.emotions: List[Any] = []
+        energies: List[Optional[float]] = []
+
+        def node(node_id: str, label: str, energy, weight, emotions) -> int:
+            i = self.index.get(node_id)
+            if i is None:
+                i = self.index[node_id] = len(self.ids)
+                self.ids.append(node_id)
+                self.labels.append(label or '')
+                energies.append(energy)
+                self.weights.append(weight)
+                self.emotions.append(emotions)
+            return i
+
+        self.link_types: List[str] = []
+        self.link_attrs: List[Dict[str, Any]] = []
+        sources: List[int] = []
+        targets: List[int] = []
+        for row in rows:
+            sources.append(node(
+                row.get('source'), row.get('source_label'), row.get('source_energy'),
+                row.get('source_weight'), row.get('source_emotions'),
+            ))
+            targets.append(node(
+                row.get('target'), row.get('target_label'), row.get('target_energy'),
+                row.get('target_weight'), row.get('target_emotions'),
+            ))
+            self.link_types.append(row.get('type'))
+            self.link_attrs.append({
+                'conductivity': row.get('conductivity'),
+                'weight': row.get('weight'),
+                'energy': row.get('energy'),
+                'strength': row.get('strength'),
+                'emotions': row.get('emotions'),
+            })
+
+        # None energies read back as None, like the node property would
+        self.energy = np.array([np.nan if e is None else e for e in energies], dtype=np.float64)
+        self.source = np.array(sources, dtype=np.int64)
+        self.target = np.array(targets, dtype=np.int64)
+        self.heat = np.array(
+            [_heat(a['energy'], a['weight']) for a in self.link_attrs], dtype=np.float64
+        )
+        n = len(self.ids)
+        self.out_ptr, self.out_links = _csr(self.source, n)
+        self.in_ptr, self.in_links = _csr(self.target, n)
+        # Links added after the CSR arrays were built, by node index
+        self._added_out: Dict[int, List[int]] = {}
+        self._added_in: Dict[int, List[int]] = {}
+        # Link emotion rows and presence masks, built on first use
+        self.vocabulary = EmotionVocabulary()
+        self._link_vectors: Optional[np.ndarray] = None
+        self._link_present: Optional[np.ndarray] = None
+
+    @classmethod
+    def load(cls, read: Any) -> "AdjacencySnapshot":
+        """Build from one query over every link."""
+        return cls(read.query(LINKS_QUERY))
+
+    # -------------------------------------------------------------------------
+    # Updates from the tick's own writes
+    # -------------------------------------------------------------------------
+
+    def set_energy(self, node_id: str, value: float) -> None:
+        i = self.index.get(node_id)
+        if i is not None:
+            self.energy[i] = value
+
+    def add_link(
+        self,
+        link_type: str,
+        source: str,
+        target: str,
+        label: str = '',
+        **attrs: Any,
+    ) -> None:
+        """Record a link the tick created (e.g. a crystallized RELATES)."""
+        ends = []
+        for node_id in (source, target):
+            i = self.index.get(node_id)
+            if i is None:
+                i = self.index[node_id] = len(self.ids)
+                self.ids.append(node_id)
+                self.labels.append(label)
+                self.weights.append(None)
+                self.emotions.append(None)
+                self.energy = np.append(self.energy, np.nan)
+            ends.append(i)
+        link = len(self.link_types)
+        self.link_types.append(link_type)
+        self.link_attrs.append({
+            'conductivity': attrs.get('conductivity'),
+            'weight': attrs.get('weight'),
+            'energy': attrs.get('energy'),
+            'strength': attrs.get('strength'),
+            'emotions': attrs.get('emotions'),
+        })
+        self.source = np.append(self.source, ends[0])
+        self.target = np.append(self.target, ends[1])
+        self.heat = np.append(self.heat, _heat(attrs.get('energy'), attrs.get('weight')))
+        self._added_out.setdefault(ends[0], []).append(link)
+        self._added_in.setdefault(ends[1], []).append(link)
+        if self._link_vectors is not None:
+            emotions = attrs.get('emotions')
+            vector, present = self.vocabulary.to_vector(emotions), self.vocabulary.to_mask(emotions)
+            size = len(self.vocabulary)
+            self._link_vectors = np.vstack([pad(self._link_vectors, size), vector])
+            self._link_present = np.vstack([pad(self._link_present, size), present])
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def _node_energy(self, i: int) -> Optional[float]:
+        value = self.energy[i]
+        return None if np.isnan(value) else float(value)
+
+    def _out(self, i: int) -> List[int]:
+        links = self.out_links[self.out_ptr[i]:self.out_ptr[i + 1]].tolist()
+        return links + self._added_out.get(i, [])
+
+    def _in(self, i: int) -> List[int]:
+        links = self.in_links[self.in_ptr[i]:self.in_ptr[i + 1]].tolist()
+        return links + self._added_in.get(i, [])
+
+    def _hottest(self, links: List[int], n: int) -> List[int]:
+        if not links:
+            return []
+        order = np.argsort(-self.heat[links], kind='stable')[:n]
+        return [links[k] for k in order]
+
+    def _node(self, node_id: str, label: str) -> Optional[int]:
+        i = self.index.get(node_id)
+        return i if i is not None and self.labels[i] == label else None
+
+    def _actor_link(self, link: int) -> Dict[str, Any]:
+        attrs = self.link_attrs[link]
+        a = int(self.source[link])
+        return {
+            'actor_id': self.ids[a],
+            'actor_energy': self._node_energy(a),
+            'actor_weight': self.weights[a],
+            'conductivity': attrs['conductivity'],
+            'weight': attrs['weight'],
+            'link_energy': attrs['energy'],
+            'strength': attrs['strength'],
+            'emotions': attrs['emotions'],
+            'link': link,
+        }
+
+    def moment_out_links(self, moment_id: str) -> List[Dict[str, Any]]:
+        """Weight and emotions of every outgoing link of a moment."""
+        m = self._node(moment_id, 'Moment')
+        if m is None:
+            return []
+        return [
+            {'weight': self.link_attrs[l]['weight'], 'emotions': self.link_attrs[l]['emotions']}
+            for l in self._out(m)
+        ]
+
+    def narrative_emotions(self, narrative_id: str) -> List[List]:
+        n = self._node(narrative_id, 'Narrative')
+        return (self.emotions[n] or []) if n is not None else []
+
+    def hot_links_to_moment(self, moment_id: str, n: int) -> List[Dict[str, Any]]:
+        """Top N EXPRESSES / CAN_SPEAK / SAID links from actors to a moment."""
+        m = self._node(moment_id, 'Moment')
+        if m is None:
+            return []
+        links = [
+            l for l in self._in(m)
+            if self.link_types[l] in DRAW_LINK_TYPES and self.labels[self.source[l]] == 'Actor'
+        ]
+        return [self._actor_link(l) for l in self._hottest(links, n)]
+
+    def hot_links_from_moment(self, moment_id: str, n: int) -> List[Dict[str, Any]]:
+        """Top N outgoing links from a moment to non-actors."""
+        m = self._node(moment_id, 'Moment')
+        if m is None:
+            return []
+        links = [l for l in self._out(m) if self.labels[self.target[l]] != 'Actor']
+        result = []
+        for l in self._hottest(links, n):
+            attrs = self.link_attrs[l]
+            t = int(self.target[l])
+            result.append({
+                'target_id': self.ids[t],
+                'target_type': self.labels[t],
+                'target_energy': self._node_energy(t),
+                'target_weight': self.weights[t],
+                'conductivity': attrs['conductivity'],
+                'weight': attrs['weight'],
+                'link_energy': attrs['energy'],
+                'emotions': attrs['emotions'],
+                'link': l,
+            })
+        return result
+
+    def hot_links_to_actors(self, narrative_id: str, n: int) -> List[Dict[str, Any]]:
+        """Top N BELIEVES links from actors to a narrative."""
+        narr = self._node(narrative_id, 'Narrative')
+        if narr is None:
+            return []
+        links = [
+            l for l in self._in(narr)
+            if self.link_types[l] == 'BELIEVES' and self.labels[self.source[l]] == 'Actor'
+        ]
+        result = []
+        for l in self._hottest(links, n):
+            row = self._actor_link(l)
+            del row['strength']
+            result.append(row)
+        return result
+
+    def shared_narratives(self, m1_id: str, m2_id: str) -> List[str]:
+        """Narratives both moments are ABOUT, in m1's link order."""
+        m1, m2 = self._node(m1_id, 'Moment'), self._node(m2_id, 'Moment')
+        if m1 is None or m2 is None:
+            return []
+
+        def about(m: int) -> List[int]:
+            return [
+                int(self.target[l]) for l in self._out(m)
+                if self.link_types[l] == 'ABOUT' and self.labels[self.target[l]] == 'Narrative'
+            ]
+
+        theirs = set(about(m2))
+        shared = dict.fromkeys(n for n in about(m1) if n in theirs)
+        return [self.ids[n] for n in shared]
+
+    # -------------------------------------------------------------------------
+    # Emotion vectors
+    # -------------------------------------------------------------------------
+
+    def _emotion_rows(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._link_vectors is None:
+            emotions = [a['emotions'] for a in self.link_attrs]
+            self._link_vectors = self.vocabulary.to_matrix(emotions)
+            self._link_present = self.vocabulary.to_masks(emotions)
+        return self._link_vectors, self._link_present
+
+    def link_intensity(self, link: int) -> float:
+        """avg_emotion_intensity of one link's emotions."""
+        vectors, present = self._emotion_rows()
+        return float(avg_intensity(vectors[link], present[link])[0])
+
+    def link_emotion_vector(self, link: int) -> Tuple[np.ndarray, np.ndarray]:
+        vectors, present = self._emotion_rows()
+        return vectors[link], present[link]
+
+    def link_proximities(self, links: List[int], emotions: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        """emotion_proximity of each link's emotions to one (vector, presence) pair."""
+        vectors, present = self._emotion_rows()
+        return proximity_rows(vectors[links], emotions[0], present[links], emotions[1])
+
+    def moment_emotion_vector(self, moment_id: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Weighted average over the moment's out-links; present if any link lists it."""
+        vectors, present = self._emotion_rows()
+        m = self._node(moment_id, 'Moment')
+        links = self._out(m) if m is not None else []
+        size = len(self.vocabulary)
+        return (
+            weighted_average(pad(vectors[links], size), [self.link_attrs[l]['weight'] for l in links]),
+            pad(present[links], size).any(axis=0),
+        )
+
+    def narrative_emotion_vector(self, narrative_id: str) -> Tuple[np.ndarray, np.ndarray]:
+        emotions = self.narrative_emotions(narrative_id)
+        return self.vocabulary.to_vector(emotions), self.vocabulary.to_mask(emotions)
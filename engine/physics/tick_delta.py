@@ -0,0 +1,120 @@
+"""
+Schema v1.2 — Tick Deltas
+
+What one tick changed, recorded as it writes:
+
+- node energy: first value read and last value written per node
+- energy moved per phase: `in` (node increases), `out` (node decreases),
+  `cooled` (link energy drained back to nodes)
+- links: energy change, links crossing the hot threshold, links created
+- the hot/cold census, when the tick took one
+
+GraphTickV1_2 fills a TickDelta during `run()`, exports it on
+`TickResultV1_2.delta` and forwards it to every `delta_sinks` entry that
+has an `apply_delta(delta)` method. The physics health checkers use it to
+keep running aggregates instead of scanning the graph every tick.
+
+Usage:
+    from engine.physics.health.checkers import LinkStateChecker
+
+    links = LinkStateChecker(graph_queries=read)
+    tick = GraphTickV1_2(graph_name="blood_ledger", delta_sinks=[links])
+    tick.run()
+    links.check()  # no graph scan until the next full_scan_every tick
+
+DOCS: docs/physics/HEALTH_Energy_Physics.md
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class TickDelta:
+    """Changes made by one tick."""
+    tick: int = 0
+    # node id -> [energy before the tick, energy after]
+    node_energy: Dict[str, List[float]] = field(default_factory=dict)
+    node_types: Dict[str, str] = field(default_factory=dict)
+    # phase name -> {"in": ..., "out": ..., "cooled": ...}
+    phase_energy: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    link_energy_change: float = 0.0
+    links_heated: int = 0      # crossed above the cold threshold
+    links_cooled_off: int = 0  # crossed to or below it
+    links_created: int = 0     # new links start cold
+    hot_links: Optional[int] = None
+    cold_links: Optional[int] = None
+
+    phase: str = ""
+
+    def _phase_totals(self) -> Dict[str, float]:
+        return self.phase_energy.setdefault(self.phase, {"in": 0.0, "out": 0.0, "cooled": 0.0})
+
+    def record_node(self, node_id: str, before: float, after: float, node_type: str = "") -> None:
+        """One energy write: `before` is the value the write was computed from."""
+        entry = self.node_energy.get(node_id)
+        if entry is None:
+            self.node_energy[node_id] = [before, after]
+        else:
+            entry[1] = after
+        if node_type:
+            self.node_types[node_id] = node_type
+        totals = self._phase_totals()
+        change = after - before
+        if change > 0:
+            totals["in"] += change
+        else:
+            totals["out"] -= change
+
+    def record_cooled(self, amount: float) -> None:
+        self._phase_totals()["cooled"] += amount
+
+    def record_link(self, before: float, after: float, hot_before: bool, hot_after: bool) -> None:
+        self.link_energy_change += after - before
+        if hot_after and not hot_before:
+            self.links_heated += 1
+        elif hot_before and not hot_after:
+            self.links_cooled_off += 1
+
+    def record_census(self, hot: int, cold: int) -> None:
+        self.hot_links, self.cold_links = int(hot or 0), int(cold or 0)
+
+    @property
+    def node_energy_change(self) -> float:
+        return sum(after - before for before, after in self.node_energy.values())
+
+    def negatives(self) -> Dict[str, float]:
+        """Nodes left with negative energy by this tick."""
+        return {nid: after for nid, (_, after) in self.node_energy.items() if after < 0}
+
+    def resolved(self) -> List[str]:
+        """Nodes written with non-negative energy by this tick."""
+        return [nid for nid, (_, after) in self.node_energy.items() if after >= 0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tick": self.tick,
+            "nodes_changed": len(self.node_energy),
+            "node_energy_change": round(self.node_energy_change, 6),
+            "phase_energy": {
+                phase: {k: round(v, 6) for k, v in totals.items()}
+                for phase, totals in self.phase_energy.items()
+            },
+            "link_energy_change": round(self.link_energy_change, 6),
+            "links_heated": self.links_heated,
+            "links_cooled_off": self.links_cooled_off,
+            "links_created": self.links_created,
+            "hot_links": self.hot_links,
+            "cold_links": self.cold_links,
+        }
+
+
+def forward_delta(delta: TickDelta, sinks) -> List[Tuple[Any, Exception]]:
+    """Hand the delta to every sink; returns the sinks that failed."""
+    failed = []
+    for sink in sinks or ():
+        try:
+            sink.apply_delta(delta)
+        except Exception as e:
+            failed.append((sink, e))
+    return failed
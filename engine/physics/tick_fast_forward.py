@@ -0,0 +1,730 @@
+"""
+Schema v1.2 — Multi-Tick Fast-Forward
+
+Runs N v1.2 ticks against an in-memory copy of the graph and writes back
+only the final state. GraphTickV1_2.run() re-reads and re-writes the graph
+for every phase of every tick; run_until_visible / run_until_next_moment
+loop it up to 100 times. Fast-forward loads nodes and links once (2 reads),
+simulates the ticks, and flushes changed nodes plus crystallized links in
+at most 3 writes — 100 ticks cost about one tick's I/O.
+
+Semantics mirror GraphTickV1_2 phase by phase, including its snapshot
+quirks (phase 4 uses tick-start moment energies, phase 6 uses phase-start
+node energies). Like GraphTickV1_2, link energy/strength/emotions are not
+persisted by traversal, so links are read-only here except for RELATES
+links created on completion. Proximity is computed with Dijkstra over the
+full link set instead of the per-pair subgraph query: the resistance
+adjacency is built once per run and extended when a link is crystallized,
+and one single-source search from the player gives every actor's
+resistance.
+
+Usage:
+    from engine.physics.tick_fast_forward import FastForwardTick, stop_on_completion
+
+    ff = FastForwardTick(graph_name="blood_ledger")
+    result = ff.run(max_ticks=100, stop_when=stop_on_completion("place_camp"))
+
+DOCS: docs/physics/tick-runner/PATTERNS_Tick_Runner.md
+"""
+
+import json
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from engine.physics.graph import GraphOps, GraphQueries
+from engine.physics.graph.graph_query_utils import (
+    add_resistance_edge,
+    resistance_graph,
+    shortest_resistances,
+)
+from engine.physics.tick_profiler import TickProfiler
+from engine.physics.tick_v1_2 import (
+    BACKFLOW_RATE,
+    COLD_THRESHOLD,
+    CONTRADICT_THRESHOLD,
+    DRAW_RATE,
+    GENERATION_RATE,
+    INTERACTION_RATE,
+    LINK_DRAIN_RATE,
+    REJECTION_RETURN_RATE,
+    SUPPORT_THRESHOLD,
+    TICKS_PER_MINUTE,
+    TOP_N_LINKS,
+    TickResultV1_2,
+    avg_emotion_intensity,
+    emotion_proximity,
+    get_weighted_average_emotions,
+)
+
+logger = logging.getLogger(__name__)
+
+COMPLETION_THRESHOLD = 0.8
+DRAW_LINK_TYPES = ('EXPRESSES', 'CAN_SPEAK', 'SAID')
+
+
+# =============================================================================
+# WORKING SUBGRAPH
+# =============================================================================
+
+def _emotions(value: Any) -> List[List]:
+    """Normalize stored emotions (list or JSON string) to [[name, intensity], ...]."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return []
+    return value if isinstance(value, list) else []
+
+
+@dataclass
+class SimNode:
+    id: str
+    label: str
+    energy: Optional[float] = None
+    weight: Optional[float] = None
+    status: Optional[str] = None
+    duration: Optional[float] = None
+    emotions: List[List] = field(default_factory=list)
+    alive: Optional[bool] = None
+    tick_resolved: Optional[int] = None
+    emotion_vector: Any = field(default=None, repr=False, compare=False)  # see emotion_vectors
+    emotion_present: Any = field(default=None, repr=False, compare=False)
+
+
+@dataclass
+class SimLink:
+    type: str
+    source: str
+    target: str
+    energy: Optional[float] = None
+    weight: Optional[float] = None
+    conductivity: Optional[float] = None
+    strength: Optional[float] = None
+    emotions: List[List] = field(default_factory=list)
+    emotion_vector: Any = field(default=None, repr=False, compare=False)  # see emotion_vectors
+    emotion_present: Any = field(default=None, repr=False, compare=False)
+
+    @property
+    def heat(self) -> float:
+        return (self.energy or 0.0) * (self.weight if self.weight is not None else 1.0)
+
+
+class WorkingSubgraph:
+    """In-memory nodes and links with the adjacency the v1.2 phases need."""
+
+    def __init__(self, nodes: List[SimNode], links: List[SimLink]):
+        self.nodes: Dict[str, SimNode] = {n.id: n for n in nodes}
+        self.links: List[SimLink] = []
+        self.out_links: Dict[str, List[SimLink]] = {}
+        self.in_links: Dict[str, List[SimLink]] = {}
+        for link in links:
+            self.add_link(link)
+        self._initial = {nid: self._state(n) for nid, n in self.nodes.items()}
+        self.created_links: List[Tuple[SimLink, str]] = []  # (link, created_from moment)
+
+    @classmethod
+    def load(cls, read: GraphQueries) -> "WorkingSubgraph":
+        """Load every node and link in two queries."""
+        node_rows = read.query("""
+        MATCH (n)
+        WHERE n.id IS NOT NULL
+        RETURN n.id AS id, labels(n)[0] AS label, n.energy AS energy,
+               n.weight AS weight, n.status AS status,
+               n.duration_minutes AS duration, n.emotions AS emotions,
+               n.alive AS alive, n.tick_resolved AS tick_resolved
+        """)
+        link_rows = read.query("""
+        MATCH (a)-[r]->(b)
+        WHERE a.id IS NOT NULL AND b.id IS NOT NULL
+        RETURN type(r) AS type, a.id AS source, b.id AS target,
+               r.energy AS energy, r.weight AS weight,
+               r.conductivity AS conductivity, r.strength AS strength,
+               r.emotions AS emotions
+        """)
+        nodes = [
+            SimNode(
+                id=row.get('id'),
+                label=row.get('label') or '',
+                energy=row.get('energy'),
+                weight=row.get('weight'),
+                status=row.get('status'),
+                duration=row.get('duration'),
+                emotions=_emotions(row.get('emotions')),
+                alive=row.get('alive'),
+                tick_resolved=row.get('tick_resolved'),
+            )
+            for row in node_rows
+        ]
+        links = [
+            SimLink(
+                type=row.get('type'),
+                source=row.get('source'),
+                target=row.get('target'),
+                energy=row.get('energy'),
+                weight=row.get('weight'),
+                conductivity=row.get('conductivity'),
+                strength=row.get('strength'),
+                emotions=_emotions(row.get('emotions')),
+            )
+            for row in link_rows
+        ]
+        return cls(nodes, links)
+
+    @staticmethod
+    def _state(node: SimNode) -> Tuple:
+        return (node.energy, node.status, node.tick_resolved)
+
+    def add_link(self, link: SimLink) -> None:
+        self.links.append(link)
+        self.out_links.setdefault(link.source, []).append(link)
+        self.in_links.setdefault(link.target, []).append(link)
+
+    def label(self, node_id: str) -> str:
+        node = self.nodes.get(node_id)
+        return node.label if node else ''
+
+    def energy(self, node_id: str) -> float:
+        node = self.nodes.get(node_id)
+        return (node.energy or 0.0) if node else 0.0
+
+    def set_energy(self, node_id: str, value: float) -> None:
+        node = self.nodes.get(node_id)
+        if node is not None:
+            node.energy = value
+
+    def dirty_nodes(self) -> List[SimNode]:
+        """Nodes whose energy/status/tick_resolved changed since load."""
+        return [n for nid, n in self.nodes.items() if self._state(n) != self._initial.get(nid)]
+
+
+def _hottest(links: List[SimLink], n: int) -> List[SimLink]:
+    return sorted(links, key=lambda l: l.heat, reverse=True)[:n]
+
+
+def _w(value: Optional[float]) -> float:
+    """`x or 1.0` — the v1.2 default for weights and conductivity."""
+    return value or 1.0
+
+
+def _resistance_edge(link: SimLink) -> Dict[str, Any]:
+    """A link as a dijkstra_with_resistance edge (GraphTickV1_2._path_resistance)."""
+    return {
+        'node_a': link.source,
+        'node_b': link.target,
+        'conductivity': _w(link.conductivity),
+        'weight': _w(link.weight),
+        'emotion_factor': max(0.1, avg_emotion_intensity(link.emotions) if link.emotions else 0.5),
+    }
+
+
+# =============================================================================
+# STOP PREDICATES
+# =============================================================================
+
+StopPredicate = Callable[[TickResultV1_2, WorkingSubgraph], List[Dict[str, Any]]]
+
+
+def stop_on_completion(location_id: Optional[str] = None) -> StopPredicate:
+    """
+    Stop when a moment completes (optionally only AT location_id).
+
+    Returns the completions that triggered the stop. The location check uses
+    the loaded AT links, so it costs no query.
+    """
+    def predicate(result: TickResultV1_2, graph: WorkingSubgraph) -> List[Dict[str, Any]]:
+        if not location_id:
+            return list(result.completions)
+        return [
+            c for c in result.completions
+            if any(
+                l.type == 'AT' and l.target == location_id
+                for l in graph.out_links.get(c.get('moment_id'), [])
+            )
+        ]
+    return predicate
+
+
+def stop_on_terminal() -> StopPredicate:
+    """Stop on any completion or rejection (run_until_completion_or_interruption)."""
+    def predicate(result: TickResultV1_2, graph: WorkingSubgraph) -> List[Dict[str, Any]]:
+        return list(result.completions) + list(result.rejections)
+    return predicate
+
+
+# =============================================================================
+# FAST-FORWARD RESULT
+# =============================================================================
+
+@dataclass
+class FastForwardResult:
+    """Outcome of a fast-forward run."""
+    ticks_run: int = 0
+    stopped_reason: str = "max_ticks_reached"
+    triggered: List[Dict[str, Any]] = field(default_factory=list)
+    tick_results: List[TickResultV1_2] = field(default_factory=list)  # per-tick event log
+    nodes_written: int = 0
+    links_created: int = 0
+    queries_issued: int = 0
+
+    @property
+    def final_tick_result(self) -> Optional[TickResultV1_2]:
+        return self.tick_results[-1] if self.tick_results else None
+
+
+# =============================================================================
+# FAST-FORWARD TICK ENGINE
+# =============================================================================
+
+class FastForwardTick:
+    """Run many v1.2 ticks in memory, then write back the final state once."""
+
+    def __init__(
+        self,
+        graph_name: str = "graph",
+        host: str = "localhost",
+        port: int = 6379,
+        graph_queries: Optional[GraphQueries] = None,
+        graph_ops: Optional[GraphOps] = None,
+        profiler: Optional[TickProfiler] = None
+    ):
+        self.read = graph_queries or GraphQueries(graph_name=graph_name, host=host, port=port)
+        self.write = graph_ops or GraphOps(graph_name=graph_name, host=host, port=port)
+        # Phases run in memory, so only wall time is interesting here
+        self.profiler = profiler or TickProfiler()
+        self.graph: Optional[WorkingSubgraph] = None
+        # Phase 1 path search: adjacency for the whole run, resistances per source
+        self._resistance_graph: Dict[str, List[tuple]] = {}
+        self._resistances: Dict[str, Dict[str, float]] = {}
+
+    def run(
+        self,
+        max_ticks: int = 100,
+        stop_when: Optional[StopPredicate] = None,
+        current_tick: int = 0,
+        player_id: str = "player",
+        idle_ticks_before_exit: int = 5
+    ) -> FastForwardResult:
+        """
+        Simulate up to max_ticks ticks, stopping early when `stop_when`
+        returns a non-empty list or the system has had no energy movement
+        for more than `idle_ticks_before_exit` ticks.
+
+        Tick i is run with tick number current_tick + i.
+        """
+        self.graph = WorkingSubgraph.load(self.read)
+        self._resistance_graph = resistance_graph(_resistance_edge(l) for l in self.graph.links)
+        self._resistances.clear()
+        ff = FastForwardResult(queries_issued=2)
+
+        for i in range(max_ticks):
+            result = self._tick(current_tick + i, player_id)
+            ff.ticks_run += 1
+            ff.tick_results.append(result)
+
+            triggered = stop_when(result, self.graph) if stop_when else []
+            if triggered:
+                ff.triggered = triggered
+                ff.stopped_reason = "stop_condition"
+                break
+
+            total_energy = (
+                result.energy_generated +
+                result.energy_drawn +
+                result.energy_flowed +
+                result.energy_backflowed
+            )
+            if total_energy == 0 and ff.ticks_run > idle_ticks_before_exit:
+                ff.stopped_reason = "no_energy_in_system"
+                break
+
+        self._write_back(ff)
+        logger.info(
+            f"[FastForward] {ff.ticks_run} ticks, reason={ff.stopped_reason}, "
+            f"nodes_written={ff.nodes_written}, queries={ff.queries_issued}"
+        )
+        return ff
+
+    # =========================================================================
+    # WRITE-BACK
+    # =========================================================================
+
+    def _write_back(self, ff: FastForwardResult) -> None:
+        dirty = self.graph.dirty_nodes()
+        energy_rows = [{'id': n.id, 'energy': n.energy} for n in dirty]
+        status_rows = [
+            {'id': n.id, 'status': n.status, 'tick_resolved': n.tick_resolved}
+            for n in dirty if n.label == 'Moment'
+        ]
+        link_rows = [
+            {'a': l.source, 'b': l.target, 'emotions': l.emotions, 'created_from': cf}
+            for l, cf in self.graph.created_links
+        ]
+
+        if energy_rows:
+            self.write._query("""
+            UNWIND $rows AS row
+            MATCH (n {id: row.id})
+            SET n.energy = row.energy
+            """, {'rows': energy_rows})
+            ff.queries_issued += 1
+        if status_rows:
+            self.write._query("""
+            UNWIND $rows AS row
+            MATCH (m:Moment {id: row.id})
+            SET m.status = row.status, m.tick_resolved = row.tick_resolved
+            """, {'rows': status_rows})
+            ff.queries_issued += 1
+        if link_rows:
+            self.write._query("""
+            UNWIND $rows AS row
+            MATCH (a:Actor {id: row.a}), (b:Actor {id: row.b})
+            CREATE (a)-[:RELATES {
+                conductivity: 0.2, weight: 0.2, energy: 0.0, strength: 0.1,
+                emotions: row.emotions, created_from: row.created_from
+            }]->(b)
+            """, {'rows': link_rows})
+            ff.queries_issued += 1
+
+        ff.nodes_written = len(dirty)
+        ff.links_created = len(link_rows)
+
+    # =========================================================================
+    # ONE TICK (mirrors GraphTickV1_2.run)
+    # =========================================================================
+
+    def _tick(self, current_tick: int, player_id: str) -> TickResultV1_2:
+        result = TickResultV1_2()
+        profiler = self.profiler
+        profiler.begin_tick(current_tick)
+
+        with profiler.phase(1):
+            result.energy_generated, result.actors_updated = self._phase_generation(player_id)
+
+        with profiler.phase(2):
+            possible = self._moments_by_status('possible')
+            active = self._moments_by_status('active')
+            result.moments_possible = len(possible)
+            result.moments_active = len(active)
+            result.energy_drawn = self._phase_moment_draw(possible + active)
+
+        with profiler.phase(3):
+            result.energy_flowed = self._phase_moment_flow(active)
+        with profiler.phase(4):
+            result.energy_interacted = self._phase_moment_interaction(active)
+        with profiler.phase(5):
+            result.energy_backflowed = self._phase_narrative_backflow()
+        with profiler.phase(6):
+            result.energy_cooled, result.links_cooled = self._phase_link_cooling()
+            result.hot_links, result.cold_links = self._count_hot_cold_links()
+
+        with profiler.phase(7):
+            completions, crystallized = self._phase_completion(active, current_tick)
+            result.completions = completions
+            result.moments_completed = len(completions)
+            result.links_crystallized = crystallized
+
+        with profiler.phase(8):
+            rejections = self._phase_rejection(player_id, current_tick)
+            result.rejections = rejections
+            result.moments_rejected = len(rejections)
+
+        result.phases = profiler.end_tick()
+        return result
+
+    def _moments_by_status(self, status: str) -> List[Dict]:
+        # Snapshot dicts, like the query rows GraphTickV1_2 passes around
+        return [
+            {'id': n.id, 'energy': n.energy, 'weight': n.weight, 'duration': n.duration}
+            for n in self.graph.nodes.values()
+            if n.label == 'Moment' and n.status == status
+        ]
+
+    def _moment_emotions(self, moment_id: str) -> List[List]:
+        links = [
+            {'weight': l.weight, 'emotions': l.emotions}
+            for l in self.graph.out_links.get(moment_id, [])
+        ]
+        return get_weighted_average_emotions(links)
+
+    # -- Phase 1 --------------------------------------------------------------
+
+    def _phase_generation(self, player_id: str) -> Tuple[float, int]:
+        actors = [
+            n for n in self.graph.nodes.values()
+            if n.label == 'Actor' and (n.alive is True or n.alive is None)
+        ]
+        actors.sort(key=lambda a: a.weight if a.weight is not None else float('-inf'), reverse=True)
+
+        total = 0.0
+        for actor in actors:
+            proximity = 1.0 if actor.id == player_id else self._proximity(player_id, actor.id)
+            generated = _w(actor.weight) * GENERATION_RATE * proximity
+            actor.energy = (actor.energy or 0.0) + generated
+            total += generated
+        return total, len(actors)
+
+    def _proximity(self, from_id: str, to_id: str) -> float:
+        resistances = self._resistances.get(from_id)
+        if resistances is None:
+            resistances = self._resistances[from_id] = shortest_resistances(
+                self._resistance_graph, from_id, 5
+            )
+        return 1.0 / (1.0 + resistances.get(to_id, 100.0))
+
+    def _add_resistance_link(self, link: SimLink) -> None:
+        """
+        Extend the phase 1 adjacency with a new link.
+
+        A search result stays valid unless it reached one of the link's
+        ends: the search never popped either end, so it never expanded the
+        new edge.
+        """
+        add_resistance_edge(self._resistance_graph, _resistance_edge(link))
+        for source, resistances in list(self._resistances.items()):
+            if link.source in resistances or link.target in resistances:
+                del self._resistances[source]
+
+    # -- Phase 2 --------------------------------------------------------------
+
+    def _phase_moment_draw(self, moments: List[Dict]) -> float:
+        g = self.graph
+        total = 0.0
+        ordered = sorted(moments, key=lambda m: (m['energy'] or 0.0) * _w(m['weight']), reverse=True)
+
+        for moment in ordered:
+            moment_id = moment['id']
+            moment_weight = _w(moment['weight'])
+            moment_energy = moment['energy'] or 0.0
+            moment_emotions = self._moment_emotions(moment_id)
+
+            links = _hottest(
+                [l for l in g.in_links.get(moment_id, [])
+                 if l.type in DRAW_LINK_TYPES and g.label(l.source) == 'Actor'],
+                TOP_N_LINKS
+            )
+            # Actor energies as of link fetch, matching the per-moment query
+            fetched = [(l, g.energy(l.source)) for l in links]
+
+            for link, actor_energy in fetched:
+                flow = (actor_energy * DRAW_RATE * _w(link.conductivity) * _w(link.weight)
+                        * emotion_proximity(link.emotions, moment_emotions))
+                if flow > 0.001:
+                    actor_energy -= flow
+                    moment_energy += flow * math.sqrt(moment_weight)
+                    total += flow
+                    g.set_energy(link.source, max(0, actor_energy))
+
+            g.set_energy(moment_id, moment_energy)
+        return total
+
+    # -- Phase 3 --------------------------------------------------------------
+
+    def _phase_moment_flow(self, active: List[Dict]) -> float:
+        g = self.graph
+        total = 0.0
+        ordered = sorted(active, key=lambda m: (m['energy'] or 0.0) * _w(m['weight']), reverse=True)
+
+        for moment in ordered:
+            node = g.nodes.get(moment['id'])
+            if node is None:
+                continue
+            moment_energy = node.energy or 0.0
+            if moment_energy <= 0.01:
+                continue
+
+            radiation = moment_energy * (1.0 / (_w(node.duration) * TICKS_PER_MINUTE))
+            moment_emotions = self._moment_emotions(node.id)
+            links = _hottest(
+                [l for l in g.out_links.get(node.id, []) if g.label(l.target) != 'Actor'],
+                TOP_N_LINKS
+            )
+            if not links:
+                continue
+            total_weight = sum(_w(l.weight) for l in links)
+            if total_weight <= 0:
+                continue
+
+            fetched = [(l, g.energy(l.target), _w(g.nodes[l.target].weight) if l.target in g.nodes else 1.0)
+                       for l in links]
+            for link, target_energy, target_weight in fetched:
+                flow = (radiation * (_w(link.weight) / total_weight) * _w(link.conductivity)
+                        * emotion_proximity(link.emotions, moment_emotions))
+                if flow > 0.001:
+                    moment_energy -= flow
+                    target_energy += flow * math.sqrt(target_weight)
+                    total += flow
+                    g.set_energy(link.target, target_energy)
+
+            g.set_energy(node.id, max(0, moment_energy))
+        return total
+
+    # -- Phase 4 --------------------------------------------------------------
+
+    def _phase_moment_interaction(self, active: List[Dict]) -> float:
+        if len(active) < 2:
+            return 0.0
+        g = self.graph
+        total = 0.0
+        emotions = {m['id']: self._moment_emotions(m['id']) for m in active}
+        about = {
+            m['id']: {l.target for l in g.out_links.get(m['id'], [])
+                      if l.type == 'ABOUT' and g.label(l.target) == 'Narrative'}
+            for m in active
+        }
+
+        for i, m1 in enumerate(active):
+            m1_energy = m1['energy'] or 0.0
+            if m1_energy <= 0.01:
+                continue
+            for m2 in active[i + 1:]:
+                if not (about[m1['id']] & about[m2['id']]):
+                    continue
+                m2_energy = m2['energy'] or 0.0
+                proximity = emotion_proximity(emotions[m1['id']], emotions[m2['id']])
+                if proximity > SUPPORT_THRESHOLD:
+                    support = m1_energy * INTERACTION_RATE * proximity
+                    g.set_energy(m2['id'], m2_energy + support * math.sqrt(_w(m2['weight'])))
+                    total += support
+                elif proximity < CONTRADICT_THRESHOLD:
+                    suppress = m1_energy * INTERACTION_RATE * (1 - proximity)
+                    g.set_energy(m2['id'], max(0, m2_energy - suppress))
+                    total += suppress
+        return total
+
+    # -- Phase 5 --------------------------------------------------------------
+
+    def _phase_narrative_backflow(self) -> float:
+        g = self.graph
+        total = 0.0
+        narratives = [n for n in g.nodes.values()
+                      if n.label == 'Narrative' and n.energy is not None and n.energy > 0.01]
+        narratives.sort(key=lambda n: n.energy, reverse=True)
+
+        for narr in narratives:
+            narr_energy = narr.energy or 0.0
+            links = _hottest(
+                [l for l in g.in_links.get(narr.id, [])
+                 if l.type == 'BELIEVES' and g.label(l.source) == 'Actor'],
+                TOP_N_LINKS
+            )
+            fetched = [(l, g.energy(l.source), _w(g.nodes[l.source].weight)) for l in links]
+
+            for link, actor_energy, actor_weight in fetched:
+                link_energy = link.energy or 0.0
+                if link_energy < COLD_THRESHOLD:
+                    continue
+                backflow = (narr_energy * BACKFLOW_RATE * _w(link.conductivity)
+                            * emotion_proximity(link.emotions, narr.emotions) * link_energy)
+                if backflow > 0.001:
+                    narr_energy -= backflow
+                    actor_energy += backflow * math.sqrt(actor_weight)
+                    total += backflow
+                    g.set_energy(link.source, actor_energy)
+
+            g.set_energy(narr.id, max(0, narr_energy))
+        return total
+
+    # -- Phase 6 --------------------------------------------------------------
+
+    def _phase_link_cooling(self) -> Tuple[float, int]:
+        g = self.graph
+        hot = [l for l in g.links if l.energy is not None and l.heat > COLD_THRESHOLD]
+        hot.sort(key=lambda l: l.heat, reverse=True)
+        # Node energies as of the single phase-start query
+        snapshot = [(l, g.energy(l.source), g.energy(l.target)) for l in hot]
+
+        total = 0.0
+        for link, a_energy, b_energy in snapshot:
+            drain = (link.energy or 0.0) * LINK_DRAIN_RATE
+            g.set_energy(link.source, a_energy + drain * 0.5)
+            g.set_energy(link.target, b_energy + drain * 0.5)
+            total += drain
+        return total, len(hot)
+
+    def _count_hot_cold_links(self) -> Tuple[int, int]:
+        hot = cold = 0
+        for link in self.graph.links:
+            if link.energy is None:
+                continue
+            if link.heat > COLD_THRESHOLD:
+                hot += 1
+            else:
+                cold += 1
+        return hot, cold
+
+    # -- Phase 7 --------------------------------------------------------------
+
+    def _phase_completion(self, active: List[Dict], current_tick: int) -> Tuple[List[Dict], int]:
+        g = self.graph
+        completions = []
+        crystallized_total = 0
+
+        for moment in active:
+            node = g.nodes.get(moment['id'])
+            if node is None:
+                continue
+            energy = node.energy or 0.0
+            if energy >= COMPLETION_THRESHOLD:
+                node.status = 'completed'
+                node.tick_resolved = current_tick
+                crystallized = self._crystallize_actor_links(node.id)
+                crystallized_total += crystallized
+                completions.append({
+                    'moment_id': node.id,
+                    'energy': energy,
+                    'tick': current_tick,
+                    'links_crystallized': crystallized
+                })
+        return completions, crystallized_total
+
+    def _crystallize_actor_links(self, moment_id: str) -> int:
+        g = self.graph
+        actor_ids = list(dict.fromkeys(
+            l.source for l in g.in_links.get(moment_id, []) if g.label(l.source) == 'Actor'
+        ))
+        if len(actor_ids) < 2:
+            return 0
+
+        emotions = self._moment_emotions(moment_id)
+        created = 0
+        for i, a in enumerate(actor_ids):
+            for b in actor_ids[i + 1:]:
+                exists = any(
+                    l.type == 'RELATES' and {l.source, l.target} == {a, b}
+                    for l in g.out_links.get(a, []) + g.out_links.get(b, [])
+                )
+                if not exists:
+                    link = SimLink(type='RELATES', source=a, target=b, energy=0.0,
+                                   weight=0.2, conductivity=0.2, strength=0.1, emotions=emotions)
+                    g.add_link(link)
+                    g.created_links.append((link, moment_id))
+                    self._add_resistance_link(link)
+                    created += 1
+        return created
+
+    # -- Phase 8 --------------------------------------------------------------
+
+    def _phase_rejection(self, player_id: str, current_tick: int) -> List[Dict]:
+        g = self.graph
+        rejections = []
+        rejected = [n for n in g.nodes.values()
+                    if n.label == 'Moment' and n.status == 'rejected'
+                    and n.energy is not None and n.energy > 0]
+
+        for moment in rejected:
+            return_energy = moment.energy * REJECTION_RETURN_RATE
+            player = g.nodes.get(player_id)
+            if player is not None and player.label == 'Actor':
+                player.energy = (player.energy or 0.0) + return_energy
+            moment.energy = 0
+            moment.tick_resolved = current_tick
+            rejections.append({
+                'moment_id': moment.id,
+                'energy_returned': return_energy,
+                'tick': current_tick
+            })
+        return rejections
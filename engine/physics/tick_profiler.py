@@ -0,0 +1,276 @@
+"""
+Schema v1.2 — Tick Phase Profiler
+
+Times every phase of a tick and every graph query issued inside it:
+wall time, query count, rows read and rows written per phase.
+
+GraphTickV1_2 wraps its GraphQueries / GraphOps in thin proxies that
+report each `query()` / `_query()` call to the profiler, and opens a
+`profiler.phase(...)` span around each of its 8 phases. At the end of a
+tick the per-phase profiles are:
+
+- exported on `TickResultV1_2.phases` (list of dicts, JSON-safe)
+- forwarded to `TickIntegrityChecker.record_phase` (V-TICK-ORDER input)
+- forwarded to `ActivityLogger.phase_profile` (detail log)
+- optionally kept as Chrome trace events (chrome://tracing, Perfetto)
+
+Rows written are counted per statement: an UNWIND batch counts one per
+`rows` parameter entry, any other write counts one.
+
+Usage:
+    from engine.physics.tick_profiler import TickProfiler
+
+    profiler = TickProfiler(trace=True)
+    tick = GraphTickV1_2(graph_name="blood_ledger", profiler=profiler)
+    tick.run()
+    profiler.write_chrome_trace("tick_trace.json")
+
+DOCS: docs/physics/tick-runner/PATTERNS_Tick_Runner.md
+"""
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Phase names as TickIntegrityChecker.EXPECTED_PHASES knows them
+PHASE_NAMES = {
+    1: "generate",
+    2: "draw",
+    3: "flow",
+    4: "interaction",
+    5: "backflow",
+    6: "link_cooling",
+    7: "completion",
+    8: "rejection",
+}
+
+MAX_TRACE_EVENTS = 200_000
+
+
+@dataclass
+class PhaseProfile:
+    """Timing and query counters for one phase of one tick."""
+    phase: int
+    name: str
+    tick: int
+    start: datetime
+    end: datetime
+    wall_ms: float = 0.0
+    queries: int = 0
+    reads: int = 0
+    writes: int = 0
+    rows_read: int = 0
+    rows_written: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = asdict(self)
+        d["start"] = self.start.isoformat()
+        d["end"] = self.end.isoformat()
+        d["wall_ms"] = round(self.wall_ms, 3)
+        return d
+
+
+class TickProfiler:
+    """
+    Collects per-phase profiles and (optionally) Chrome trace events.
+
+    Sinks are optional: `integrity` is a TickIntegrityChecker, `activity`
+    an ActivityLogger. Both are duck-typed so the profiler has no import
+    dependency on the health packages.
+    """
+
+    def __init__(
+        self,
+        integrity: Any = None,
+        activity: Any = None,
+        trace: bool = False,
+    ):
+        self.integrity = integrity
+        self.activity = activity
+        self.trace = trace
+        self.trace_events: List[Dict[str, Any]] = []
+        self.last_tick: List[PhaseProfile] = []
+        self.totals: Dict[str, Dict[str, float]] = {}
+        self.unattributed_queries = 0
+
+        self._origin = time.perf_counter()
+        self._tick = 0
+        self._current: Optional[PhaseProfile] = None
+        self._phases: List[PhaseProfile] = []
+
+    # -------------------------------------------------------------------------
+    # Tick / phase spans
+    # -------------------------------------------------------------------------
+
+    def begin_tick(self, tick: int) -> None:
+        self._tick = tick
+        self._phases = []
+        if self.integrity is not None:
+            self.integrity.clear_phases()
+
+    def end_tick(self) -> List[Dict[str, Any]]:
+        """Close the tick; returns the phase profiles as dicts."""
+        self.last_tick = self._phases
+        for p in self._phases:
+            total = self.totals.setdefault(p.name, {
+                "wall_ms": 0.0, "queries": 0, "rows_read": 0, "rows_written": 0
+            })
+            total["wall_ms"] += p.wall_ms
+            total["queries"] += p.queries
+            total["rows_read"] += p.rows_read
+            total["rows_written"] += p.rows_written
+        return [p.to_dict() for p in self._phases]
+
+    @contextmanager
+    def phase(self, index: int, name: Optional[str] = None) -> Iterator[PhaseProfile]:
+        """Time one phase; queries issued inside are attributed to it."""
+        profile = PhaseProfile(
+            phase=index,
+            name=name or PHASE_NAMES.get(index, f"phase_{index}"),
+            tick=self._tick,
+            start=datetime.utcnow(),
+            end=datetime.utcnow(),
+        )
+        outer, self._current = self._current, profile
+        started = time.perf_counter()
+        try:
+            yield profile
+        finally:
+            elapsed = time.perf_counter() - started
+            self._current = outer
+            profile.end = datetime.utcnow()
+            profile.wall_ms = elapsed * 1000
+            self._phases.append(profile)
+            self._emit(profile.name, "phase", started, elapsed, {
+                "tick": profile.tick,
+                "queries": profile.queries,
+                "rows_read": profile.rows_read,
+                "rows_written": profile.rows_written,
+            })
+            self._forward(profile)
+
+    def _forward(self, profile: PhaseProfile) -> None:
+        # Sinks must never break a tick
+        if self.integrity is not None:
+            try:
+                self.integrity.record_phase(profile.name, profile.start, profile.end)
+            except Exception as e:
+                logger.warning(f"[TickProfiler] Integrity sink failed: {e}")
+        if self.activity is not None:
+            try:
+                self.activity.phase_profile(
+                    profile.phase, profile.name, profile.wall_ms,
+                    profile.queries, profile.rows_read, profile.rows_written
+                )
+            except Exception as e:
+                logger.warning(f"[TickProfiler] Activity sink failed: {e}")
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def record_query(
+        self,
+        kind: str,
+        cypher: str,
+        params: Optional[Dict[str, Any]],
+        result: Any,
+        started: float,
+        elapsed: float,
+    ) -> None:
+        """Attribute one query to the open phase. `kind` is 'read' or 'write'."""
+        rows = len(result) if isinstance(result, list) else 0
+        if kind == "write":
+            batch = (params or {}).get("rows")
+            written = len(batch) if isinstance(batch, list) else 1
+        else:
+            written = 0
+
+        p = self._current
+        if p is None:
+            self.unattributed_queries += 1
+        else:
+            p.queries += 1
+            if kind == "write":
+                p.writes += 1
+                p.rows_written += written
+            else:
+                p.reads += 1
+                p.rows_read += rows
+
+        if self.trace:
+            self._emit(" ".join(cypher.split())[:80], kind, started, elapsed, {
+                "rows": rows, "rows_written": written
+            })
+
+    def instrument_read(self, read: Any) -> "_ProfiledQueries":
+        return read if isinstance(read, _ProfiledQueries) else _ProfiledQueries(read, self)
+
+    def instrument_write(self, write: Any) -> "_ProfiledOps":
+        return write if isinstance(write, _ProfiledOps) else _ProfiledOps(write, self)
+
+    # -------------------------------------------------------------------------
+    # Chrome trace
+    # -------------------------------------------------------------------------
+
+    def _emit(self, name: str, cat: str, started: float, elapsed: float, args: Dict[str, Any]) -> None:
+        if not self.trace or len(self.trace_events) >= MAX_TRACE_EVENTS:
+            return
+        self.trace_events.append({
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": round((started - self._origin) * 1e6, 1),
+            "dur": round(elapsed * 1e6, 1),
+            "pid": 1,
+            "tid": 1,
+            "args": args,
+        })
+
+    def write_chrome_trace(self, path: str) -> Path:
+        """Write collected events in Chrome trace-event JSON format."""
+        out = Path(path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps({"traceEvents": self.trace_events, "displayTimeUnit": "ms"}))
+        return out
+
+
+class _ProfiledQueries:
+    """GraphQueries proxy: times query(), delegates everything else."""
+
+    def __init__(self, inner: Any, profiler: TickProfiler):
+        self._inner = inner
+        self._profiler = profiler
+
+    def query(self, cypher: str, params: Dict[str, Any] = None):
+        started = time.perf_counter()
+        result = self._inner.query(cypher, params)
+        self._profiler.record_query("read", cypher, params, result, started, time.perf_counter() - started)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+
+class _ProfiledOps:
+    """GraphOps proxy: times _query(), delegates everything else."""
+
+    def __init__(self, inner: Any, profiler: TickProfiler):
+        self._inner = inner
+        self._profiler = profiler
+
+    def _query(self, cypher: str, params: Dict[str, Any] = None):
+        started = time.perf_counter()
+        result = self._inner._query(cypher, params)
+        self._profiler.record_query("write", cypher, params, result, started, time.perf_counter() - started)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
@@ -23,6 +23,9 @@ Modes:
 Options:
     --graph NAME    Graph name (default: test)
     --max-ticks N   Maximum ticks before giving up (default: 100)
+    --fast-forward  Simulate ticks in memory, write back the final state once
+    --sparse        Fast-forward with vectorized draw/flow/backflow phases
+    --trace PATH    Write a Chrome trace (phases + queries) to PATH
     --verbose       Show detailed tick output
     --json          Output as JSON
 
@@ -57,7 +60,10 @@ class TickRunResult:
 def run_until_next_moment(
     graph_name: str = "test",
     max_ticks: int = 100,
-    verbose: bool = False
+    verbose: bool = False,
+    fast_forward: bool = False,
+    sparse: bool = False,
+    trace_path: Optional[str] = None
 ) -> TickRunResult:
     """
     Run ticks until any moment completes.
@@ -69,13 +75,22 @@ def run_until_next_moment(
         graph_name: Graph database name
         max_ticks: Maximum ticks before giving up
         verbose: Log detailed tick output
+        fast_forward: Run in memory via FastForwardTick
+        sparse: Use SparseFastForwardTick (implies fast_forward)
+        trace_path: Write a Chrome trace of phases and queries here
 
     Returns:
         TickRunResult with run details
     """
     from engine.physics.tick_v1_2 import GraphTickV1_2
 
-    tick_runner = GraphTickV1_2(graph_name=graph_name)
+    if fast_forward or sparse:
+        from engine.physics.tick_fast_forward import stop_on_completion
+        return _run_fast_forward("until_next_moment", graph_name, max_ticks, stop_on_completion(),
+                                 sparse, trace_path)
+
+    profiler = _make_profiler(trace_path)
+    tick_runner = GraphTickV1_2(graph_name=graph_name, profiler=profiler)
 
     ticks_run = 0
     completions = []
@@ -117,6 +132,7 @@ def run_until_next_moment(
             "moments_possible": final_result.moments_possible,
             "hot_links": final_result.hot_links,
         }
+    final_stats.update(_profile_stats(profiler, trace_path))
 
     return TickRunResult(
         mode="until_next_moment",
@@ -132,7 +148,10 @@ def run_until_next_moment(
 def run_until_completion_or_interruption(
     graph_name: str = "test",
     max_ticks: int = 100,
-    verbose: bool = False
+    verbose: bool = False,
+    fast_forward: bool = False,
+    sparse: bool = False,
+    trace_path: Optional[str] = None
 ) -> TickRunResult:
     """
     Run ticks until a moment completes OR is interrupted/overridden.
@@ -146,13 +165,22 @@ def run_until_completion_or_interruption(
         graph_name: Graph database name
         max_ticks: Maximum ticks before giving up
         verbose: Log detailed tick output
+        fast_forward: Run in memory via FastForwardTick
+        sparse: Use SparseFastForwardTick (implies fast_forward)
+        trace_path: Write a Chrome trace of phases and queries here
 
     Returns:
         TickRunResult with run details
     """
     from engine.physics.tick_v1_2 import GraphTickV1_2
 
-    tick_runner = GraphTickV1_2(graph_name=graph_name)
+    if fast_forward or sparse:
+        from engine.physics.tick_fast_forward import stop_on_terminal
+        return _run_fast_forward("until_completion_or_interruption", graph_name, max_ticks, stop_on_terminal(),
+                                 sparse, trace_path)
+
+    profiler = _make_profiler(trace_path)
+    tick_runner = GraphTickV1_2(graph_name=graph_name, profiler=profiler)
 
     ticks_run = 0
     completions = []
@@ -214,6 +242,7 @@ def run_until_completion_or_interruption(
             "moments_possible": final_result.moments_possible,
             "hot_links": final_result.hot_links,
         }
+    final_stats.update(_profile_stats(profiler, trace_path))
 
     return TickRunResult(
         mode="until_completion_or_interruption",
@@ -226,6 +255,80 @@ def run_until_completion_or_interruption(
     )
 
 
+def _run_fast_forward(
+    mode: str,
+    graph_name: str,
+    max_ticks: int,
+    stop_when,
+    sparse: bool = False,
+    trace_path: Optional[str] = None
+) -> TickRunResult:
+    """Shared fast-forward path for both run modes."""
+    if sparse:
+        from engine.physics.tick_sparse import SparseFastForwardTick as engine_cls
+    else:
+        from engine.physics.tick_fast_forward import FastForwardTick as engine_cls
+
+    profiler = _make_profiler(trace_path)
+    ff = engine_cls(graph_name=graph_name, profiler=profiler).run(max_ticks=max_ticks, stop_when=stop_when)
+    final_result = ff.final_tick_result
+
+    completions = [t for t in ff.triggered if 'energy_returned' not in t]
+    interruptions = [t for t in ff.triggered if 'energy_returned' in t]
+    stopped_reason = ff.stopped_reason
+    if stopped_reason == "stop_condition":
+        stopped_reason = "moment_completed" if completions else "moment_rejected"
+
+    final_stats = {}
+    if final_result:
+        final_stats = {
+            "energy_generated": final_result.energy_generated,
+            "energy_drawn": final_result.energy_drawn,
+            "moments_active": final_result.moments_active,
+            "moments_possible": final_result.moments_possible,
+            "hot_links": final_result.hot_links,
+            "queries_issued": ff.queries_issued,
+        }
+    final_stats.update(_profile_stats(profiler, trace_path))
+
+    return TickRunResult(
+        mode=mode,
+        ticks_run=ff.ticks_run,
+        stopped_reason=stopped_reason,
+        completions=completions,
+        interruptions=interruptions,
+        final_stats=final_stats,
+        graph_name=graph_name,
+    )
+
+
+def _make_profiler(trace_path: Optional[str] = None):
+    """Profiler feeding the tick_integrity checker and the activity log."""
+    from engine.health import get_activity_logger
+    from engine.physics.health.checkers import TickIntegrityChecker
+    from engine.physics.tick_profiler import TickProfiler
+
+    return TickProfiler(
+        integrity=TickIntegrityChecker(),
+        activity=get_activity_logger(),
+        trace=trace_path is not None,
+    )
+
+
+def _profile_stats(profiler, trace_path: Optional[str] = None) -> Dict[str, Any]:
+    """Per-phase totals for final_stats; writes the Chrome trace if requested."""
+    stats: Dict[str, Any] = {
+        "phase_totals": {
+            name: {k: round(v, 3) for k, v in totals.items()}
+            for name, totals in profiler.totals.items()
+        },
+        "tick_integrity": profiler.integrity.check().status.value,
+    }
+    if trace_path:
+        stats["trace_path"] = str(profiler.write_chrome_trace(trace_path))
+    return stats
+
+
 def print_result(result: TickRunResult, verbose: bool = False):
     """Print tick run result to console."""
     status_color = {
@@ -279,6 +382,9 @@ def main():
     )
     parser.add_argument("--graph", default="test", help="Graph name (default: test)")
     parser.add_argument("--max-ticks", type=int, default=100, help="Max ticks (default: 100)")
+    parser.add_argument("--fast-forward", action="store_true", help="Simulate in memory, write back once")
+    parser.add_argument("--sparse", action="store_true", help="Fast-forward with vectorized flow phases")
+    parser.add_argument("--trace", metavar="PATH", help="Write a Chrome trace (chrome://tracing) of phases and queries")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
 
@@ -295,13 +401,19 @@ def main():
         result = run_until_next_moment(
             graph_name=args.graph,
             max_ticks=args.max_ticks,
-            verbose=args.verbose
+            verbose=args.verbose,
+            fast_forward=args.fast_forward,
+            sparse=args.sparse,
+            trace_path=args.trace
         )
     else:
         result = run_until_completion_or_interruption(
             graph_name=args.graph,
             max_ticks=args.max_ticks,
-            verbose=args.verbose
+            verbose=args.verbose,
+            fast_forward=args.fast_forward,
+            sparse=args.sparse,
+            trace_path=args.trace
         )
 
     # Output
@@ -0,0 +1,499 @@
+"""
+Schema v1.2 — Sparse Energy Flow Phases
+
+Vectorized phases 2 to 5 (draw, flow, interaction, backflow) for the
+in-memory fast-forward engine. Every flow in those phases has the shape
+
+    flow = source_energy × rate × conductivity × weight × emotion_factor
+
+so the per-link coefficients form a sparse matrix (rows = links, one
+source and one sink column each). Coefficients are built once from the
+working subgraph — links are read-only during a fast-forward, so they stay
+valid until a link is added — and each phase becomes gathers, a
+multiply and bincount scatters over NumPy arrays.
+
+Phases process moments/narratives in a documented order and later ones
+see energy written by earlier ones, so a single matvec over the whole
+phase would be a different (Jacobi-style) update. Each phase is instead
+split along the dependencies it actually has:
+
+    draw       moments only read actors, and an actor only sees its own
+               earlier draws: step k applies every actor's k-th drawing
+               moment at once (steps = most moments drawing on one actor)
+    flow       moments also feed moments (THEN), so groups are packed
+               greedily, in order, into conflict-free batches that touch
+               disjoint nodes; batches run in order
+    interact   pairs sharing a narrative, as a sparse pair list; every
+               write starts from the target's snapshot energy, so the last
+               acting pair per target wins
+    backflow   each narrative drains link by link, one step per link
+               column (at most TOP_N) for all narratives at once; actor
+               writes only add, so one scatter serves the phase
+
+Quirks of the scalar loop (snapshot reads, last write wins for duplicate
+links to the same node) are reproduced. Results match the scalar engine
+to float rounding, not bit for bit: emotion intensities are float32 and
+sums run in a different order.
+
+Emotion factors come from the vector algebra in emotion_vectors: link and
+node emotions are interned into a per-run vocabulary, with presence masks
+so zero-intensity emotions keep the list semantics, and each group's
+proximities are one batched weighted-Jaccard call.
+
+SciPy is not a dependency of this repo; the COO/CSR arithmetic is done
+with NumPy (`np.bincount`, `np.maximum.at`).
+
+DOCS: docs/physics/algorithms/ALGORITHM_Physics_Schema_v1.2_Energy_Physics.md
+"""
+
+import logging
+from dataclasses import dataclass
+from itertools import chain, combinations
+from typing import Callable, Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from engine.physics.emotion_vectors import (
+    EmotionVocabulary,
+    proximity_pairs,
+    proximity_rows,
+    stack,
+    weighted_average,
+)
+from engine.physics.tick_fast_forward import (
+    DRAW_LINK_TYPES,
+    FastForwardTick,
+    WorkingSubgraph,
+    _hottest,
+    _w,
+)
+from engine.physics.tick_v1_2 import (
+    BACKFLOW_RATE,
+    COLD_THRESHOLD,
+    CONTRADICT_THRESHOLD,
+    DRAW_RATE,
+    INTERACTION_RATE,
+    SUPPORT_THRESHOLD,
+    TICKS_PER_MINUTE,
+    TOP_N_LINKS,
+)
+
+logger = logging.getLogger(__name__)
+
+MIN_FLOW = 0.001
+
+
+# =============================================================================
+# COEFFICIENT MATRICES
+# =============================================================================
+
+@dataclass
+class LinkGroup:
+    """
+    The top-N links of one moment or narrative, as COO rows.
+
+    `owner` is the moment/narrative index; `other` holds the node index at
+    the far end of each link; `coef` the static per-link coefficient.
+    """
+    owner: int
+    other: np.ndarray
+    coef: np.ndarray
+    total_weight: float = 0.0
+
+
+# An emotion vector and its presence mask (see emotion_vectors)
+Emotions = Tuple[np.ndarray, np.ndarray]
+
+
+def _proximities(links, emotions: Emotions) -> np.ndarray:
+    """emotion_proximity of every link to one emotion vector, in one call."""
+    vector, present = emotions
+    return proximity_rows(
+        stack([l.emotion_vector for l in links], len(vector)),
+        vector,
+        stack([l.emotion_present for l in links], len(vector), dtype=bool),
+        present,
+    )
+
+
+def _group(owner: int, other: Sequence[int], coef: Sequence[float], total_weight: float = 0.0) -> LinkGroup:
+    return LinkGroup(
+        owner=owner,
+        other=np.asarray(other, dtype=np.int64),
+        coef=np.asarray(coef, dtype=np.float64),
+        total_weight=total_weight,
+    )
+
+
+class FlowMatrices:
+    """Per-link coefficients for draw, flow and backflow, keyed by owner id."""
+
+    def __init__(self, graph: WorkingSubgraph, moment_emotions: Callable[[str], Emotions]):
+        self.ids: List[str] = list(graph.nodes)
+        self.index: Dict[str, int] = {nid: i for i, nid in enumerate(self.ids)}
+        self.weight = np.array([_w(graph.nodes[n].weight) for n in self.ids])
+        self.link_count = len(graph.links)
+
+        self.draw: Dict[str, LinkGroup] = {}
+        self.flow: Dict[str, LinkGroup] = {}
+        self.backflow: Dict[str, LinkGroup] = {}
+        # Moment emotions depend only on out-links, so they live as long as the coefficients
+        self.moment_emotions: Dict[str, Emotions] = {}
+
+        for node in graph.nodes.values():
+            if node.label == 'Moment':
+                emotions = self.moment_emotions[node.id] = moment_emotions(node.id)
+                self._build_moment(graph, node.id, emotions)
+            elif node.label == 'Narrative':
+                self._build_narrative(graph, node.id, (node.emotion_vector, node.emotion_present))
+
+    def _build_moment(self, graph: WorkingSubgraph, moment_id: str, emotions: Emotions) -> None:
+        idx = self.index
+        owner = idx[moment_id]
+
+        draw_links = _hottest(
+            [l for l in graph.in_links.get(moment_id, [])
+             if l.type in DRAW_LINK_TYPES and graph.label(l.source) == 'Actor'],
+            TOP_N_LINKS
+        )
+        self.draw[moment_id] = _group(
+            owner,
+            [idx[l.source] for l in draw_links],
+            DRAW_RATE * np.array([_w(l.conductivity) * _w(l.weight) for l in draw_links])
+            * _proximities(draw_links, emotions),
+        )
+
+        flow_links = _hottest(
+            [l for l in graph.out_links.get(moment_id, []) if graph.label(l.target) != 'Actor'],
+            TOP_N_LINKS
+        )
+        total_weight = sum(_w(l.weight) for l in flow_links)
+        self.flow[moment_id] = _group(
+            owner,
+            [idx[l.target] for l in flow_links],
+            np.array([(_w(l.weight) / total_weight) * _w(l.conductivity) if total_weight > 0 else 0.0
+                      for l in flow_links])
+            * _proximities(flow_links, emotions),
+            total_weight,
+        )
+
+    def _build_narrative(self, graph: WorkingSubgraph, narrative_id: str, emotions: Emotions) -> None:
+        links = _hottest(
+            [l for l in graph.in_links.get(narrative_id, [])
+             if l.type == 'BELIEVES' and graph.label(l.source) == 'Actor'],
+            TOP_N_LINKS
+        )
+        # link.energy gate: cold links carry a zero coefficient
+        self.backflow[narrative_id] = _group(
+            self.index[narrative_id],
+            [self.index[l.source] for l in links],
+            BACKFLOW_RATE * np.array([_w(l.conductivity) * (l.energy or 0.0)
+                                      if (l.energy or 0.0) >= COLD_THRESHOLD else 0.0
+                                      for l in links])
+            * _proximities(links, emotions),
+        )
+
+
+def conflict_free_batches(footprints: List[Set[int]]) -> List[List[int]]:
+    """
+    Pack groups, in order, into batches whose footprints are disjoint.
+
+    A group joins the current batch unless it shares a node with it; then a
+    new batch starts. Order across batches is preserved, and groups inside a
+    batch are independent, so processing a batch at once matches the
+    sequential loop.
+    """
+    batches: List[List[int]] = []
+    used: Set[int] = set()
+    for i, footprint in enumerate(footprints):
+        if not batches or footprint & used:
+            batches.append([])
+            used = set()
+        batches[-1].append(i)
+        used |= footprint
+    return batches
+
+
+def _last_write(other: np.ndarray, mask: np.ndarray, size: int) -> np.ndarray:
+    """Position of the last masked row per target node (-1 if none)."""
+    last = np.full(size, -1, dtype=np.int64)
+    positions = np.arange(len(other))
+    np.maximum.at(last, other[mask], positions[mask])
+    return last
+
+
+def _event_rank(other: np.ndarray, group: np.ndarray) -> np.ndarray:
+    """
+    Per row: how many earlier groups touched the row's node.
+
+    Rows are in group order. Rows of one group that hit the same node share
+    a rank, so step k of a phase can take every node's k-th group at once.
+    """
+    order = np.lexsort((group, other))
+    node, grp = other[order], group[order]
+    new_node = np.r_[True, node[1:] != node[:-1]]
+    event = np.cumsum(new_node | np.r_[True, grp[1:] != grp[:-1]]) - 1
+    first = np.maximum.accumulate(np.where(new_node, event, 0))
+    rank = np.empty_like(event)
+    rank[order] = event - first
+    return rank
+
+
+def _last_per_group(other: np.ndarray, group: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Rows that are the last masked row for their (group, node) pair."""
+    rows = np.flatnonzero(mask)
+    keys = group[rows] * (int(other.max(initial=0)) + 1) + other[rows]
+    _, first_from_end = np.unique(keys[::-1], return_index=True)
+    return rows[len(rows) - 1 - first_from_end]
+
+
+# =============================================================================
+# SPARSE FAST-FORWARD ENGINE
+# =============================================================================
+
+class SparseFastForwardTick(FastForwardTick):
+    """FastForwardTick with phases 2 to 5 as batched array operations and vector emotions."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._matrices: FlowMatrices = None
+        self.vocabulary = EmotionVocabulary()
+        self.batches_run = 0
+
+    def _vectorize(self) -> None:
+        """Give every node and link a float32 emotion vector and presence mask (new links included)."""
+        g = self.graph
+        for item in chain(g.nodes.values(), g.links):
+            if item.emotion_vector is None:
+                item.emotion_vector = self.vocabulary.to_vector(item.emotions)
+                item.emotion_present = self.vocabulary.to_mask(item.emotions)
+
+    def _moment_emotion_vector(self, moment_id: str) -> Emotions:
+        """Weighted average of the out-links; an emotion is present if any link lists it."""
+        links = self.graph.out_links.get(moment_id, [])
+        size = len(self.vocabulary)
+        vector = weighted_average(stack([l.emotion_vector for l in links], size), [l.weight for l in links])
+        present = stack([l.emotion_present for l in links], size, dtype=bool).any(axis=0)
+        return vector, present
+
+    def _flow_matrices(self) -> FlowMatrices:
+        """Build coefficients once; rebuild only if a new link touches a flow phase."""
+        g = self.graph
+        m = self._matrices
+        if m is not None and len(m.ids) == len(g.nodes):
+            added = g.links[m.link_count:]
+            # Crystallization only adds Actor-Actor RELATES links, which
+            # phases 2, 3 and 5 never traverse.
+            if not any(g.label(l.source) != 'Actor' or g.label(l.target) != 'Actor' for l in added):
+                m.link_count = len(g.links)
+                return m
+        self._vectorize()
+        m = self._matrices = FlowMatrices(g, self._moment_emotion_vector)
+        return m
+
+    def run(self, *args, **kwargs):
+        self._matrices = None
+        self.vocabulary = EmotionVocabulary()
+        return super().run(*args, **kwargs)
+
+    def _energies(self, m: FlowMatrices) -> np.ndarray:
+        nodes = self.graph.nodes
+        return np.array([nodes[n].energy or 0.0 for n in m.ids], dtype=np.float64)
+
+    def _store(self, m: FlowMatrices, energy: np.ndarray, touched: np.ndarray) -> None:
+        nodes = self.graph.nodes
+        for i in np.flatnonzero(touched):
+            nodes[m.ids[i]].energy = float(energy[i])
+
+    # -- Phase 2 --------------------------------------------------------------
+
+    def _phase_moment_draw(self, moments: List[Dict]) -> float:
+        m = self._flow_matrices()
+        E = self._energies(m)
+        touched = np.zeros(len(E), dtype=bool)
+
+        ordered = sorted(moments, key=lambda x: (x['energy'] or 0.0) * _w(x['weight']), reverse=True)
+        groups = [m.draw[x['id']] for x in ordered]
+        if not groups:
+            return 0.0
+        other = np.concatenate([g.other for g in groups])
+        coef = np.concatenate([g.coef for g in groups])
+        row_group = np.repeat(np.arange(len(groups)), [len(g.other) for g in groups])
+        flows = np.zeros(len(other))
+
+        # Moments only read actors, and each actor only sees its own earlier
+        # draws: step k applies every actor's k-th drawing moment at once.
+        rank = _event_rank(other, row_group)
+        order = np.argsort(rank, kind='stable')
+        bounds = np.cumsum(np.bincount(rank))
+        for start, end in zip(np.r_[0, bounds[:-1]], bounds):
+            self.batches_run += 1
+            rows = order[start:end]
+            step = E[other[rows]] * coef[rows]
+            mask = step > MIN_FLOW
+            step = np.where(mask, step, 0.0)
+            flows[rows] = step
+
+            # Within a moment, duplicate links to one actor: the last write wins
+            last = _last_write(other[rows], mask, len(E))
+            hit = np.flatnonzero(last >= 0)
+            E[hit] = np.maximum(0.0, E[hit] - step[last[hit]])
+            touched[hit] = True
+
+        owners = np.array([g.owner for g in groups], dtype=np.int64)
+        gained = np.bincount(row_group, weights=flows, minlength=len(groups)) * np.sqrt(m.weight[owners])
+        E[owners] = np.array([x['energy'] or 0.0 for x in ordered]) + gained
+        touched[owners] = True
+
+        self._store(m, E, touched)
+        return float(flows.sum())
+
+    # -- Phase 3 --------------------------------------------------------------
+
+    def _phase_moment_flow(self, active: List[Dict]) -> float:
+        m = self._flow_matrices()
+        E = self._energies(m)
+        touched = np.zeros(len(E), dtype=bool)
+        total = 0.0
+
+        ordered = sorted(active, key=lambda x: (x['energy'] or 0.0) * _w(x['weight']), reverse=True)
+        ordered = [x for x in ordered if x['id'] in m.flow]
+        groups = [m.flow[x['id']] for x in ordered]
+        durations = {x['id']: _w(self.graph.nodes[x['id']].duration) for x in ordered}
+
+        footprints = [set(g.other.tolist()) | {g.owner} for g in groups]
+        for batch in conflict_free_batches(footprints):
+            self.batches_run += 1
+            # Skip the groups the scalar loop would skip (no write either)
+            live = [
+                i for i in batch
+                if E[groups[i].owner] > 0.01 and len(groups[i].other) and groups[i].total_weight > 0
+            ]
+            if not live:
+                continue
+            bg = [groups[i] for i in live]
+            owners = np.array([g.owner for g in bg], dtype=np.int64)
+            radiation = E[owners] / (np.array([durations[ordered[i]['id']] for i in live]) * TICKS_PER_MINUTE)
+
+            other = np.concatenate([g.other for g in bg])
+            coef = np.concatenate([g.coef for g in bg])
+            row_owner = np.repeat(np.arange(len(bg)), [len(g.other) for g in bg])
+
+            flows = radiation[row_owner] * coef
+            mask = flows > MIN_FLOW
+            flows = np.where(mask, flows, 0.0)
+            total += float(flows.sum())
+
+            received = flows * np.sqrt(m.weight[other])
+            last = _last_write(other, mask, len(E))
+            hit = np.flatnonzero(last >= 0)
+            E[hit] = E[hit] + received[last[hit]]
+            touched[hit] = True
+
+            spent = np.bincount(row_owner, weights=flows, minlength=len(bg))
+            E[owners] = np.maximum(0.0, E[owners] - spent)
+            touched[owners] = True
+
+        self._store(m, E, touched)
+        return total
+
+    # -- Phase 4 --------------------------------------------------------------
+
+    def _phase_moment_interaction(self, active: List[Dict]) -> float:
+        if len(active) < 2:
+            return 0.0
+        m = self._flow_matrices()
+        g = self.graph
+
+        # Pairs (i, j), i < j, sharing a narrative: active[i] supports or suppresses active[j]
+        energy = np.array([x['energy'] or 0.0 for x in active], dtype=np.float64)
+        members: Dict[str, List[int]] = {}
+        for i, x in enumerate(active):
+            for l in g.out_links.get(x['id'], []):
+                if l.type == 'ABOUT' and g.label(l.target) == 'Narrative':
+                    members.setdefault(l.target, []).append(i)
+        pairs = set()
+        for group in members.values():
+            pairs.update(combinations(sorted(set(group)), 2))
+        pairs = sorted(p for p in pairs if energy[p[0]] > 0.01)
+        if not pairs:
+            return 0.0
+        src, dst = np.array(pairs, dtype=np.int64).T
+
+        size = len(self.vocabulary)
+        emotions = [m.moment_emotions.get(x['id']) or self._moment_emotion_vector(x['id']) for x in active]
+        vectors = stack([v for v, _ in emotions], size)
+        present = stack([p for _, p in emotions], size, dtype=bool)
+        proximity = proximity_pairs(vectors[src], vectors[dst], present[src], present[dst])
+
+        support = proximity > SUPPORT_THRESHOLD
+        acts = support | (proximity < CONTRADICT_THRESHOLD)
+        amount = np.where(acts, energy[src] * INTERACTION_RATE * np.where(support, proximity, 1 - proximity), 0.0)
+        total = float(amount.sum())
+
+        # Every write starts from the target's snapshot energy: the last pair wins
+        # (pairs are sorted by source, so the last acting row per target)
+        last = _last_write(dst, acts, len(active))
+        hit = np.flatnonzero(last >= 0)
+        k = last[hit]
+        weight = np.array([_w(active[j]['weight']) for j in hit], dtype=np.float64)
+        energies = np.where(
+            support[k],
+            energy[hit] + amount[k] * np.sqrt(weight),
+            np.maximum(0.0, energy[hit] - amount[k]),
+        )
+        for j, value in zip(hit, energies):
+            g.set_energy(active[j]['id'], float(value))
+        return total
+
+    # -- Phase 5 --------------------------------------------------------------
+
+    def _phase_narrative_backflow(self) -> float:
+        m = self._flow_matrices()
+        E = self._energies(m)
+        touched = np.zeros(len(E), dtype=bool)
+        total = 0.0
+
+        narratives = [
+            n for n in self.graph.nodes.values()
+            if n.label == 'Narrative' and n.energy is not None and n.energy > 0.01
+        ]
+        narratives.sort(key=lambda n: n.energy, reverse=True)
+        groups = [m.backflow[n.id] for n in narratives]
+
+        if not groups:
+            return 0.0
+        self.batches_run += 1
+        width = max(len(g.other) for g in groups)
+        # Links padded into a (groups x TOP_N) block; padding has coef 0
+        coef = np.zeros((len(groups), width))
+        other = np.zeros((len(groups), width), dtype=np.int64)
+        for r, g in enumerate(groups):
+            coef[r, :len(g.coef)] = g.coef
+            other[r, :len(g.other)] = g.other
+
+        # The narrative drains as it flows, so each link sees the remainder
+        # of the previous ones: one step per link column (<= TOP_N), all
+        # narratives at once. Narratives only write actors, and those writes
+        # add, so one scatter serves the phase.
+        narr_energy = np.array([n.energy for n in narratives], dtype=np.float64)
+        flows = np.zeros_like(coef)
+        for k in range(width):
+            backflow = narr_energy * coef[:, k]
+            flows[:, k] = np.where(backflow > MIN_FLOW, backflow, 0.0)
+            narr_energy = narr_energy - flows[:, k]
+        total = float(flows.sum())
+
+        # Within a narrative, duplicate links to one actor: the last write wins
+        row_group = np.repeat(np.arange(len(groups)), width)
+        other, flows = other.ravel(), flows.ravel()
+        last = _last_per_group(other, row_group, flows > 0)
+        np.add.at(E, other[last], flows[last] * np.sqrt(m.weight[other[last]]))
+        touched[other[last]] = True
+
+        owners = np.array([g.owner for g in groups], dtype=np.int64)
+        E[owners] = np.maximum(0.0, narr_energy)
+        touched[owners] = True
+
+        self._store(m, E, touched)
+        return total
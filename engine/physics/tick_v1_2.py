@@ -24,11 +24,17 @@ OWNER: Claude Dev 2
 
 import logging
 import math
-from typing import List, Dict, Any, Tuple, Optional, Set
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Tuple, Optional, Set
 from dataclasses import dataclass, field
 
 from engine.physics.graph import GraphQueries, GraphOps
 from engine.physics.graph.graph_query_utils import dijkstra_with_resistance, calculate_link_resistance
+from engine.physics.emotion_vectors import blend, proximity_matrix, stack
+from engine.physics.tick_adjacency import AdjacencySnapshot
+from engine.physics.tick_delta import TickDelta, forward_delta
+from engine.physics.tick_profiler import PhaseProfile, TickProfiler
+from engine.physics.tick_write_buffer import EnergyWriteBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +95,15 @@ class TickResultV1_2:
     hot_links: int = 0
     cold_links: int = 0
 
+    # Per-phase wall time / query counters (see tick_profiler.PhaseProfile)
+    phases: List[Dict[str, Any]] = field(default_factory=list)
+
+    # What this tick changed (see tick_delta.TickDelta)
+    delta: TickDelta = field(default_factory=TickDelta)
+
+    # Node writes requested vs written (see tick_write_buffer.EnergyWriteBuffer.report)
+    write_back: Dict[str, Any] = field(default_factory=dict)
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -216,12 +231,31 @@ class GraphTickV1_2:
         self,
         graph_name: str = "graph",
         host: str = "localhost",
-        port: int = 6379
+        port: int = 6379,
+        graph_queries: Optional[GraphQueries] = None,
+        graph_ops: Optional[GraphOps] = None,
+        profiler: Optional[TickProfiler] = None,
+        delta_sinks: Optional[List[Any]] = None,
+        write_mode: Optional[str] = None
     ):
-        self.read = GraphQueries(graph_name=graph_name, host=host, port=port)
-        self.write = GraphOps(graph_name=graph_name, host=host, port=port)
+        # Always profiled: a perf_counter pair per query is noise next to a DB round trip
+        self.profiler = profiler or TickProfiler()
+        self.read = self.profiler.instrument_read(
+            graph_queries or GraphQueries(graph_name=graph_name, host=host, port=port)
+        )
+        self.write = self.profiler.instrument_write(
+            graph_ops or GraphOps(graph_name=graph_name, host=host, port=port)
+        )
         self.graph_name = graph_name
         self._tick_count = 0
+        # Receivers of each tick's TickDelta (apply_delta), e.g. health checkers
+        self.delta_sinks = list(delta_sinks or [])
+        self._delta = TickDelta()
+        # Per-tick adjacency for the helper queries, read on first use in run()
+        self._adjacency: Optional[AdjacencySnapshot] = None
+        self._use_adjacency = False
+        # Node energy writes, flushed at each phase end (see tick_write_buffer)
+        self.energy_buffer = EnergyWriteBuffer(self.write, self.read, mode=write_mode)
 
         logger.info(f"[GraphTick v1.2] Initialized for {graph_name}")
 
@@ -239,44 +273,66 @@ class GraphTickV1_2:
         self._tick_count += 1
         logger.info(f"[GraphTick v1.2] Running tick #{current_tick}")
         result = TickResultV1_2()
+        self._delta = result.delta
+        result.delta.tick = current_tick
+        self._adjacency, self._use_adjacency = None, True
+        self.energy_buffer.begin_tick()
+        profiler = self.profiler
+        profiler.begin_tick(current_tick)
 
         # Phase 1: Generation (proximity-gated)
-        result.energy_generated, result.actors_updated = self._phase_generation(player_id)
+        with self._phase(1):
+            result.energy_generated, result.actors_updated = self._phase_generation(player_id)
 
         # Phase 2: Moment Draw (possible + active)
-        possible_moments = self._get_moments_by_status('possible')
-        active_moments = self._get_moments_by_status('active')
-        result.moments_possible = len(possible_moments)
-        result.moments_active = len(active_moments)
+        with self._phase(2):
+            possible_moments = self._get_moments_by_status('possible')
+            active_moments = self._get_moments_by_status('active')
+            result.moments_possible = len(possible_moments)
+            result.moments_active = len(active_moments)
 
-        all_draw_moments = possible_moments + active_moments
-        result.energy_drawn = self._phase_moment_draw(all_draw_moments)
+            all_draw_moments = possible_moments + active_moments
+            result.energy_drawn = self._phase_moment_draw(all_draw_moments)
 
         # Phase 3: Moment Flow (active only, duration-based)
-        result.energy_flowed = self._phase_moment_flow(active_moments)
+        with self._phase(3):
+            result.energy_flowed = self._phase_moment_flow(active_moments)
 
         # Phase 4: Moment Interaction (support/contradict)
-        result.energy_interacted = self._phase_moment_interaction(active_moments)
+        with self._phase(4):
+            result.energy_interacted = self._phase_moment_interaction(active_moments)
 
         # Phase 5: Narrative Backflow (link.energy gated)
-        result.energy_backflowed = self._phase_narrative_backflow()
-
-        # Phase 6: Link Cooling (drain + strength)
-        result.energy_cooled, result.links_cooled = self._phase_link_cooling()
+        with self._phase(5):
+            result.energy_backflowed = self._phase_narrative_backflow()
 
-        # Count hot/cold links
-        result.hot_links, result.cold_links = self._count_hot_cold_links()
+        # Phase 6: Link Cooling (drain + strength), plus the hot/cold census
+        with self._phase(6):
+            result.energy_cooled, result.links_cooled = self._phase_link_cooling()
+            result.hot_links, result.cold_links = self._count_hot_cold_links()
+            result.delta.record_census(result.hot_links, result.cold_links)
 
         # Phase 7: Completion Processing
-        completions, crystallized = self._phase_completion(active_moments, current_tick)
-        result.completions = completions
-        result.moments_completed = len(completions)
-        result.links_crystallized = crystallized
+        with self._phase(7):
+            completions, crystallized = self._phase_completion(active_moments, current_tick)
+            result.completions = completions
+            result.moments_completed = len(completions)
+            result.links_crystallized = crystallized
+            result.delta.links_created += crystallized
 
         # Phase 8: Rejection Processing
-        rejections = self._phase_rejection(possible_moments, player_id, current_tick)
-        result.rejections = rejections
-        result.moments_rejected = len(rejections)
+        with self._phase(8):
+            rejections = self._phase_rejection(possible_moments, player_id, current_tick)
+            result.rejections = rejections
+            result.moments_rejected = len(rejections)
+
+        self._adjacency, self._use_adjacency = None, False
+        result.write_back = self.energy_buffer.report()
+        result.phases = profiler.end_tick()
+        result.delta.phase = ""
+        # Sinks must never break a tick
+        for sink, e in forward_delta(result.delta, self.delta_sinks):
+            logger.warning(f"[GraphTick v1.2] Delta sink {type(sink).__name__} failed: {e}")
 
         logger.info(
             f"[GraphTick v1.2] Complete: "
@@ -287,11 +343,22 @@ class GraphTickV1_2:
             f"backflow={result.energy_backflowed:.2f}, "
             f"cooled={result.energy_cooled:.2f}, "
             f"hot_links={result.hot_links}, "
-            f"completed={result.moments_completed}"
+            f"completed={result.moments_completed}, "
+            f"node_writes={result.write_back['updates']}->{result.write_back['rows_written']}"
         )
 
         return result
 
+    @contextmanager
+    def _phase(self, index: int) -> Iterator[PhaseProfile]:
+        """Profile one phase, tag its delta entries, and flush its buffered writes."""
+        with self.profiler.phase(index) as span:
+            self._delta.phase = span.name
+            try:
+                yield span
+            finally:
+                self.energy_buffer.flush()
+
     # =========================================================================
     # PHASE 1: GENERATION
     # =========================================================================
@@ -334,10 +401,7 @@ class GraphTickV1_2:
                 total_generated += generated
 
                 # Update actor
-                self.write._query(f"""
-                MATCH (a:Actor {{id: '{actor_id}'}})
-                SET a.energy = {new_energy}
-                """)
+                self._write_energy(actor_id, current_energy, new_energy, "Actor")
                 actors_updated += 1
 
         except Exception as e:
@@ -458,24 +522,24 @@ class GraphTickV1_2:
             moment_id = moment.get('id')
             moment_weight = moment.get('weight', 1.0) or 1.0
             moment_energy = moment.get('energy', 0.0) or 0.0
+            moment_before = moment_energy
 
             try:
                 # Get weighted average emotions from moment's links
-                moment_emotions = self._get_moment_emotions(moment_id)
+                moment_emotions = self._flow_emotions(moment_id, 'Moment')
 
                 # Get top 20 expresses links
                 links = self._get_hot_links_to_moment(moment_id, TOP_N_LINKS)
 
-                for link in links:
+                # Emotion factor of every link at once
+                factors = self._emotion_factors(links, moment_emotions)
+
+                for link, emotion_factor in zip(links, factors):
                     actor_id = link.get('actor_id')
                     actor_energy = link.get('actor_energy', 0.0) or 0.0
                     conductivity = link.get('conductivity', 1.0) or 1.0
                     link_weight = link.get('weight', 1.0) or 1.0
                     link_energy = link.get('link_energy', 0.0) or 0.0
-                    link_emotions = link.get('emotions', []) or []
-
-                    # Calculate emotion factor
-                    emotion_factor = emotion_proximity(link_emotions, moment_emotions)
 
                     # Calculate flow
                     flow = actor_energy * DRAW_RATE * conductivity * link_weight * emotion_factor
@@ -483,6 +547,7 @@ class GraphTickV1_2:
 
                     if flow > 0.001:  # Skip tiny flows
                         # Update energies
+                        actor_before = actor_energy
                         actor_energy -= flow
                         moment_energy += received
                         total_drawn += flow
@@ -495,16 +560,10 @@ class GraphTickV1_2:
                         )
 
                         # Update actor
-                        self.write._query(f"""
-                        MATCH (a:Actor {{id: '{actor_id}'}})
-                        SET a.energy = {max(0, actor_energy)}
-                        """)
+                        self._write_energy(actor_id, actor_before, max(0, actor_energy), "Actor")
 
                 # Update moment
-                self.write._query(f"""
-                MATCH (m:Moment {{id: '{moment_id}'}})
-                SET m.energy = {moment_energy}
-                """)
+                self._write_energy(moment_id, moment_before, moment_energy, "Moment")
 
             except Exception as e:
                 logger.warning(f"[Phase 2] Draw error for {moment_id}: {e}")
@@ -546,7 +605,9 @@ class GraphTickV1_2:
                 if not m:
                     continue
 
-                moment_energy = m[0].get('energy', 0.0) or 0.0
+                # Earlier moments in this phase may have flowed into this one
+                moment_energy = self.energy_buffer.get(moment_id, m[0].get('energy')) or 0.0
+                moment_before = moment_energy
                 duration = m[0].get('duration', 1.0) or 1.0  # Default 1 minute
                 moment_weight = m[0].get('weight', 1.0) or 1.0
 
@@ -558,7 +619,7 @@ class GraphTickV1_2:
                 radiation = moment_energy * radiation_rate
 
                 # Get moment emotions
-                moment_emotions = self._get_moment_emotions(moment_id)
+                moment_emotions = self._flow_emotions(moment_id, 'Moment')
 
                 # Get top 20 outgoing links
                 links = self._get_hot_links_from_moment(moment_id, TOP_N_LINKS)
@@ -571,23 +632,24 @@ class GraphTickV1_2:
                 if total_weight <= 0:
                     continue
 
-                for link in links:
+                factors = self._emotion_factors(links, moment_emotions)
+
+                for link, emotion_factor in zip(links, factors):
                     target_id = link.get('target_id')
                     target_weight = link.get('target_weight', 1.0) or 1.0
                     target_energy = link.get('target_energy', 0.0) or 0.0
                     conductivity = link.get('conductivity', 1.0) or 1.0
                     link_weight = link.get('weight', 1.0) or 1.0
-                    link_emotions = link.get('emotions', []) or []
 
                     # Calculate share and flow
                     share = link_weight / total_weight
-                    emotion_factor = emotion_proximity(link_emotions, moment_emotions)
 
                     flow = radiation * share * conductivity * emotion_factor
                     received = flow * math.sqrt(target_weight)
 
                     if flow > 0.001:
                         # Deduct from moment
+                        target_before = target_energy
                         moment_energy -= flow
                         target_energy += received
                         total_flowed += flow
@@ -600,16 +662,12 @@ class GraphTickV1_2:
                         )
 
                         # Update target
-                        self.write._query(f"""
-                        MATCH (n {{id: '{target_id}'}})
-                        SET n.energy = {target_energy}
-                        """)
+                        self._write_energy(
+                            target_id, target_before, target_energy, link.get('target_type') or ""
+                        )
 
                 # Update moment energy
-                self.write._query(f"""
-                MATCH (m:Moment {{id: '{moment_id}'}})
-                SET m.energy = {max(0, moment_energy)}
-                """)
+                self._write_energy(moment_id, moment_before, max(0, moment_energy), "Moment")
 
             except Exception as e:
                 logger.warning(f"[Phase 3] Flow error for {moment_id}: {e}")
@@ -634,14 +692,9 @@ class GraphTickV1_2:
         if len(active_moments) < 2:
             return 0.0
 
-        # Get emotions for each moment
-        moment_emotions = {}
-        for m in active_moments:
-            mid = m.get('id')
-            moment_emotions[mid] = self._get_moment_emotions(mid)
-
-        # Get shared narratives between moment pairs
+        # Emotion proximity of every moment pair
         moment_ids = [m.get('id') for m in active_moments]
+        proximities = self._pairwise_emotion_proximity(moment_ids)
 
         for i, m1 in enumerate(active_moments):
             m1_id = m1.get('id')
@@ -650,7 +703,7 @@ class GraphTickV1_2:
             if m1_energy <= 0.01:
                 continue
 
-            for m2 in active_moments[i+1:]:
+            for j, m2 in enumerate(active_moments[i+1:]):
                 m2_id = m2.get('id')
                 m2_energy = m2.get('energy', 0.0) or 0.0
 
@@ -660,43 +713,48 @@ class GraphTickV1_2:
                     if not shared:
                         continue
 
-                    # Calculate emotion proximity
-                    proximity = emotion_proximity(
-                        moment_emotions.get(m1_id, []),
-                        moment_emotions.get(m2_id, [])
-                    )
+                    proximity = proximities[i][i + 1 + j]
 
                     if proximity > SUPPORT_THRESHOLD:
                         # Support: m1 feeds m2
                         support = m1_energy * INTERACTION_RATE * proximity
                         m2_weight = m2.get('weight', 1.0) or 1.0
                         received = support * math.sqrt(m2_weight)
+                        m2_before = m2_energy
                         m2_energy += received
                         total_interacted += support
 
-                        self.write._query(f"""
-                        MATCH (m:Moment {{id: '{m2_id}'}})
-                        SET m.energy = {m2_energy}
-                        """)
+                        self._write_energy(m2_id, m2_before, m2_energy, "Moment")
 
                     elif proximity < CONTRADICT_THRESHOLD:
                         # Contradict: m1 drains m2
                         suppress = m1_energy * INTERACTION_RATE * (1 - proximity)
+                        m2_before = m2_energy
                         m2_energy = max(0, m2_energy - suppress)
                         total_interacted += suppress
 
-                        self.write._query(f"""
-                        MATCH (m:Moment {{id: '{m2_id}'}})
-                        SET m.energy = {m2_energy}
-                        """)
+                        self._write_energy(m2_id, m2_before, m2_energy, "Moment")
 
                 except Exception as e:
                     logger.warning(f"[Phase 4] Interaction error {m1_id} <-> {m2_id}: {e}")
 
         return total_interacted
 
+    def _pairwise_emotion_proximity(self, moment_ids: List[str]) -> List[List[float]]:
+        """emotion_proximity between the moments' emotions, as a square table."""
+        emotions = [self._flow_emotions(mid, 'Moment') for mid in moment_ids]
+        if self._adjacency is not None:
+            size = len(self._adjacency.vocabulary)
+            vectors = stack([v for v, _ in emotions], size)
+            present = stack([p for _, p in emotions], size, dtype=bool)
+            return proximity_matrix(vectors, vectors, present, present).tolist()
+        return [[emotion_proximity(a, b) for b in emotions] for a in emotions]
+
     def _get_shared_narratives(self, m1_id: str, m2_id: str) -> List[str]:
         """Get narrative IDs that both moments connect to."""
+        adjacency = self._adjacency_snapshot()
+        if adjacency is not None:
+            return adjacency.shared_narratives(m1_id, m2_id)
         try:
             result = self.read.query(f"""
             MATCH (m1:Moment {{id: '{m1_id}'}})-[:ABOUT]->(n:Narrative)<-[:ABOUT]-(m2:Moment {{id: '{m2_id}'}})
@@ -733,14 +791,16 @@ class GraphTickV1_2:
             for narr in narratives:
                 narr_id = narr.get('id')
                 narr_energy = narr.get('energy', 0.0) or 0.0
+                narr_before = narr_energy
 
                 # Get narrative emotions
-                narr_emotions = self._get_narrative_emotions(narr_id)
+                narr_emotions = self._flow_emotions(narr_id, 'Narrative')
 
                 # Get top 20 actor links
                 links = self._get_hot_links_to_actors(narr_id, TOP_N_LINKS)
+                factors = self._emotion_factors(links, narr_emotions)
 
-                for link in links:
+                for link, emotion_factor in zip(links, factors):
                     link_energy = link.get('link_energy', 0.0) or 0.0
 
                     # Gate by link.energy
@@ -751,14 +811,13 @@ class GraphTickV1_2:
                     actor_energy = link.get('actor_energy', 0.0) or 0.0
                     actor_weight = link.get('actor_weight', 1.0) or 1.0
                     conductivity = link.get('conductivity', 1.0) or 1.0
-                    link_emotions = link.get('emotions', []) or []
 
                     # Backflow formula includes link.energy
-                    emotion_factor = emotion_proximity(link_emotions, narr_emotions)
                     backflow = narr_energy * BACKFLOW_RATE * conductivity * emotion_factor * link_energy
                     received = backflow * math.sqrt(actor_weight)
 
                     if backflow > 0.001:
+                        actor_before = actor_energy
                         narr_energy -= backflow
                         actor_energy += received
                         total_backflow += backflow
@@ -771,16 +830,10 @@ class GraphTickV1_2:
                         )
 
                         # Update actor
-                        self.write._query(f"""
-                        MATCH (a:Actor {{id: '{actor_id}'}})
-                        SET a.energy = {actor_energy}
-                        """)
+                        self._write_energy(actor_id, actor_before, actor_energy, "Actor")
 
                 # Update narrative
-                self.write._query(f"""
-                MATCH (n:Narrative {{id: '{narr_id}'}})
-                SET n.energy = {max(0, narr_energy)}
-                """)
+                self._write_energy(narr_id, narr_before, max(0, narr_energy), "Narrative")
 
         except Exception as e:
             logger.warning(f"[Phase 5] Backflow error: {e}")
@@ -834,6 +887,7 @@ class GraphTickV1_2:
                 drain = link_energy * LINK_DRAIN_RATE
 
                 # Return to nodes (50/50)
+                a_before, b_before = a_energy, b_energy
                 a_energy += drain * 0.5
                 b_energy += drain * 0.5
 
@@ -850,14 +904,9 @@ class GraphTickV1_2:
                 links_cooled += 1
 
                 # Update nodes
-                self.write._query(f"""
-                MATCH (a {{id: '{node_a}'}})
-                SET a.energy = {a_energy}
-                """)
-                self.write._query(f"""
-                MATCH (b {{id: '{node_b}'}})
-                SET b.energy = {b_energy}
-                """)
+                self._write_energy(node_a, a_before, a_energy)
+                self._write_energy(node_b, b_before, b_energy)
+                self._delta.record_cooled(drain)
 
                 # Note: Updating relationship properties by id(r) requires
                 # different syntax. Using node match instead.
@@ -971,6 +1020,12 @@ class GraphTickV1_2:
                         }}]->(b)
                         """)
                         crystallized += 1
+                        if self._adjacency is not None:
+                            self._adjacency.add_link(
+                                'RELATES', actor_a, actor_b, 'Actor',
+                                conductivity=0.2, weight=0.2, energy=0.0, strength=0.1,
+                                emotions=moment_emotions,
+                            )
 
         except Exception as e:
             logger.warning(f"[Crystallize] Error for {moment_id}: {e}")
@@ -1020,19 +1075,15 @@ class GraphTickV1_2:
                 """)
 
                 if player:
-                    player_energy = player[0].get('energy', 0.0) or 0.0
+                    # The previous rejection's return may still be buffered
+                    player_energy = self.energy_buffer.get(player_id, player[0].get('energy')) or 0.0
                     new_energy = player_energy + return_energy
 
-                    self.write._query(f"""
-                    MATCH (p:Actor {{id: '{player_id}'}})
-                    SET p.energy = {new_energy}
-                    """)
+                    self._write_energy(player_id, player_energy, new_energy, "Actor")
 
                 # Clear moment energy
-                self.write._query(f"""
-                MATCH (m:Moment {{id: '{moment_id}'}})
-                SET m.energy = 0, m.tick_resolved = {current_tick}
-                """)
+                self._write_energy(moment_id, energy, 0.0, "Moment")
+                self.energy_buffer.set(moment_id, current_tick, "Moment", prop="tick_resolved")
 
                 rejections.append({
                     'moment_id': moment_id,
@@ -1055,7 +1106,7 @@ class GraphTickV1_2:
         self,
         link: Dict,
         amount: float,
-        flow_emotions: List[List],
+        flow_emotions: Any,
         origin_id: str,
         origin_energy: float,
         target_id: str,
@@ -1068,11 +1119,15 @@ class GraphTickV1_2:
         - energy += amount × weight
         - strength grows (permanent)
         - emotions blend
+
+        `flow_emotions` comes from _flow_emotions: a vector pair when the
+        link is in this tick's adjacency snapshot, else an emotion list.
         """
         link_energy = link.get('link_energy', 0.0) or 0.0
         link_strength = link.get('strength', 0.0) or 0.0
         link_weight = link.get('weight', 1.0) or 1.0
         link_emotions = link.get('emotions', []) or []
+        vectors = isinstance(flow_emotions, tuple) and link.get('link') is not None
         origin_weight = link.get('origin_weight', 1.0) or 1.0
         target_weight = link.get('target_weight', 1.0) or 1.0
 
@@ -1080,13 +1135,20 @@ class GraphTickV1_2:
         new_link_energy = link_energy + (amount * link_weight)
 
         # Strength grows (permanent)
-        emotion_intensity = avg_emotion_intensity(link_emotions)
+        if vectors:
+            emotion_intensity = self._adjacency.link_intensity(link['link'])
+        else:
+            emotion_intensity = avg_emotion_intensity(link_emotions)
         growth = (amount * emotion_intensity * origin_weight) / ((1 + link_strength) * target_weight)
         new_strength = link_strength + growth
 
         # Emotion coloring
         blend_rate = amount / (amount + link_energy + 1)
-        new_emotions = blend_emotions(link_emotions, flow_emotions, blend_rate)
+        if vectors:
+            existing, _ = self._adjacency.link_emotion_vector(link['link'])
+            new_emotions = blend(existing, flow_emotions[0], blend_rate)
+        else:
+            new_emotions = blend_emotions(link_emotions, flow_emotions, blend_rate)
 
         # Note: Actual link update requires relationship ID
         # This would be done via the link's rid if we had it
@@ -1101,6 +1163,29 @@ class GraphTickV1_2:
     # HELPER QUERIES
     # =========================================================================
 
+    def _adjacency_snapshot(self) -> Optional[AdjacencySnapshot]:
+        """This tick's adjacency, read on first use; None outside run() or if the read failed."""
+        if self._use_adjacency and self._adjacency is None:
+            try:
+                self._adjacency = AdjacencySnapshot.load(self.read)
+            except Exception as e:
+                logger.warning(f"[GraphTick v1.2] Adjacency snapshot failed, querying per node: {e}")
+                self._use_adjacency = False
+        return self._adjacency
+
+    def _write_energy(self, node_id: str, before: float, after: float, node_type: str = "") -> None:
+        """Buffer a node energy write and record it in the tick delta and adjacency snapshot."""
+        self.energy_buffer.set(node_id, after, node_type)
+        self._delta.record_node(node_id, before, after, node_type)
+        if self._adjacency is not None:
+            self._adjacency.set_energy(node_id, after)
+
+    def _with_buffered_energy(self, rows: List[Dict], id_key: str, energy_key: str) -> List[Dict]:
+        """Overlay energies written earlier in this phase but not yet flushed."""
+        for row in rows:
+            row[energy_key] = self.energy_buffer.get(row.get(id_key), row.get(energy_key))
+        return rows
+
     def _get_moments_by_status(self, status: str) -> List[Dict]:
         """Get moments with a given status."""
         try:
@@ -1115,6 +1200,9 @@ class GraphTickV1_2:
 
     def _get_moment_emotions(self, moment_id: str) -> List[List]:
         """Get weighted average emotions from moment's links."""
+        adjacency = self._adjacency_snapshot()
+        if adjacency is not None:
+            return get_weighted_average_emotions(adjacency.moment_out_links(moment_id))
         try:
             links = self.read.query(f"""
             MATCH (m:Moment {{id: '{moment_id}'}})-[r]->()
@@ -1124,8 +1212,34 @@ class GraphTickV1_2:
         except:
             return []
 
+    def _flow_emotions(self, node_id: str, label: str) -> Any:
+        """
+        A moment's or narrative's emotions for the flow phases.
+
+        With an adjacency snapshot: a (vector, presence) pair over the
+        snapshot's vocabulary, so link factors are one batched call.
+        Otherwise the emotion list from the per-node query.
+        """
+        adjacency = self._adjacency_snapshot()
+        if adjacency is None:
+            if label == 'Moment':
+                return self._get_moment_emotions(node_id)
+            return self._get_narrative_emotions(node_id)
+        if label == 'Moment':
+            return adjacency.moment_emotion_vector(node_id)
+        return adjacency.narrative_emotion_vector(node_id)
+
+    def _emotion_factors(self, links: List[Dict], emotions: Any) -> List[float]:
+        """emotion_proximity of each link's emotions to `emotions` (from _flow_emotions)."""
+        if isinstance(emotions, tuple) and all(l.get('link') is not None for l in links):
+            return self._adjacency.link_proximities([l['link'] for l in links], emotions).tolist()
+        return [emotion_proximity(l.get('emotions', []) or [], emotions) for l in links]
+
     def _get_narrative_emotions(self, narrative_id: str) -> List[List]:
         """Get emotions associated with a narrative."""
+        adjacency = self._adjacency_snapshot()
+        if adjacency is not None:
+            return adjacency.narrative_emotions(narrative_id)
         try:
             result = self.read.query(f"""
             MATCH (n:Narrative {{id: '{narrative_id}'}})
@@ -1139,8 +1253,11 @@ class GraphTickV1_2:
 
     def _get_hot_links_to_moment(self, moment_id: str, n: int = 20) -> List[Dict]:
         """Get top N hot links from actors to a moment."""
+        adjacency = self._adjacency_snapshot()
+        if adjacency is not None:
+            return adjacency.hot_links_to_moment(moment_id, n)
         try:
-            return self.read.query(f"""
+            rows = self.read.query(f"""
             MATCH (a:Actor)-[r]->(m:Moment {{id: '{moment_id}'}})
             WHERE type(r) IN ['EXPRESSES', 'CAN_SPEAK', 'SAID']
             RETURN a.id AS actor_id, a.energy AS actor_energy, a.weight AS actor_weight,
@@ -1149,13 +1266,17 @@ class GraphTickV1_2:
             ORDER BY coalesce(r.energy, 0) * coalesce(r.weight, 1) DESC
             LIMIT {n}
             """)
+            return self._with_buffered_energy(rows, 'actor_id', 'actor_energy')
         except:
             return []
 
     def _get_hot_links_from_moment(self, moment_id: str, n: int = 20) -> List[Dict]:
         """Get top N hot outgoing links from a moment."""
+        adjacency = self._adjacency_snapshot()
+        if adjacency is not None:
+            return adjacency.hot_links_from_moment(moment_id, n)
         try:
-            return self.read.query(f"""
+            rows = self.read.query(f"""
             MATCH (m:Moment {{id: '{moment_id}'}})-[r]->(t)
             WHERE NOT t:Actor
             RETURN t.id AS target_id, labels(t)[0] AS target_type,
@@ -1165,13 +1286,17 @@ class GraphTickV1_2:
             ORDER BY coalesce(r.energy, 0) * coalesce(r.weight, 1) DESC
             LIMIT {n}
             """)
+            return self._with_buffered_energy(rows, 'target_id', 'target_energy')
         except:
             return []
 
     def _get_hot_links_to_actors(self, narrative_id: str, n: int = 20) -> List[Dict]:
         """Get top N hot links from narrative to actors."""
+        adjacency = self._adjacency_snapshot()
+        if adjacency is not None:
+            return adjacency.hot_links_to_actors(narrative_id, n)
         try:
-            return self.read.query(f"""
+            rows = self.read.query(f"""
             MATCH (a:Actor)-[r:BELIEVES]->(n:Narrative {{id: '{narrative_id}'}})
             RETURN a.id AS actor_id, a.energy AS actor_energy, a.weight AS actor_weight,
                    r.conductivity AS conductivity, r.weight AS weight,
@@ -1179,6 +1304,7 @@ class GraphTickV1_2:
             ORDER BY coalesce(r.energy, 0) * coalesce(r.weight, 1) DESC
             LIMIT {n}
             """)
+            return self._with_buffered_energy(rows, 'actor_id', 'actor_energy')
         except:
             return []
 
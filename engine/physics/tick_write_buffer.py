@@ -0,0 +1,184 @@
+"""
+Schema v1.2 — Tick Write-Back Buffer
+
+GraphTickV1_2 updates node energy after every individual flow, so a busy
+actor or moment is written once per link it takes part in — dozens of
+single-row `SET` queries per tick for one final value. The buffer keeps
+the last value per (node id, property) and writes only dirty entries when
+the tick flushes it at the end of each phase: one `UNWIND` per (label,
+property) and BULK_CHUNK rows.
+
+Phases still read node energy from the graph in Cypher (the next phase's
+`WHERE n.energy > ...` filters, the per-moment state reads), so the tick
+flushes at every phase boundary rather than once per tick. Reads inside a
+phase that may follow a buffered write go through `get()`.
+
+Modes (`mode=` or NGRAM_TICK_WRITE_MODE):
+- "phase" (default): buffer, flush at phase end
+- "write_through": one query per write, as before the buffer; for debugging
+- "verify": like "phase", then read every flushed value back and log
+  mismatches
+
+`report()` gives the tick's write amplification: `amplification_before`
+is writes requested per distinct (node, property), which is the query count
+without the buffer; `amplification_after` is rows actually written per
+distinct entry.
+
+Usage:
+    buffer = EnergyWriteBuffer(write, read)
+    buffer.set("char_aldric", 1.4, label="Actor")
+    buffer.get("char_aldric")  # 1.4, before the flush
+    buffer.flush()
+    buffer.report()
+
+DOCS: docs/physics/tick-runner/PATTERNS_Tick_Runner.md
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WRITE_MODES = ("phase", "write_through", "verify")
+DEFAULT_WRITE_MODE = os.getenv("NGRAM_TICK_WRITE_MODE", "phase")
+BULK_CHUNK = 500
+
+
+def _match(label: str) -> str:
+    return f"(n:{label} {{id: row.id}})" if label else "(n {id: row.id})"
+
+
+class EnergyWriteBuffer:
+    """Last value per (node id, property), flushed in batched UNWIND writes."""
+
+    def __init__(self, write: Any, read: Any = None, mode: Optional[str] = None):
+        mode = mode or DEFAULT_WRITE_MODE
+        if mode not in WRITE_MODES:
+            raise ValueError(f"Unknown tick write mode {mode!r}; expected one of {WRITE_MODES}")
+        if mode == "verify" and read is None:
+            raise ValueError("verify mode needs a read connection")
+        self.write = write
+        self.read = read
+        self.mode = mode
+        # (node id, property) -> [label, value]
+        self._dirty: Dict[Tuple[str, str], List[Any]] = {}
+        self.begin_tick()
+
+    def begin_tick(self) -> None:
+        """Reset the per-tick counters (unflushed entries are kept)."""
+        self.updates = 0
+        self.rows_written = 0
+        self.queries = 0
+        self.errors = 0
+        self.mismatches = 0
+        self._touched: set = set()
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def set(self, node_id: str, value: Any, label: str = "", prop: str = "energy") -> None:
+        """Record a write; the last value per (node, property) wins."""
+        self.updates += 1
+        self._touched.add((node_id, prop))
+        if self.mode == "write_through":
+            self._run(label, prop, [{"id": node_id, "value": value}])
+            return
+        entry = self._dirty.get((node_id, prop))
+        if entry is None:
+            self._dirty[(node_id, prop)] = [label, value]
+        else:
+            # Same node matched with and without a label: keep the label
+            entry[0] = entry[0] or label
+            entry[1] = value
+
+    def get(self, node_id: str, default: Any = None, prop: str = "energy") -> Any:
+        """The buffered value if the node is dirty, else `default` (the graph's value)."""
+        entry = self._dirty.get((node_id, prop))
+        return entry[1] if entry is not None else default
+
+    def flush(self) -> int:
+        """Write every dirty entry; returns the number of rows written."""
+        if not self._dirty:
+            return 0
+        groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for (node_id, prop), (label, value) in self._dirty.items():
+            groups.setdefault((label, prop), []).append({"id": node_id, "value": value})
+        self._dirty = {}
+
+        written = 0
+        for (label, prop), rows in groups.items():
+            for start in range(0, len(rows), BULK_CHUNK):
+                chunk = rows[start:start + BULK_CHUNK]
+                if self._run(label, prop, chunk, batched=True):
+                    written += len(chunk)
+                    if self.mode == "verify":
+                        self._verify(prop, chunk)
+        return written
+
+    def _run(self, label: str, prop: str, rows: List[Dict[str, Any]], batched: bool = False) -> bool:
+        if batched:
+            cypher = f"""
+            UNWIND $rows AS row
+            MATCH {_match(label)}
+            SET n.{prop} = row.value
+            """
+            params: Dict[str, Any] = {"rows": rows}
+        else:
+            cypher = f"""
+            MATCH {_match(label).replace("row.id", "$id")}
+            SET n.{prop} = $value
+            """
+            params = rows[0]
+        self.queries += 1
+        try:
+            self.write._query(cypher, params)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"[TickWriteBuffer] Write of {len(rows)} {label or 'node'}.{prop} failed: {e}")
+            return False
+        self.rows_written += len(rows)
+        return True
+
+    def _verify(self, prop: str, rows: List[Dict[str, Any]]) -> None:
+        try:
+            stored = self.read.query(f"""
+            UNWIND $ids AS id
+            MATCH (n {{id: id}})
+            RETURN n.id AS id, n.{prop} AS value
+            """, {"ids": [row["id"] for row in rows]})
+        except Exception as e:
+            logger.warning(f"[TickWriteBuffer] Verify read failed: {e}")
+            return
+        values = {r.get("id"): r.get("value") for r in stored or []}
+        for row in rows:
+            if values.get(row["id"]) != row["value"]:
+                self.mismatches += 1
+                logger.warning(
+                    f"[TickWriteBuffer] {row['id']}.{prop}: wrote {row['value']}, "
+                    f"read back {values.get(row['id'])}"
+                )
+
+    # -------------------------------------------------------------------------
+    # Reporting
+    # -------------------------------------------------------------------------
+
+    @property
+    def dirty(self) -> int:
+        return len(self._dirty)
+
+    def report(self) -> Dict[str, Any]:
+        """This tick's write amplification, without and with the buffer."""
+        distinct = len(self._touched)
+        return {
+            "mode": self.mode,
+            "updates": self.updates,
+            "distinct": distinct,
+            "rows_written": self.rows_written,
+            "queries": self.queries,
+            "errors": self.errors,
+            "mismatches": self.mismatches,
+            "amplification_before": round(self.updates / distinct, 3) if distinct else 0.0,
+            "amplification_after": round(self.rows_written / distinct, 3) if distinct else 0.0,
+        }
@@ -0,0 +1,96 @@
+"""
+Tests for the activity logger's background writer.
+
+Lines are queued by the logging calls and appended by a writer thread;
+rotation renames segments, and the bounded queue samples then drops
+detail lines (never summary lines) while counting what it lost.
+
+DOCS: docs/connectome/health/HEALTH_Connectome_Activity_Logging.md
+"""
+
+from engine.health.activity_logger import ActivityLogger, LogConfig
+
+
+def _lines(path):
+    return path.read_text().splitlines() if path.exists() else []
+
+
+def test_lines_written_in_order_after_flush(tmp_path):
+    logger = ActivityLogger(LogConfig(log_dir=tmp_path))
+    logger.tick_start(3, "seed")
+    for i in range(5):
+        logger.decay(f"n{i}", 1.0, 0.9, 0.1, "narrative")
+
+    assert logger.flush()
+    detail = _lines(logger.detail_path)
+    assert detail[0].endswith("═══ TICK 3 START ═══")
+    assert [line.split()[2] for line in detail[1:]] == [f"narrative:n{i}" for i in range(5)]
+    assert _lines(logger.summary_path)[0].endswith("graph=seed")
+
+    stats = logger.stats()
+    assert stats["queued"] == stats["written"] == 7
+    assert stats["dropped"] == stats["sampled_out"] == 0
+    assert stats["flushes"] >= 1 and stats["max_flush_ms"] >= 0
+    logger.close()
+
+
+def test_rotation_renames_segments(tmp_path):
+    config = LogConfig(log_dir=tmp_path, detail_max_bytes=2000, segments=2)
+    logger = ActivityLogger(config)
+    for i in range(200):
+        logger.custom(f"line {i:04d} " + "x" * 40)
+    logger.flush()
+
+    live = logger.detail_path
+    one, two = tmp_path / "health_detail.log.1", tmp_path / "health_detail.log.2"
+    assert not (tmp_path / "health_detail.log.3").exists()
+    for path in (live, one, two):
+        assert 0 < path.stat().st_size <= 2000
+    # Segments are contiguous, newest in the live file
+    numbers = [int(line.split()[2]) for path in (two, one, live) for line in _lines(path)]
+    assert numbers == list(range(numbers[0], 200))
+    assert logger.stats()["rotations"] >= 4
+
+    # A restarted logger continues from the sizes on disk
+    restarted = ActivityLogger(config)
+    restarted.custom("after restart")
+    restarted.flush()
+    tail = _lines(one) + _lines(live)
+    assert "line 0199" in tail[-2] and tail[-1].endswith("after restart")
+    logger.close()
+    restarted.close()
+
+
+def test_bounded_queue_samples_then_drops_detail(tmp_path):
+    config = LogConfig(
+        log_dir=tmp_path, queue_size=100, sample_above=0.5, detail_sample_every=10, flush_interval=60
+    )
+    logger = ActivityLogger(config)
+    logger.state_change("OK", "WARN", "start")
+    logger.flush()  # writer is now idle until flushed
+
+    for i in range(1000):
+        logger.energy_transfer("a", "b", 0.1, f"t{i}")
+    logger.violation("query_write", "still logged")
+    logger.flush()
+
+    stats = logger.stats()
+    assert len(_lines(logger.detail_path)) == 100
+    assert stats["sampled_out"] == 450
+    assert stats["dropped"] == 450
+    summary = _lines(logger.summary_path)
+    assert "VIOLATION: query_write" in summary[1]
+    assert summary[-1].endswith("LOG BACKPRESSURE: 900 detail lines dropped or sampled out")
+    logger.close()
+
+
+def test_close_drains_and_stops(tmp_path):
+    logger = ActivityLogger(LogConfig(log_dir=tmp_path, flush_interval=60))
+    logger.interrupt("player spoke")
+    logger.close()
+
+    assert not logger._thread.is_alive()
+    assert _lines(logger.summary_path)[0].endswith("INTERRUPT: player spoke")
+    logger.interrupt("ignored after close")
+    assert logger.flush()
+    assert len(_lines(logger.summary_path)) == 1
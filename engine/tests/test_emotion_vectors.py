@@ -0,0 +1,115 @@
+"""
+Tests for the vectorized emotion algebra.
+
+Each vector op is checked against the list helper in tick_v1_2 it replaces.
+
+DOCS: docs/physics/algorithms/ALGORITHM_Physics_Schema_v1.2_Energy_Physics.md
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from engine.physics.emotion_vectors import (
+    EmotionVocabulary,
+    avg_intensity,
+    blend,
+    proximity,
+    proximity_matrix,
+    proximity_rows,
+    weighted_average,
+)
+from engine.physics.tick_v1_2 import (
+    avg_emotion_intensity,
+    blend_emotions,
+    emotion_proximity,
+    get_weighted_average_emotions,
+)
+
+NAMES = ["fear", "anger", "hope", "grief", "trust", "shame", "awe", "dread", "joy"]
+
+
+def _random_emotions(rng, max_len=4):
+    # Unrounded intensities: no ties at the blend cap, where order is unspecified
+    return [[e, rng.uniform(0.05, 1.0)] for e in rng.sample(NAMES, rng.randint(0, max_len))]
+
+
+@pytest.fixture
+def samples():
+    rng = random.Random(3)
+    return [_random_emotions(rng) for _ in range(40)]
+
+
+def _as_dict(emotions):
+    return {name: pytest.approx(value, rel=1e-6) for name, value in emotions}
+
+
+def test_round_trip_keeps_names_and_intensities():
+    vocab = EmotionVocabulary(["fear"])
+    vec = vocab.to_vector([["hope", 0.4], ["fear", 0.7]])
+
+    assert vec.dtype == np.float32
+    assert vocab.index == {"fear": 0, "hope": 1}
+    assert vocab.to_list(vec) == [["fear", pytest.approx(0.7)], ["hope", pytest.approx(0.4)]]
+    assert vocab.to_vector([]).tolist() == [0.0, 0.0]
+
+
+def test_proximity_matches_list_helper(samples):
+    vocab = EmotionVocabulary.from_lists(samples)
+    matrix = vocab.to_matrix(samples)
+
+    pairwise = proximity_matrix(matrix, matrix)
+    for i, a in enumerate(samples):
+        for j, b in enumerate(samples):
+            assert pairwise[i, j] == pytest.approx(emotion_proximity(a, b), rel=1e-6)
+
+    rows = proximity_rows(matrix, matrix[5])
+    assert rows == pytest.approx([emotion_proximity(a, samples[5]) for a in samples], rel=1e-6)
+    assert proximity(matrix[1], matrix[2]) == pytest.approx(emotion_proximity(samples[1], samples[2]))
+
+
+def test_vectors_from_a_smaller_vocabulary_are_padded():
+    vocab = EmotionVocabulary()
+    early = vocab.to_vector([["fear", 0.5]])
+    late = vocab.to_vector([["fear", 0.5], ["hope", 0.5]])
+
+    assert len(early) < len(late)
+    assert proximity(early, late) == pytest.approx(0.5)
+
+
+def test_blend_matches_list_helper(samples):
+    vocab = EmotionVocabulary.from_lists(samples)
+    for existing, incoming in zip(samples, samples[1:]):
+        expected = blend_emotions(existing, incoming, 0.3, max_emotions=3)
+        got = vocab.to_list(blend(vocab.to_vector(existing), vocab.to_vector(incoming), 0.3, max_emotions=3))
+        assert {n: v for n, v in got} == _as_dict(expected)
+
+
+def test_weighted_average_and_intensity_match_list_helpers(samples):
+    vocab = EmotionVocabulary.from_lists(samples)
+    weights = [None, 2.0, 0.5, 1.0, 0.0]
+    links = [{"weight": w, "emotions": e} for w, e in zip(weights, samples)]
+
+    got = weighted_average(vocab.to_matrix(samples[:5]), weights)
+
+    assert {n: v for n, v in vocab.to_list(got)} == _as_dict(get_weighted_average_emotions(links))
+    assert avg_intensity(vocab.to_matrix(samples)) == pytest.approx(
+        [avg_emotion_intensity(e) for e in samples], rel=1e-6
+    )
+
+
+def test_zero_intensity_emotions_are_present():
+    listed = [["joy", 0.0]]
+    samples = [listed, [["joy", 0.5]], [["fear", 0.0]], [], [["joy", 0.0], ["fear", 0.4]]]
+    vocab = EmotionVocabulary.from_lists(samples)
+    matrix, masks = vocab.to_matrix(samples), vocab.to_masks(samples)
+
+    assert vocab.to_mask(listed).tolist() == [True, False]
+    pairwise = proximity_matrix(matrix, matrix, masks, masks)
+    for i, a in enumerate(samples):
+        assert proximity_rows(matrix, matrix[i], masks, masks[i]) == pytest.approx(pairwise[:, i])
+        for j, b in enumerate(samples):
+            assert pairwise[i, j] == pytest.approx(emotion_proximity(a, b))
+    assert proximity(matrix[0], matrix[1], masks[0], masks[1]) == 0.0
+    assert avg_intensity(matrix, masks) == pytest.approx([avg_emotion_intensity(e) for e in samples])
@@ -0,0 +1,100 @@
+"""
+Tests for the shared FalkorDB connection manager.
+
+GraphOps and GraphQueries built without a `db` draw from one pooled
+client per host:port. The pool is bounded, counts checkouts, waiters
+and failures, and the manager reuses clients and graph handles.
+
+DOCS: docs/physics/graph/PATTERNS_Graph.md
+"""
+
+import threading
+import time
+
+import pytest
+import redis
+
+import engine.physics.graph.graph_connections as graph_connections
+from engine.physics.graph.graph_connections import ConnectionManager, MeteredConnectionPool
+
+
+class FakeConnection(redis.Connection):
+    """Connection that never touches a socket."""
+
+    refuse = False
+
+    def connect(self):
+        if self.refuse:
+            raise redis.ConnectionError("refused")
+
+    def disconnect(self, *args, **kwargs):
+        pass
+
+
+class FakeFalkorDB:
+    def __init__(self, host, port, connection_pool):
+        self.connection_pool = connection_pool
+
+    def select_graph(self, name):
+        return (name, object())
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(graph_connections, "FalkorDB", FakeFalkorDB)
+    return ConnectionManager(max_connections=4)
+
+
+def test_clients_and_graph_handles_are_shared(manager):
+    db = manager.client("localhost", 6379)
+    assert manager.client("localhost", "6379") is db
+    assert manager.client("other", 6379) is not db
+
+    graph = manager.graph("pt_a")
+    assert manager.graph("pt_a") is graph
+    assert manager.graph("pt_b") is not graph
+
+    stats = manager.stats()
+    assert set(stats) == {"localhost:6379", "other:6379"}
+    assert stats["localhost:6379"]["graphs"] == ["pt_a", "pt_b"]
+    assert stats["localhost:6379"]["max_connections"] == 4
+
+
+def test_pool_counts_checkouts_waiters_and_errors():
+    pool = MeteredConnectionPool(connection_class=FakeConnection, max_connections=2, timeout=0.3)
+    first, second = pool.get_connection(), pool.get_connection()
+    assert pool.stats()["checked_out"] == 2
+
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.get_connection()))
+    waiter.start()
+    time.sleep(0.1)
+    assert pool.stats()["waiting"] == 1
+
+    pool.release(first)
+    waiter.join(timeout=1)
+    assert got == [first]
+    assert pool.stats() == {
+        "max_connections": 2, "open": 2, "checked_out": 2, "idle": 0, "waiting": 0, "errors": 0,
+    }
+
+    # Exhausted pool: the caller times out instead of opening a third connection
+    with pytest.raises(redis.ConnectionError):
+        pool.get_connection()
+    assert pool.stats()["errors"] == 1
+
+    pool.release(second)
+    pool.release(got[0])
+    assert pool.stats()["checked_out"] == 0 and pool.stats()["idle"] == 2
+
+
+def test_failed_connect_is_not_left_checked_out(monkeypatch):
+    monkeypatch.setattr(FakeConnection, "refuse", True)
+    pool = MeteredConnectionPool(connection_class=FakeConnection, max_connections=2, timeout=0.1)
+
+    for _ in range(3):
+        with pytest.raises(redis.ConnectionError):
+            pool.get_connection()
+
+    stats = pool.stats()
+    assert stats["errors"] == 3 and stats["checked_out"] == 0
@@ -0,0 +1,183 @@
+"""
+Tests for GraphOps.apply(bulk=True).
+
+The bulk path validates every node and link first, then writes each
+distinct statement as one UNWIND query. It must report the same
+persisted/rejected/error items as the per-item path. Capturing only
+applies to the applying thread; other users of the same instance write
+as usual.
+
+DOCS: docs/physics/graph/PATTERNS_Graph.md
+"""
+
+import threading
+
+import pytest
+
+import engine.infrastructure.embeddings.service as embedding_service
+from engine.physics.graph.graph_ops import GraphOps
+from engine.physics.graph.graph_ops_apply import _WriteBatch
+
+
+class Result:
+    def __init__(self, rows):
+        self.result_set = rows
+
+
+class FakeGraph:
+    """Records queries; fails any write that touches an id in `bad_ids`."""
+
+    def __init__(self, existing=(), embeddings=None, bad_ids=()):
+        self.existing = list(existing)
+        self.embeddings = embeddings or {}
+        self.bad_ids = set(bad_ids)
+        self.queries = []
+
+    def _ids(self, params):
+        ids = {v for v in params.values() if isinstance(v, str)}
+        for row in params.get("rows", []):
+            ids |= {v for v in row.values() if isinstance(v, str)}
+        return ids
+
+    def query(self, cypher, params=None):
+        params = params or {}
+        self.queries.append((cypher, params))
+        if "RETURN n.id\n" in cypher and "MATCH (n)\n" in cypher:
+            return Result([[node_id] for node_id in self.existing])
+        if "n.embedding IS NOT NULL" in cypher:
+            label = cypher.split("MATCH (n:")[1].split(")")[0]
+            return Result(self.embeddings.get(label, []))
+        if "UNWIND $ids" in cypher:
+            return Result([])
+        if self._ids(params) & self.bad_ids:
+            raise RuntimeError("constraint violated")
+        return Result([])
+
+
+class FakeDB:
+    def __init__(self, graph):
+        self.graph = graph
+
+    def select_graph(self, name):
+        return self.graph
+
+
+MUTATIONS = {
+    "nodes": [
+        {"type": "character", "id": "char_a", "name": "A"},
+        {"type": "character", "id": "char_b", "name": "B"},
+        {"type": "character", "id": "char_bad", "name": "Bad"},
+        {"type": "place", "id": "place_camp", "name": "Camp"},
+        {"type": "place", "id": "place_road", "name": "Road"},
+        {"type": "dragon", "id": "dragon_x"},
+    ],
+    "links": [
+        {"type": "present", "from": "char_a", "to": "place_camp"},
+        {"type": "present", "from": "char_b", "to": "place_camp"},
+        {"type": "present", "from": "char_bad", "to": "place_road"},
+        {"type": "geography", "from": "place_camp", "to": "place_road", "path": 1.0},
+        {"type": "present", "from": "char_ghost", "to": "place_camp"},
+        {"type": "teleport", "from": "char_a", "to": "place_road"},
+    ],
+}
+
+
+def _apply(graph, **kwargs):
+    ops = GraphOps(graph_name="test", db=FakeDB(graph))
+    return ops.apply(data=MUTATIONS, **kwargs)
+
+
+def _writes(graph):
+    return [c for c, _ in graph.queries if "MERGE" in c]
+
+
+def test_bulk_matches_per_item_results_in_fewer_queries():
+    per_item_graph, bulk_graph = FakeGraph(bad_ids={"char_bad"}), FakeGraph(bad_ids={"char_bad"})
+    per_item = _apply(per_item_graph)
+    bulk = _apply(bulk_graph, bulk=True)
+
+    assert sorted(bulk.persisted) == sorted(per_item.persisted)
+    assert sorted(bulk.rejected) == sorted(per_item.rejected)
+    assert sorted(e["item"] for e in bulk.errors) == sorted(e["item"] for e in per_item.errors)
+    assert "char_bad" in bulk.rejected and "present:char_a@place_camp" in bulk.persisted
+
+    # The two chunks containing char_bad are replayed row by row
+    replays = [c for c in _writes(bulk_graph) if not c.startswith("UNWIND $rows")]
+    assert len(replays) == 3 + 3  # three actors, three AT links
+    actor_rows = next(p["rows"] for c, p in bulk_graph.queries if "MERGE (n:Actor" in c and "rows" in p)
+    assert [row["id"] for row in actor_rows] == ["char_a", "char_b", "char_bad"]
+
+    # Without failures: Actor, Space, AT and CONNECTS, one UNWIND each
+    clean_per_item, clean_bulk = FakeGraph(), FakeGraph()
+    _apply(clean_per_item)
+    _apply(clean_bulk, bulk=True)
+    assert len(_writes(clean_bulk)) == 4
+    assert all(c.startswith("UNWIND $rows") for c in _writes(clean_bulk))
+    assert len(_writes(clean_per_item)) == 9
+
+
+def test_nodes_are_written_before_links():
+    graph = FakeGraph()
+    GraphOps(graph_name="test", db=FakeDB(graph)).apply(
+        data={
+            "nodes": [
+                {"type": "moment", "id": "m1", "text": "hi", "place_id": "place_camp"},
+                {"type": "place", "id": "place_camp", "name": "Camp"},
+            ],
+            "links": [],
+        },
+        bulk=True,
+    )
+    writes = [c.split("\n")[1].strip() for c in _writes(graph)]
+    assert writes[0].startswith("MERGE (n:Moment") and writes[1].startswith("MERGE (n:Space")
+    assert "MATCH (m:Moment" in writes[2]
+
+
+def test_duplicates_checked_against_graph_and_batch(monkeypatch):
+    graph = FakeGraph(embeddings={"Narrative": [["narr_old", "Old", [1.0, 0.0, 0.0]]]})
+    nodes = [
+        {"type": "narrative", "id": "narr_same", "name": "Same", "embedding": [2.0, 0.0, 0.0]},
+        {"type": "narrative", "id": "narr_new", "name": "New", "content": "x"},
+        {"type": "narrative", "id": "narr_twin", "name": "Twin", "content": "x"},
+    ]
+    calls = []
+
+    class FakeService:
+        def node_text(self, node):
+            return node["name"]
+
+        def embed_batch(self, texts):
+            calls.append(texts)
+            return [[0.0, 1.0, 0.0] for _ in texts]
+
+    monkeypatch.setattr(embedding_service, "get_embedding_service", lambda: FakeService())
+    result = GraphOps(graph_name="test", db=FakeDB(graph)).apply(
+        data={"nodes": nodes, "links": []}, bulk=True, embed=True
+    )
+
+    assert calls == [["New", "Twin"]]
+    assert [(d["new_node"], d["similar_to"]) for d in result.duplicates] == [
+        ("narr_same", "narr_old"),
+        ("narr_twin", "narr_new"),
+    ]
+    assert sum("n.embedding IS NOT NULL" in c for c, _ in graph.queries) == 1
+    assert "narr_new" in result.persisted  # orphaned: reported, but still written
+    assert [e["item"] for e in result.errors] == ["narr_new"]
+
+
+def test_capture_leaves_other_threads_writing():
+    graph = FakeGraph()
+    ops = GraphOps(graph_name="test", db=FakeDB(graph))
+    batch = _WriteBatch()
+
+    with batch.capture(ops, "char_a"):
+        ops.add_character(id="char_a", name="A")
+        other = threading.Thread(target=lambda: ops.add_character(id="char_b", name="B"))
+        other.start()
+        other.join()
+
+    # The other thread's write ran; the capturing thread's was recorded
+    assert [p["id"] for _, p in graph.queries] == ["char_b"]
+    assert [item for rows in batch.groups.values() for item, _ in rows] == ["char_a"]
+    ops._query("RETURN 1")
+    assert len(graph.queries) == 2
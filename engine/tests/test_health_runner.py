@@ -0,0 +1,129 @@
+"""
+Tests for the physics health runner.
+
+`all` takes one shared snapshot (two aggregate queries) for every checker,
+runs graph checkers concurrently under a per-checker time budget, and
+`--watch` re-runs the same checkers on an interval.
+
+DOCS: docs/physics/HEALTH_Energy_Physics.md
+"""
+
+import json
+import threading
+import time
+
+from engine.physics.health.base import BaseChecker, HealthStatus
+from engine.physics.health.checker import HealthRunner, watch
+from engine.physics.health.checkers import TickIntegrityChecker
+
+
+class FakeGraph:
+    """Answers both the snapshot queries and the checkers' own queries."""
+
+    def __init__(self, fail_snapshot=False):
+        self.queries = []
+        self.fail_snapshot = fail_snapshot
+        self._lock = threading.Lock()
+
+    def query(self, cypher, params=None):
+        with self._lock:
+            self.queries.append(cypher)
+        if "AS invalid_states" in cypher or "AS negative" in cypher:
+            if self.fail_snapshot:
+                raise RuntimeError("no collect() here")
+        if "AS invalid_states" in cypher:
+            return [{
+                "node_energy": 50.0, "actors": 4, "moments": 2,
+                "negative": [["m9", "Moment", -0.5]],
+                "invalid_states": [["m3", "stuck"]],
+            }]
+        if "AS negative" in cypher:
+            return [{"link_energy": 2.0, "hot": 6, "total": 20, "negative": []}]
+        if "sum(n.energy)" in cypher:
+            return [{"total": 50.0}]
+        if "sum(r.energy)" in cypher:
+            return [{"total": 2.0}]
+        if "AS actors" in cypher:
+            return [{"actors": 4, "moments": 2}]
+        if "AS hot" in cypher:
+            return [{"hot": 6, "cold": 14, "total": 20}]
+        if "n.energy < 0" in cypher:
+            return [{"id": "m9", "type": "Moment", "energy": -0.5}]
+        if "NOT m.status IN" in cypher:
+            return [{"id": "m3", "status": "stuck"}]
+        return []
+
+
+def _by_name(result):
+    return {c.checker_name: (c.status, c.message) for c in result.checks}
+
+
+def test_one_snapshot_feeds_every_checker():
+    graph = FakeGraph()
+    result = HealthRunner(graph).run()
+
+    assert len(graph.queries) == 2
+    assert result.snapshot["node_energy"] == 50.0
+    assert result.snapshot["negative_nodes"] == 1
+
+    # Same outcome as each checker querying the graph itself
+    fallback_graph = FakeGraph(fail_snapshot=True)
+    fallback = HealthRunner(fallback_graph).run()
+    assert len(fallback_graph.queries) > 2
+    assert fallback.snapshot is None
+    assert _by_name(result) == _by_name(fallback)
+    assert _by_name(result)["moment_lifecycle"][0] == HealthStatus.ERROR
+    assert result.summary["total"] == 5
+
+
+class SlowChecker(BaseChecker):
+    name = "slow"
+
+    def check(self):
+        time.sleep(0.5)
+        return self.ok("finally")
+
+
+class FastChecker(BaseChecker):
+    name = "fast"
+
+    def check(self):
+        return self.ok(f"on {threading.current_thread().name}")
+
+
+def test_time_budget_reports_unknown():
+    graph = FakeGraph()
+    runner = HealthRunner(
+        graph,
+        checkers={
+            "slow": SlowChecker(graph),
+            "fast": FastChecker(graph),
+            "tick_integrity": TickIntegrityChecker(),
+        },
+        budgets={"slow": 0.1},
+    )
+
+    started = time.perf_counter()
+    result = runner.run()
+
+    assert time.perf_counter() - started < 0.4
+    checks = _by_name(result)
+    assert checks["slow"] == (HealthStatus.UNKNOWN, "Exceeded time budget (0.1s)")
+    assert checks["fast"][1].startswith("on health")  # ran on the pool
+    assert checks["tick_integrity"][0] == HealthStatus.UNKNOWN  # inline, nothing recorded
+    assert [c.checker_name for c in result.checks] == ["slow", "fast", "tick_integrity"]
+
+
+def test_watch_reuses_checkers(capsys):
+    graph = FakeGraph()
+    runner = HealthRunner(graph)
+    checkers = dict(runner.checkers)
+
+    last = watch(runner, interval=0, as_json=True, iterations=3)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 3
+    assert all(json.loads(line)["summary"]["total"] == 5 for line in lines)
+    assert runner.checkers == checkers
+    assert len(graph.queries) == 6
+    assert last.status == HealthStatus.ERROR
@@ -0,0 +1,154 @@
+"""
+Tests for incremental physics health checks.
+
+The tick engine records a TickDelta as it writes; the energy, link and
+negative-energy checkers fold deltas into running aggregates and only
+scan the graph on their first check and every `full_scan_every` ticks.
+
+DOCS: docs/physics/HEALTH_Energy_Physics.md
+"""
+
+from engine.physics.health.base import HealthStatus
+from engine.physics.health.checkers import (
+    EnergyConservationChecker,
+    LinkStateChecker,
+    NoNegativeEnergyChecker,
+)
+from engine.physics.tick_delta import TickDelta
+from engine.physics.tick_v1_2 import GraphTickV1_2
+
+
+class FakeGraph:
+    """Answers the checkers' aggregate queries from plain counters."""
+
+    def __init__(self):
+        self.calls = 0
+        self.node_energy = 90.0
+        self.link_energy = 5.0
+        self.actors, self.moments = 8, 4
+        self.hot, self.cold = 30, 70
+        self.negative_nodes = []
+
+    def query(self, cypher, params=None):
+        self.calls += 1
+        if "sum(n.energy)" in cypher:
+            return [{"total": self.node_energy}]
+        if "sum(r.energy)" in cypher:
+            return [{"total": self.link_energy}]
+        if "AS actors" in cypher:
+            return [{"actors": self.actors, "moments": self.moments}]
+        if "AS hot" in cypher:
+            return [{"hot": self.hot, "cold": self.cold, "total": self.hot + self.cold}]
+        if "n.energy < 0" in cypher:
+            return list(self.negative_nodes)
+        return []
+
+
+def _delta(tick, changes=(), **kwargs):
+    delta = TickDelta(tick=tick, **kwargs)
+    delta.phase = "generate"
+    for node_id, before, after in changes:
+        delta.record_node(node_id, before, after, "Actor")
+    return delta
+
+
+def test_checks_between_full_scans_skip_the_graph():
+    graph = FakeGraph()
+    energy = EnergyConservationChecker(graph_queries=graph, full_scan_every=3)
+
+    first = energy.check()
+    assert first.details["source"] == "full_scan" and first.details["total_energy"] == 95.0
+    scanned_calls = graph.calls
+
+    energy.apply_delta(_delta(1, [("a1", 1.0, 1.5)]))
+    energy.apply_delta(_delta(2, [("a1", 1.5, 2.0), ("a2", 0.0, 0.5)]))
+    result = energy.check()
+    assert graph.calls == scanned_calls
+    assert result.details["source"] == "incremental"
+    assert result.details["node_energy"] == 91.5
+    assert result.details["last_tick_phases"] == {"generate": {"in": 1.0, "out": 0.0, "cooled": 0.0}}
+
+    # Third delta reaches full_scan_every: rescan and report drift
+    graph.node_energy = 92.0
+    energy.apply_delta(_delta(3, [("a3", 0.0, 0.25)]))
+    rescanned = energy.check()
+    assert graph.calls > scanned_calls
+    assert rescanned.details["source"] == "full_scan"
+    assert rescanned.details["drift"] == {"node_energy": 0.25}
+    assert energy.full_scans == 2
+
+
+def test_without_deltas_every_check_scans():
+    graph = FakeGraph()
+    links = LinkStateChecker(graph_queries=graph)
+
+    links.check()
+    calls = graph.calls
+    assert links.check().details["source"] == "full_scan"
+    assert graph.calls == 2 * calls
+
+
+def test_link_state_follows_census_and_crossings():
+    graph = FakeGraph()
+    links = LinkStateChecker(graph_queries=graph)
+    links.check()
+
+    links.apply_delta(_delta(1, hot_links=5, cold_links=95, links_created=2))
+    result = links.check()
+    assert (result.details["hot_links"], result.details["cold_links"]) == (5, 97)
+    assert result.status == HealthStatus.WARN  # 5/102 < 10% hot
+
+    links.apply_delta(_delta(2, links_heated=20, links_cooled_off=1))
+    result = links.check()
+    assert (result.details["hot_links"], result.details["total_links"]) == (24, 102)
+    assert result.status == HealthStatus.OK
+
+
+def test_no_negative_tracks_written_nodes():
+    graph = FakeGraph()
+    graph.negative_nodes = [{"id": "m1", "type": "Moment", "energy": -0.2}]
+    negatives = NoNegativeEnergyChecker(graph_queries=graph)
+    assert negatives.check().status == HealthStatus.ERROR
+
+    negatives.apply_delta(_delta(1, [("m1", -0.2, 0.0), ("a1", 0.1, -0.3)]))
+    result = negatives.check()
+    assert result.details["source"] == "incremental"
+    assert result.details["negative_nodes"] == [{"id": "a1", "type": "Actor", "energy": -0.3}]
+
+    negatives.apply_delta(_delta(2, [("a1", -0.3, 0.4)]))
+    assert negatives.check().status == HealthStatus.OK
+
+
+class TickRead:
+    def query(self, cypher, params=None):
+        if "MATCH (a:Actor)" in cypher and "ORDER BY a.weight" in cypher:
+            return [{"id": "player", "weight": 1.0, "energy": 0.25}]
+        if "AS hot" in cypher:
+            return [{"hot": 3, "cold": 7}]
+        return []
+
+
+class TickWrite:
+    def _query(self, cypher, params=None):
+        return []
+
+
+class BrokenSink:
+    def apply_delta(self, delta):
+        raise RuntimeError("boom")
+
+
+def test_tick_emits_delta_to_sinks():
+    graph = FakeGraph()
+    links = LinkStateChecker(graph_queries=graph)
+    links.check()
+    tick = GraphTickV1_2(graph_queries=TickRead(), graph_ops=TickWrite(), delta_sinks=[BrokenSink(), links])
+
+    result = tick.run(current_tick=7)
+
+    delta = result.delta
+    assert delta.tick == 7
+    assert delta.node_energy == {"player": [0.25, 0.75]}
+    assert delta.phase_energy["generate"]["in"] == 0.5
+    assert (delta.hot_links, delta.cold_links) == (3, 7)
+    assert links.check().details["hot_links"] == 3
@@ -35,7 +35,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 @pytest.fixture
 def mock_graph_ops():
     """Create a GraphOps instance with mocked database connection."""
-    with patch('engine.physics.graph.graph_ops.FalkorDB') as mock_falkor:
+    # Fresh connection manager so the mocked client is not shared with other tests
+    with patch('engine.physics.graph.graph_connections.FalkorDB') as mock_falkor, \
+            patch('engine.physics.graph.graph_connections._manager', None):
         mock_graph = MagicMock()
         mock_falkor.return_value.select_graph.return_value = mock_graph
 
@@ -58,7 +60,9 @@ def mock_graph_ops():
 @pytest.fixture
 def mock_graph_queries():
     """Create a GraphQueries instance with mocked database connection."""
-    with patch('engine.physics.graph.graph_queries.FalkorDB') as mock_falkor:
+    # Fresh connection manager so the mocked client is not shared with other tests
+    with patch('engine.physics.graph.graph_connections.FalkorDB') as mock_falkor, \
+            patch('engine.physics.graph.graph_connections._manager', None):
         mock_graph = MagicMock()
         mock_falkor.return_value.select_graph.return_value = mock_graph
 
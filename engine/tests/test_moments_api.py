@@ -32,7 +32,7 @@ from fastapi.testclient import TestClient
 @pytest.fixture
 def mock_moment_queries():
     """Create mocked MomentQueries."""
-    with patch('engine.infrastructure.api.moments.MomentQueries') as mock_class:
+    with patch('engine.infrastructure.api.playthrough_registry.MomentQueries') as mock_class:
         mock_instance = MagicMock()
         mock_class.return_value = mock_instance
 
@@ -75,7 +75,7 @@ def mock_moment_queries():
 @pytest.fixture
 def mock_moment_traversal():
     """Create mocked MomentTraversal."""
-    with patch('engine.infrastructure.api.moments.MomentTraversal') as mock_class:
+    with patch('engine.infrastructure.api.playthrough_registry.MomentTraversal') as mock_class:
         mock_instance = MagicMock()
         mock_class.return_value = mock_instance
 
@@ -97,7 +97,7 @@ def mock_moment_traversal():
 @pytest.fixture
 def mock_moment_surface():
     """Create mocked MomentSurface."""
-    with patch('engine.infrastructure.api.moments.MomentSurface') as mock_class:
+    with patch('engine.infrastructure.api.playthrough_registry.MomentSurface') as mock_class:
         mock_instance = MagicMock()
         mock_class.return_value = mock_instance
 
@@ -117,7 +117,7 @@ def mock_moment_surface():
 @pytest.fixture
 def mock_graph_queries():
     """Create mocked GraphQueries."""
-    with patch('engine.infrastructure.api.moments.GraphQueries') as mock_class:
+    with patch('engine.infrastructure.api.playthrough_registry.GraphQueries') as mock_class:
         mock_instance = MagicMock()
         mock_class.return_value = mock_instance
 
@@ -141,7 +141,9 @@ def test_client(mock_moment_queries, mock_moment_traversal, mock_moment_surface,
     )
     app.include_router(router, prefix="/api")
 
-    return TestClient(app)
+    # Fresh playthrough registry so bundles built from the mocks don't leak between tests
+    with patch.dict('engine.infrastructure.api.playthrough_registry._registries', clear=True):
+        yield TestClient(app)
 
 
 # =============================================================================
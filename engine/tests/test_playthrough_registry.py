@@ -0,0 +1,92 @@
+"""
+Tests for the per-playthrough registry behind the moments API.
+
+Bundles of query objects are reused across requests, bounded by an LRU
+with idle eviction, and graph names are re-resolved only when the
+playthrough's player.yaml changes.
+
+DOCS: docs/infrastructure/api/IMPLEMENTATION_Api.md
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+import engine.infrastructure.api.playthrough_registry as registry_mod
+from engine.infrastructure.api.playthrough_registry import PlaythroughRegistry
+
+
+class FakeQueries:
+    built = []
+
+    def __init__(self, graph_name, host, port):
+        self.graph_name = graph_name
+        FakeQueries.built.append(graph_name)
+
+
+@pytest.fixture
+def playthroughs(tmp_path, monkeypatch):
+    FakeQueries.built = []
+    for name in ("MomentQueries", "MomentTraversal", "MomentSurface", "GraphQueries"):
+        monkeypatch.setattr(registry_mod, name, FakeQueries)
+    reads = []
+    resolve = registry_mod.resolve_graph_name
+
+    def counting_resolve(playthrough_id, playthroughs_dir):
+        reads.append(playthrough_id)
+        return resolve(playthrough_id, playthroughs_dir)
+
+    monkeypatch.setattr(registry_mod, "resolve_graph_name", counting_resolve)
+    return SimpleNamespace(root=tmp_path, reads=reads)
+
+
+def _write_player(root, playthrough_id, graph_name, mtime=None):
+    player = root / playthrough_id / "player.yaml"
+    player.parent.mkdir(parents=True, exist_ok=True)
+    player.write_text(yaml.dump({"graph_name": graph_name}))
+    if mtime is not None:
+        os.utime(player, ns=(mtime, mtime))
+
+
+def test_bundles_and_graph_names_are_reused(playthroughs):
+    _write_player(playthroughs.root, "pt_a", "graph_a", mtime=1_000)
+    registry = PlaythroughRegistry(playthroughs_dir=playthroughs.root)
+
+    first = registry.get("pt_a")
+    assert first.queries is registry.get("pt_a").queries
+    assert first.graph_queries.graph_name == "graph_a"
+    assert FakeQueries.built == ["graph_a", "graph_a"]
+    assert playthroughs.reads == ["pt_a"]
+    assert registry.stats()["hits"] == 1
+
+    # Metadata change: re-resolve, and a new graph name means a new bundle
+    _write_player(playthroughs.root, "pt_a", "graph_a2", mtime=2_000)
+    second = registry.get("pt_a")
+    assert second is not first and second.queries.graph_name == "graph_a2"
+    assert playthroughs.reads == ["pt_a", "pt_a"]
+
+    registry.invalidate("pt_a")
+    assert registry.get("pt_a") is not second
+
+
+def test_lru_and_idle_eviction(playthroughs):
+    now = [0.0]
+    registry = PlaythroughRegistry(
+        playthroughs_dir=playthroughs.root, max_size=2, idle_ttl=60, clock=lambda: now[0]
+    )
+
+    a = registry.get("pt_a")
+    registry.get("pt_b")
+    assert registry.get("pt_a") is a
+    registry.get("pt_c")  # evicts pt_b, the least recently used
+    assert registry.get("pt_a") is a
+    assert registry.stats()["evictions"] == 1
+
+    now[0] = 45.0
+    registry.get("pt_c")
+    now[0] = 90.0
+    registry.get("pt_c")  # pt_a idle for 90s
+    assert registry.stats()["size"] == 1
+    assert registry.get("pt_a") is not a
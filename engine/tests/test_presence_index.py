@@ -0,0 +1,151 @@
+"""
+Tests for the moment presence index.
+
+get_current_view gates moments through an in-memory index of their
+presence-required attachments instead of collecting them in Cypher on every
+request; GraphOps writes keep the index current, and a Moment/ATTACHED_TO
+count check catches writes it didn't see.
+
+DOCS: docs/engine/moment-graph-engine/PATTERNS_Instant_Traversal_Moment_Graph.md
+"""
+
+from engine.moment_graph.presence_index import (
+    ATTACHED_COUNT_QUERY,
+    BUILD_QUERY,
+    MOMENT_COUNT_QUERY,
+    PresenceIndex,
+    register,
+)
+from engine.moment_graph.queries import MomentQueries
+from engine.physics.graph.graph_ops_events import emit_event
+
+def gating():
+    return [
+        {"id": "m_free", "attached": [["place_camp", False]]},
+        {"id": "m_aldric", "attached": [["char_aldric", True]]},
+        {"id": "m_both", "attached": [["char_aldric", True], ["char_mildred", True]]},
+        {"id": "m_sword", "attached": [["thing_sword", True], [None, None]]},
+    ]
+
+
+class FakeRead:
+    def __init__(self, fail_build=False):
+        self.fail_build = fail_build
+        self.rows = gating()
+        self.queries = []
+
+    def query(self, cypher, params=None):
+        self.queries.append((cypher, params))
+        if self.fail_build and cypher in (BUILD_QUERY, MOMENT_COUNT_QUERY):
+            raise RuntimeError("graph unavailable")
+        if cypher == BUILD_QUERY:
+            return self.rows
+        if cypher == MOMENT_COUNT_QUERY:
+            return [{"n": len(self.rows)}]
+        if cypher == ATTACHED_COUNT_QUERY:
+            return [{"n": sum(1 for row in self.rows for t, _ in row["attached"] if t)}]
+        if "RETURN m.id AS id" in cypher:
+            stored = {row["id"] for row in self.rows}
+            return [{"id": i, "status": "possible"} for i in sorted(params["candidates"]) if i in stored]
+        return []
+
+    def builds(self):
+        return sum(1 for c, _ in self.queries if c == BUILD_QUERY)
+
+    def get_place(self, place_id):
+        return {"id": place_id}
+
+    def get_character(self, char_id):
+        return {"id": char_id}
+
+    def get_thing(self, thing_id):
+        return {"id": thing_id}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_candidates_once_every_target_is_present():
+    index = PresenceIndex("g")
+    index.rebuild(FakeRead())
+
+    assert index.candidates([]) == {"m_free"}
+    assert index.candidates(["char_aldric"]) == {"m_free", "m_aldric"}
+    assert index.candidates(["char_aldric", "char_mildred", "thing_sword"]) == {
+        "m_free", "m_aldric", "m_both", "m_sword",
+    }
+    assert index.stats() == {"moments": 4, "gated": 3, "targets": 3}
+
+    index.set_requirement("m_aldric", "char_aldric", required=False)
+    assert "m_aldric" in index.candidates([])
+
+
+def test_graph_ops_events_keep_index_current():
+    clock = Clock()
+    index = register(PresenceIndex("g", clock=clock))
+    other = register(PresenceIndex("other_graph", clock=clock))
+    index.rebuild(FakeRead())
+    other.rebuild(FakeRead())
+
+    emit_event("presence_changed", {"graph": "g", "moment_id": "m_new"})
+    emit_event("presence_changed", {
+        "graph": "g", "moment_id": "m_new", "target_id": "char_mildred", "presence_required": True,
+    })
+    emit_event("presence_changed", {
+        "graph": "g", "moment_id": "m_free", "target_id": "place_camp", "presence_required": False,
+    })
+
+    assert "m_new" not in index.candidates([]) and "m_free" in index.candidates([])
+    assert "m_new" in index.candidates(["char_mildred"])
+    assert "m_new" not in other.candidates(["char_mildred"])
+
+    # The events' writes are accounted for: a graph holding them matches
+    read = FakeRead()
+    read.rows.append({"id": "m_new", "attached": [["char_mildred", True]]})
+    assert index.matches_graph(read)
+    # A repeated (MERGEd) attachment isn't counted twice
+    emit_event("presence_changed", {
+        "graph": "g", "moment_id": "m_new", "target_id": "char_mildred", "presence_required": True,
+    })
+    assert index.matches_graph(read)
+
+    assert not index.is_stale(60)
+    clock.now = 60.0
+    assert index.is_stale(60)
+
+
+def test_current_view_uses_index():
+    queries = MomentQueries.__new__(MomentQueries)
+    queries.read = FakeRead()
+    queries.presence = PresenceIndex("g")
+    queries.presence_ttl = 60
+
+    view = queries.get_current_view("char_player", "place_camp", ["char_aldric"])
+
+    assert [m["id"] for m in view["moments"]] == ["m_aldric", "m_free"]
+    cypher, params = queries.read.queries[-1]
+    assert "$candidates" in cypher and "required_targets" not in cypher
+    assert sorted(params["candidates"]) == ["m_aldric", "m_free"]
+    assert queries.read.builds() == 1
+
+    queries.get_current_view("char_player", "place_camp", [])
+    assert queries.read.builds() == 1
+
+    # m_recall was created by raw Cypher: the counts no longer match, so the
+    # index is rebuilt and the moment shows
+    queries.read.rows.append({"id": "m_recall", "attached": []})
+    view = queries.get_current_view("char_player", "place_camp", [])
+    assert [m["id"] for m in view["moments"]] == ["m_free", "m_recall"]
+    assert queries.read.builds() == 2
+
+    # Index can't be built: gate in Cypher as before
+    queries.read = FakeRead(fail_build=True)
+    queries.presence.invalidate()
+    queries.get_current_view("char_player", "place_camp", [])
+    cypher, params = queries.read.queries[-1]
+    assert "required_targets" in cypher and params["candidates"] == []
@@ -0,0 +1,148 @@
+import threading
+
+import pytest
+
+from engine.infrastructure.orchestration.narrator import NarratorService, is_fallback_response
+from engine.infrastructure.orchestration.orchestrator import Orchestrator
+from engine.infrastructure.orchestration.speculative import (
+    SpeculationCache,
+    SpeculativeNarrator,
+    graph_version,
+    rank_click_candidates,
+)
+from engine.physics.graph.graph_ops_events import emit_event
+
+
+VIEW = {
+    "moments": [
+        {"id": "m_fire", "status": "active", "weight": 0.9},
+        {"id": "m_road", "status": "active", "weight": 0.4},
+        {"id": "m_old", "status": "completed", "weight": 1.0},
+    ],
+    "transitions": [
+        {"from_id": "m_fire", "to_id": "m_a", "trigger": "click",
+         "require_words": ["Blade"], "weight_transfer": 0.5},
+        {"from_id": "m_road", "to_id": "m_b", "trigger": "click",
+         "require_words": ["north", "south"], "weight_transfer": 0.9},
+        {"from_id": "m_fire", "to_id": "m_c", "trigger": "wait",
+         "require_words": ["ignored"], "weight_transfer": 1.0},
+        {"from_id": "m_old", "to_id": "m_d", "trigger": "click",
+         "require_words": ["history"], "weight_transfer": 1.0},
+    ],
+}
+
+
+def test_rank_click_candidates_orders_by_weight_times_transfer():
+    ranked = rank_click_candidates(VIEW, k=2)
+
+    assert [(c.moment_id, c.word) for c in ranked] == [
+        ("m_fire", "blade"),
+        ("m_road", "north"),
+    ]
+    assert ranked[0].score == 0.45
+
+
+def test_cache_counts_hits_misses_and_wasted():
+    cache = SpeculationCache(ttl_seconds=60, max_entries=1)
+    cache.put(("pt", "m", "a", "v"), {"scene": 1})
+    cache.put(("pt", "m", "b", "v"), {"scene": 2})  # evicts the first, unused
+
+    assert cache.get(("pt", "m", "a", "v")) is None
+    assert cache.get(("pt", "m", "b", "v")) == {"scene": 2}
+    assert cache.get(("pt", "m", "b", "v")) is None  # single use
+
+    assert cache.stats.wasted == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+
+
+def test_speculate_then_lookup_hits():
+    done = threading.Event()
+    calls = []
+
+    def generate(scene_context, instruction):
+        calls.append(instruction)
+        done.set()
+        return {"scene": {"id": instruction}}
+
+    spec = SpeculativeNarrator(generate=generate, top_k=1)
+    keys = spec.speculate("pt_1", VIEW, "7:0", build_context=lambda: {})
+    assert len(keys) == 1
+    assert done.wait(5)
+    spec._executor.shutdown(wait=True)
+
+    hit = spec.lookup("pt_1", "m_fire", "BLADE", "7:0")
+    assert hit == {"scene": {"id": "Player action: blade"}}
+    assert spec.lookup("pt_1", "m_fire", "blade", "8:0") is None
+    assert spec.stats.generated == 1
+
+
+def test_graph_version_changes_on_apply():
+    before = graph_version(3)
+    emit_event("apply_complete", {})
+    assert graph_version(3) != before
+
+
+def test_fallback_output_is_failed_not_cached():
+    threads = []
+
+    def build_context():
+        threads.append(threading.current_thread().name)
+        return {}
+
+    spec = SpeculativeNarrator(
+        generate=lambda **kw: NarratorService()._fallback_response(),
+        top_k=1,
+        is_failure=is_fallback_response,
+    )
+    spec.speculate("pt_1", VIEW, "7:0", build_context=build_context)
+    spec._executor.shutdown(wait=True)
+
+    assert threads and threads[0].startswith("speculative-narrator")
+    assert spec.lookup("pt_1", "m_fire", "blade", "7:0") is None
+    assert (spec.stats.generated, spec.stats.failed) == (0, 1)
+
+
+def test_speculative_dir_is_never_the_live_narrator_dir(tmp_path):
+    live = tmp_path / "agents" / "narrator"
+    live.mkdir(parents=True)
+    (live / "CLAUDE.md").write_text("narrate")
+    orch = Orchestrator.__new__(Orchestrator)
+    orch.playthrough_dir = tmp_path / "playthroughs" / "pt_1"
+    orch.narrator = NarratorService(working_dir=str(live))
+
+    spec_dir = orch._speculative_dir(None)
+
+    assert spec_dir == str(orch.playthrough_dir / "speculative_narrator")
+    assert (orch.playthrough_dir / "speculative_narrator" / "CLAUDE.md").read_text() == "narrate"
+    with pytest.raises(ValueError):
+        orch._speculative_dir(str(live))
+
+
+def test_hit_skips_scene_context_and_is_replayed_to_live_session(tmp_path):
+    served = {"scene": {"id": "scene_blade"}, "time_elapsed": "1 minute"}
+
+    class Speculator:
+        def lookup(self, playthrough_id, moment_id, click, version):
+            return served if click == "blade" else None
+
+    prompts = []
+    narrator = NarratorService(working_dir=str(tmp_path))
+    narrator._call_claude = lambda prompt: prompts.append(prompt) or {"scene": {"id": "scene_live"}}
+
+    orch = Orchestrator.__new__(Orchestrator)
+    orch.playthrough_id = "pt_1"
+    orch.playthrough_dir = tmp_path / "pt_1"
+    orch.speculator = Speculator()
+    orch.narrator = narrator
+    orch._get_world_tick = lambda: 7
+    built = []
+    orch._build_scene_context = lambda player_id, location: built.append(location) or {}
+
+    assert orch.process_action("blade", player_location="place_camp", moment_id="m_fire") is served
+    assert built == [] and prompts == []
+
+    orch.process_action("north", player_location="place_camp", moment_id="m_fire")
+    assert built == ["place_camp"]
+    assert "ALREADY_SERVED" in prompts[0] and "scene_blade" in prompts[0]
+    assert narrator.served == []
@@ -0,0 +1,175 @@
+"""
+Tests for the per-tick adjacency snapshot.
+
+GraphTickV1_2 reads every link once per tick and answers its hot-link,
+emotion and shared-narrative helpers from CSR arrays, kept current by the
+tick's own energy writes.
+
+DOCS: docs/physics/tick-runner/PATTERNS_Tick_Runner.md
+"""
+
+import pytest
+
+from engine.physics.tick_adjacency import LINKS_QUERY, AdjacencySnapshot
+from engine.physics.tick_v1_2 import GraphTickV1_2, emotion_proximity, get_weighted_average_emotions
+
+NODES = {
+    "char_a": ("Actor", 2.0, 1.0, None),
+    "char_b": ("Actor", 1.0, 4.0, None),
+    "m1": ("Moment", 0.5, 1.0, None),
+    "m2": ("Moment", 0.0, 1.0, None),
+    "narr_oath": ("Narrative", 0.8, 1.0, [["duty", 0.9]]),
+    "narr_debt": ("Narrative", 0.1, 1.0, None),
+    "place_camp": ("Space", None, 2.0, None),
+}
+
+
+def _link(link_type, source, target, energy=None, weight=None, emotions=None):
+    s_label, s_energy, s_weight, s_emotions = NODES[source]
+    t_label, t_energy, t_weight, t_emotions = NODES[target]
+    return {
+        "type": link_type,
+        "source": source, "source_label": s_label, "source_energy": s_energy,
+        "source_weight": s_weight, "source_emotions": s_emotions,
+        "target": target, "target_label": t_label, "target_energy": t_energy,
+        "target_weight": t_weight, "target_emotions": t_emotions,
+        "energy": energy, "weight": weight, "conductivity": None,
+        "strength": 0.1, "emotions": emotions,
+    }
+
+
+LINKS = [
+    _link("EXPRESSES", "char_a", "m1", energy=0.1, weight=1.0),
+    _link("SAID", "char_b", "m1", energy=0.5, weight=1.0, emotions=[["fear", 0.4]]),
+    _link("BELIEVES", "char_b", "m1", energy=9.0),  # not a draw link
+    _link("AT", "m1", "place_camp", energy=0.2, weight=2.0),
+    _link("ABOUT", "m1", "narr_oath", energy=0.3, weight=0.5, emotions=[["duty", 1.0]]),
+    _link("ABOUT", "m1", "narr_debt"),
+    _link("ABOUT", "m2", "narr_oath"),
+    _link("BELIEVES", "char_a", "narr_oath", energy=0.4),
+    _link("BELIEVES", "char_b", "narr_oath", energy=0.4, weight=2.0),
+]
+
+
+def test_helpers_read_from_csr_arrays():
+    snapshot = AdjacencySnapshot(LINKS)
+
+    to_m1 = snapshot.hot_links_to_moment("m1", 20)
+    assert [l["actor_id"] for l in to_m1] == ["char_b", "char_a"]
+    assert to_m1[0]["actor_weight"] == 4.0 and to_m1[0]["conductivity"] is None
+    assert snapshot.hot_links_to_moment("m1", 1)[0]["link_energy"] == 0.5
+
+    from_m1 = snapshot.hot_links_from_moment("m1", 20)
+    assert [(l["target_id"], l["target_type"]) for l in from_m1] == [
+        ("place_camp", "Space"), ("narr_oath", "Narrative"), ("narr_debt", "Narrative"),
+    ]
+    assert from_m1[0]["target_energy"] is None
+
+    assert [l["actor_id"] for l in snapshot.hot_links_to_actors("narr_oath", 20)] == ["char_b", "char_a"]
+    assert snapshot.narrative_emotions("narr_oath") == [["duty", 0.9]]
+    assert snapshot.shared_narratives("m1", "m2") == ["narr_oath"]
+    assert [l["weight"] for l in snapshot.moment_out_links("m1")] == [2.0, 0.5, None]
+
+    # Wrong label or unknown node: what the query would return
+    assert snapshot.hot_links_to_moment("char_a", 20) == []
+    assert snapshot.narrative_emotions("ghost") == []
+
+    snapshot.set_energy("char_b", 3.5)
+    assert snapshot.hot_links_to_moment("m1", 1)[0]["actor_energy"] == 3.5
+    snapshot.add_link("RELATES", "char_a", "char_b", "Actor", energy=0.0, weight=0.2)
+    assert snapshot.ids[snapshot.out_links[snapshot.out_ptr[0]]] == "char_a"
+    assert snapshot.link_types[-1] == "RELATES"
+
+
+class FakeRead:
+    def __init__(self):
+        self.queries = []
+
+    def query(self, cypher, params=None):
+        self.queries.append(cypher)
+        if cypher == LINKS_QUERY:
+            return LINKS
+        if "MATCH (m:Moment)" in cypher and "'active'" in cypher:
+            return [{"id": "m1", "energy": 0.5, "weight": 1.0}, {"id": "m2", "energy": 0.0, "weight": 1.0}]
+        if "MATCH (m:Moment {id: 'm1'})" in cypher and "duration" in cypher:
+            return [{"energy": 0.5, "duration": 1.0, "weight": 1.0}]
+        if "MATCH (n:Narrative)" in cypher:
+            return [{"id": "narr_oath", "energy": 0.8}]
+        return []
+
+
+class FakeWrite:
+    def __init__(self):
+        self.queries = []
+
+    def _query(self, cypher, params=None):
+        self.queries.append(cypher)
+        return []
+
+
+def test_tick_reads_adjacency_once():
+    read, write = FakeRead(), FakeWrite()
+    tick = GraphTickV1_2(graph_queries=read, graph_ops=write)
+    drawn = []
+    original = tick._energy_flows_through
+
+    def spy(link, amount, emotions, origin_id, origin_energy, target_id, target_energy):
+        if "actor_id" in link and target_id == "m1":
+            drawn.append((link["actor_id"], link["actor_energy"]))
+        original(link, amount, emotions, origin_id, origin_energy, target_id, target_energy)
+
+    tick._energy_flows_through = spy
+    tick.run(current_tick=1)
+
+    assert read.queries.count(LINKS_QUERY) == 1
+    per_node = [q for q in read.queries if "{id: 'm1'})-[r]->" in q or "BELIEVES]->(n:Narrative {id" in q]
+    assert per_node == []
+    # char_b's fear does not match m1's duty: only char_a draws
+    assert drawn == [("char_a", 2.0)]
+
+    # Outside run() the helpers query the graph again
+    assert tick._adjacency is None
+    tick._get_hot_links_to_moment("m1")
+    assert "(m:Moment {id: 'm1'})" in read.queries[-1]
+
+
+def test_energy_writes_update_the_snapshot():
+    tick = GraphTickV1_2(graph_queries=FakeRead(), graph_ops=FakeWrite())
+    tick._use_adjacency = True
+    before = tick._get_hot_links_to_actors("narr_oath")[0]["actor_energy"]
+    tick._write_energy("char_b", before, 7.0, "Actor")
+    assert tick._get_hot_links_to_actors("narr_oath")[0]["actor_energy"] == 7.0
+    assert tick._delta.node_energy["char_b"] == [1.0, 7.0]
+
+
+def test_emotion_factors_match_list_helpers():
+    # m2 lists emotions at intensity 0: present, so no 0.2 empty baseline
+    snapshot = AdjacencySnapshot(LINKS + [
+        _link("EXPRESSES", "char_a", "m2", energy=0.3, emotions=[["duty", 0.0]]),
+        _link("EXPRESSES", "char_b", "m2", energy=0.2, emotions=[["fear", 0.5]]),
+        _link("AT", "m2", "place_camp", weight=2.0, emotions=[["fear", 0.0]]),
+    ])
+    tick = GraphTickV1_2(graph_queries=FakeRead(), graph_ops=FakeWrite())
+    tick._adjacency = snapshot
+
+    def listed(links, emotions):
+        return [emotion_proximity(l["emotions"] or [], emotions) for l in links]
+
+    moment_lists = []
+    for moment_id in ("m1", "m2"):
+        emotions = get_weighted_average_emotions(snapshot.moment_out_links(moment_id))
+        moment_lists.append(emotions)
+        vector = tick._flow_emotions(moment_id, "Moment")
+        for links in (snapshot.hot_links_to_moment(moment_id, 20), snapshot.hot_links_from_moment(moment_id, 20)):
+            assert tick._emotion_factors(links, vector) == pytest.approx(listed(links, emotions))
+
+    to_m2 = snapshot.hot_links_to_moment("m2", 20)
+    # duty 0 vs fear 0: empty union, baseline; fear 0.5 vs fear 0: no overlap
+    assert tick._emotion_factors(to_m2, tick._flow_emotions("m2", "Moment")) == [0.2, 0.0]
+
+    links = snapshot.hot_links_to_actors("narr_oath", 20)
+    vector = tick._flow_emotions("narr_oath", "Narrative")
+    assert tick._emotion_factors(links, vector) == pytest.approx(listed(links, [["duty", 0.9]]))
+
+    pairwise = tick._pairwise_emotion_proximity(["m1", "m2"])
+    assert pairwise[0][1] == pytest.approx(emotion_proximity(*moment_lists))
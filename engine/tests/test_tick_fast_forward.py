@@ -0,0 +1,324 @@
+"""
+Tests for the v1.2 multi-tick fast-forward engine.
+
+No database: the fake read/write record queries so we can check that
+fast-forward loads once and writes back once. MemoryGraph answers the
+Cypher GraphTickV1_2 issues from dicts, so fast-forward can be checked
+against the per-query engine it mirrors.
+
+DOCS: docs/physics/tick-runner/PATTERNS_Tick_Runner.md
+"""
+
+import json
+import random
+import re
+
+import pytest
+
+from engine.physics.graph.graph_query_utils import dijkstra_with_resistance
+from engine.physics.tick_adjacency import LINKS_QUERY
+from engine.physics.tick_fast_forward import (
+    FastForwardTick,
+    _resistance_edge,
+    stop_on_completion,
+    stop_on_terminal,
+)
+from engine.physics.tick_sparse import SparseFastForwardTick, conflict_free_batches
+from engine.physics.tick_v1_2 import COLD_THRESHOLD, GraphTickV1_2
+
+
+class FakeRead:
+    def __init__(self, nodes, links):
+        self.nodes = nodes
+        self.links = links
+        self.calls = 0
+
+    def query(self, cypher, params=None):
+        self.calls += 1
+        return self.links if "[r]" in cypher else self.nodes
+
+
+class FakeWrite:
+    def __init__(self):
+        self.queries = []
+
+    def _query(self, cypher, params=None):
+        self.queries.append((cypher, params))
+        return []
+
+
+def _graph(moment_energy=0.79):
+    nodes = [
+        {"id": "player", "label": "Actor", "energy": 0.0, "weight": 1.0},
+        {"id": "aldric", "label": "Actor", "energy": 0.0, "weight": 1.0},
+        {"id": "camp", "label": "Space", "energy": 0.0, "weight": 1.0},
+        {"id": "road", "label": "Space", "energy": 0.0, "weight": 1.0},
+        {"id": "m1", "label": "Moment", "energy": moment_energy, "weight": 1.0,
+         "status": "active", "duration": 1.0},
+    ]
+    links = [
+        {"type": "CAN_SPEAK", "source": "player", "target": "m1", "energy": 0.0, "weight": 1.0},
+        {"type": "SAID", "source": "aldric", "target": "m1", "energy": 0.0, "weight": 1.0},
+        {"type": "AT", "source": "m1", "target": "camp", "weight": 1.0},
+    ]
+    return nodes, links
+
+
+def _engine(nodes, links):
+    read, write = FakeRead(nodes, links), FakeWrite()
+    return FastForwardTick(graph_queries=read, graph_ops=write), read, write
+
+
+def test_fast_forward_stops_on_completion_and_writes_back_once():
+    engine, read, write = _engine(*_graph())
+
+    result = engine.run(max_ticks=100, stop_when=stop_on_completion(), player_id="player")
+
+    assert result.ticks_run == 1
+    assert result.stopped_reason == "stop_condition"
+    assert [c["moment_id"] for c in result.triggered] == ["m1"]
+    assert read.calls == 2
+    # energies, moment status, crystallized RELATES link
+    assert len(write.queries) == 3
+    assert result.queries_issued == 5
+    assert result.links_created == 1
+    status_rows = write.queries[1][1]["rows"]
+    assert status_rows == [{"id": "m1", "status": "completed", "tick_resolved": 0}]
+
+
+def test_fast_forward_location_filter_ignores_other_places():
+    engine, _, _ = _engine(*_graph())
+
+    result = engine.run(max_ticks=3, stop_when=stop_on_completion("road"), player_id="player")
+
+    assert result.triggered == []
+    assert result.ticks_run == 3
+    assert len(result.tick_results) == 3
+    assert result.tick_results[0].moments_completed == 1
+
+
+def test_fast_forward_rejection_returns_energy_to_player():
+    nodes, links = _graph()
+    nodes.append({"id": "m2", "label": "Moment", "energy": 1.0, "weight": 1.0, "status": "rejected"})
+    engine, _, _ = _engine(nodes, links)
+
+    result = engine.run(max_ticks=1, stop_when=stop_on_terminal(), player_id="player")
+
+    rejection = [t for t in result.triggered if t["moment_id"] == "m2"][0]
+    assert rejection["energy_returned"] == 0.8
+    assert engine.graph.nodes["m2"].energy == 0
+
+
+def _random_graph(seed=7, actors=6, moments=10, narratives=3):
+    rng = random.Random(seed)
+    emotions = ["fear", "anger", "hope", "grief"]
+
+    def emo():
+        return [[e, round(rng.random(), 2)] for e in rng.sample(emotions, rng.randint(0, 2))]
+
+    nodes = [{"id": "player", "label": "Actor", "energy": 1.0, "weight": 1.0}]
+    nodes += [{"id": f"a{i}", "label": "Actor", "energy": rng.random(), "weight": rng.uniform(0.5, 2)}
+              for i in range(actors)]
+    nodes += [{"id": f"n{i}", "label": "Narrative", "energy": rng.random(), "weight": 1.0, "emotions": emo()}
+              for i in range(narratives)]
+    nodes += [{"id": f"m{i}", "label": "Moment", "energy": rng.uniform(0, 0.5), "weight": rng.uniform(0.5, 1),
+               "status": rng.choice(["possible", "active"]), "duration": rng.choice([1.0, 3.0])}
+              for i in range(moments)]
+
+    actor_ids = ["player"] + [f"a{i}" for i in range(actors)]
+    links = []
+    for i in range(moments):
+        for a in rng.sample(actor_ids, 3):
+            links.append({"type": rng.choice(["CAN_SPEAK", "SAID", "EXPRESSES"]), "source": a,
+                          "target": f"m{i}", "energy": rng.random(), "weight": rng.uniform(0.2, 1.5),
+                          "conductivity": rng.random(), "emotions": emo()})
+        for n in rng.sample(range(narratives), 2):
+            links.append({"type": "ABOUT", "source": f"m{i}", "target": f"n{n}", "energy": rng.random(),
+                          "weight": rng.uniform(0.2, 1.5), "emotions": emo()})
+        links.append({"type": "THEN", "source": f"m{i}", "target": f"m{(i + 1) % moments}", "weight": 1.0})
+    for a in actor_ids:
+        for n in rng.sample(range(narratives), 2):
+            links.append({"type": "BELIEVES", "source": a, "target": f"n{n}", "energy": rng.random(),
+                          "weight": 1.0, "conductivity": rng.random(), "emotions": emo()})
+    return nodes, links
+
+
+@pytest.mark.parametrize("size,ticks", [
+    ({}, 5),
+    # A mid-size world: about 3000 links, a third of the moments active
+    ({"actors": 60, "moments": 600, "narratives": 40}, 10),
+])
+def test_sparse_phases_match_scalar_fast_forward(size, ticks):
+    nodes, links = _random_graph(**size)
+    # Emotions listed at intensity 0 are present: no 0.2 empty baseline
+    for link in links[::5]:
+        link["emotions"] = [[name, 0.0] for name, _ in link.get("emotions") or [["fear", 0.0]]]
+    scalar = FastForwardTick(graph_queries=FakeRead(nodes, links), graph_ops=FakeWrite())
+    sparse = SparseFastForwardTick(graph_queries=FakeRead(nodes, links), graph_ops=FakeWrite())
+
+    a = scalar.run(max_ticks=ticks, player_id="player", idle_ticks_before_exit=99)
+    b = sparse.run(max_ticks=ticks, player_id="player", idle_ticks_before_exit=99)
+
+    assert a.ticks_run == b.ticks_run == ticks
+    for ra, rb in zip(a.tick_results, b.tick_results):
+        assert rb.energy_drawn == pytest.approx(ra.energy_drawn)
+        assert rb.energy_flowed == pytest.approx(ra.energy_flowed)
+        assert rb.energy_interacted == pytest.approx(ra.energy_interacted)
+        assert rb.energy_backflowed == pytest.approx(ra.energy_backflowed)
+        assert rb.moments_completed == ra.moments_completed
+    for node_id, node in scalar.graph.nodes.items():
+        assert sparse.graph.nodes[node_id].energy == pytest.approx(node.energy)
+    assert sparse.batches_run > 0
+
+
+def test_proximity_search_is_kept_current_with_crystallized_links():
+    nodes, links = _random_graph(5)
+    ff = FastForwardTick(graph_queries=FakeRead(nodes, links), graph_ops=FakeWrite())
+    ff.run(max_ticks=1, player_id="player", idle_ticks_before_exit=99)
+    adjacency = ff._resistance_graph
+    actors = [n.id for n in ff.graph.nodes.values() if n.label == "Actor" and n.id != "player"]
+
+    def searched(actor_id):
+        path = dijkstra_with_resistance([_resistance_edge(l) for l in ff.graph.links], "player", actor_id, 5)
+        return 1.0 / (1.0 + (path["total_resistance"] if path else 100.0))
+
+    assert [ff._proximity("player", a) for a in actors] == pytest.approx([searched(a) for a in actors])
+    assert ff._crystallize_actor_links("m0") > 0
+    assert [ff._proximity("player", a) for a in actors] == pytest.approx([searched(a) for a in actors])
+    assert ff._resistance_graph is adjacency
+
+
+def test_conflict_free_batches_preserve_order():
+    assert conflict_free_batches([{1}, {2}, {1, 3}, {4}, {3}]) == [[0, 1], [2, 3], [4]]
+
+
+class MemoryGraph:
+    """Answers each query GraphTickV1_2 issues from in-memory nodes and links."""
+
+    def __init__(self, nodes, links):
+        self.nodes = {n["id"]: dict(n) for n in nodes}
+        self.links = [dict(l) for l in links]
+
+    def _heat(self, link):
+        weight = link.get("weight")
+        return (link.get("energy") or 0.0) * (weight if weight is not None else 1.0)
+
+    def _by_label(self, label):
+        return [n for n in self.nodes.values() if n["label"] == label]
+
+    def query(self, cypher, params=None):
+        c = cypher
+        if c == LINKS_QUERY:
+            rows = []
+            for l in self.links:
+                a, b = self.nodes[l["source"]], self.nodes[l["target"]]
+                rows.append({
+                    "type": l["type"], "energy": l.get("energy"), "weight": l.get("weight"),
+                    "conductivity": l.get("conductivity"), "strength": l.get("strength"),
+                    "emotions": l.get("emotions"),
+                    **{f"{end}_{key}": node.get(key) for end, node in (("source", a), ("target", b))
+                       for key in ("energy", "weight", "emotions")},
+                    "source": a["id"], "source_label": a["label"],
+                    "target": b["id"], "target_label": b["label"],
+                })
+            return rows
+        if "shortestPath((start" in c:
+            # The full link set: a superset of the per-pair subgraph
+            return [{"node_a": l["source"], "node_b": l["target"],
+                     "conductivity": l.get("conductivity") if l.get("conductivity") is not None else 1.0,
+                     "weight": l.get("weight") if l.get("weight") is not None else 1.0,
+                     "emotions": l.get("emotions")} for l in self.links]
+        if "a.alive = true" in c:
+            actors = [a for a in self._by_label("Actor") if a.get("alive") in (True, None)]
+            actors.sort(key=lambda a: a["weight"] if a.get("weight") is not None else float("-inf"), reverse=True)
+            return [{"id": a["id"], "weight": a.get("weight"), "energy": a.get("energy")} for a in actors]
+        if "m.status = 'rejected'" in c:
+            return [{"id": m["id"], "energy": m["energy"]} for m in self._by_label("Moment")
+                    if m.get("status") == "rejected" and (m.get("energy") or 0) > 0]
+        status = re.search(r"WHERE m.status = '(\w+)'", c)
+        if status:
+            return [{"id": m["id"], "energy": m.get("energy"), "weight": m.get("weight"),
+                     "duration": m.get("duration")}
+                    for m in self._by_label("Moment") if m.get("status") == status.group(1)]
+        members = re.search(r"MATCH \(a:Actor\)-\[\]->\(m:Moment \{id: '([^']+)'\}\)", c)
+        if members:
+            ids = [l["source"] for l in self.links
+                   if l["target"] == members.group(1) and self.nodes[l["source"]]["label"] == "Actor"]
+            return [{"actor_id": a} for a in dict.fromkeys(ids)]
+        node = re.search(r"\((?:m:Moment|p:Actor) \{id: '([^']+)'\}\)\s*RETURN", c)
+        if node:
+            n = self.nodes.get(node.group(1))
+            return [{"energy": n.get("energy"), "status": n.get("status"), "duration": n.get("duration"),
+                     "weight": n.get("weight")}] if n else []
+        if "MATCH (n:Narrative)" in c:
+            narratives = [n for n in self._by_label("Narrative") if (n.get("energy") or 0) > 0.01]
+            narratives.sort(key=lambda n: n["energy"], reverse=True)
+            return [{"id": n["id"], "energy": n["energy"]} for n in narratives]
+        if "id(r) AS rid" in c:
+            hot = [l for l in self.links if l.get("energy") is not None and self._heat(l) > COLD_THRESHOLD]
+            hot.sort(key=self._heat, reverse=True)
+            return [{"node_a": l["source"], "node_b": l["target"], "energy": l["energy"],
+                     "strength": l.get("strength"), "weight": l.get("weight"), "emotions": l.get("emotions"),
+                     **{f"{end}_{key}": self.nodes[l[side]].get(key)
+                        for end, side in (("a", "source"), ("b", "target")) for key in ("energy", "weight")}}
+                    for l in hot]
+        if "sum(CASE" in c:
+            heats = [self._heat(l) for l in self.links if l.get("energy") is not None]
+            return [{"hot": sum(h > COLD_THRESHOLD for h in heats), "cold": sum(h <= COLD_THRESHOLD for h in heats)}]
+        relates = re.search(r"\{id: '([^']+)'\}\)-\[r:RELATES\]-\(b:Actor \{id: '([^']+)'\}", c)
+        if relates:
+            pair = set(relates.groups())
+            return [{"cnt": sum(1 for l in self.links
+                                if l["type"] == "RELATES" and {l["source"], l["target"]} == pair)}]
+        raise AssertionError(f"unexpected read: {c}")
+
+    def _query(self, cypher, params=None):
+        c = cypher
+        batch = re.search(r"SET n\.(\w+) = row\.value", c)
+        if batch:
+            for row in params["rows"]:
+                self.nodes[row["id"]][batch.group(1)] = row["value"]
+            return []
+        completed = re.search(r"\{id: '([^']+)'\}\)\s*SET m.status = 'completed',\s*m.tick_resolved = (\d+)", c)
+        if completed:
+            self.nodes[completed.group(1)].update(status="completed", tick_resolved=int(completed.group(2)))
+            return []
+        created = re.search(
+            r"\(a:Actor \{id: '([^']+)'\}\), \(b:Actor \{id: '([^']+)'\}\).*emotions: (.*),\s*created_from",
+            c, re.S,
+        )
+        if created:
+            a, b, emotions = created.groups()
+            self.links.append({"type": "RELATES", "source": a, "target": b, "conductivity": 0.2,
+                               "weight": 0.2, "energy": 0.0, "strength": 0.1, "emotions": json.loads(emotions)})
+            return []
+        raise AssertionError(f"unexpected write: {c}")
+
+
+def _completing_graph():
+    nodes, links = _graph()
+    nodes.append({"id": "m2", "label": "Moment", "energy": 1.0, "weight": 1.0, "status": "rejected"})
+    return nodes, links
+
+
+@pytest.mark.parametrize("build", [lambda: _random_graph(7), lambda: _random_graph(11), _completing_graph])
+def test_fast_forward_matches_graph_tick(build):
+    nodes, links = build()
+    graph = MemoryGraph(nodes, links)
+    tick = GraphTickV1_2(graph_queries=graph, graph_ops=graph, write_mode="phase")
+    ff = FastForwardTick(graph_queries=FakeRead(nodes, links), graph_ops=FakeWrite())
+
+    expected = [tick.run(current_tick=i, player_id="player") for i in range(4)]
+    result = ff.run(max_ticks=4, player_id="player", idle_ticks_before_exit=99)
+
+    assert result.ticks_run == 4
+    for ra, rb in zip(expected, result.tick_results):
+        for field in ("energy_generated", "energy_drawn", "energy_flowed", "energy_interacted",
+                      "energy_backflowed", "energy_cooled"):
+            assert getattr(rb, field) == pytest.approx(getattr(ra, field)), field
+        assert (rb.moments_completed, rb.links_crystallized, rb.hot_links, rb.cold_links) == (
+            ra.moments_completed, ra.links_crystallized, ra.hot_links, ra.cold_links)
+    for node_id, node in ff.graph.nodes.items():
+        assert node.energy == pytest.approx(graph.nodes[node_id].get("energy")), node_id
+        assert node.status == graph.nodes[node_id].get("status"), node_id
+    assert len(graph.links) == len(links) + len(ff.graph.created_links)
@@ -0,0 +1,134 @@
+"""
+Tests for the tick write-back buffer.
+
+Node energy writes keep only the last value per (node, property) and are
+flushed as UNWIND batches at phase end; write_through and verify modes
+exist for debugging.
+
+DOCS: docs/physics/tick-runner/PATTERNS_Tick_Runner.md
+"""
+
+import pytest
+
+from engine.physics.tick_v1_2 import GraphTickV1_2
+from engine.physics.tick_write_buffer import EnergyWriteBuffer
+
+
+class FakeWrite:
+    def __init__(self):
+        self.queries = []
+
+    def _query(self, cypher, params=None):
+        self.queries.append((cypher, params))
+        return []
+
+
+class FakeRead:
+    def __init__(self, stored=None):
+        self.stored = stored or {}
+
+    def query(self, cypher, params=None):
+        return [{"id": i, "value": self.stored.get(i)} for i in (params or {}).get("ids", [])]
+
+
+def test_last_value_wins_and_flushes_per_label():
+    write = FakeWrite()
+    buffer = EnergyWriteBuffer(write, mode="phase")
+    for value in (1.0, 2.0, 3.0):
+        buffer.set("char_a", value, "Actor")
+    buffer.set("m1", 0.5, "Moment")
+    buffer.set("m1", 0.7)  # unlabeled match of the same node
+    buffer.set("m1", 4, "Moment", prop="tick_resolved")
+
+    assert write.queries == []
+    assert buffer.get("char_a") == 3.0 and buffer.get("ghost", 9.0) == 9.0
+
+    assert buffer.flush() == 3
+    batches = {(c.split("MATCH ")[1].split(" ")[0], c.split("SET ")[1].split(" ")[0]): p["rows"]
+               for c, p in write.queries}
+    assert batches == {
+        ("(n:Actor", "n.energy"): [{"id": "char_a", "value": 3.0}],
+        ("(n:Moment", "n.energy"): [{"id": "m1", "value": 0.7}],
+        ("(n:Moment", "n.tick_resolved"): [{"id": "m1", "value": 4}],
+    }
+    assert buffer.flush() == 0 and buffer.get("char_a") is None
+
+    report = buffer.report()
+    assert (report["updates"], report["distinct"], report["rows_written"]) == (6, 3, 3)
+    assert report["amplification_before"] == 2.0 and report["amplification_after"] == 1.0
+
+
+def test_write_through_and_verify_modes():
+    write = FakeWrite()
+    through = EnergyWriteBuffer(write, mode="write_through")
+    through.set("char_a", 1.0, "Actor")
+    through.set("char_a", 2.0, "Actor")
+    assert [p for _, p in write.queries] == [{"id": "char_a", "value": 1.0}, {"id": "char_a", "value": 2.0}]
+    assert through.dirty == 0 and through.report()["amplification_after"] == 2.0
+
+    verify = EnergyWriteBuffer(FakeWrite(), FakeRead({"char_a": 2.0, "char_b": 0.0}), mode="verify")
+    verify.set("char_a", 2.0, "Actor")
+    verify.set("char_b", 1.0, "Actor")
+    verify.flush()
+    assert verify.report()["mismatches"] == 1
+
+    with pytest.raises(ValueError):
+        EnergyWriteBuffer(FakeWrite(), mode="eventually")
+
+
+class TickGraph(FakeWrite):
+    """Two actors feed one active moment; the player gets two rejections back."""
+
+    def __init__(self):
+        super().__init__()
+        self.player_energy = 1.0
+
+    def _query(self, cypher, params=None):
+        super()._query(cypher, params)
+        for row in (params or {}).get("rows", [params or {}]):
+            if row.get("id") == "player" and "n.energy" in cypher:
+                self.player_energy = row["value"]
+        return []
+
+    def query(self, cypher, params=None):
+        if "MATCH (a:Actor)" in cypher and "ORDER BY a.weight" in cypher:
+            return [{"id": "player", "weight": 1.0, "energy": self.player_energy}]
+        if "MATCH (m:Moment)" in cypher and "'active'" in cypher:
+            return [{"id": "m1", "energy": 0.5, "weight": 1.0}]
+        if "MATCH (a)-[r]->(b)" in cypher and "source_label" in cypher:
+            return [
+                {"type": "EXPRESSES", "source": actor, "source_label": "Actor", "source_energy": 1.0,
+                 "target": "m1", "target_label": "Moment", "target_energy": 0.5, "energy": 0.1}
+                for actor in ("char_a", "char_b")
+            ]
+        if "m.status = 'rejected'" in cypher:
+            return [{"id": "m7", "energy": 1.0}, {"id": "m8", "energy": 1.0}]
+        if "MATCH (p:Actor" in cypher:
+            return [{"energy": self.player_energy}]
+        return []
+
+
+@pytest.mark.parametrize("mode", ["phase", "write_through"])
+def test_tick_buffers_node_writes(mode):
+    graph = TickGraph()
+    tick = GraphTickV1_2(graph_queries=graph, graph_ops=graph, write_mode=mode)
+
+    result = tick.run(current_tick=3)
+
+    report = result.write_back
+    assert report["mode"] == mode
+    # m1 drawn from twice, player returned energy twice
+    assert report["updates"] > report["distinct"]
+    assert result.delta.node_energy["player"] == [1.0, pytest.approx(3.1)]
+    player_rows = [
+        row for c, p in graph.queries if "n:Actor" in c
+        for row in (p["rows"] if "rows" in p else [p]) if row["id"] == "player"
+    ]
+    if mode == "phase":
+        assert report["rows_written"] < report["updates"]
+        assert all(c.lstrip().startswith("UNWIND $rows") for c, _ in graph.queries if "SET n." in c)
+        # one write per phase that touched the player: generate, rejection
+        assert [row["value"] for row in player_rows] == pytest.approx([1.5, 3.1])
+    else:
+        assert report["rows_written"] == report["updates"]
+        assert [row["value"] for row in player_rows] == pytest.approx([1.5, 2.3, 3.1])
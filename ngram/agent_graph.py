@@ -160,13 +160,16 @@ class AgentGraph:
         graph_name: str = "ngram",
         host: str = "localhost",
         port: int = 6379,
+        graph_ops=None,
+        graph_queries=None,
     ):
         self.graph_name = graph_name
         self.host = host
         self.port = port
-        self._graph_ops = None
-        self._graph_queries = None
-        self._connected = False
+        # Callers that already hold GraphOps/GraphQueries share them (and their connection)
+        self._graph_ops = graph_ops
+        self._graph_queries = graph_queries
+        self._connected = graph_ops is not None and graph_queries is not None
 
     def _connect(self) -> bool:
         """Lazy connect to graph database."""
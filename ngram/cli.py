@@ -26,35 +26,133 @@ TEMPLATES LOCATION:
 """
 
 import argparse
+import importlib
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-# Import from submodules
+# agent_cli is stdlib-only; its constants are needed to build the parser
 from .agent_cli import AGENT_CHOICES, DEFAULT_AGENT
-from .init_cmd import init_protocol
-from .validate import validate_protocol
-from .prompt import print_bootstrap_prompt
-from .context import print_module_context
-from .doctor import doctor_command
-from .doctor_files import add_doctor_ignore, load_doctor_ignore
-from .project_map import print_project_map
-from .sync import sync_command
-from .solve_escalations import solve_special_markers_command
-from .work import work_command
-from .work import work_command
-from .refactor import refactor_command
-from .status_cmd import status_command
-from .repo_overview import generate_and_save as generate_overview
-from .docs_fix import docs_fix_command
-from .symbol_extractor import extract_symbols_command
-from .protocol_runner import run_protocol_command, ProtocolResult
-from .graph_query import query_command as graph_query_command
-from .protocol_validator import validate_cluster_command
-from .cluster_metrics import ClusterMetrics, ClusterValidator
-
-
-from .agent_cli import build_agent_command
+
+
+# Subcommand entry points, imported only when a subcommand is dispatched.
+# Importing them eagerly pulled in rich, yaml, numpy and google-genai for
+# every invocation, including `ngram --help` and hook-invoked commands.
+# tests/ngram/test_cli_import_time.py keeps the cold start under budget.
+_LAZY_COMMANDS = {
+    "init_protocol": (".init_cmd", "init_protocol"),
+    "validate_protocol": (".validate", "validate_protocol"),
+    "print_bootstrap_prompt": (".prompt", "print_bootstrap_prompt"),
+    "print_module_context": (".context", "print_module_context"),
+    "doctor_command": (".doctor", "doctor_command"),
+    "add_doctor_ignore": (".doctor_files", "add_doctor_ignore"),
+    "load_doctor_ignore": (".doctor_files", "load_doctor_ignore"),
+    "print_project_map": (".project_map", "print_project_map"),
+    "sync_command": (".sync", "sync_command"),
+    "solve_special_markers_command": (".solve_escalations", "solve_special_markers_command"),
+    "work_command": (".work", "work_command"),
+    "refactor_command": (".refactor", "refactor_command"),
+    "status_command": (".status_cmd", "status_command"),
+    "generate_overview": (".repo_overview", "generate_and_save"),
+    "docs_fix_command": (".docs_fix", "docs_fix_command"),
+    "extract_symbols_command": (".symbol_extractor", "extract_symbols_command"),
+    "run_protocol_command": (".protocol_runner", "run_protocol_command"),
+    "graph_query_command": (".graph_query", "query_command"),
+    "validate_cluster_command": (".protocol_validator", "validate_cluster_command"),
+    "build_agent_command": (".agent_cli", "build_agent_command"),
+}
+
+# Non-command names this module used to re-export
+_LAZY_EXPORTS = {
+    "ProtocolResult": (".protocol_runner", "ProtocolResult"),
+    "ClusterMetrics": (".cluster_metrics", "ClusterMetrics"),
+    "ClusterValidator": (".cluster_metrics", "ClusterValidator"),
+}
+
+# Subcommand -> entry point it dispatches to (used by import_budget.py)
+_SUBCOMMAND_ENTRY = {
+    "init": "init_protocol",
+    "validate": "validate_protocol",
+    "prompt": "print_bootstrap_prompt",
+    "context": "print_module_context",
+    "doctor": "doctor_command",
+    "solve-markers": "solve_special_markers_command",
+    "map": "print_project_map",
+    "overview": "generate_overview",
+    "sync": "sync_command",
+    "status": "status_command",
+    "work": "work_command",
+    "refactor": "refactor_command",
+    "ignore": "load_doctor_ignore",
+    "docs-fix": "docs_fix_command",
+    "symbols": "extract_symbols_command",
+    "protocol": "run_protocol_command",
+    "query": "graph_query_command",
+}
+
+
+def _resolve(name: str) -> Any:
+    module_name, attr = {**_LAZY_COMMANDS, **_LAZY_EXPORTS}[name]
+    return getattr(importlib.import_module(module_name, __package__), attr)
+
+
+class _LazyCommand:
+    """Stand-in for a subcommand function; imports its module on first call."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._target = None
+
+    def __call__(self, *args, **kwargs):
+        if self._target is None:
+            self._target = _resolve(self.name)
+        return self._target(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        module_name, attr = _LAZY_COMMANDS[self.name]
+        return f"<lazy ngram{module_name}.{attr}>"
+
+
+init_protocol = _LazyCommand("init_protocol")
+validate_protocol = _LazyCommand("validate_protocol")
+print_bootstrap_prompt = _LazyCommand("print_bootstrap_prompt")
+print_module_context = _LazyCommand("print_module_context")
+doctor_command = _LazyCommand("doctor_command")
+add_doctor_ignore = _LazyCommand("add_doctor_ignore")
+load_doctor_ignore = _LazyCommand("load_doctor_ignore")
+print_project_map = _LazyCommand("print_project_map")
+sync_command = _LazyCommand("sync_command")
+solve_special_markers_command = _LazyCommand("solve_special_markers_command")
+work_command = _LazyCommand("work_command")
+refactor_command = _LazyCommand("refactor_command")
+status_command = _LazyCommand("status_command")
+generate_overview = _LazyCommand("generate_overview")
+docs_fix_command = _LazyCommand("docs_fix_command")
+extract_symbols_command = _LazyCommand("extract_symbols_command")
+run_protocol_command = _LazyCommand("run_protocol_command")
+graph_query_command = _LazyCommand("graph_query_command")
+validate_cluster_command = _LazyCommand("validate_cluster_command")
+build_agent_command = _LazyCommand("build_agent_command")
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: `from ngram.cli import ClusterMetrics` still works
+    if name in _LAZY_EXPORTS:
+        return _resolve(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _context_depth(value: str) -> Optional[int]:
+    """`--depth` for context: a non-negative int, or `all` for no limit."""
+    if value == "all":
+        return None
+    try:
+        depth = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number or 'all', got {value!r}")
+    if depth < 0:
+        raise argparse.ArgumentTypeError("depth must be >= 0")
+    return depth
 
 
 def _add_module_translation_args(parser):
@@ -86,6 +184,14 @@ def _add_refactor_conflict_args(parser):
     )
 
 
+def _add_refactor_dry_run_arg(parser):
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show moves and reference rewrites without changing files",
+    )
+
+
 def _validate_refactor_conflicts(args):
     if args.skip_existing and args.overwrite:
         raise ValueError("--skip-existing and --overwrite cannot be used together")
@@ -188,6 +294,12 @@ def main():
         default=Path.cwd(),
         help="Project directory (default: current directory)"
     )
+    context_parser.add_argument(
+        "--depth",
+        type=_context_depth,
+        default=2,
+        help="Import levels to follow for the dependency map, or 'all' (default: 2)"
+    )
 
     # doctor command
     doctor_parser = subparsers.add_parser(
@@ -351,68 +463,13 @@ def main():
         action="store_true",
         help="Show detailed information including doc chain files"
     )
-
-    # work command
-    work_parser = subparsers.add_parser(
-        "work",
-        help="Automatically fix project health issues using work agents"
-    )
-    work_parser.add_argument(
-        "--dir", "-d",
-        type=Path,
-        default=Path.cwd(),
-        help="Project directory (default: current directory)"
-    )
-    work_parser.add_argument(
-        "--max", "-m",
-        type=int,
-        default=None,
-        help="Maximum issues to fix (default: all)"
-    )
-    work_parser.add_argument(
-        "--type", "-t",
-        action="append",
-        dest="types",
-        choices=[
-            "MONOLITH", "UNDOCUMENTED", "STALE_SYNC", "PLACEHOLDER",
-            "INCOMPLETE_CHAIN", "NO_DOCS_REF", "BROKEN_IMPL_LINK",
-            "STUB_IMPL", "INCOMPLETE_IMPL", "UNDOC_IMPL", "LARGE_DOC_MODULE",
-            "YAML_DRIFT"
-        ],
-        help="Only fix specific issue types (can be repeated)"
-    )
-    work_parser.add_argument(
-        "--depth",
-        choices=["links", "docs", "full"],
-        default="docs",
-        help="Work depth: links (refs only), docs (+ content), full (+ code changes). Default: docs"
-    )
-    work_parser.add_argument(
-        "--dry-run",
+    status_parser.add_argument(
+        "--refresh",
         action="store_true",
-        help="Show what would be done without spawning agents"
-    )
-    work_parser.add_argument(
-        "--parallel", "-p",
-        type=int,
-        default=5,
-        help="Number of parallel agents (default: 5, or 6 if model is 'all')",
-    )
-    work_parser.add_argument(
-        "--model",
-        choices=AGENT_CHOICES,
-        dest="work_model",
-        default=None,
-        help="Agent model for work runs (overrides global --model, default: all)",
-    )
-    work_parser.add_argument(
-        "--agents",
-        choices=AGENT_CHOICES,
-        dest="work_model",
-        help=argparse.SUPPRESS,
+        help="Re-run doctor instead of reusing its last saved result"
     )
 
-    # work command (replaces work with simpler interface)
+    # work command
     work_parser = subparsers.add_parser(
         "work",
         help="Run AI-assisted work on a path (auto-runs doctor first)"
@@ -494,6 +551,7 @@ def main():
     rename_parser.add_argument("new", type=str, help="New target path (relative to project root)")
     _add_module_translation_args(rename_parser)
     _add_refactor_conflict_args(rename_parser)
+    _add_refactor_dry_run_arg(rename_parser)
     rename_parser.set_defaults(overwrite=True)
     rename_parser.set_defaults(action="rename")
 
@@ -505,6 +563,7 @@ def main():
     move_parser.add_argument("new", type=str, help="Destination path (relative to project root)")
     _add_module_translation_args(move_parser)
     _add_refactor_conflict_args(move_parser)
+    _add_refactor_dry_run_arg(move_parser)
     move_parser.set_defaults(overwrite=True)
     move_parser.set_defaults(action="move")
 
@@ -521,6 +580,7 @@ def main():
     )
     _add_module_translation_args(promote_parser)
     _add_refactor_conflict_args(promote_parser)
+    _add_refactor_dry_run_arg(promote_parser)
     promote_parser.set_defaults(overwrite=True)
     promote_parser.set_defaults(action="promote")
 
@@ -537,6 +597,7 @@ def main():
     )
     _add_module_translation_args(demote_parser)
     _add_refactor_conflict_args(demote_parser)
+    _add_refactor_dry_run_arg(demote_parser)
     demote_parser.set_defaults(overwrite=True)
     demote_parser.set_defaults(action="demote")
 
@@ -552,6 +613,7 @@ def main():
     )
     _add_module_translation_args(batch_parser)
     _add_refactor_conflict_args(batch_parser)
+    _add_refactor_dry_run_arg(batch_parser)
     batch_parser.set_defaults(overwrite=True)
     batch_parser.set_defaults(action="batch")
 
@@ -784,7 +846,7 @@ def main():
         print_bootstrap_prompt(args.dir)
         sys.exit(0)
     elif args.command == "context":
-        success = print_module_context(args.dir, args.file)
+        success = print_module_context(args.dir, args.file, depth=args.depth)
         sys.exit(0 if success else 1)
     elif args.command == "doctor":
         # Run symbol extraction first if requested
@@ -832,25 +894,12 @@ def main():
         exit_code = sync_command(args.dir)
         sys.exit(exit_code)
     elif args.command == "status":
-        exit_code = status_command(args.dir, args.module, args.verbose)
-        sys.exit(exit_code)
-    elif args.command == "work":
-        agent_provider = args.work_model or args.model
-        exit_code = work_command(
-            args.dir,
-            max_issues=args.max,
-            issue_types=args.types,
-            depth=args.depth,
-            dry_run=args.dry_run,
-            parallel=args.parallel,
-            agent_provider=agent_provider,
-        )
+        exit_code = status_command(args.dir, args.module, args.verbose, refresh=args.refresh)
         sys.exit(exit_code)
     elif args.command == "work":
         agent_provider = args.work_model or args.model
         exit_code = work_command(
-            path=args.path,
-            objective=args.objective,
+            args.path,
             max_issues=args.max,
             issue_types=args.types,
             depth=args.depth,
@@ -12,10 +12,12 @@ DOCS: docs/cli/core/PATTERNS_Why_CLI_Over_Copy.md
 
 import json
 import re
-from collections import Counter
+from collections import Counter, deque
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .trace_index import summary_path, get_trace_writer, summarize_traces, trace_days
 
 
 # =============================================================================
@@ -53,28 +55,19 @@ def log_trace(target_dir: Path, action: str, file_path: str, via: str = "direct"
     if session:
         entry["session"] = session
 
-    with open(trace_file, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    # Buffered; flushed in batches and at exit
+    get_trace_writer().write(trace_file, entry)
 
 
 def read_traces(target_dir: Path, days: int = 7) -> List[Dict[str, Any]]:
-    """Read trace entries from the last N days."""
-    traces_dir = target_dir / ".ngram" / "traces"
-    if not traces_dir.exists():
-        return []
+    """Read trace entries from the last N days.
 
+    Loads every entry; use summarize_traces() for counts.
+    """
+    get_trace_writer().flush()
     traces = []
-    cutoff = datetime.now() - timedelta(days=days)
-
-    for trace_file in sorted(traces_dir.glob("*.jsonl")):
-        # Parse date from filename
-        try:
-            file_date = datetime.strptime(trace_file.stem, "%Y-%m-%d")
-            if file_date < cutoff:
-                continue
-        except ValueError:
-            continue
 
+    for trace_file in trace_days(target_dir, days):
         with open(trace_file) as f:
             for line in f:
                 line = line.strip()
@@ -119,9 +112,8 @@ def analyze_traces(traces: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 
 def print_trace_summary(target_dir: Path, days: int = 7):
-    """Print a summary of recent file access patterns."""
-    traces = read_traces(target_dir, days)
-    analysis = analyze_traces(traces)
+    """Print a summary of recent file access patterns (from per-day summaries)."""
+    analysis = summarize_traces(target_dir, days)
 
     print(f"## Context Access Patterns (last {days} days)")
     print()
@@ -169,6 +161,7 @@ def clear_traces(target_dir: Path, before_days: int = 30):
             file_date = datetime.strptime(trace_file.stem, "%Y-%m-%d")
             if file_date < cutoff:
                 trace_file.unlink()
+                summary_path(trace_file).unlink(missing_ok=True)
                 deleted += 1
         except (ValueError, OSError):
             continue
@@ -187,10 +180,12 @@ def parse_imports(file_path: Path) -> List[str]:
     """
     if not file_path.exists():
         return []
+    return parse_imports_from_content(file_path.read_text(), file_path.suffix)
 
+
+def parse_imports_from_content(content: str, suffix: str) -> List[str]:
+    """parse_imports() for already-read file content."""
     imports = []
-    content = file_path.read_text()
-    suffix = file_path.suffix
 
     if suffix == '.py':
         # Python imports
@@ -217,10 +212,18 @@ def parse_imports(file_path: Path) -> List[str]:
     return imports
 
 
-def find_file_from_import(target_dir: Path, importing_file: Path, import_path: str) -> Optional[Path]:
+def find_file_from_import(
+    target_dir: Path,
+    importing_file: Path,
+    import_path: str,
+    is_file: Optional[Callable[[Path], bool]] = None,
+) -> Optional[Path]:
     """
     Resolve an import path to an actual file.
+
+    `is_file` replaces Path.is_file (ContextResolver passes a cached one).
     """
+    is_file = is_file or Path.is_file
     # Try relative to importing file
     base_dir = importing_file.parent
 
@@ -232,17 +235,17 @@ def find_file_from_import(target_dir: Path, importing_file: Path, import_path: s
         for ext in extensions:
             # Try relative path
             candidate = base_dir / (import_path + ext)
-            if candidate.exists() and candidate.is_file():
+            if is_file(candidate):
                 return candidate
 
             # Try from project root
             candidate = target_dir / prefix / (import_path + ext)
-            if candidate.exists() and candidate.is_file():
+            if is_file(candidate):
                 return candidate
 
             # Try as directory with index
             candidate = target_dir / prefix / import_path / f"index{ext}"
-            if candidate.exists() and candidate.is_file():
+            if is_file(candidate):
                 return candidate
 
     return None
@@ -267,9 +270,10 @@ def find_module_docs(target_dir: Path, file_path: Path) -> Optional[Path]:
     # First, check if the file has a DOCS: reference in its header
     if file_path.exists() and file_path.suffix in ['.py', '.ts', '.tsx', '.js', '.jsx', '.go', '.rs', '.java']:
         try:
-            content = file_path.read_text()
             # Look for DOCS: reference in first 50 lines
-            for line in content.split('\n')[:50]:
+            with open(file_path, errors="ignore") as f:
+                header = [line.rstrip('\n') for _, line in zip(range(50), f)]
+            for line in header:
                 if 'DOCS:' in line:
                     # Extract the path after DOCS:
                     docs_ref = line.split('DOCS:')[1].strip().strip('"\'')
@@ -317,14 +321,95 @@ def find_module_docs(target_dir: Path, file_path: Path) -> Optional[Path]:
     return None
 
 
-def get_module_context(target_dir: Path, file_path: Path, visited: Optional[set] = None) -> dict:
+DOC_TYPES = ['PATTERNS', 'BEHAVIORS', 'ALGORITHM', 'VALIDATION', 'TEST', 'SYNC']
+
+
+class ContextResolver:
+    """
+    Per-invocation memo for context lookups.
+
+    A dependency map reaches the same files, import names, directories and
+    docs folders along many paths. Each lookup is computed once:
+    - file -> parsed imports
+    - (importing dir, import) -> resolved file
+    - file -> docs folder
+    - docs folder -> doc chain
+    - (dir, suffix) -> sibling files
+    - path -> is_file
+    """
+
+    def __init__(self, target_dir: Path):
+        self.target_dir = target_dir
+        self._imports: Dict[Path, List[str]] = {}
+        self._resolved: Dict[Tuple[Path, str], Optional[Path]] = {}
+        self._module_docs: Dict[Path, Optional[Path]] = {}
+        self._chains: Dict[Path, List[Path]] = {}
+        self._siblings: Dict[Tuple[Path, str], List[Path]] = {}
+        self._is_file: Dict[Path, bool] = {}
+
+    def is_file(self, path: Path) -> bool:
+        if path not in self._is_file:
+            self._is_file[path] = path.is_file()
+        return self._is_file[path]
+
+    def imports(self, file_path: Path) -> List[str]:
+        if file_path not in self._imports:
+            try:
+                self._imports[file_path] = parse_imports(file_path)
+            except (OSError, UnicodeDecodeError):
+                self._imports[file_path] = []
+        return self._imports[file_path]
+
+    def resolve_import(self, importing_file: Path, import_path: str) -> Optional[Path]:
+        # Resolution only depends on the importing file's directory
+        key = (importing_file.parent, import_path)
+        if key not in self._resolved:
+            self._resolved[key] = find_file_from_import(
+                self.target_dir, importing_file, import_path, is_file=self.is_file
+            )
+        return self._resolved[key]
+
+    def module_docs(self, file_path: Path) -> Optional[Path]:
+        if file_path not in self._module_docs:
+            self._module_docs[file_path] = find_module_docs(self.target_dir, file_path)
+        return self._module_docs[file_path]
+
+    def doc_chain(self, docs_folder: Path) -> List[Path]:
+        """Doc files of a docs folder, in DOC_TYPES order. Content is not read."""
+        if docs_folder not in self._chains:
+            self._chains[docs_folder] = [
+                doc_file
+                for doc_type in DOC_TYPES
+                for doc_file in docs_folder.glob(f'{doc_type}_*.md')
+            ]
+        return self._chains[docs_folder]
+
+    def siblings(self, file_path: Path) -> List[Path]:
+        """Resolved files in the same directory with the same suffix (incl. file_path)."""
+        key = (file_path.parent, file_path.suffix)
+        if key not in self._siblings:
+            self._siblings[key] = [
+                sibling.resolve()
+                for sibling in file_path.parent.glob(f'*{file_path.suffix}')
+                if sibling.is_file()
+            ]
+        return self._siblings[key]
+
+
+def get_module_context(
+    target_dir: Path,
+    file_path: Path,
+    visited: Optional[set] = None,
+    resolver: Optional[ContextResolver] = None,
+    load_docs: bool = True,
+) -> dict:
     """
     Get all documentation context for a file/module.
 
     Returns dict with:
     - file: the file path
     - module_docs: path to docs folder
-    - docs: dict of doc type -> content
+    - docs: dict of doc type -> content (empty unless load_docs)
     - chain: list of linked doc files
     - imports: list of import paths
     - import_files: list of resolved import file paths
@@ -333,6 +418,8 @@ def get_module_context(target_dir: Path, file_path: Path, visited: Optional[set]
     """
     if visited is None:
         visited = set()
+    if resolver is None:
+        resolver = ContextResolver(target_dir)
 
     result = {
         'file': str(file_path),
@@ -352,103 +439,116 @@ def get_module_context(target_dir: Path, file_path: Path, visited: Optional[set]
     visited.add(file_key)
 
     # Find the docs folder for this file
-    docs_folder = find_module_docs(target_dir, file_path)
+    docs_folder = resolver.module_docs(file_path)
 
     if docs_folder:
         result['module_docs'] = str(docs_folder)
 
         # Collect all doc files
-        doc_types = ['PATTERNS', 'BEHAVIORS', 'ALGORITHM', 'VALIDATION', 'TEST', 'SYNC']
-
-        for doc_type in doc_types:
-            matching = list(docs_folder.glob(f'{doc_type}_*.md'))
-            if matching:
-                for doc_file in matching:
-                    result['docs'][doc_file.name] = doc_file.read_text()
-                    result['chain'].append(str(doc_file))
+        for doc_file in resolver.doc_chain(docs_folder):
+            if load_docs:
+                result['docs'][doc_file.name] = doc_file.read_text()
+            result['chain'].append(str(doc_file))
 
     # Parse imports from the file
     if file_path.exists():
-        imports = parse_imports(file_path)
+        imports = resolver.imports(file_path)
         result['imports'] = imports
 
         # Resolve imports to actual files and find their docs
         for imp in imports:
-            resolved = find_file_from_import(target_dir, file_path, imp)
+            resolved = resolver.resolve_import(file_path, imp)
             if resolved:
                 result['import_files'].append(str(resolved))
                 # Find docs for the imported module
-                imp_docs = find_module_docs(target_dir, resolved)
+                imp_docs = resolver.module_docs(resolved)
                 if imp_docs:
                     result['import_docs'][imp] = str(imp_docs)
 
         # Find sibling files (same directory, same extension)
-        suffix = file_path.suffix
-        if suffix and file_path.parent.exists():
-            for sibling in file_path.parent.glob(f'*{suffix}'):
-                if sibling.resolve() != file_path.resolve() and sibling.is_file():
-                    result['siblings'].append(str(sibling.resolve()))
+        if file_path.suffix and file_path.parent.exists():
+            own = file_path.resolve()
+            result['siblings'] = [str(sib) for sib in resolver.siblings(file_path) if sib != own]
 
     return result
 
 
-def build_dependency_map(target_dir: Path, file_path: Path, depth: int = 2) -> dict:
+def build_dependency_map(
+    target_dir: Path,
+    file_path: Path,
+    depth: Optional[int] = 2,
+    resolver: Optional[ContextResolver] = None,
+) -> dict:
     """
     Build a dependency map for a file, following imports up to `depth` levels.
 
+    depth=None follows imports until no new files are reached (whole-package
+    map). Files are visited breadth-first, so each node is recorded at its
+    shortest import distance and expanded once. Doc content is never read.
+
     Returns a map structure with the file at center and its relationships.
     """
-    visited = set()
+    resolver = resolver or ContextResolver(target_dir)
     map_data = {
         'root': str(file_path),
         'nodes': {},  # file_path -> context summary
         'edges': [],  # (from, to, type)
     }
 
-    def add_node(fp: Path, current_depth: int):
-        if current_depth > depth:
-            return
-
-        fp_str = str(fp.resolve()) if fp.exists() else str(fp)
-        if fp_str in visited:
-            return
-        visited.add(fp_str)
+    root_key = str(file_path.resolve()) if file_path.exists() else str(file_path)
+    queue = deque([(file_path, root_key, 0)])
+    seen = {root_key}
 
-        # Don't pass visited to get_module_context - it's only for map recursion
-        ctx = get_module_context(target_dir, fp)
+    while queue:
+        fp, fp_str, current_depth = queue.popleft()
+        ctx = get_module_context(target_dir, fp, resolver=resolver, load_docs=False)
 
         # Add node
         map_data['nodes'][fp_str] = {
             'file': ctx['file'],
             'has_docs': ctx['module_docs'] is not None,
             'docs_folder': ctx['module_docs'],
-            'doc_count': len(ctx['docs']),
+            'doc_count': len(ctx['chain']),
+            'depth': current_depth,
         }
 
         # Add edges for imports
         for imp_file in ctx['import_files']:
             map_data['edges'].append((fp_str, imp_file, 'imports'))
-            # Recurse
+            if depth is not None and current_depth >= depth:
+                continue
             imp_path = Path(imp_file)
-            if imp_path.exists():
-                add_node(imp_path, current_depth + 1)
+            imp_key = str(imp_path.resolve())
+            if imp_key not in seen:
+                seen.add(imp_key)
+                queue.append((imp_path, imp_key, current_depth + 1))
 
         # Add edges for siblings (weaker relationship)
         for sib in ctx['siblings'][:5]:  # Limit siblings
             map_data['edges'].append((fp_str, sib, 'sibling'))
 
-    add_node(file_path, 0)
     return map_data
 
 
-def print_module_context(target_dir: Path, file_path: Path):
-    """Print the full documentation context for a file, including dependency map."""
+def _display_path(target_dir: Path, path: str) -> str:
+    try:
+        return str(Path(path).relative_to(target_dir.resolve()))
+    except ValueError:
+        return path
+
+
+def print_module_context(target_dir: Path, file_path: Path, depth: Optional[int] = 2):
+    """Print the full documentation context for a file, including dependency map.
+
+    depth limits how far imports are followed for the map (None = no limit).
+    """
     # Resolve the file path
     if not file_path.is_absolute():
         file_path = (target_dir / file_path).resolve()
 
-    # Get context for the main file
-    context = get_module_context(target_dir, file_path)
+    # One resolver for the whole invocation; doc content is read when printed
+    resolver = ContextResolver(target_dir)
+    context = get_module_context(target_dir, file_path, resolver=resolver, load_docs=False)
 
     # Log trace for the context request
     try:
@@ -466,7 +566,7 @@ def print_module_context(target_dir: Path, file_path: Path):
         log_trace(target_dir, "read", chain_rel, via="context-cmd")
 
     # Build dependency map
-    dep_map = build_dependency_map(target_dir, file_path)
+    dep_map = build_dependency_map(target_dir, file_path, depth=depth, resolver=resolver)
 
     print(f"## Context for: {context['file']}")
     print()
@@ -506,6 +606,18 @@ def print_module_context(target_dir: Path, file_path: Path):
     print("```")
     print()
 
+    # Files reached through imports beyond the direct ones
+    transitive = [n for n in dep_map['nodes'].values() if n['depth'] > 1]
+    if transitive:
+        documented = sum(1 for n in transitive if n['has_docs'])
+        print(f"**Transitive imports:** {len(transitive)} file(s), {documented} with docs")
+        undocumented = sorted(n['file'] for n in transitive if not n['has_docs'])
+        for path in undocumented[:10]:
+            print(f"  - no docs: {_display_path(target_dir, path)}")
+        if len(undocumented) > 10:
+            print(f"  - ... and {len(undocumented) - 10} more without docs")
+        print()
+
     # Print main file docs
     if not context['module_docs']:
         print("**No linked documentation found for this file.**")
@@ -538,16 +650,16 @@ def print_module_context(target_dir: Path, file_path: Path):
         print()
 
     # Print full docs
-    if context['docs']:
+    if context['chain']:
         print("---")
         print()
         print("## Full Documentation")
         print()
 
-        for filename, content in context['docs'].items():
-            print(f"### {filename}")
+        for chain_file in context['chain']:
+            print(f"### {Path(chain_file).name}")
             print()
-            print(content)
+            print(Path(chain_file).read_text())
             print()
             print("---")
             print()
@@ -15,10 +15,11 @@ DOCS: docs/cli/core/IMPLEMENTATION_CLI_Code_Architecture/overview/IMPLEMENTATION
 import json
 import random
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .sync import archive_all_syncs
 from .doctor_types import DoctorIssue, DoctorConfig
+from .doctor_cache import save_doctor_result
 from .doctor_report import (
     generate_health_markdown,
     print_doctor_report,
@@ -75,6 +76,7 @@ from .doctor_checks_content import (
     doctor_check_special_markers,
     doctor_check_legacy_markers,
 )
+from .marker_scanner import scan_markers
 from .doctor_checks_invariants import (
     doctor_check_invariant_coverage,
     doctor_check_test_validates_markers,
@@ -105,6 +107,144 @@ def calculate_health_score(issues: Dict[str, List[DoctorIssue]]) -> int:
     return max(0, score)
 
 
+# Every doctor check, in report order. doctor_live re-runs subsets by name.
+DOCTOR_CHECKS = [
+    ("monolith", doctor_check_monolith),
+    ("undocumented", doctor_check_undocumented),
+    ("stale_sync", doctor_check_stale_sync),
+    ("placeholder_docs", doctor_check_placeholder_docs),
+    ("no_docs_ref", doctor_check_no_docs_ref),
+    ("incomplete_chain", doctor_check_incomplete_chain),
+    # Implementation checks
+    ("broken_impl_links", doctor_check_broken_impl_links),
+    ("stub_impl", doctor_check_stub_impl),
+    ("incomplete_impl", doctor_check_incomplete_impl),
+    ("undoc_impl", doctor_check_undoc_impl),
+    ("new_undoc_code", doctor_check_new_undoc_code),
+    ("large_doc_module", doctor_check_large_doc_module),
+    ("yaml_drift", doctor_check_yaml_drift),
+    # New checks
+    ("missing_tests", doctor_check_missing_tests),
+    ("orphan_docs", doctor_check_orphan_docs),
+    ("stale_impl", doctor_check_stale_impl),
+    ("doc_template_drift", doctor_check_doc_template_drift),
+    ("validation_behaviors_list", doctor_check_validation_behaviors_list),
+    ("prompt_doc_reference", doctor_check_prompt_doc_reference),
+    ("prompt_view_table", doctor_check_prompt_view_table),
+    ("prompt_checklist", doctor_check_prompt_checklist),
+    ("doc_link_integrity", doctor_check_doc_link_integrity),
+    ("code_doc_delta_coupling", doctor_check_code_doc_delta_coupling),
+    ("nonstandard_doc_type", doctor_check_nonstandard_doc_type),
+    ("naming_conventions", doctor_check_naming_conventions),
+    ("doc_gaps", doctor_check_doc_gaps),
+    ("conflicts", doctor_check_conflicts),
+    ("suggestions", doctor_check_suggestions),
+    ("doc_duplication", doctor_check_doc_duplication),
+    ("recent_log_errors", doctor_check_recent_log_errors),
+    ("special_markers", doctor_check_special_markers),
+    ("legacy_markers", doctor_check_legacy_markers),
+    # Code quality checks
+    ("magic_values", doctor_check_magic_values),
+    ("hardcoded_secrets", doctor_check_hardcoded_secrets),
+    ("long_strings", doctor_check_long_strings),
+    # Invariant test coverage checks
+    ("invariant_coverage", doctor_check_invariant_coverage),
+    ("test_validates_markers", doctor_check_test_validates_markers),
+    ("completion_gate", doctor_check_completion_gate),
+    # Graph ingestion checks
+    ("docs_not_ingested", doctor_check_docs_not_ingested),
+]
+
+# Checks that read the marker scan; a run walks the tree for them once
+MARKER_CHECKS = ("special_markers", "legacy_markers")
+
+
+def run_doctor_checks(
+    target_dir: Path,
+    config: DoctorConfig,
+    names: Optional[Iterable[str]] = None,
+) -> Dict[str, List[DoctorIssue]]:
+    """Run the named checks (all by default); unfiltered issues per check name."""
+    wanted = None if names is None else set(names)
+    scan = None
+    results = {}
+    for name, check in DOCTOR_CHECKS:
+        if wanted is not None and name not in wanted:
+            continue
+        if name in MARKER_CHECKS:
+            if scan is None:
+                scan = scan_markers(target_dir, config)
+            results[name] = check(target_dir, config, scan=scan)
+        else:
+            results[name] = check(target_dir, config)
+    return results
+
+
+def filter_doctor_issues(
+    issues: List[DoctorIssue],
+    target_dir: Path,
+    config: DoctorConfig,
+) -> Tuple[List[DoctorIssue], int, int]:
+    """Drop suppressed and doc-declared false-positive issues, then assign graph ids.
+
+    Returns (issues, ignored_count, false_positive_count).
+    """
+    # Filter out suppressed issues from doctor-ignore.yaml
+    ignores = load_doctor_ignore(target_dir)
+    issues, ignored_count = filter_ignored_issues(issues, ignores)
+
+    # Filter out doc-declared false positives
+    false_positives = load_doctor_false_positives(target_dir, config)
+    issues, false_positive_count = filter_false_positive_issues(
+        issues,
+        false_positives,
+        target_dir,
+        config,
+    )
+
+    # Generate graph node IDs for all issues
+    for issue in issues:
+        if not issue.id:
+            # Derive module from path (first directory segment or project name)
+            rel_path = Path(issue.path)
+            if rel_path.parts:
+                module = rel_path.parts[0]
+            else:
+                module = target_dir.name
+            issue.generate_id(module)
+
+    return issues, ignored_count, false_positive_count
+
+
+def build_doctor_result(
+    target_dir: Path,
+    issues: List[DoctorIssue],
+    ignored_count: int = 0,
+    false_positive_count: int = 0,
+) -> Dict[str, Any]:
+    """Group issues by severity and score them (run_doctor's result shape)."""
+    grouped = {
+        "critical": [i for i in issues if i.severity == "critical"],
+        "warning": [i for i in issues if i.severity == "warning"],
+        "info": [i for i in issues if i.severity == "info"],
+    }
+
+    score = calculate_health_score(grouped)
+
+    return {
+        "project": str(target_dir),
+        "score": score,
+        "issues": grouped,
+        "summary": {
+            "critical": len(grouped["critical"]),
+            "warning": len(grouped["warning"]),
+            "info": len(grouped["info"]),
+        },
+        "ignored_count": ignored_count,
+        "false_positive_count": false_positive_count,
+    }
+
+
 def run_doctor(target_dir: Path, config: DoctorConfig, sync_graph: bool = True) -> Dict[str, Any]:
     """Run all doctor checks and return results.
 
@@ -151,74 +291,10 @@ def run_doctor(target_dir: Path, config: DoctorConfig, sync_graph: bool = True)
             store = None
 
     # Run checks
-    all_issues.extend(doctor_check_monolith(target_dir, config))
-    all_issues.extend(doctor_check_undocumented(target_dir, config))
-    all_issues.extend(doctor_check_stale_sync(target_dir, config))
-    all_issues.extend(doctor_check_placeholder_docs(target_dir, config))
-    all_issues.extend(doctor_check_no_docs_ref(target_dir, config))
-    all_issues.extend(doctor_check_incomplete_chain(target_dir, config))
-    # Implementation checks
-    all_issues.extend(doctor_check_broken_impl_links(target_dir, config))
-    all_issues.extend(doctor_check_stub_impl(target_dir, config))
-    all_issues.extend(doctor_check_incomplete_impl(target_dir, config))
-    all_issues.extend(doctor_check_undoc_impl(target_dir, config))
-    all_issues.extend(doctor_check_new_undoc_code(target_dir, config))
-    all_issues.extend(doctor_check_large_doc_module(target_dir, config))
-    all_issues.extend(doctor_check_yaml_drift(target_dir, config))
-    # New checks
-    all_issues.extend(doctor_check_missing_tests(target_dir, config))
-    all_issues.extend(doctor_check_orphan_docs(target_dir, config))
-    all_issues.extend(doctor_check_stale_impl(target_dir, config))
-    all_issues.extend(doctor_check_doc_template_drift(target_dir, config))
-    all_issues.extend(doctor_check_validation_behaviors_list(target_dir, config))
-    all_issues.extend(doctor_check_prompt_doc_reference(target_dir, config))
-    all_issues.extend(doctor_check_prompt_view_table(target_dir, config))
-    all_issues.extend(doctor_check_prompt_checklist(target_dir, config))
-    all_issues.extend(doctor_check_doc_link_integrity(target_dir, config))
-    all_issues.extend(doctor_check_code_doc_delta_coupling(target_dir, config))
-    all_issues.extend(doctor_check_nonstandard_doc_type(target_dir, config))
-    all_issues.extend(doctor_check_naming_conventions(target_dir, config))
-    all_issues.extend(doctor_check_doc_gaps(target_dir, config))
-    all_issues.extend(doctor_check_conflicts(target_dir, config))
-    all_issues.extend(doctor_check_suggestions(target_dir, config))
-    all_issues.extend(doctor_check_doc_duplication(target_dir, config))
-    all_issues.extend(doctor_check_recent_log_errors(target_dir, config))
-    all_issues.extend(doctor_check_special_markers(target_dir, config))
-    all_issues.extend(doctor_check_legacy_markers(target_dir, config))
-    # Code quality checks
-    all_issues.extend(doctor_check_magic_values(target_dir, config))
-    all_issues.extend(doctor_check_hardcoded_secrets(target_dir, config))
-    all_issues.extend(doctor_check_long_strings(target_dir, config))
-    # Invariant test coverage checks
-    all_issues.extend(doctor_check_invariant_coverage(target_dir, config))
-    all_issues.extend(doctor_check_test_validates_markers(target_dir, config))
-    all_issues.extend(doctor_check_completion_gate(target_dir, config))
-    # Graph ingestion checks
-    all_issues.extend(doctor_check_docs_not_ingested(target_dir, config))
-
-    # Filter out suppressed issues from doctor-ignore.yaml
-    ignores = load_doctor_ignore(target_dir)
-    all_issues, ignored_count = filter_ignored_issues(all_issues, ignores)
+    for issues in run_doctor_checks(target_dir, config).values():
+        all_issues.extend(issues)
 
-    # Filter out doc-declared false positives
-    false_positives = load_doctor_false_positives(target_dir, config)
-    all_issues, false_positive_count = filter_false_positive_issues(
-        all_issues,
-        false_positives,
-        target_dir,
-        config,
-    )
-
-    # Generate graph node IDs for all issues
-    for issue in all_issues:
-        if not issue.id:
-            # Derive module from path (first directory segment or project name)
-            rel_path = Path(issue.path)
-            if rel_path.parts:
-                module = rel_path.parts[0]
-            else:
-                module = target_dir.name
-            issue.generate_id(module)
+    all_issues, ignored_count, false_positive_count = filter_doctor_issues(all_issues, target_dir, config)
 
     # Upsert issue narratives to graph store
     if sync_graph and store is not None:
@@ -425,27 +501,7 @@ def run_doctor(target_dir: Path, config: DoctorConfig, sync_graph: bool = True)
                 if graph_stats:
                     graph_stats["task_sync_error"] = str(e)[:100]
 
-    # Group by severity
-    grouped = {
-        "critical": [i for i in all_issues if i.severity == "critical"],
-        "warning": [i for i in all_issues if i.severity == "warning"],
-        "info": [i for i in all_issues if i.severity == "info"],
-    }
-
-    score = calculate_health_score(grouped)
-
-    result = {
-        "project": str(target_dir),
-        "score": score,
-        "issues": grouped,
-        "summary": {
-            "critical": len(grouped["critical"]),
-            "warning": len(grouped["warning"]),
-            "info": len(grouped["info"]),
-        },
-        "ignored_count": ignored_count,
-        "false_positive_count": false_positive_count,
-    }
+    result = build_doctor_result(target_dir, all_issues, ignored_count, false_positive_count)
 
     # Include graph stats if available
     if graph_stats:
@@ -469,6 +525,10 @@ def doctor_command(
     config = load_doctor_config(target_dir)
     results = run_doctor(target_dir, config)
 
+    # Persist the full issue list for `ngram status` (before level filtering)
+    if not no_save:
+        save_doctor_result(target_dir, results, config)
+
     # Filter by level if specified
     if level == "critical":
         results["issues"]["warning"] = []
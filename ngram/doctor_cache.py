@@ -0,0 +1,135 @@
+"""
+Persisted doctor results.
+
+`ngram doctor` saves its issue list to .ngram/state/doctor_result.json
+together with a fingerprint of the project tree. Commands that only need
+the issue list (`ngram status`) reuse it while it is fresh instead of
+re-running every doctor check.
+
+Fresh means: the saved fingerprint (a hash of every file's path, mtime and
+size, ignoring config.ignore patterns and the files doctor writes itself)
+equals the current one, so edits, renames and moves all invalidate it, and
+the result is younger than max_age_seconds. The fingerprint walk only
+stats files, so checking freshness is much cheaper than a doctor run.
+
+Contains:
+- tree_fingerprint: Cheap change detector for the project tree
+- save_doctor_result: Persist run_doctor() issues
+- load_fresh_doctor_result: Load persisted issues if still fresh
+"""
+# DOCS: docs/cli/core/PATTERNS_Why_CLI_Over_Copy.md
+
+import fnmatch
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .doctor_types import DoctorConfig, DoctorIssue
+
+DOCTOR_RESULT_PATH = Path(".ngram") / "state" / "doctor_result.json"
+DEFAULT_MAX_AGE_SECONDS = 3600
+CACHE_VERSION = 2
+
+# Written by doctor runs themselves; the other .ngram/state files (SYNC docs)
+# are check inputs
+HEALTH_REPORT_NAME = "SYNC_Project_Health.md"
+
+_ISSUE_FIELDS = ("issue_type", "severity", "path", "message", "details", "suggestion", "protocol")
+
+
+def _ignored_dir(rel_dir: str, name: str, patterns: List[str]) -> bool:
+    if name == ".git":
+        return True
+    for pattern in patterns:
+        base = pattern.rstrip("/").removesuffix("/**")
+        if fnmatch.fnmatch(name, base) or fnmatch.fnmatch(rel_dir, base):
+            return True
+    return False
+
+
+def _doctor_output(rel_path: str) -> bool:
+    """Result, cache and report files doctor writes under .ngram/state."""
+    state_dir = DOCTOR_RESULT_PATH.parent.as_posix() + "/"
+    if not rel_path.startswith(state_dir):
+        return False
+    # Only markdown there is read by checks: json results/caches and their
+    # .tmp files are doctor's own, and so is the health report
+    return not rel_path.endswith(".md") or rel_path == state_dir + HEALTH_REPORT_NAME
+
+
+def tree_fingerprint(target_dir: Path, ignore_patterns: List[str]) -> Dict[str, Any]:
+    """File count and a hash of every (path, mtime_ns, size) under target_dir, pruning ignored dirs."""
+    entries = []
+    root = str(target_dir)
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel = os.path.relpath(dirpath, root)
+        dirnames[:] = [
+            d for d in dirnames
+            if not _ignored_dir(os.path.normpath(os.path.join(rel, d)), d, ignore_patterns)
+        ]
+        for name in filenames:
+            try:
+                stat = os.stat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            rel_path = os.path.normpath(os.path.join(rel, name)).replace("\\", "/")
+            if _doctor_output(rel_path):
+                continue
+            entries.append(f"{rel_path}\0{stat.st_mtime_ns}\0{stat.st_size}")
+    digest = hashlib.sha1("\n".join(sorted(entries)).encode("utf-8", "surrogateescape")).hexdigest()
+    return {"files": len(entries), "digest": digest}
+
+
+def _issue_to_dict(issue: DoctorIssue) -> Dict[str, Any]:
+    return {name: getattr(issue, name, "") for name in _ISSUE_FIELDS}
+
+
+def save_doctor_result(target_dir: Path, results: Dict[str, Any], config: DoctorConfig) -> Optional[Path]:
+    """Persist run_doctor() issues. Skipped when .ngram/state does not exist."""
+    path = target_dir / DOCTOR_RESULT_PATH
+    if not path.parent.exists():
+        return None
+    payload = {
+        "version": CACHE_VERSION,
+        "saved_at": time.time(),
+        "fingerprint": tree_fingerprint(target_dir, config.ignore),
+        "issues": {
+            severity: [_issue_to_dict(i) for i in results["issues"].get(severity, [])]
+            for severity in ("critical", "warning", "info")
+        },
+    }
+    try:
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(payload, default=str))
+        tmp.replace(path)
+    except OSError:
+        return None
+    return path
+
+
+def load_fresh_doctor_result(
+    target_dir: Path,
+    config: DoctorConfig,
+    max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+) -> Optional[Dict[str, List[DoctorIssue]]]:
+    """Return persisted issues by severity, or None if missing or stale."""
+    path = target_dir / DOCTOR_RESULT_PATH
+    try:
+        payload = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if payload.get("version") != CACHE_VERSION:
+        return None
+    if time.time() - payload.get("saved_at", 0) > max_age_seconds:
+        return None
+    if payload.get("fingerprint") != tree_fingerprint(target_dir, config.ignore):
+        return None
+
+    return {
+        severity: [DoctorIssue(**{k: v for k, v in d.items() if k in _ISSUE_FIELDS}) for d in issues]
+        for severity, issues in payload.get("issues", {}).items()
+    }
@@ -13,7 +13,7 @@ DOCS: docs/cli/core/IMPLEMENTATION_CLI_Code_Architecture/overview/IMPLEMENTATION
 import re
 import time
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from .core_utils import find_module_directories
 from .doctor_types import DoctorIssue, DoctorConfig
@@ -21,9 +21,9 @@ from .doctor_files import (
     should_ignore_path,
     find_source_files,
     count_lines,
-    is_binary_file,
 )
-from .solve_escalations import ESCALATION_TAGS, PROPOSITION_TAGS, TODO_TAGS, IGNORED_FILES
+from .marker_scanner import MarkerScan, scan_markers
+from .solve_escalations import IGNORED_FILES
 
 try:
     import yaml
@@ -414,7 +414,6 @@ def doctor_check_long_strings(target_dir: Path, config: DoctorConfig) -> List[Do
 
             try:
                 content = code_file.read_text(errors="ignore")
-                rel_path = str(code_file.relative_to(target_dir))
 
                 long_strings = []
 
@@ -518,7 +517,11 @@ def _extract_questions_from_text(text: str, is_code: bool = False) -> List[str]:
     return questions
 
 
-def doctor_check_legacy_markers(target_dir: Path, config: DoctorConfig) -> List[DoctorIssue]:
+def doctor_check_legacy_markers(
+    target_dir: Path,
+    config: DoctorConfig,
+    scan: Optional[MarkerScan] = None,
+) -> List[DoctorIssue]:
     """Check for legacy marker formats and unresolved questions.
 
     Detects:
@@ -527,45 +530,49 @@ def doctor_check_legacy_markers(target_dir: Path, config: DoctorConfig) -> List[
     - Legacy `- IDEA:` items (should be @ngram:proposition)
     - Legacy `- QUESTION:` items (should be @ngram:escalation)
     - Unresolved questions (sentences ending with ?) in docs and code comments
+
+    Pass `scan` to reuse a marker scan already made in this doctor run.
     """
     if "legacy_markers" in config.disabled_checks:
         return []
 
     issues = []
-    docs_dir = target_dir / "docs"
-
-    # Legacy patterns to detect
-    legacy_patterns = {
-        "GAPS_SECTION": (r'^## GAPS / IDEAS / QUESTIONS', "Legacy GAPS section header"),
-        "LEGACY_TODO": (r'^- \[ \] ', "Legacy todo format (use @ngram:todo)"),
-        "LEGACY_IDEA": (r'^- IDEA:', "Legacy IDEA format (use @ngram:proposition)"),
-        "LEGACY_QUESTION": (r'^- QUESTION:', "Legacy QUESTION format (use @ngram:escalation)"),
+    if scan is None:
+        scan = scan_markers(target_dir, config)
+
+    # Legacy marker families matched by the scanner
+    legacy_messages = {
+        "GAPS_SECTION": "Legacy GAPS section header",
+        "LEGACY_TODO": "Legacy todo format (use @ngram:todo)",
+        "LEGACY_IDEA": "Legacy IDEA format (use @ngram:proposition)",
+        "LEGACY_QUESTION": "Legacy QUESTION format (use @ngram:escalation)",
     }
+    code_extensions = {".py", ".js", ".ts", ".tsx", ".jsx"}
 
-    # Check docs for legacy markers and questions
-    if docs_dir.exists():
-        for doc_file in docs_dir.rglob("*.md"):
-            if should_ignore_path(doc_file, config.ignore, target_dir):
-                continue
+    for rel_path in scan.files:
+        name = rel_path.rsplit("/", 1)[-1]
+
+        # Check docs for legacy markers and questions
+        if rel_path.startswith("docs/") and name.endswith(".md"):
             # Skip templates and archives
-            if "TEMPLATE" in doc_file.name or "_archive_" in doc_file.name:
+            if "TEMPLATE" in name or "_archive_" in name:
                 continue
 
             try:
-                content = doc_file.read_text(errors="ignore")
-                rel_path = str(doc_file.relative_to(target_dir))
-
-                # Check for legacy patterns
-                for marker_type, (pattern, message) in legacy_patterns.items():
-                    if re.search(pattern, content, re.MULTILINE):
-                        issues.append(DoctorIssue(
-                            issue_type="LEGACY_MARKER",
-                            severity="warning",
-                            path=rel_path,
-                            message=message,
-                            details={"marker_type": marker_type},
-                            suggestion="Convert to @ngram:todo, @ngram:proposition, or @ngram:escalation format"
-                        ))
+                content = (target_dir / rel_path).read_text(errors="ignore")
+
+                markers = scan.markers.get(rel_path)
+                if markers:
+                    for marker_type, message in legacy_messages.items():
+                        if markers.family(marker_type):
+                            issues.append(DoctorIssue(
+                                issue_type="LEGACY_MARKER",
+                                severity="warning",
+                                path=rel_path,
+                                message=message,
+                                details={"marker_type": marker_type},
+                                suggestion="Convert to @ngram:todo, @ngram:proposition, or @ngram:escalation format"
+                            ))
 
                 # Check for unresolved questions (not in code blocks or MARKERS sections)
                 # Remove MARKERS sections and Discussion sections before scanning
@@ -621,15 +628,11 @@ def doctor_check_legacy_markers(target_dir: Path, config: DoctorConfig) -> List[
             except Exception:
                 pass
 
-    # Check code files for questions in comments
-    code_extensions = {".py", ".js", ".ts", ".tsx", ".jsx"}
-
-    for ext in code_extensions:
-        for code_file in target_dir.rglob(f"*{ext}"):
-            if should_ignore_path(code_file, config.ignore, target_dir):
-                continue
+        # Check code files for questions in comments
+        elif Path(name).suffix in code_extensions:
+            code_file = target_dir / rel_path
             # Skip test files and prompts
-            if "test" in code_file.name.lower() or "prompt" in str(code_file).lower():
+            if "test" in name.lower() or "prompt" in str(code_file).lower():
                 continue
             # Skip node_modules, .venv, etc.
             if any(p in str(code_file) for p in ["node_modules", ".venv", "__pycache__", ".git"]):
@@ -637,7 +640,6 @@ def doctor_check_legacy_markers(target_dir: Path, config: DoctorConfig) -> List[
 
             try:
                 content = code_file.read_text(errors="ignore")
-                rel_path = str(code_file.relative_to(target_dir))
 
                 # Extract questions from comments only
                 questions = _extract_questions_from_text(content, is_code=True)
@@ -664,39 +666,22 @@ def doctor_check_legacy_markers(target_dir: Path, config: DoctorConfig) -> List[
     return issues
 
 
-def _extract_marker_priority(content: str, marker_tags: tuple) -> int:
-    """Extract priority from marker YAML. Returns 0-10 (higher = more urgent)."""
-    for tag in marker_tags:
-        if tag not in content:
-            continue
-        # Find the marker section
-        start = content.find(tag)
-        end = min(start + 500, len(content))  # Look at next 500 chars
-        section = content[start:end]
-
-        # Try to find priority field
-        # Format: priority: 8 or priority: high
-        priority_match = re.search(r'priority:\s*(\d+|low|medium|high|critical)', section, re.IGNORECASE)
-        if priority_match:
-            val = priority_match.group(1).lower()
-            if val.isdigit():
-                return int(val)
-            # Convert text priorities to numeric
-            return {"critical": 10, "high": 8, "medium": 5, "low": 2}.get(val, 5)
-    return 5  # Default priority
-
-
-def doctor_check_special_markers(target_dir: Path, config: DoctorConfig) -> List[DoctorIssue]:
+def doctor_check_special_markers(
+    target_dir: Path,
+    config: DoctorConfig,
+    scan: Optional[MarkerScan] = None,
+) -> List[DoctorIssue]:
     """Check for special markers that need attention (escalations, propositions, todos).
 
-    Extracts priority from marker YAML to order results.
+    Extracts priority from marker YAML to order results. Pass `scan` to reuse
+    a marker scan already made in this doctor run.
     """
     issues = []
 
     all_marker_info = [
-        ("ESCALATION", ESCALATION_TAGS, "Escalation marker needs decision"),
-        ("PROPOSITION", PROPOSITION_TAGS, "Agent proposition needs review"),
-        ("TODO", TODO_TAGS, "Todo marker needs attention"),
+        ("ESCALATION", "Escalation marker needs decision"),
+        ("PROPOSITION", "Agent proposition needs review"),
+        ("TODO", "Todo marker needs attention"),
     ]
     # Base severity by type - escalations are warnings, others are info
     severity_by_type = {
@@ -705,40 +690,26 @@ def doctor_check_special_markers(target_dir: Path, config: DoctorConfig) -> List
         "TODO": "info",
     }
 
-    for issue_type, marker_tags, message_template in all_marker_info:
-        for path in target_dir.rglob("*"):
-            if not path.is_file():
-                continue
-            if should_ignore_path(path, config.ignore, target_dir):
-                continue
-            if str(path.relative_to(target_dir)) in IGNORED_FILES:
-                continue
-            if path.suffix == ".log":
-                continue
-            if is_binary_file(path):
+    if scan is None:
+        scan = scan_markers(target_dir, config)
+
+    for issue_type, message_template in all_marker_info:
+        for markers in scan.with_family(issue_type):
+            rel_path = markers.path
+            if rel_path in IGNORED_FILES:
                 continue
-            rel_path = str(path.relative_to(target_dir))
             if rel_path.startswith("templates/") or rel_path.startswith(".ngram/views"):
                 continue
-            try:
-                content = path.read_text(errors="ignore")
-            except Exception:
-                continue
-            if not any(tag in content for tag in marker_tags):
-                continue
 
-            # Extract priority from marker YAML
-            priority = _extract_marker_priority(content, marker_tags)
+            # Priority and title from marker YAML
+            priority = markers.priority(issue_type)
+            title = markers.title(issue_type)
 
             # High priority markers (7+) get elevated severity
             severity = severity_by_type.get(issue_type, "info")
             if priority >= 7:
                 severity = "warning" if severity == "info" else "critical"
 
-            # Find title if available
-            title_match = re.search(r'(?:title|task_name):\s*["\']?([^"\'\n]+)', content)
-            title = title_match.group(1).strip() if title_match else ""
-
             message = f"{message_template} (priority: {priority})"
             if title:
                 message = f"{title[:60]} (priority: {priority})"
@@ -749,10 +720,10 @@ def doctor_check_special_markers(target_dir: Path, config: DoctorConfig) -> List
                 path=rel_path,
                 message=message,
                 details={
-                    "markers": [tag for tag in marker_tags if tag in content],
+                    "markers": markers.tags(issue_type),
                     "priority": priority,
                     "title": title,
-                    "content_snippet": content[content.find(next(tag for tag in marker_tags if tag in content)):][:200] + "..." if any(tag in content for tag in marker_tags) else ""
+                    "content_snippet": markers.lead(issue_type)[0].snippet + "...",
                 },
                 suggestion=f"Review and resolve {issue_type.lower()} in this file"
             ))
@@ -0,0 +1,451 @@
+"""
+Live doctor service.
+
+A long-lived doctor that keeps its issue list current instead of
+re-running every check on a timer:
+
+- Watches the project tree: watchdog (inotify on Linux) when installed,
+  otherwise a stat-walk poll every few seconds.
+- Maps each changed path to a kind (code, docs, logs, config) and re-runs
+  only the checks that read that kind (CHECK_INPUTS). Doctor config files
+  (.ngram/config.yaml, doctor-ignore, .gitignore, modules.yaml) reload the
+  config and re-run everything.
+- Keeps issues per check, re-applies ignore / false-positive filtering,
+  and pushes an IssueDiff (added / removed issues, new score) to every
+  subscriber when something changed.
+- Saves each result to .ngram/state/doctor_result.json so `ngram status`
+  picks it up.
+
+No graph sync happens here; `ngram doctor` and an explicit `/doctor` in
+the TUI run the full run_doctor() with sync. The TUI's DOCTOR tab and the
+MCP doctor_check read this service.
+A full rescan still runs every FULL_RESCAN_SECONDS, for the checks that
+depend on the clock (stale SYNC dates, recent log errors).
+
+Usage:
+    live = get_live_doctor(target_dir)       # shared per project, started
+    unsubscribe = live.subscribe(on_diff)    # called from the service thread
+    result = live.result()                   # run_doctor()-shaped dict
+
+Contains:
+- CHECK_INPUTS / affected_checks: which checks a changed path invalidates
+- PollingWatcher, WatchdogWatcher: change sources
+- LiveDoctor: incremental evaluation + subscribers
+- get_live_doctor: one service per project per process
+"""
+# DOCS: docs/cli/core/PATTERNS_Why_CLI_Over_Copy.md
+
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from .doctor import DOCTOR_CHECKS, build_doctor_result, filter_doctor_issues, run_doctor_checks
+from .doctor_cache import _doctor_output, _ignored_dir, save_doctor_result
+from .doctor_files import load_doctor_config, should_ignore_path
+from .doctor_types import DoctorConfig, DoctorIssue
+
+try:
+    from watchdog.observers import Observer
+    HAS_WATCHDOG = True
+except ImportError:
+    HAS_WATCHDOG = False
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL_SECONDS = 2.0
+DEBOUNCE_SECONDS = 0.3
+FULL_RESCAN_SECONDS = 1800.0
+
+CODE, DOCS, LOGS, CONFIG = "code", "docs", "logs", "config"
+ALL_KINDS = frozenset({CODE, DOCS, LOGS, CONFIG})
+
+# Changes to these reload the doctor config and re-run every check
+CONFIG_FILES = {
+    ".gitignore",
+    ".ngramignore",
+    "modules.yaml",
+    ".ngram/config.yaml",
+    ".ngram/doctor-ignore.yaml",
+}
+
+# Kinds of files each check reads; checks not listed re-run on any change
+CHECK_INPUTS: Dict[str, FrozenSet[str]] = {
+    "monolith": frozenset({CODE, DOCS}),
+    "undocumented": frozenset({CODE}),
+    "stale_sync": frozenset({DOCS}),
+    "placeholder_docs": frozenset({DOCS}),
+    "no_docs_ref": frozenset({CODE}),
+    "incomplete_chain": frozenset({DOCS}),
+    "broken_impl_links": frozenset({CODE, DOCS}),
+    "stub_impl": frozenset({CODE}),
+    "incomplete_impl": frozenset({CODE}),
+    "undoc_impl": frozenset({CODE, DOCS}),
+    "new_undoc_code": frozenset({CODE, DOCS}),
+    "large_doc_module": frozenset({DOCS}),
+    "yaml_drift": frozenset({CODE, DOCS}),
+    "missing_tests": frozenset({CODE}),
+    "orphan_docs": frozenset({CODE, DOCS}),
+    "stale_impl": frozenset({CODE, DOCS}),
+    "doc_template_drift": frozenset({DOCS}),
+    "validation_behaviors_list": frozenset({DOCS}),
+    "prompt_doc_reference": frozenset({CODE, DOCS}),
+    "prompt_view_table": frozenset({CODE, DOCS}),
+    "prompt_checklist": frozenset({CODE, DOCS}),
+    "doc_link_integrity": frozenset({CODE, DOCS}),
+    "code_doc_delta_coupling": frozenset({CODE, DOCS}),
+    "nonstandard_doc_type": frozenset({DOCS}),
+    "naming_conventions": frozenset({CODE, DOCS}),
+    "doc_gaps": frozenset({DOCS}),
+    "conflicts": frozenset({DOCS}),
+    "suggestions": frozenset({DOCS}),
+    "doc_duplication": frozenset({DOCS}),
+    "recent_log_errors": frozenset({LOGS}),
+    "special_markers": frozenset({CODE, DOCS}),
+    "legacy_markers": frozenset({CODE, DOCS}),
+    "magic_values": frozenset({CODE}),
+    "hardcoded_secrets": frozenset({CODE}),
+    "long_strings": frozenset({CODE}),
+    "invariant_coverage": frozenset({CODE, DOCS}),
+    "test_validates_markers": frozenset({CODE}),
+    "completion_gate": frozenset({CONFIG}),
+    "docs_not_ingested": frozenset({DOCS}),
+}
+
+
+def path_kind(rel_path: str) -> str:
+    suffix = Path(rel_path).suffix.lower()
+    if suffix == ".md":
+        return DOCS
+    if suffix == ".log":
+        return LOGS
+    if suffix in (".yaml", ".yml"):
+        return CONFIG
+    return CODE
+
+
+def affected_checks(paths: Iterable[str]) -> Optional[List[str]]:
+    """Check names to re-run for these changed paths; None means all of them."""
+    paths = set(paths)
+    if paths & CONFIG_FILES:
+        return None
+    kinds = {path_kind(p) for p in paths}
+    return [name for name, _ in DOCTOR_CHECKS if CHECK_INPUTS.get(name, ALL_KINDS) & kinds]
+
+
+def _issue_key(issue: DoctorIssue) -> Tuple[str, str, str]:
+    return (issue.issue_type, issue.path, issue.message)
+
+
+@dataclass
+class IssueDiff:
+    """What one re-evaluation changed."""
+    added: List[DoctorIssue] = field(default_factory=list)
+    removed: List[DoctorIssue] = field(default_factory=list)
+    score: int = 0
+    previous_score: Optional[int] = None
+    changed_paths: List[str] = field(default_factory=list)
+    checks_run: List[str] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    @property
+    def empty(self) -> bool:
+        return not self.added and not self.removed
+
+    def to_dict(self) -> Dict[str, Any]:
+        def brief(issue):
+            return {"type": issue.issue_type, "severity": issue.severity, "path": issue.path, "message": issue.message}
+        return {
+            "added": [brief(i) for i in self.added],
+            "removed": [brief(i) for i in self.removed],
+            "score": self.score,
+            "previous_score": self.previous_score,
+            "changed_paths": self.changed_paths,
+            "checks_run": len(self.checks_run),
+            "elapsed_ms": round(self.elapsed_ms, 1),
+        }
+
+
+# =============================================================================
+# WATCHERS
+# =============================================================================
+
+def _relative(path: str, target_dir: Path) -> Optional[str]:
+    try:
+        return Path(path).resolve().relative_to(target_dir).as_posix()
+    except (ValueError, OSError):
+        return None
+
+
+def _watched(rel_path: str, target_dir: Path, ignore_patterns: List[str]) -> bool:
+    if _doctor_output(rel_path):
+        return False  # our own results and caches; SYNC files in .ngram/state are watched
+    parts = rel_path.split("/")
+    for depth in range(1, len(parts)):
+        if _ignored_dir("/".join(parts[:depth]), parts[depth - 1], ignore_patterns):
+            return False
+    return not should_ignore_path(target_dir / rel_path, ignore_patterns, target_dir)
+
+
+class PollingWatcher:
+    """Change source that diffs (mtime, size) of every file each interval."""
+
+    def __init__(self, target_dir: Path, ignore_patterns: List[str], interval: float = POLL_INTERVAL_SECONDS):
+        self.target_dir = Path(target_dir).resolve()
+        self.ignore_patterns = ignore_patterns
+        self.interval = interval
+        self._stop = threading.Event()
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        files = {}
+        root = str(self.target_dir)
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel = os.path.relpath(dirpath, root)
+            dirnames[:] = [
+                d for d in dirnames
+                if not _ignored_dir(os.path.normpath(os.path.join(rel, d)), d, self.ignore_patterns)
+            ]
+            for name in filenames:
+                try:
+                    st = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                rel_path = os.path.normpath(os.path.join(rel, name)).replace(os.sep, "/")
+                if not _doctor_output(rel_path):
+                    files[rel_path] = (st.st_mtime_ns, st.st_size)
+        return files
+
+    def start(self) -> None:
+        self._snapshot = self._scan()
+
+    def poll(self, timeout: float) -> Set[str]:
+        """Paths changed since the last poll (waits one interval)."""
+        if self._stop.wait(min(timeout, self.interval)):
+            return set()
+        current = self._scan()
+        previous, self._snapshot = self._snapshot, current
+        changed = {p for p, sig in current.items() if previous.get(p) != sig}
+        changed |= previous.keys() - current.keys()
+        return {p for p in changed if _watched(p, self.target_dir, self.ignore_patterns)}
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+class WatchdogWatcher:
+    """Change source fed by watchdog filesystem events (inotify on Linux)."""
+
+    def __init__(self, target_dir: Path, ignore_patterns: List[str]):
+        self.target_dir = Path(target_dir).resolve()
+        self.ignore_patterns = ignore_patterns
+        self._events: "queue.Queue[str]" = queue.Queue()
+        self._observer = Observer()
+
+    def dispatch(self, event) -> None:
+        """watchdog handler hook; runs on the observer thread."""
+        for attr in ("src_path", "dest_path"):
+            path = getattr(event, attr, None)
+            if path:
+                rel = _relative(os.fsdecode(path), self.target_dir)
+                if rel and _watched(rel, self.target_dir, self.ignore_patterns):
+                    self._events.put(rel)
+
+    def start(self) -> None:
+        self._observer.schedule(self, str(self.target_dir), recursive=True)
+        self._observer.start()
+
+    def poll(self, timeout: float) -> Set[str]:
+        """First event within `timeout`, plus everything arriving until DEBOUNCE_SECONDS of quiet."""
+        try:
+            changed = {self._events.get(timeout=timeout)}
+        except queue.Empty:
+            return set()
+        while True:
+            try:
+                changed.add(self._events.get(timeout=DEBOUNCE_SECONDS))
+            except queue.Empty:
+                return changed
+
+    def stop(self) -> None:
+        self._observer.stop()
+
+
+def make_watcher(target_dir: Path, ignore_patterns: List[str]):
+    if HAS_WATCHDOG:
+        try:
+            return WatchdogWatcher(target_dir, ignore_patterns)
+        except Exception as e:
+            logger.warning(f"[doctor_live] watchdog unavailable, polling instead: {e}")
+    return PollingWatcher(target_dir, ignore_patterns)
+
+
+# =============================================================================
+# SERVICE
+# =============================================================================
+
+class LiveDoctor:
+    """Doctor issues kept current by re-running only the checks changes affect."""
+
+    def __init__(
+        self,
+        target_dir: Path,
+        config: Optional[DoctorConfig] = None,
+        watcher=None,
+        full_rescan_every: float = FULL_RESCAN_SECONDS,
+    ):
+        self.target_dir = Path(target_dir)
+        self.config = config or load_doctor_config(self.target_dir)
+        self.full_rescan_every = full_rescan_every
+        self._watcher = watcher
+        self._by_check: Dict[str, List[DoctorIssue]] = {}
+        self._result: Optional[Dict[str, Any]] = None
+        self._keys: Dict[Tuple[str, str, str], DoctorIssue] = {}
+        self._eval_lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._subscribers: List[Callable[[IssueDiff], None]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._last_full = 0.0
+        self.last_error: Optional[str] = None
+        self.stats = {"full_runs": 0, "incremental_runs": 0, "checks_run": 0, "checks_skipped": 0}
+
+    # -- subscribers -------------------------------------------------------
+
+    def subscribe(self, callback: Callable[[IssueDiff], None]) -> Callable[[], None]:
+        """Call `callback(diff)` after every evaluation that changed issues; returns unsubscribe."""
+        self._subscribers.append(callback)
+
+        def unsubscribe():
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+        return unsubscribe
+
+    def _publish(self, diff: IssueDiff) -> None:
+        for callback in list(self._subscribers):
+            try:
+                callback(diff)
+            except Exception as e:
+                logger.warning(f"[doctor_live] subscriber failed: {e}")
+
+    # -- evaluation --------------------------------------------------------
+
+    def refresh(self, changed: Optional[Iterable[str]] = None) -> IssueDiff:
+        """Re-evaluate for these changed paths (None: every check) and publish the diff."""
+        started = time.perf_counter()
+        paths = sorted(set(changed)) if changed is not None else []
+        with self._eval_lock:
+            names = None if changed is None or not self._by_check else affected_checks(paths)
+            if names is None:
+                if changed is not None:
+                    self.config = load_doctor_config(self.target_dir)
+                self._by_check = run_doctor_checks(self.target_dir, self.config)
+                self._last_full = time.monotonic()
+                self.stats["full_runs"] += 1
+                ran = [name for name, _ in DOCTOR_CHECKS]
+            else:
+                self._by_check.update(run_doctor_checks(self.target_dir, self.config, names))
+                self.stats["incremental_runs"] += 1
+                ran = names
+            self.stats["checks_run"] += len(ran)
+            self.stats["checks_skipped"] += len(DOCTOR_CHECKS) - len(ran)
+
+            issues = [issue for name, _ in DOCTOR_CHECKS for issue in self._by_check.get(name, [])]
+            issues, ignored, false_positives = filter_doctor_issues(issues, self.target_dir, self.config)
+            result = build_doctor_result(self.target_dir, issues, ignored, false_positives)
+
+            keys = {_issue_key(i): i for i in issues}
+            previous = self._result
+            diff = IssueDiff(
+                added=[i for k, i in keys.items() if k not in self._keys],
+                removed=[i for k, i in self._keys.items() if k not in keys],
+                score=result["score"],
+                previous_score=previous["score"] if previous else None,
+                changed_paths=paths,
+                checks_run=ran,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+            )
+            result["live"] = {
+                "updated_at": time.time(),
+                "changed_paths": paths,
+                "checks_run": len(ran),
+                "elapsed_ms": round(diff.elapsed_ms, 1),
+            }
+            self._keys = keys
+            self._result = result
+            save_doctor_result(self.target_dir, result, self.config)
+
+        if previous is None or not diff.empty:
+            self._publish(diff)
+        # After publishing, so result() callers never see a diff for a result they already have
+        self._ready.set()
+        return diff
+
+    def result(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Latest run_doctor()-shaped result; evaluates now if the service is not running."""
+        if self._thread is None and self._result is None:
+            self.refresh()
+        self._ready.wait(timeout)
+        return self._result
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self) -> "LiveDoctor":
+        if self._thread is not None:
+            return self
+        if self._watcher is None:
+            self._watcher = make_watcher(self.target_dir, self.config.ignore)
+        self._thread = threading.Thread(target=self._run, name="doctor-live", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.stop()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _safe_refresh(self, changed: Optional[Set[str]]) -> None:
+        try:
+            self.refresh(changed)
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            logger.exception("[doctor_live] evaluation failed")
+            self._ready.set()  # result() returns the last good result (or None)
+
+    def _run(self) -> None:
+        try:
+            self._watcher.start()
+        except Exception as e:
+            logger.warning(f"[doctor_live] watcher failed to start, polling instead: {e}")
+            self._watcher = PollingWatcher(self.target_dir, self.config.ignore)
+            self._watcher.start()
+        self._safe_refresh(None)
+        while not self._stop.is_set():
+            changed = self._watcher.poll(timeout=1.0)
+            if self._stop.is_set():
+                break
+            if changed:
+                self._safe_refresh(changed)
+            elif time.monotonic() - self._last_full > self.full_rescan_every:
+                self._safe_refresh(None)
+
+
+_SHARED: Dict[Path, LiveDoctor] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def get_live_doctor(target_dir: Path) -> LiveDoctor:
+    """The running LiveDoctor for this project, started on first use."""
+    key = Path(target_dir).resolve()
+    with _SHARED_LOCK:
+        live = _SHARED.get(key)
+        if live is None:
+            live = _SHARED[key] = LiveDoctor(key).start()
+        return live
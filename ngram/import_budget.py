@@ -0,0 +1,139 @@
+"""
+Import-time benchmark for ngram CLI cold start.
+
+Runs `python -X importtime` in a fresh interpreter, parses the report and
+checks the cost of `import ngram.cli` (plus a subcommand's module) against a
+fixed budget. Hook-invoked commands run on every agent action, so their
+startup must not pay for rich, yaml, numpy or google-genai.
+
+Modules the bare interpreter imports at startup (site, encodings, .pth
+hooks) are measured separately and excluded.
+
+Usage:
+    python -m ngram.import_budget                 # bare CLI + hook commands
+    python -m ngram.import_budget doctor          # any subcommand
+    python -m ngram.import_budget --top 20 --budget-ms 80
+
+DOCS: docs/ngram_cli_core/PATTERNS_ngram_cli_core.md
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+# Cold-start budget for `import ngram.cli` + one hook-invoked subcommand
+HOOK_BUDGET_MS = 150.0
+
+# Subcommands invoked from agent hooks / prompts
+HOOK_COMMANDS = ("context", "prompt")
+
+# Must never load on the hook path
+HEAVY_MODULES = ("rich", "yaml", "numpy", "google.genai", "textual")
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass
+class ImportEntry:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportReport:
+    statement: str
+    entries: List[ImportEntry] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        """Cumulative time of the statement's top-level imports."""
+        return sum(e.cumulative_us for e in self.entries if e.depth == 0) / 1000
+
+    @property
+    def modules(self) -> List[str]:
+        return [e.module for e in self.entries]
+
+    def imported(self, prefix: str) -> bool:
+        return any(m == prefix or m.startswith(prefix + ".") for m in self.modules)
+
+    def slowest(self, n: int = 10) -> List[ImportEntry]:
+        return sorted(self.entries, key=lambda e: e.self_us, reverse=True)[:n]
+
+
+def parse_importtime(stderr: str) -> List[ImportEntry]:
+    """Parse `-X importtime` output (stderr) into entries."""
+    entries = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append(ImportEntry(
+                module=module,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=max(0, len(indent) - 1) // 2,
+            ))
+    return entries
+
+
+def _run(statement: str, python: str) -> List[ImportEntry]:
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def measure_import(statement: str = "import ngram.cli", python: Optional[str] = None) -> ImportReport:
+    """Measure `statement` in a fresh interpreter, minus interpreter startup."""
+    python = python or sys.executable
+    startup = {e.module for e in _run("pass", python)}
+    entries = [e for e in _run(statement, python) if e.module not in startup]
+    return ImportReport(statement=statement, entries=entries)
+
+
+def measure_command(command: Optional[str] = None, python: Optional[str] = None) -> ImportReport:
+    """Startup imports for `ngram <command>`: the CLI plus that command's module."""
+    statement = "import ngram.cli"
+    if command:
+        from .cli import _LAZY_COMMANDS, _SUBCOMMAND_ENTRY
+        module_name, _ = _LAZY_COMMANDS[_SUBCOMMAND_ENTRY[command]]
+        statement += f"; import ngram{module_name}"
+    return measure_import(statement, python)
+
+
+def format_report(report: ImportReport, top: int = 10) -> str:
+    lines = [f"{report.statement}: {report.total_ms:.1f}ms, {len(report.entries)} modules"]
+    for e in report.slowest(top):
+        lines.append(f"  {e.self_us / 1000:7.2f}ms self  {e.cumulative_us / 1000:7.2f}ms cum  {e.module}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="ngram CLI import-time benchmark")
+    parser.add_argument("commands", nargs="*", help="Subcommands to measure (default: bare CLI + hook commands)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list")
+    parser.add_argument("--budget-ms", type=float, default=HOOK_BUDGET_MS, help="Fail above this")
+    args = parser.parse_args(argv)
+
+    over_budget = False
+    for command in args.commands or [None, *HOOK_COMMANDS]:
+        report = measure_command(command)
+        print(format_report(report, args.top))
+        heavy = [m for m in HEAVY_MODULES if report.imported(m)]
+        if heavy:
+            print(f"  heavy modules loaded: {', '.join(heavy)}")
+        # Heavy imports are only a failure on the hook path
+        if report.total_ms > args.budget_ms or (heavy and (command is None or command in HOOK_COMMANDS)):
+            over_budget = True
+        print()
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,276 @@
+"""
+Single-pass marker scanner.
+
+Walks the project tree once, skips ignored directories, logs and binary
+files, and matches every marker family with one combined regex:
+
+- ESCALATION / PROPOSITION / TODO: @ngram:* tags. Each hit carries the
+  priority, title and resolved status read from the 500 chars after it.
+- GAPS_SECTION / LEGACY_TODO / LEGACY_IDEA / LEGACY_QUESTION: legacy
+  line-start formats reported by doctor_check_legacy_markers.
+
+Per-file hits are cached in .ngram/state/marker_cache.json. An entry is
+reused without reading the file while size and mtime are unchanged, and
+after a re-read while the content hash is unchanged.
+
+Contains:
+- MarkerHit / FileMarkers / MarkerScan: Structured results
+- scan_markers: Walk + match + cache
+"""
+# DOCS: docs/cli/core/PATTERNS_Why_CLI_Over_Copy.md
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .doctor_files import is_binary_file, should_ignore_path
+from .doctor_types import DoctorConfig
+
+ESCALATION_TAGS = (
+    "@ngram:doctor:escalation",
+    "@ngram:escalation",
+)
+
+PROPOSITION_TAGS = (
+    "@ngram:doctor:proposition",
+    "@ngram:proposition",
+)
+
+TODO_TAGS = (
+    "@ngram:doctor:todo",
+    "@ngram:todo",
+)
+
+TAG_FAMILIES: Dict[str, Tuple[str, ...]] = {
+    "ESCALATION": ESCALATION_TAGS,
+    "PROPOSITION": PROPOSITION_TAGS,
+    "TODO": TODO_TAGS,
+}
+
+# Line-start patterns for pre-@ngram marker formats
+LEGACY_FAMILIES: Dict[str, str] = {
+    "GAPS_SECTION": r"^## GAPS / IDEAS / QUESTIONS",
+    "LEGACY_TODO": r"^- \[ \] ",
+    "LEGACY_IDEA": r"^- IDEA:",
+    "LEGACY_QUESTION": r"^- QUESTION:",
+}
+
+MARKER_CACHE_PATH = Path(".ngram") / "state" / "marker_cache.json"
+CACHE_VERSION = 1
+
+# How far after a tag its YAML fields are read
+SECTION_CHARS = 500
+SNIPPET_CHARS = 200
+
+_PRIORITY = re.compile(r"priority:\s*(\d+|low|medium|high|critical)", re.IGNORECASE)
+_TITLE = re.compile(r"(?:title|task_name):\s*[\"']?([^\"'\n]+)")
+_RESOLVED = re.compile(r"status:\s*resolved", re.IGNORECASE)
+_TEXT_PRIORITY = {"critical": 10, "high": 8, "medium": 5, "low": 2}
+
+
+def _build_pattern() -> re.Pattern:
+    parts = [
+        f"(?P<{family}>{'|'.join(re.escape(t) for t in tags)})"
+        for family, tags in TAG_FAMILIES.items()
+    ]
+    parts += [f"(?P<{family}>{pattern})" for family, pattern in LEGACY_FAMILIES.items()]
+    return re.compile("|".join(parts), re.MULTILINE)
+
+
+_MARKERS = _build_pattern()
+# Cached hits are only valid for the patterns that produced them
+_PATTERN_KEY = hashlib.sha1(_MARKERS.pattern.encode()).hexdigest()[:12]
+
+
+@dataclass
+class MarkerHit:
+    """One marker occurrence."""
+    family: str
+    tag: str
+    offset: int
+    line: int
+    resolved: bool = False
+    priority: Optional[int] = None  # None when the section has no priority field
+    title: str = ""
+    snippet: str = ""
+
+
+@dataclass
+class FileMarkers:
+    """All marker hits in one file, in file order."""
+    path: str
+    hits: List[MarkerHit] = field(default_factory=list)
+
+    def family(self, name: str) -> List[MarkerHit]:
+        return [h for h in self.hits if h.family == name]
+
+    def tags(self, name: str) -> List[str]:
+        """Tags of a family present in the file, in declaration order."""
+        present = {h.tag for h in self.hits if h.family == name}
+        return [t for t in TAG_FAMILIES[name] if t in present]
+
+    def lead(self, name: str) -> List[MarkerHit]:
+        """First hit of each present tag, in declaration order."""
+        firsts: Dict[str, MarkerHit] = {}
+        for hit in self.hits:
+            if hit.family == name:
+                firsts.setdefault(hit.tag, hit)
+        return [firsts[t] for t in TAG_FAMILIES[name] if t in firsts]
+
+    def priority(self, name: str, default: int = 5) -> int:
+        for hit in self.lead(name):
+            if hit.priority is not None:
+                return hit.priority
+        return default
+
+    def title(self, name: str) -> str:
+        for hit in self.lead(name):
+            if hit.title:
+                return hit.title
+        return ""
+
+    def unresolved(self, name: str) -> int:
+        return sum(1 for h in self.hits if h.family == name and not h.resolved)
+
+
+@dataclass
+class MarkerScan:
+    """Result of one tree walk."""
+    files: List[str] = field(default_factory=list)  # every text file scanned
+    markers: Dict[str, FileMarkers] = field(default_factory=dict)  # files with hits
+    cache_hits: int = 0
+    files_read: int = 0
+
+    def with_family(self, name: str) -> List[FileMarkers]:
+        return [fm for fm in self.markers.values() if any(h.family == name for h in fm.hits)]
+
+
+def _parse_priority(section: str) -> Optional[int]:
+    match = _PRIORITY.search(section)
+    if not match:
+        return None
+    val = match.group(1).lower()
+    if val.isdigit():
+        return int(val)
+    return _TEXT_PRIORITY.get(val, 5)
+
+
+def match_markers(content: str) -> List[MarkerHit]:
+    """Run the combined pattern over one file's content."""
+    hits = []
+    line = 1
+    last = 0
+    for match in _MARKERS.finditer(content):
+        pos = match.start()
+        line += content.count("\n", last, pos)
+        last = pos
+        family = match.lastgroup
+        hit = MarkerHit(family=family, tag=match.group(), offset=pos, line=line)
+        if family in TAG_FAMILIES:
+            section = content[pos:pos + SECTION_CHARS]
+            title_match = _TITLE.search(section)
+            hit.resolved = bool(_RESOLVED.search(section))
+            hit.priority = _parse_priority(section)
+            hit.title = title_match.group(1).strip() if title_match else ""
+            hit.snippet = content[pos:pos + SNIPPET_CHARS]
+        hits.append(hit)
+    return hits
+
+
+def _is_log_file(name: str) -> bool:
+    return name.endswith(".log")
+
+
+def _load_cache(target_dir: Path) -> Dict[str, dict]:
+    try:
+        payload = json.loads((target_dir / MARKER_CACHE_PATH).read_text())
+    except (OSError, ValueError):
+        return {}
+    if payload.get("version") != CACHE_VERSION or payload.get("patterns") != _PATTERN_KEY:
+        return {}
+    return payload.get("files", {})
+
+
+def _save_cache(target_dir: Path, entries: Dict[str, dict]) -> None:
+    path = target_dir / MARKER_CACHE_PATH
+    if not path.parent.exists():
+        return
+    payload = {"version": CACHE_VERSION, "patterns": _PATTERN_KEY, "files": entries}
+    try:
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(payload))
+        tmp.replace(path)
+    except OSError:
+        pass
+
+
+def _decode(data: bytes) -> str:
+    # Same text read_text(errors="ignore") would give
+    return data.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def scan_markers(target_dir: Path, config: DoctorConfig, use_cache: bool = True) -> MarkerScan:
+    """Walk target_dir once and match all marker families in every text file."""
+    target_dir = Path(target_dir)
+    root = str(target_dir)
+    old = _load_cache(target_dir) if use_cache else {}
+    entries: Dict[str, dict] = {}
+    scan = MarkerScan()
+    cache_rel = str(MARKER_CACHE_PATH)
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        dirnames[:] = sorted(
+            d for d in dirnames
+            if d != ".git" and not should_ignore_path(current / d, config.ignore, target_dir)
+        )
+        for name in sorted(filenames):
+            if _is_log_file(name):
+                continue
+            path = current / name
+            rel_path = os.path.relpath(path, root).replace("\\", "/")
+            if rel_path.startswith(cache_rel):
+                continue
+            if should_ignore_path(path, config.ignore, target_dir):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            entry = old.get(rel_path)
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                scan.cache_hits += 1
+            else:
+                if is_binary_file(path):
+                    entry = {"binary": True}
+                else:
+                    try:
+                        data = path.read_bytes()
+                    except OSError:
+                        continue
+                    digest = hashlib.sha1(data).hexdigest()
+                    scan.files_read += 1
+                    if entry and entry.get("sha1") == digest:
+                        scan.cache_hits += 1
+                    else:
+                        hits = match_markers(_decode(data))
+                        entry = {"sha1": digest, "hits": [asdict(h) for h in hits]}
+                entry = {**entry, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            entries[rel_path] = entry
+
+            if entry.get("binary"):
+                continue
+            scan.files.append(rel_path)
+            if entry["hits"]:
+                scan.markers[rel_path] = FileMarkers(
+                    path=rel_path, hits=[MarkerHit(**h) for h in entry["hits"]]
+                )
+
+    if use_cache:
+        _save_cache(target_dir, entries)
+    return scan
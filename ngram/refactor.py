@@ -10,29 +10,18 @@ import argparse
 import shlex
 import shutil
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import List, Optional, Tuple
 
 from .doctor import doctor_command
+from .refactor_rewrite import (
+    TEXT_EXTENSIONS,
+    ReplacementSet,
+    format_rewrite_summary,
+    rewrite_references,
+)
 from .repo_overview import generate_and_save as generate_overview
 
 
-TEXT_EXTENSIONS = {
-    ".md",
-    ".yaml",
-    ".yml",
-    ".txt",
-    ".py",
-    ".json",
-    ".ini",
-    ".cfg",
-    ".sh",
-    ".ts",
-    ".js",
-    ".rst",
-    ".csv",
-}
-
-
 def _posix_relative(target_dir: Path, path: Path) -> str:
     try:
         rel = path.relative_to(target_dir)
@@ -41,34 +30,6 @@ def _posix_relative(target_dir: Path, path: Path) -> str:
     return rel.as_posix()
 
 
-def _collect_text_files(target_dir: Path) -> Iterable[Path]:
-    for file_path in target_dir.rglob("*"):
-        if not file_path.is_file():
-            continue
-        if file_path.suffix.lower() not in TEXT_EXTENSIONS:
-            continue
-        yield file_path
-
-
-def _replace_text(file_path: Path, replacements: List[Tuple[str, str]]) -> bool:
-    try:
-        text = file_path.read_text()
-    except UnicodeDecodeError:
-        return False
-
-    updated = text
-    changed = False
-    for old, new in replacements:
-        if old in updated:
-            updated = updated.replace(old, new)
-            changed = True
-
-    if changed:
-        file_path.write_text(updated)
-
-    return changed
-
-
 def _resolve_path(target_dir: Path, path: Path) -> Path:
     return path if path.is_absolute() else target_dir / path
 
@@ -135,19 +96,9 @@ def _parse_batch_line(line: str) -> Tuple[str, List[str]]:
     return parts[0], parts[1:]
 
 
-def _run_batch_actions(
-    target_dir: Path,
-    filelist_path: Path,
-    module_translation: Tuple[str, str] | None,
-    skip_existing: bool,
-    overwrite: bool,
-) -> None:
-    filelist_path = _resolve_path(target_dir, filelist_path)
-    if not filelist_path.exists():
-        raise FileNotFoundError(f"Filelist not found: {filelist_path}")
-
-    lines = filelist_path.read_text().splitlines()
-    changed = False
+def _parse_batch_moves(target_dir: Path, lines: List[str]) -> List[Tuple[int, Path, Path]]:
+    """Parse every filelist line into (line number, old path, new path)."""
+    moves: List[Tuple[int, Path, Path]] = []
     for index, raw in enumerate(lines, start=1):
         stripped = raw.strip()
         if not stripped or stripped.startswith("#"):
@@ -156,52 +107,101 @@ def _run_batch_actions(
         if action in {"rename", "move"}:
             if len(args) < 2:
                 raise ValueError(f"Line {index}: expected '{action} <old> <new>'")
-            moved = refactor_rename(
-                target_dir,
-                Path(args[0]),
-                Path(args[1]),
-                module_translation=module_translation,
-                run_post=False,
-                skip_existing=skip_existing,
-                overwrite=overwrite,
-            )
-            changed = changed or moved
-            continue
-        if action == "promote":
+            old_path, new_path = Path(args[0]), Path(args[1])
+        elif action == "promote":
             if not args:
                 raise ValueError(f"Line {index}: expected 'promote <source> [target]'")
-            target = Path(args[1]) if len(args) > 1 else None
-            moved = refactor_promote(
-                target_dir,
-                Path(args[0]),
-                target=target,
-                module_translation=module_translation,
-                run_post=False,
-                skip_existing=skip_existing,
-                overwrite=overwrite,
-            )
-            changed = changed or moved
-            continue
-        if action == "demote":
+            old_path = Path(args[0])
+            new_path = _promote_target(target_dir, old_path, Path(args[1]) if len(args) > 1 else None)
+        elif action == "demote":
             if len(args) < 2:
                 raise ValueError(f"Line {index}: expected 'demote <module> <area>'")
-            moved = refactor_demote(
-                target_dir,
-                Path(args[0]),
-                args[1],
-                module_translation=module_translation,
-                run_post=False,
-                skip_existing=skip_existing,
-                overwrite=overwrite,
-            )
-            changed = changed or moved
-            continue
-        raise ValueError(f"Line {index}: unsupported action '{action}'")
+            old_path = Path(args[0])
+            new_path = _demote_target(target_dir, old_path, args[1])
+        else:
+            raise ValueError(f"Line {index}: unsupported action '{action}'")
+        moves.append((index, old_path, new_path))
+    return moves
 
-    if changed:
-        _run_post_refactor_workflow(target_dir)
-    else:
+
+class _PlannedMoves:
+    """Moves of a batch that have not touched the disk, for existence checks."""
+
+    def __init__(self) -> None:
+        self.moves: List[Tuple[Path, Path]] = []
+
+    def record(self, old_path: Path, new_path: Path) -> None:
+        self.moves.append((old_path, new_path))
+
+    def origin(self, path: Path) -> Optional[Path]:
+        """Where `path` is on disk before the recorded moves; None if moved away."""
+        for old_path, new_path in reversed(self.moves):
+            if path == new_path or new_path in path.parents:
+                path = old_path / path.relative_to(new_path)
+            elif path == old_path or old_path in path.parents:
+                return None
+        return path
+
+    def exists(self, path: Path) -> bool:
+        origin = self.origin(path)
+        return origin is not None and origin.exists()
+
+
+def _check_batch_sources(target_dir: Path, moves: List[Tuple[int, Path, Path]]) -> None:
+    """Fail before anything moves if a source won't exist when its line runs."""
+    planned = _PlannedMoves()
+    for index, old_path, new_path in moves:
+        old_path = _resolve_path(target_dir, old_path)
+        if not planned.exists(old_path):
+            raise FileNotFoundError(f"Line {index}: source path does not exist: {old_path}")
+        planned.record(old_path, _resolve_path(target_dir, new_path))
+
+
+def _run_batch_actions(
+    target_dir: Path,
+    filelist_path: Path,
+    module_translation: Tuple[str, str] | None,
+    skip_existing: bool,
+    overwrite: bool,
+    dry_run: bool = False,
+) -> None:
+    """Apply every move in the filelist, then rewrite references in one pass.
+
+    The whole filelist is parsed and checked before the first move. If a move
+    still fails, references are rewritten for the moves already applied before
+    the error propagates, so the tree is never left pointing at moved paths.
+    """
+    filelist_path = _resolve_path(target_dir, filelist_path)
+    if not filelist_path.exists():
+        raise FileNotFoundError(f"Filelist not found: {filelist_path}")
+
+    moves = _parse_batch_moves(target_dir, filelist_path.read_text().splitlines())
+    _check_batch_sources(target_dir, moves)
+
+    replacements = ReplacementSet()
+    # Dry runs track moves here instead of touching the filesystem
+    virtual = _PlannedMoves() if dry_run else None
+    completed = False
+    try:
+        for _, old_path, new_path in moves:
+            moved = _apply_move(target_dir, old_path, new_path, skip_existing, overwrite, virtual)
+            if moved:
+                replacements.extend(moved)
+        completed = True
+    finally:
+        if not completed and replacements and not dry_run:
+            print("Batch stopped early; updating references for the moves already applied.")
+            _rewrite_all(target_dir, replacements, module_translation, dry_run)
+
+    if not replacements:
         print("No refactor changes applied; skipping overview/doctor.")
+        return
+
+    _rewrite_all(target_dir, replacements, module_translation, dry_run)
+    if dry_run:
+        print("Dry run: no files were moved or written.")
+    else:
+        _run_post_refactor_workflow(target_dir)
 
 
 def _handle_existing_target(target: Path, skip_existing: bool, overwrite: bool) -> bool:
@@ -219,47 +219,90 @@ def _handle_existing_target(target: Path, skip_existing: bool, overwrite: bool)
     raise FileExistsError(f"Target path already exists: {target}")
 
 
-def refactor_rename(
+def _apply_move(
     target_dir: Path,
     old_path: Path,
     new_path: Path,
-    module_translation: Tuple[str, str] | None = None,
-    run_post: bool = True,
-    skip_existing: bool = False,
-    overwrite: bool = True,
-) -> bool:
+    skip_existing: bool,
+    overwrite: bool,
+    virtual: Optional[_PlannedMoves] = None,
+) -> Optional[List[Tuple[str, str]]]:
+    """Move old_path to new_path and return the reference replacements it needs.
+
+    Returns None when the move is skipped. With `virtual` (dry run) nothing is
+    touched; the move is recorded there and existence resolved through it.
+    """
     old_path = _resolve_path(target_dir, old_path)
     new_path = _resolve_path(target_dir, new_path)
+    exists = virtual.exists if virtual is not None else Path.exists
 
-    if not old_path.exists():
+    if not exists(old_path):
         raise FileNotFoundError(f"Source path does not exist: {old_path}")
     if old_path.resolve() == new_path.resolve():
         print(f"Skipping no-op move: {old_path}")
-        return False
-    if not _handle_existing_target(new_path, skip_existing, overwrite):
-        return False
-
-    is_dir = old_path.is_dir()
-    doc_replacements = _gather_replacements(
+        return None
+
+    if virtual is None:
+        if not _handle_existing_target(new_path, skip_existing, overwrite):
+            return None
+    elif exists(new_path):
+        if skip_existing:
+            print(f"Skipping existing target: {new_path}")
+            return None
+        if not overwrite:
+            raise FileExistsError(f"Target path already exists: {new_path}")
+
+    source = virtual.origin(old_path) if virtual is not None else old_path
+    is_dir = source.is_dir() if source is not None and source.exists() else not old_path.suffix
+    replacements = _gather_replacements(
         _posix_relative(target_dir, old_path), _posix_relative(target_dir, new_path), is_dir
     )
 
-    print(f"Moving {old_path} → {new_path}")
-    new_path.parent.mkdir(parents=True, exist_ok=True)
-    old_path.rename(new_path)
+    if virtual is not None:
+        print(f"Would move {old_path} → {new_path}")
+        virtual.record(old_path, new_path)
+    else:
+        print(f"Moving {old_path} → {new_path}")
+        new_path.parent.mkdir(parents=True, exist_ok=True)
+        old_path.rename(new_path)
+    return replacements
 
-    print("Updating doc references …")
-    updated_files = 0
-    for file_path in _collect_text_files(target_dir):
-        if _replace_text(file_path, doc_replacements):
-            updated_files += 1
 
-    print(f"Updated references in {updated_files} files.")
+def _rewrite_all(
+    target_dir: Path,
+    replacements: ReplacementSet,
+    module_translation: Tuple[str, str] | None,
+    dry_run: bool,
+) -> None:
+    print("Updating doc references …")
+    report = rewrite_references(target_dir, replacements, dry_run=dry_run)
+    print(format_rewrite_summary(report, replacements))
 
-    if _update_modules_yaml(target_dir, doc_replacements, module_translation):
+    # modules.yaml references were rewritten by the pass above; re-applying
+    # them would rewrite new paths that contain the old ones (a -> a_v2_v2)
+    if not dry_run and _update_modules_yaml(target_dir, [], module_translation):
         print("modules.yaml updated.")
 
-    if run_post:
+
+def refactor_rename(
+    target_dir: Path,
+    old_path: Path,
+    new_path: Path,
+    module_translation: Tuple[str, str] | None = None,
+    run_post: bool = True,
+    skip_existing: bool = False,
+    overwrite: bool = True,
+    dry_run: bool = False,
+) -> bool:
+    replacements = _apply_move(
+        target_dir, old_path, new_path, skip_existing, overwrite, _PlannedMoves() if dry_run else None
+    )
+    if replacements is None:
+        return False
+
+    _rewrite_all(target_dir, ReplacementSet(replacements), module_translation, dry_run)
+
+    if run_post and not dry_run:
         _run_post_refactor_workflow(target_dir)
     return True
 
@@ -272,6 +315,7 @@ def refactor_move(
     run_post: bool = True,
     skip_existing: bool = False,
     overwrite: bool = True,
+    dry_run: bool = False,
 ) -> bool:
     return refactor_rename(
         target_dir,
@@ -281,9 +325,30 @@ def refactor_move(
         run_post=run_post,
         skip_existing=skip_existing,
         overwrite=overwrite,
+        dry_run=dry_run,
     )
 
 
+def _promote_target(target_dir: Path, source: Path, target: Path | None) -> Path:
+    if target:
+        return _resolve_path(target_dir, target)
+    source_path = _resolve_path(target_dir, source)
+    try:
+        rel_parts = source_path.relative_to(target_dir).parts
+    except ValueError:
+        raise ValueError("Source path must live inside project root")
+    if len(rel_parts) < 3 or rel_parts[0] != "docs":
+        raise ValueError("Promote requires a `docs/<area>/<module>` path")
+    module_name = rel_parts[-1]
+    return target_dir / "docs" / module_name
+
+
+def _demote_target(target_dir: Path, module_path: Path, target_area: str) -> Path:
+    if not target_area:
+        raise ValueError("Demote requires --target-area to specify the destination area")
+    return target_dir / "docs" / target_area / module_path.name
+
+
 def refactor_promote(
     target_dir: Path,
     source: Path,
@@ -292,28 +357,17 @@ def refactor_promote(
     run_post: bool = True,
     skip_existing: bool = False,
     overwrite: bool = True,
+    dry_run: bool = False,
 ) -> bool:
-    source_path = _resolve_path(target_dir, source)
-    if target:
-        new_path = _resolve_path(target_dir, target)
-    else:
-        try:
-            rel_parts = source_path.relative_to(target_dir).parts
-        except ValueError:
-            raise ValueError("Source path must live inside project root")
-        if len(rel_parts) < 3 or rel_parts[0] != "docs":
-            raise ValueError("Promote requires a `docs/<area>/<module>` path")
-        module_name = rel_parts[-1]
-        new_path = target_dir / "docs" / module_name
-
     return refactor_rename(
         target_dir,
-        source_path,
-        new_path,
+        _resolve_path(target_dir, source),
+        _promote_target(target_dir, source, target),
         module_translation=module_translation,
         run_post=run_post,
         skip_existing=skip_existing,
         overwrite=overwrite,
+        dry_run=dry_run,
     )
 
 
@@ -325,22 +379,17 @@ def refactor_demote(
     run_post: bool = True,
     skip_existing: bool = False,
     overwrite: bool = True,
+    dry_run: bool = False,
 ) -> bool:
-    module_path = _resolve_path(target_dir, module_path)
-    if not target_area:
-        raise ValueError("Demote requires --target-area to specify the destination area")
-
-    module_name = module_path.name
-    new_path = target_dir / "docs" / target_area / module_name
-
     return refactor_rename(
         target_dir,
-        module_path,
-        new_path,
+        _resolve_path(target_dir, module_path),
+        _demote_target(target_dir, module_path, target_area),
         module_translation=module_translation,
         run_post=run_post,
         skip_existing=skip_existing,
         overwrite=overwrite,
+        dry_run=dry_run,
     )
 
 
@@ -348,6 +397,7 @@ def refactor_command(args: argparse.Namespace) -> int:
     target_dir = Path(args.dir or Path.cwd())
 
     module_translation = None
+    dry_run = getattr(args, "dry_run", False)
     if getattr(args, "module_old", None) and getattr(args, "module_new", None):
         module_translation = (args.module_old, args.module_new)
 
@@ -360,6 +410,7 @@ def refactor_command(args: argparse.Namespace) -> int:
                 module_translation=module_translation,
                 skip_existing=args.skip_existing,
                 overwrite=args.overwrite,
+                dry_run=dry_run,
             )
             return 0
         if args.action == "move":
@@ -370,6 +421,7 @@ def refactor_command(args: argparse.Namespace) -> int:
                 module_translation=module_translation,
                 skip_existing=args.skip_existing,
                 overwrite=args.overwrite,
+                dry_run=dry_run,
             )
             return 0
         if args.action == "batch":
@@ -379,6 +431,7 @@ def refactor_command(args: argparse.Namespace) -> int:
                 module_translation=module_translation,
                 skip_existing=args.skip_existing,
                 overwrite=args.overwrite,
+                dry_run=dry_run,
             )
             return 0
         if args.action == "promote":
@@ -389,6 +442,7 @@ def refactor_command(args: argparse.Namespace) -> int:
                 module_translation=module_translation,
                 skip_existing=args.skip_existing,
                 overwrite=args.overwrite,
+                dry_run=dry_run,
             )
             return 0
         if args.action == "demote":
@@ -399,6 +453,7 @@ def refactor_command(args: argparse.Namespace) -> int:
                 module_translation=module_translation,
                 skip_existing=args.skip_existing,
                 overwrite=args.overwrite,
+                dry_run=dry_run,
             )
             return 0
 
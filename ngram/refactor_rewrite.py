@@ -0,0 +1,229 @@
+"""
+Bulk reference rewriting for ngram refactor.
+
+All (old, new) replacements of a refactor batch are compiled into one
+regex alternation (longest `old` first) and applied to every text file in
+a single pass. Files are scanned on a thread pool. Changed files are
+written atomically: temp file in the same directory, then os.replace.
+
+Replacements added later rewrite the targets of earlier ones, so a batch
+that renames a -> b and then b -> c rewrites `a` straight to `c`. A later
+move of something inside an earlier target (a -> b, then b/x -> c/x) adds
+the composed replacement a/x -> c/x. The replacements of one move (`dir`
+and `dir/`) are added together and do not rewrite each other.
+
+DOCS: docs/cli/core/PATTERNS_Why_CLI_Over_Copy.md
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+TEXT_EXTENSIONS = {
+    ".md",
+    ".yaml",
+    ".yml",
+    ".txt",
+    ".py",
+    ".json",
+    ".ini",
+    ".cfg",
+    ".sh",
+    ".ts",
+    ".js",
+    ".rst",
+    ".csv",
+}
+
+# Directories never rewritten
+SKIP_DIRS = {".git"}
+
+
+def _inside(path: str, prefix: str) -> bool:
+    """path lies strictly below prefix (a directory, with or without its slash)."""
+    if len(path) <= len(prefix) or not path.startswith(prefix):
+        return False
+    return prefix.endswith("/") or path[len(prefix)] == "/"
+
+
+class ReplacementSet:
+    """Ordered (old, new) replacements compiled into one matcher."""
+
+    def __init__(self, replacements: Iterable[Tuple[str, str]] = ()):
+        self._targets: Dict[str, str] = {}
+        self._pattern: Optional[re.Pattern] = None
+        self.extend(replacements)
+
+    def add(self, old: str, new: str) -> None:
+        self.extend([(old, new)])
+
+    def extend(self, replacements: Iterable[Tuple[str, str]]) -> None:
+        """Add one move's replacements; they rewrite earlier targets together."""
+        group = ReplacementSet.__new__(ReplacementSet)
+        group._targets = {old: new for old, new in replacements if old}
+        group._pattern = None
+        if not group._targets:
+            return
+        # Moves inside an earlier target also apply to the path it came from
+        composed = {
+            key + old[len(target):]: new
+            for key, target in self._targets.items()
+            for old, new in group._targets.items()
+            if _inside(old, target)
+        }
+        # Later moves apply to what earlier ones produce
+        for key, target in self._targets.items():
+            self._targets[key] = group.apply(target)[0]
+        for old, new in chain(group._targets.items(), composed.items()):
+            self._targets.setdefault(old, new)
+        self._pattern = None
+
+    def __bool__(self) -> bool:
+        return bool(self._targets)
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def items(self) -> List[Tuple[str, str]]:
+        return list(self._targets.items())
+
+    @property
+    def pattern(self) -> re.Pattern:
+        if self._pattern is None:
+            olds = sorted(self._targets, key=len, reverse=True)
+            self._pattern = re.compile("|".join(re.escape(old) for old in olds))
+        return self._pattern
+
+    def apply(self, text: str) -> Tuple[str, Dict[str, int]]:
+        """Return (rewritten text, match count per old string)."""
+        counts: Dict[str, int] = {}
+        if not self._targets:
+            return text, counts
+
+        def substitute(match: re.Match) -> str:
+            old = match.group()
+            counts[old] = counts.get(old, 0) + 1
+            return self._targets[old]
+
+        return self.pattern.sub(substitute, text), counts
+
+
+@dataclass
+class RewriteReport:
+    """Outcome of one rewrite pass."""
+    files_scanned: int = 0
+    changed: Dict[str, Dict[str, int]] = field(default_factory=dict)  # rel path -> old -> count
+    errors: Dict[str, str] = field(default_factory=dict)
+    dry_run: bool = False
+
+    def totals(self) -> Dict[str, int]:
+        totals: Dict[str, int] = {}
+        for counts in self.changed.values():
+            for old, count in counts.items():
+                totals[old] = totals.get(old, 0) + count
+        return totals
+
+
+def collect_text_files(target_dir: Path) -> List[Path]:
+    """Text files under target_dir (by extension), in one walk."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(target_dir):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for name in sorted(filenames):
+            if Path(name).suffix.lower() in TEXT_EXTENSIONS:
+                files.append(Path(dirpath) / name)
+    return files
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Replace path's content in one rename, keeping its permissions."""
+    mode = stat.S_IMODE(path.stat().st_mode) if path.exists() else None
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _rewrite_file(path: Path, replacements: ReplacementSet, dry_run: bool) -> Optional[Dict[str, int]]:
+    try:
+        text = path.read_text()
+    except UnicodeDecodeError:
+        return None
+    if not replacements.pattern.search(text):
+        return None
+    updated, counts = replacements.apply(text)
+    if not dry_run:
+        write_atomic(path, updated)
+    return counts
+
+
+def rewrite_references(
+    target_dir: Path,
+    replacements: ReplacementSet,
+    dry_run: bool = False,
+    files: Optional[List[Path]] = None,
+    max_workers: Optional[int] = None,
+) -> RewriteReport:
+    """Apply all replacements to every text file in one parallel pass."""
+    report = RewriteReport(dry_run=dry_run)
+    if not replacements:
+        return report
+    files = collect_text_files(target_dir) if files is None else files
+    report.files_scanned = len(files)
+
+    def work(path: Path):
+        try:
+            return path, _rewrite_file(path, replacements, dry_run), None
+        except OSError as exc:
+            return path, None, str(exc)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for path, counts, error in pool.map(work, files):
+            rel = _relative(target_dir, path)
+            if error:
+                report.errors[rel] = error
+            elif counts:
+                report.changed[rel] = counts
+    return report
+
+
+def _relative(target_dir: Path, path: Path) -> str:
+    try:
+        return path.relative_to(target_dir).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def format_rewrite_summary(report: RewriteReport, replacements: ReplacementSet, limit: int = 20) -> str:
+    """Per-replacement totals and the most-changed files."""
+    verb = "Would update" if report.dry_run else "Updated"
+    lines = [f"{verb} references in {len(report.changed)} of {report.files_scanned} files."]
+    totals = report.totals()
+    for old, new in replacements.items():
+        if old in totals:
+            lines.append(f"  {old} → {new}: {totals[old]} occurrence(s)")
+    ranked = sorted(report.changed.items(), key=lambda item: (-sum(item[1].values()), item[0]))
+    for rel, counts in ranked[:limit]:
+        lines.append(f"  {rel}: {sum(counts.values())}")
+    if len(ranked) > limit:
+        lines.append(f"  ... and {len(ranked) - limit} more files")
+    for rel, error in sorted(report.errors.items()):
+        lines.append(f"  ! {rel}: {error}")
+    return "\n".join(lines)
@@ -20,11 +20,17 @@ from typing import Any, Dict, List, Optional
 from .doctor_files import (
     load_doctor_config,
     should_ignore_path,
-    is_binary_file,
 )
 from .project_map import analyze_modules, load_modules_yaml
-from .context import parse_imports
 from .core_utils import IGNORED_EXTENSIONS
+from .repo_overview_facts import (
+    FactCache,
+    code_definitions,
+    docs_ref_from_content,
+    markdown_code_refs,
+    markdown_doc_refs,
+    markdown_sections,
+)
 from .repo_overview_formatters import (
     format_markdown,
     format_yaml,
@@ -103,224 +109,37 @@ def get_language(file_path: Path) -> str:
     return ext_map.get(file_path.suffix.lower(), '')
 
 
-def extract_docs_ref(file_path: Path, search_chars: int) -> str:
-    """Extract DOCS: reference from file header (bidirectional link).
-
-    Looks for patterns like:
-    - Python: # DOCS: docs/path/to/PATTERNS_*.md
-    - JS/TS: // DOCS: docs/path/to/PATTERNS_*.md
-    - C-style: /* DOCS: docs/path/to/PATTERNS_*.md */
-    - In docstrings: DOCS: docs/path/to/PATTERNS_*.md
-    """
+def _read_text(file_path: Path) -> Optional[str]:
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        return file_path.read_text(encoding='utf-8', errors='ignore')
     except Exception:
-        return ""
-
-    # Only search in the configured header slice
-    header = content[:max(0, search_chars)]
-
-    # Pattern to match DOCS: references in various comment styles
-    patterns = [
-        r'#\s*DOCS:\s*([^\n]+)',      # Python style
-        r'//\s*DOCS:\s*([^\n]+)',     # JS/C++ style
-        r'/\*\s*DOCS:\s*([^\n*]+)',   # C-style block comment
-        r'^\s*DOCS:\s*([^\n]+)',      # In docstrings (no comment marker)
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, header, re.MULTILINE)
-        if match:
-            return match.group(1).strip()
+        return None
 
-    return ""
 
+def extract_docs_ref(file_path: Path, search_chars: int) -> str:
+    """Extract DOCS: reference from file header (bidirectional link)."""
+    content = _read_text(file_path)
+    return docs_ref_from_content(content, search_chars) if content is not None else ""
 
 def extract_markdown_sections(file_path: Path) -> List[str]:
     """Extract # and ## section titles from markdown file."""
-    try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-    except Exception:
-        return []
-
-    sections = []
-    for line in content.split('\n'):
-        # Match # and ## headers (not ### or deeper)
-        match = re.match(r'^(#{1,2})\s+(.+)$', line.strip())
-        if match:
-            level = len(match.group(1))
-            title = match.group(2).strip()
-            prefix = '#' * level
-            sections.append(f"{prefix} {title}")
-
-    return sections
-
+    content = _read_text(file_path)
+    return markdown_sections(content) if content is not None else []
 
 def extract_markdown_code_refs(file_path: Path) -> List[str]:
     """Extract code file references from markdown files (docs → code direction)."""
-    try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-    except Exception:
-        return []
-
-    refs = set()
-
-    # Pattern 1: Backtick code references like `ngram/cli.py` or `cli.py`
-    backtick_refs = re.findall(r'`((?:src/)?[a-zA-Z_][\w/]*\.(?:py|js|ts|tsx|jsx|go|rs|java))`', content)
-    refs.update(backtick_refs)
-
-    # Pattern 2: Markdown links to code files [text](path/to/file.py)
-    link_refs = re.findall(r'\]\(([^)]*\.(?:py|js|ts|tsx|jsx|go|rs|java))\)', content)
-    refs.update(link_refs)
-
-    # Pattern 3: Explicit CODE: or IMPL: markers
-    code_markers = re.findall(r'(?:CODE|IMPL):\s*`?([^\s`\n]+\.(?:py|js|ts|tsx|jsx|go|rs|java))`?', content)
-    refs.update(code_markers)
-
-    # Pattern 4: Table cells with src/ paths like | `ngram/cli.py` | or | ngram/cli.py |
-    table_refs = re.findall(r'\|\s*`?(src/[a-zA-Z_][\w/]*\.(?:py|js|ts|tsx|jsx|go|rs|java))`?\s*\|', content)
-    refs.update(table_refs)
-
-    # Clean up paths (remove ../ prefixes, normalize)
-    cleaned = []
-    for ref in refs:
-        # Remove leading ../ or ./
-        ref = re.sub(r'^(?:\.\./)+', '', ref)
-        ref = re.sub(r'^\./', '', ref)
-        if ref:
-            cleaned.append(ref)
-
-    return sorted(set(cleaned))
-
+    content = _read_text(file_path)
+    return markdown_code_refs(content) if content is not None else []
 
 def extract_markdown_doc_refs(file_path: Path) -> List[str]:
-    """Extract doc file references from markdown files (docs → docs cross-links).
-
-    Only includes cross-folder references - skips same-folder siblings (chain links).
-    """
-    try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-    except Exception:
-        return []
-
-    refs = set()
-
-    # Pattern 1: Markdown links to other docs [text](path/to/DOC.md) - only with path
-    link_refs = re.findall(r'\]\(([^)]+/[^)]*\.md)\)', content)
-    refs.update(link_refs)
-
-    # Pattern 2: Backtick doc references with paths like `docs/cli/SYNC.md`
-    backtick_refs = re.findall(r'`([a-z][a-z0-9_/]*[A-Z][A-Z_]*[^`]*\.md)`', content)
-    refs.update(backtick_refs)
-
-    # Clean up paths (remove ../ prefixes, normalize)
-    cleaned = []
-    for ref in refs:
-        # Remove leading ../ or ./
-        ref = re.sub(r'^(?:\.\./)+', '', ref)
-        ref = re.sub(r'^\./', '', ref)
-        # Skip self-references, anchors, and same-folder refs (no / means same folder)
-        if ref and not ref.startswith('#') and '/' in ref and ref != file_path.name:
-            cleaned.append(ref)
-
-    return sorted(set(cleaned))
-
+    """Extract cross-folder doc file references from markdown files."""
+    content = _read_text(file_path)
+    return markdown_doc_refs(content, file_path.name) if content is not None else []
 
 def extract_code_definitions(file_path: Path) -> List[str]:
     """Extract function and class definitions from code files."""
-    try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-    except Exception:
-        return []
-
-    definitions = []
-    suffix = file_path.suffix.lower()
-
-    if suffix == '.py':
-        # Python: def, class, async def
-        pattern = re.compile(r'^(?:async\s+)?(?:def|class)\s+(\w+)')
-        for line in content.split('\n'):
-            line = line.strip()
-            match = pattern.match(line)
-            if match:
-                name = match.group(1)
-                if line.startswith('class'):
-                    definitions.append(f"class {name}")
-                elif 'async def' in line:
-                    definitions.append(f"async def {name}()")
-                else:
-                    definitions.append(f"def {name}()")
-
-    elif suffix in ['.js', '.ts', '.jsx', '.tsx']:
-        # JavaScript/TypeScript
-        patterns = [
-            (re.compile(r'^(?:export\s+)?(?:async\s+)?function\s+(\w+)'), 'function'),
-            (re.compile(r'^(?:export\s+)?class\s+(\w+)'), 'class'),
-            (re.compile(r'^(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?\('), 'const'),
-            (re.compile(r'^(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?function'), 'const'),
-        ]
-        for line in content.split('\n'):
-            line = line.strip()
-            for pattern, kind in patterns:
-                match = pattern.match(line)
-                if match:
-                    name = match.group(1)
-                    if kind == 'class':
-                        definitions.append(f"class {name}")
-                    else:
-                        definitions.append(f"{name}()")
-                    break
-
-    elif suffix == '.go':
-        # Go: func, type
-        func_pattern = re.compile(r'^func\s+(?:\([^)]+\)\s+)?(\w+)')
-        type_pattern = re.compile(r'^type\s+(\w+)\s+(?:struct|interface)')
-        for line in content.split('\n'):
-            line = line.strip()
-            match = func_pattern.match(line)
-            if match:
-                definitions.append(f"func {match.group(1)}()")
-                continue
-            match = type_pattern.match(line)
-            if match:
-                definitions.append(f"type {match.group(1)}")
-
-    elif suffix == '.rs':
-        # Rust: fn, struct, impl, enum
-        patterns = [
-            (re.compile(r'^(?:pub\s+)?(?:async\s+)?fn\s+(\w+)'), 'fn'),
-            (re.compile(r'^(?:pub\s+)?struct\s+(\w+)'), 'struct'),
-            (re.compile(r'^(?:pub\s+)?enum\s+(\w+)'), 'enum'),
-            (re.compile(r'^impl(?:<[^>]+>)?\s+(\w+)'), 'impl'),
-        ]
-        for line in content.split('\n'):
-            line = line.strip()
-            for pattern, kind in patterns:
-                match = pattern.match(line)
-                if match:
-                    name = match.group(1)
-                    if kind == 'fn':
-                        definitions.append(f"fn {name}()")
-                    else:
-                        definitions.append(f"{kind} {name}")
-                    break
-
-    elif suffix in ['.java', '.kt']:
-        # Java/Kotlin: class, interface, method
-        class_pattern = re.compile(r'^(?:public\s+)?(?:abstract\s+)?(?:class|interface)\s+(\w+)')
-        method_pattern = re.compile(r'^(?:public|private|protected)?\s*(?:static\s+)?(?:\w+\s+)+(\w+)\s*\(')
-        for line in content.split('\n'):
-            line = line.strip()
-            match = class_pattern.match(line)
-            if match:
-                definitions.append(f"class {match.group(1)}")
-                continue
-            match = method_pattern.match(line)
-            if match and match.group(1) not in ['if', 'for', 'while', 'switch']:
-                definitions.append(f"{match.group(1)}()")
-
-    return definitions
-
+    content = _read_text(file_path)
+    return code_definitions(content, file_path.suffix.lower()) if content is not None else []
 
 def count_chars(file_path: Path) -> int:
     """Count characters in a file."""
@@ -425,6 +244,57 @@ def _filter_local_imports(imports: List[str], target_dir: Path) -> List[str]:
     return result
 
 
+def _tree_entry_kind(target_dir: Path, config, path: Path, depth: int, max_depth: int) -> Optional[str]:
+    """'file' or 'dir' if the tree includes path (before content checks), else None."""
+    if depth > max_depth:
+        return None
+
+    # Skip ignored paths
+    if should_ignore_path(path, config.ignore, target_dir):
+        return None
+
+    if path.is_file():
+        # Skip ignored extensions (binary files are dropped once facts are read)
+        if path.suffix.lower() in IGNORED_EXTENSIONS:
+            return None
+        return 'file'
+
+    if path.is_dir():
+        # Skip hidden directories and common non-code directories
+        if path.name.startswith('.') and path != target_dir:
+            return None
+
+        skip_dirs = {'__pycache__', 'node_modules', '.venv', 'venv', 'dist', 'build', '.git'}
+        if path.name in skip_dirs:
+            return None
+        return 'dir'
+
+    return None
+
+
+def _collect_tree(
+    target_dir: Path,
+    config,
+    path: Path,
+    depth: int,
+    max_depth: int,
+    files: List[tuple],
+    listing: Dict[Path, List[tuple]],
+) -> Optional[str]:
+    """Walk the tree once: record (file, language) pairs and each dir's included children."""
+    kind = _tree_entry_kind(target_dir, config, path, depth, max_depth)
+    if kind == 'file':
+        files.append((path, get_language(path)))
+    elif kind == 'dir':
+        children = []
+        for child in sorted(path.iterdir()):
+            child_kind = _collect_tree(target_dir, config, child, depth + 1, max_depth, files, listing)
+            if child_kind:
+                children.append((child, child_kind))
+        listing[path] = children
+    return kind
+
+
 def build_file_tree(
     target_dir: Path,
     config,
@@ -433,8 +303,12 @@ def build_file_tree(
     max_depth: int = 10,
     min_size: int = 0,
     top_files: int = 0,
+    fact_cache: Optional[FactCache] = None,
 ) -> Optional[FileInfo]:
-    """Build file tree recursively.
+    """Build file tree.
+
+    The tree is walked once to list files, their facts are computed on a
+    thread pool (or taken from fact_cache), then the nodes are assembled.
 
     Args:
         target_dir: Root directory of the project
@@ -444,17 +318,38 @@ def build_file_tree(
         max_depth: Maximum recursion depth
         min_size: Minimum file size in chars to include (0 = include all)
         top_files: Maximum files per directory, sorted by size (0 = include all)
+        fact_cache: Shared per-file facts; a persisted one is used if None
     """
     if current_path is None:
         current_path = target_dir
 
-    if depth > max_depth:
-        return None
+    owns_cache = fact_cache is None
+    if owns_cache:
+        fact_cache = FactCache(target_dir, config.docs_ref_search_chars)
 
-    # Skip ignored paths
-    if should_ignore_path(current_path, config.ignore, target_dir):
+    files: List[tuple] = []
+    listing: Dict[Path, List[tuple]] = {}
+    kind = _collect_tree(target_dir, config, current_path, depth, max_depth, files, listing)
+    if not kind:
         return None
+    fact_cache.prefetch(files)
+
+    tree = _build_node(target_dir, current_path, kind, listing, fact_cache, min_size, top_files)
+    if owns_cache:
+        fact_cache.save()
+    return tree
 
+
+def _build_node(
+    target_dir: Path,
+    current_path: Path,
+    kind: str,
+    listing: Dict[Path, List[tuple]],
+    fact_cache: FactCache,
+    min_size: int,
+    top_files: int,
+) -> Optional[FileInfo]:
+    """Assemble a FileInfo from collected listings and facts."""
     # Get relative path
     try:
         rel_path = str(current_path.relative_to(target_dir))
@@ -464,117 +359,84 @@ def build_file_tree(
     if rel_path == '.':
         rel_path = current_path.name
 
-    if current_path.is_file():
-        # Skip binary and ignored extensions
-        if current_path.suffix.lower() in IGNORED_EXTENSIONS:
-            return None
-        if is_binary_file(current_path):
+    if kind == 'file':
+        language = get_language(current_path)
+        facts = fact_cache.get(current_path, language)
+        # Skip binary files
+        if facts.binary:
             return None
 
-        language = get_language(current_path)
-        chars = count_chars(current_path)
-
-        # Extract docs_ref and imports for code files
-        docs_ref = ""
-        imports = []
-        sections = []
-        functions = []
-
-        code_refs = []
-        doc_refs = []
-        if language == 'markdown':
-            sections = extract_markdown_sections(current_path)
-            code_refs = extract_markdown_code_refs(current_path)
-            doc_refs = extract_markdown_doc_refs(current_path)
-        elif language in ['python', 'javascript', 'typescript', 'tsx', 'jsx', 'go', 'rust', 'java']:
-            functions = extract_code_definitions(current_path)
-            docs_ref = extract_docs_ref(current_path, config.docs_ref_search_chars)
-            raw_imports = parse_imports(current_path)
-            # Filter to only local imports (not stdlib/third-party)
-            imports = _filter_local_imports(raw_imports, target_dir)
+        # Filter to only local imports (not stdlib/third-party)
+        imports = _filter_local_imports(facts.imports, target_dir) if facts.imports else []
 
         return FileInfo(
             path=rel_path,
             type='file',
             language=language,
-            chars=chars,
-            docs_ref=docs_ref,
-            code_refs=code_refs,
-            doc_refs=doc_refs,
+            chars=facts.chars,
+            docs_ref=facts.docs_ref,
+            code_refs=list(facts.code_refs),
+            doc_refs=list(facts.doc_refs),
             imports=imports,
-            sections=sections,
-            functions=functions,
+            sections=list(facts.sections),
+            functions=list(facts.functions),
         )
 
-    elif current_path.is_dir():
-        # Skip hidden directories and common non-code directories
-        if current_path.name.startswith('.') and current_path != target_dir:
-            return None
-
-        skip_dirs = {'__pycache__', 'node_modules', '.venv', 'venv', 'dist', 'build', '.git'}
-        if current_path.name in skip_dirs:
-            return None
-
-        # Collect all children first
-        all_children = []
-        for child in sorted(current_path.iterdir()):
-            child_info = build_file_tree(
-                target_dir, config, child, depth + 1, max_depth,
-                min_size=min_size, top_files=top_files
-            )
-            if child_info:
-                all_children.append(child_info)
-
-        # Separate directories and files
-        dirs = [c for c in all_children if c.type == 'dir']
-        files = [c for c in all_children if c.type == 'file']
-
-        # Apply min_size filter to files
-        hidden_by_size = 0
-        if min_size > 0:
-            filtered_files = []
-            for f in files:
-                if f.chars >= min_size:
-                    filtered_files.append(f)
-                else:
-                    hidden_by_size += 1
-            files = filtered_files
-
-        # Apply top_files filter (keep largest files)
-        hidden_by_top = 0
-        if top_files > 0 and len(files) > top_files:
-            # Sort by size descending, take top N
-            files_sorted = sorted(files, key=lambda f: f.chars, reverse=True)
-            hidden_by_top = len(files) - top_files
-            files = files_sorted[:top_files]
-            # Re-sort alphabetically for display
-            files = sorted(files, key=lambda f: f.path)
-
-        # Combine: directories first, then files
-        children = dirs + files
-        hidden_count = hidden_by_size + hidden_by_top
-
-        # Don't include empty directories (unless they have hidden files)
-        if not children and hidden_count == 0 and current_path != target_dir:
-            return None
-
-        # Calculate total chars for directory (sum of all children, including hidden)
-        total_chars = 0
-        for child in all_children:
-            if child.type == 'file':
-                total_chars += child.chars
+    # Collect all children first
+    all_children = []
+    for child, child_kind in listing.get(current_path, []):
+        child_info = _build_node(target_dir, child, child_kind, listing, fact_cache, min_size, top_files)
+        if child_info:
+            all_children.append(child_info)
+
+    # Separate directories and files
+    dirs = [c for c in all_children if c.type == 'dir']
+    files = [c for c in all_children if c.type == 'file']
+
+    # Apply min_size filter to files
+    hidden_by_size = 0
+    if min_size > 0:
+        filtered_files = []
+        for f in files:
+            if f.chars >= min_size:
+                filtered_files.append(f)
             else:
-                total_chars += child.total_chars
-
-        return FileInfo(
-            path=rel_path,
-            type='dir',
-            total_chars=total_chars,
-            children=children,
-            hidden_count=hidden_count,
-        )
+                hidden_by_size += 1
+        files = filtered_files
+
+    # Apply top_files filter (keep largest files)
+    hidden_by_top = 0
+    if top_files > 0 and len(files) > top_files:
+        # Sort by size descending, take top N
+        files_sorted = sorted(files, key=lambda f: f.chars, reverse=True)
+        hidden_by_top = len(files) - top_files
+        files = files_sorted[:top_files]
+        # Re-sort alphabetically for display
+        files = sorted(files, key=lambda f: f.path)
+
+    # Combine: directories first, then files
+    children = dirs + files
+    hidden_count = hidden_by_size + hidden_by_top
+
+    # Don't include empty directories (unless they have hidden files)
+    if not children and hidden_count == 0 and current_path != target_dir:
+        return None
 
-    return None
+    # Calculate total chars for directory (sum of all children, including hidden)
+    total_chars = 0
+    for child in all_children:
+        if child.type == 'file':
+            total_chars += child.chars
+        else:
+            total_chars += child.total_chars
+
+    return FileInfo(
+        path=rel_path,
+        type='dir',
+        total_chars=total_chars,
+        children=children,
+        hidden_count=hidden_count,
+    )
 
 
 def get_dependency_info(target_dir: Path) -> List[DependencyInfo]:
@@ -671,6 +533,7 @@ def generate_repo_overview(
     subfolder: Optional[str] = None,
     min_size: int = 500,
     top_files: int = 10,
+    fact_cache: Optional[FactCache] = None,
 ) -> RepoOverview:
     """Generate complete repository overview.
 
@@ -679,6 +542,7 @@ def generate_repo_overview(
         subfolder: Optional subfolder to map only (relative to target_dir)
         min_size: Minimum file size in chars to include (default 500)
         top_files: Maximum files per directory (default 10, 0 = unlimited)
+        fact_cache: Shared per-file facts (see build_file_tree)
     """
     from datetime import datetime
 
@@ -696,6 +560,7 @@ def generate_repo_overview(
         current_path=start_path,
         min_size=min_size,
         top_files=top_files,
+        fact_cache=fact_cache,
     )
     if not file_tree:
         file_tree = FileInfo(path=start_path.name, type='dir')
@@ -722,18 +587,23 @@ def generate_repo_overview(
 
 def _save_single_map(
     target_dir: Path,
-    output_dir: Path,
+    output_dirs: List[Path],
     output_format: str,
     subfolder: Optional[str],
     min_size: int,
     top_files: int,
+    fact_cache: Optional[FactCache] = None,
 ) -> Path:
-    """Internal helper to generate and save a single map file."""
+    """Internal helper to generate a single map and save it to each output dir.
+
+    Returns the path in the first output dir.
+    """
     overview = generate_repo_overview(
         target_dir,
         subfolder=subfolder,
         min_size=min_size,
-        top_files=top_files
+        top_files=top_files,
+        fact_cache=fact_cache,
     )
 
     # Generate filename (map_subfolder if provided)
@@ -744,8 +614,6 @@ def _save_single_map(
         safe_folder = re.sub(r'[^a-zA-Z0-9_-]', '_', subfolder.strip('/'))
         output_name = f"map_{safe_folder}"
 
-    output_path = output_dir / f"{output_name}.{ext}"
-
     if output_format == "yaml":
         content = format_yaml(overview)
     elif output_format == "json":
@@ -753,8 +621,13 @@ def _save_single_map(
     else:
         content = format_markdown(overview)
 
-    output_path.write_text(content, encoding='utf-8')
-    return output_path
+    for output_dir in output_dirs:
+        output_path = output_dir / f"{output_name}.{ext}"
+        output_path.write_text(content, encoding='utf-8')
+        if fact_cache is not None:
+            # A later map in the same run lists this file
+            fact_cache.forget(output_path)
+    return output_dirs[0] / f"{output_name}.{ext}"
 
 
 def generate_and_save(
@@ -771,6 +644,11 @@ def generate_and_save(
     - Saves map.{ext} to docs/ (if exists)
     - Saves map_{folder}.{ext} for key folders (src, app, backend, frontend, etc)
 
+    All maps share one FactCache, so each source file is read at most once,
+    and only files changed since the last run (by mtime and size) are
+    re-read. A map written earlier in the run is re-read by the maps after
+    it, which list it as they did when each map was built separately.
+
     Args:
         target_dir: Root directory of the project
         output_format: Output format (md, yaml, json)
@@ -778,18 +656,30 @@ def generate_and_save(
         min_size: Minimum file size in chars to include
         top_files: Maximum files per directory
     """
+    config = load_doctor_config(target_dir)
+    fact_cache = FactCache(target_dir, config.docs_ref_search_chars)
+
     if subfolder:
         # Explicit subfolder requested - save only to root
-        return _save_single_map(target_dir, target_dir, output_format, subfolder, min_size, top_files)
+        output = _save_single_map(
+            target_dir, [target_dir], output_format, subfolder, min_size, top_files, fact_cache
+        )
+        fact_cache.save()
+        return output
 
     # Default logic: Multi-generation
     # 1. Main map in root
-    main_map = _save_single_map(target_dir, target_dir, output_format, None, min_size, top_files)
+    main_map = _save_single_map(
+        target_dir, [target_dir], output_format, None, min_size, top_files, fact_cache
+    )
 
-    # 2. Main map in docs/ (if exists)
+    # 2. Main map in docs/ (if exists). Built again rather than copied: it
+    # lists the root map just written, and only that file is re-read
     docs_dir = target_dir / "docs"
     if docs_dir.exists() and docs_dir.is_dir():
-        _save_single_map(target_dir, docs_dir, output_format, None, min_size, top_files)
+        _save_single_map(
+            target_dir, [docs_dir], output_format, None, min_size, top_files, fact_cache
+        )
 
     # 3. Auto-folder maps (in root)
     auto_folders = ['src', 'app', 'backend', 'frontend', 'website', 'api']
@@ -797,10 +687,13 @@ def generate_and_save(
         folder_path = target_dir / folder
         if folder_path.exists() and folder_path.is_dir():
             try:
-                _save_single_map(target_dir, target_dir, output_format, folder, min_size, top_files)
+                _save_single_map(
+                    target_dir, [target_dir], output_format, folder, min_size, top_files, fact_cache
+                )
             except Exception:
                 continue
 
+    fact_cache.save()
     return main_map
 
 
@@ -0,0 +1,357 @@
+# DOCS: docs/cli/core/IMPLEMENTATION_CLI_Code_Architecture/overview/IMPLEMENTATION_Overview.md
+"""
+Repository Overview File Facts.
+
+Extracted from repo_overview.py to manage file size.
+Everything the overview needs from one file (binary check, size, sections,
+definitions, DOCS: reference, refs, imports) comes from a single read.
+FactCache keeps the facts in .ngram/state/overview_facts.json keyed by
+(path, mtime, size), computes misses on a thread pool, and is shared by all
+maps written in one generate_and_save call.
+"""
+
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .context import parse_imports_from_content
+
+FACT_CACHE_PATH = Path(".ngram") / "state" / "overview_facts.json"
+FACT_CACHE_VERSION = 1
+
+# Same heuristic as doctor_files.is_binary_file
+BINARY_SNIFF_BYTES = 8192
+
+CODE_LANGUAGES = ('python', 'javascript', 'typescript', 'tsx', 'jsx', 'go', 'rust', 'java')
+
+
+def docs_ref_from_content(content: str, search_chars: int) -> str:
+    """Extract DOCS: reference from file header (bidirectional link).
+
+    Looks for patterns like:
+    - Python: # DOCS: docs/path/to/PATTERNS_*.md
+    - JS/TS: // DOCS: docs/path/to/PATTERNS_*.md
+    - C-style: /* DOCS: docs/path/to/PATTERNS_*.md */
+    - In docstrings: DOCS: docs/path/to/PATTERNS_*.md
+    """
+    # Only search in the configured header slice
+    header = content[:max(0, search_chars)]
+
+    # Pattern to match DOCS: references in various comment styles
+    patterns = [
+        r'#\s*DOCS:\s*([^\n]+)',      # Python style
+        r'//\s*DOCS:\s*([^\n]+)',     # JS/C++ style
+        r'/\*\s*DOCS:\s*([^\n*]+)',   # C-style block comment
+        r'^\s*DOCS:\s*([^\n]+)',      # In docstrings (no comment marker)
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, header, re.MULTILINE)
+        if match:
+            return match.group(1).strip()
+
+    return ""
+
+
+
+def markdown_sections(content: str) -> List[str]:
+    """Extract # and ## section titles from markdown file."""
+    sections = []
+    for line in content.split('\n'):
+        # Match # and ## headers (not ### or deeper)
+        match = re.match(r'^(#{1,2})\s+(.+)$', line.strip())
+        if match:
+            level = len(match.group(1))
+            title = match.group(2).strip()
+            prefix = '#' * level
+            sections.append(f"{prefix} {title}")
+
+    return sections
+
+
+
+def markdown_code_refs(content: str) -> List[str]:
+    """Extract code file references from markdown files (docs → code direction)."""
+    refs = set()
+
+    # Pattern 1: Backtick code references like `ngram/cli.py` or `cli.py`
+    backtick_refs = re.findall(r'`((?:src/)?[a-zA-Z_][\w/]*\.(?:py|js|ts|tsx|jsx|go|rs|java))`', content)
+    refs.update(backtick_refs)
+
+    # Pattern 2: Markdown links to code files [text](path/to/file.py)
+    link_refs = re.findall(r'\]\(([^)]*\.(?:py|js|ts|tsx|jsx|go|rs|java))\)', content)
+    refs.update(link_refs)
+
+    # Pattern 3: Explicit CODE: or IMPL: markers
+    code_markers = re.findall(r'(?:CODE|IMPL):\s*`?([^\s`\n]+\.(?:py|js|ts|tsx|jsx|go|rs|java))`?', content)
+    refs.update(code_markers)
+
+    # Pattern 4: Table cells with src/ paths like | `ngram/cli.py` | or | ngram/cli.py |
+    table_refs = re.findall(r'\|\s*`?(src/[a-zA-Z_][\w/]*\.(?:py|js|ts|tsx|jsx|go|rs|java))`?\s*\|', content)
+    refs.update(table_refs)
+
+    # Clean up paths (remove ../ prefixes, normalize)
+    cleaned = []
+    for ref in refs:
+        # Remove leading ../ or ./
+        ref = re.sub(r'^(?:\.\./)+', '', ref)
+        ref = re.sub(r'^\./', '', ref)
+        if ref:
+            cleaned.append(ref)
+
+    return sorted(set(cleaned))
+
+
+
+def markdown_doc_refs(content: str, file_name: str) -> List[str]:
+    """Extract doc file references from markdown files (docs → docs cross-links).
+
+    Only includes cross-folder references - skips same-folder siblings (chain links).
+    """
+    refs = set()
+
+    # Pattern 1: Markdown links to other docs [text](path/to/DOC.md) - only with path
+    link_refs = re.findall(r'\]\(([^)]+/[^)]*\.md)\)', content)
+    refs.update(link_refs)
+
+    # Pattern 2: Backtick doc references with paths like `docs/cli/SYNC.md`
+    backtick_refs = re.findall(r'`([a-z][a-z0-9_/]*[A-Z][A-Z_]*[^`]*\.md)`', content)
+    refs.update(backtick_refs)
+
+    # Clean up paths (remove ../ prefixes, normalize)
+    cleaned = []
+    for ref in refs:
+        # Remove leading ../ or ./
+        ref = re.sub(r'^(?:\.\./)+', '', ref)
+        ref = re.sub(r'^\./', '', ref)
+        # Skip self-references, anchors, and same-folder refs (no / means same folder)
+        if ref and not ref.startswith('#') and '/' in ref and ref != file_name:
+            cleaned.append(ref)
+
+    return sorted(set(cleaned))
+
+
+
+def code_definitions(content: str, suffix: str) -> List[str]:
+    """Extract function and class definitions from code files."""
+    definitions = []
+
+    if suffix == '.py':
+        # Python: def, class, async def
+        pattern = re.compile(r'^(?:async\s+)?(?:def|class)\s+(\w+)')
+        for line in content.split('\n'):
+            line = line.strip()
+            match = pattern.match(line)
+            if match:
+                name = match.group(1)
+                if line.startswith('class'):
+                    definitions.append(f"class {name}")
+                elif 'async def' in line:
+                    definitions.append(f"async def {name}()")
+                else:
+                    definitions.append(f"def {name}()")
+
+    elif suffix in ['.js', '.ts', '.jsx', '.tsx']:
+        # JavaScript/TypeScript
+        patterns = [
+            (re.compile(r'^(?:export\s+)?(?:async\s+)?function\s+(\w+)'), 'function'),
+            (re.compile(r'^(?:export\s+)?class\s+(\w+)'), 'class'),
+            (re.compile(r'^(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?\('), 'const'),
+            (re.compile(r'^(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?function'), 'const'),
+        ]
+        for line in content.split('\n'):
+            line = line.strip()
+            for pattern, kind in patterns:
+                match = pattern.match(line)
+                if match:
+                    name = match.group(1)
+                    if kind == 'class':
+                        definitions.append(f"class {name}")
+                    else:
+                        definitions.append(f"{name}()")
+                    break
+
+    elif suffix == '.go':
+        # Go: func, type
+        func_pattern = re.compile(r'^func\s+(?:\([^)]+\)\s+)?(\w+)')
+        type_pattern = re.compile(r'^type\s+(\w+)\s+(?:struct|interface)')
+        for line in content.split('\n'):
+            line = line.strip()
+            match = func_pattern.match(line)
+            if match:
+                definitions.append(f"func {match.group(1)}()")
+                continue
+            match = type_pattern.match(line)
+            if match:
+                definitions.append(f"type {match.group(1)}")
+
+    elif suffix == '.rs':
+        # Rust: fn, struct, impl, enum
+        patterns = [
+            (re.compile(r'^(?:pub\s+)?(?:async\s+)?fn\s+(\w+)'), 'fn'),
+            (re.compile(r'^(?:pub\s+)?struct\s+(\w+)'), 'struct'),
+            (re.compile(r'^(?:pub\s+)?enum\s+(\w+)'), 'enum'),
+            (re.compile(r'^impl(?:<[^>]+>)?\s+(\w+)'), 'impl'),
+        ]
+        for line in content.split('\n'):
+            line = line.strip()
+            for pattern, kind in patterns:
+                match = pattern.match(line)
+                if match:
+                    name = match.group(1)
+                    if kind == 'fn':
+                        definitions.append(f"fn {name}()")
+                    else:
+                        definitions.append(f"{kind} {name}")
+                    break
+
+    elif suffix in ['.java', '.kt']:
+        # Java/Kotlin: class, interface, method
+        class_pattern = re.compile(r'^(?:public\s+)?(?:abstract\s+)?(?:class|interface)\s+(\w+)')
+        method_pattern = re.compile(r'^(?:public|private|protected)?\s*(?:static\s+)?(?:\w+\s+)+(\w+)\s*\(')
+        for line in content.split('\n'):
+            line = line.strip()
+            match = class_pattern.match(line)
+            if match:
+                definitions.append(f"class {match.group(1)}")
+                continue
+            match = method_pattern.match(line)
+            if match and match.group(1) not in ['if', 'for', 'while', 'switch']:
+                definitions.append(f"{match.group(1)}()")
+
+    return definitions
+
+
+
+@dataclass
+class FileFacts:
+    """Per-file facts for the overview. Imports are unfiltered."""
+    binary: bool = False
+    chars: int = 0
+    docs_ref: str = ""
+    code_refs: List[str] = field(default_factory=list)
+    doc_refs: List[str] = field(default_factory=list)
+    imports: List[str] = field(default_factory=list)
+    sections: List[str] = field(default_factory=list)
+    functions: List[str] = field(default_factory=list)
+
+
+def read_file_facts(file_path: Path, language: str, search_chars: int) -> FileFacts:
+    """Compute all facts for a file from one read."""
+    needs_content = language == 'markdown' or language in CODE_LANGUAGES
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read(BINARY_SNIFF_BYTES)
+            if b'\x00' in data:
+                return FileFacts(binary=True)
+            if not needs_content:
+                return FileFacts(chars=os.fstat(f.fileno()).st_size)
+            data += f.read()
+    except OSError:
+        # Unreadable files are skipped like binaries
+        return FileFacts(binary=True)
+
+    facts = FileFacts(chars=len(data))
+    content = data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+    if language == 'markdown':
+        facts.sections = markdown_sections(content)
+        facts.code_refs = markdown_code_refs(content)
+        facts.doc_refs = markdown_doc_refs(content, file_path.name)
+    else:
+        facts.functions = code_definitions(content, file_path.suffix.lower())
+        facts.docs_ref = docs_ref_from_content(content, search_chars)
+        facts.imports = parse_imports_from_content(content, file_path.suffix)
+    return facts
+
+
+class FactCache:
+    """Per-file facts keyed by (path, mtime, size), persisted between runs."""
+
+    def __init__(self, target_dir: Path, search_chars: int, max_workers: Optional[int] = None):
+        self.target_dir = target_dir
+        self.search_chars = search_chars
+        self.max_workers = max_workers
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, dict] = {}
+        self._facts: Dict[Path, FileFacts] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @property
+    def path(self) -> Path:
+        return self.target_dir / FACT_CACHE_PATH
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if payload.get("version") == FACT_CACHE_VERSION and payload.get("search_chars") == self.search_chars:
+            self._entries = payload.get("files", {})
+
+    def save(self) -> None:
+        """Persist facts (only when .ngram/state exists)."""
+        if not self.path.parent.exists():
+            return
+        payload = {"version": FACT_CACHE_VERSION, "search_chars": self.search_chars, "files": self._entries}
+        try:
+            tmp = self.path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(payload))
+            tmp.replace(self.path)
+        except OSError:
+            pass
+
+    def _key(self, file_path: Path) -> str:
+        try:
+            return str(file_path.relative_to(self.target_dir))
+        except ValueError:
+            return str(file_path)
+
+    def _compute(self, file_path: Path, language: str) -> None:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            facts = FileFacts(binary=True)
+            with self._lock:
+                self._facts[file_path] = facts
+            return
+        key = self._key(file_path)
+        entry = self._entries.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            facts = FileFacts(**entry["facts"])
+            hit = True
+        else:
+            facts = read_file_facts(file_path, language, self.search_chars)
+            entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "facts": asdict(facts)}
+            hit = False
+        with self._lock:
+            self._facts[file_path] = facts
+            self._entries[key] = entry
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def prefetch(self, files: Iterable[tuple]) -> None:
+        """Compute facts for (path, language) pairs not yet known, in parallel."""
+        todo = [(p, lang) for p, lang in files if p not in self._facts]
+        if not todo:
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            list(pool.map(lambda item: self._compute(*item), todo))
+
+    def forget(self, file_path: Path) -> None:
+        """Drop this run's facts for a file just rewritten; the next lookup re-checks it."""
+        with self._lock:
+            self._facts.pop(file_path, None)
+
+    def get(self, file_path: Path, language: str) -> FileFacts:
+        if file_path not in self._facts:
+            self._compute(file_path, language)
+        return self._facts[file_path]
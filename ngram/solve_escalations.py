@@ -4,97 +4,32 @@ Scan the repo for escalation markers and report them.
 """
 
 from pathlib import Path
-from typing import List, Tuple
-
-from .doctor_files import load_doctor_config, should_ignore_path, is_binary_file
-
-ESCALATION_TAGS = (
-    "@ngram:doctor:escalation",
-    "@ngram:escalation",
+from typing import List, Optional, Tuple
+
+from .doctor_files import load_doctor_config
+from .marker_scanner import (
+    ESCALATION_TAGS,
+    PROPOSITION_TAGS,
+    TODO_TAGS,
+    MarkerScan,
+    scan_markers,
 )
 
-PROPOSITION_TAGS = (
-    "@ngram:doctor:proposition",
-    "@ngram:proposition",
-)
-
-TODO_TAGS = (
-    "@ngram:doctor:todo",
-    "@ngram:todo",
-)
 IGNORED_FILES = {
     "ngram/solve_escalations.py",
+    "ngram/marker_scanner.py",
     "ngram/init_cmd.py",
     "docs/cli/core/ALGORITHM_CLI_Command_Execution_Logic/ALGORITHM_Overview.md",
 }
 
 
-def _is_log_file(path: Path) -> bool:
-    return path.suffix == ".log" or path.name.endswith(".log")
-
-
-def _extract_priority_from_content(content: str, marker_tags: Tuple[str, ...]) -> int:
-    """Extract priority from marker YAML. Returns 0-10 (higher = more urgent)."""
-    import re
-    for tag in marker_tags:
-        if tag not in content:
-            continue
-        start = content.find(tag)
-        end = min(start + 500, len(content))
-        section = content[start:end]
-
-        priority_match = re.search(r'priority:\s*(\d+|low|medium|high|critical)', section, re.IGNORECASE)
-        if priority_match:
-            val = priority_match.group(1).lower()
-            if val.isdigit():
-                return int(val)
-            return {"critical": 10, "high": 8, "medium": 5, "low": 2}.get(val, 5)
-    return 5  # Default priority
-
-
-def _extract_title_from_content(content: str, marker_tags: Tuple[str, ...]) -> str:
-    """Extract title from marker YAML."""
-    import re
-    for tag in marker_tags:
-        if tag not in content:
-            continue
-        start = content.find(tag)
-        end = min(start + 500, len(content))
-        section = content[start:end]
-
-        title_match = re.search(r'(?:title|task_name):\s*["\']?([^"\'\n]+)', section)
-        if title_match:
-            return title_match.group(1).strip()[:60]
-    return ""
-
-
-def _count_unresolved_markers(content: str, marker_tags: Tuple[str, ...]) -> int:
-    """Count markers that are NOT marked as resolved."""
-    import re
-    count = 0
-    for tag in marker_tags:
-        # Find all occurrences of this tag
-        start = 0
-        while True:
-            pos = content.find(tag, start)
-            if pos == -1:
-                break
-            # Look at the next 500 chars for status: resolved
-            end = min(pos + 500, len(content))
-            section = content[pos:end]
-            # Check if this marker is resolved
-            if not re.search(r'status:\s*resolved', section, re.IGNORECASE):
-                count += 1
-            start = pos + 1
-    return count
-
-
-def _find_markers_in_files(target_dir: Path, marker_tags: Tuple[str, ...], issue_type: str) -> List[Tuple[int, int, str, str, str]]:
+def _find_markers_in_files(target_dir: Path, issue_type: str, scan: Optional[MarkerScan] = None) -> List[Tuple[int, int, str, str, str]]:
     """Return file paths with given markers, ordered by priority (highest first).
 
     Returns: List of (priority_sort, occurrences, path, issue_type, title)
     """
-    config = load_doctor_config(target_dir)
+    if scan is None:
+        scan = scan_markers(target_dir, load_doctor_config(target_dir))
     matches: List[Tuple[int, int, str, str, str]] = []
 
     # Directories to ignore (templates, skills contain instructional examples)
@@ -105,43 +40,21 @@ def _find_markers_in_files(target_dir: Path, marker_tags: Tuple[str, ...], issue
         ".ngram/views",
     }
 
-    for path in target_dir.rglob("*"):
-        if not path.is_file():
-            continue
-        try:
-            rel_path = str(path.relative_to(target_dir))
-        except ValueError:
-            continue
-
-        # Skip ignore dirs
+    for markers in scan.with_family(issue_type):
+        rel_path = markers.path
         if any(rel_path.startswith(d) for d in ignore_dirs):
             continue
-
         if rel_path in IGNORED_FILES:
             continue
-        if should_ignore_path(path, config.ignore, target_dir):
-            continue
-        if _is_log_file(path):
-            continue
-        if is_binary_file(path):
-            continue
-
-        try:
-            content = path.read_text(errors="ignore")
-        except Exception:
-            continue
-
-        if not any(tag in content for tag in marker_tags):
-            continue
 
         # Count only unresolved markers (skip status: resolved)
-        occurrences = _count_unresolved_markers(content, marker_tags)
+        occurrences = markers.unresolved(issue_type)
         if occurrences == 0:
             continue  # All markers in this file are resolved
 
-        # Extract priority from YAML (0-10, higher = more urgent)
-        priority = _extract_priority_from_content(content, marker_tags)
-        title = _extract_title_from_content(content, marker_tags)
+        # Priority from marker YAML (0-10, higher = more urgent)
+        priority = markers.priority(issue_type)
+        title = markers.title(issue_type)[:60]
 
         # Sort key: -priority (so higher priority comes first), then by occurrences
         matches.append((-priority, -occurrences, rel_path, issue_type, title))
@@ -152,9 +65,10 @@ def _find_markers_in_files(target_dir: Path, marker_tags: Tuple[str, ...], issue
 
 def solve_special_markers_command(target_dir: Path) -> int:
     """CLI entrypoint for `ngram solve-markers` to find and report special markers."""
-    escalation_matches = _find_markers_in_files(target_dir, ESCALATION_TAGS, "ESCALATION")
-    proposition_matches = _find_markers_in_files(target_dir, PROPOSITION_TAGS, "PROPOSITION")
-    todo_matches = _find_markers_in_files(target_dir, TODO_TAGS, "TODO")
+    scan = scan_markers(target_dir, load_doctor_config(target_dir))
+    escalation_matches = _find_markers_in_files(target_dir, "ESCALATION", scan)
+    proposition_matches = _find_markers_in_files(target_dir, "PROPOSITION", scan)
+    todo_matches = _find_markers_in_files(target_dir, "TODO", scan)
 
     all_matches = sorted(escalation_matches + proposition_matches + todo_matches)
 
@@ -334,17 +334,29 @@ def _path_matches_glob(path: str, pattern: str) -> bool:
     return fnmatch.fnmatch(path, pattern)
 
 
-def get_all_health_issues(project_dir: Path) -> List[HealthIssue]:
-    """Get all health issues from doctor."""
+def get_all_health_issues(project_dir: Path, refresh: bool = False) -> List[HealthIssue]:
+    """
+    Get all health issues from doctor.
+
+    Reuses the result persisted by the last doctor run while it is fresh
+    (see doctor_cache); otherwise runs the checks once, without graph sync,
+    and persists the result. `refresh` forces a new run.
+    """
     try:
-        from .doctor import run_doctor
-        from .doctor_types import DoctorConfig
-        config = DoctorConfig()
-        result = run_doctor(project_dir, config)
+        from .doctor_cache import load_fresh_doctor_result, save_doctor_result
+        from .doctor_files import load_doctor_config
+
+        config = load_doctor_config(project_dir)
+        issues_by_severity = None if refresh else load_fresh_doctor_result(project_dir, config)
+        if issues_by_severity is None:
+            from .doctor import run_doctor
+            result = run_doctor(project_dir, config, sync_graph=False)
+            save_doctor_result(project_dir, result, config)
+            issues_by_severity = result["issues"]
 
         all_issues = []
         for severity in ["critical", "warning", "info"]:
-            for issue in result["issues"].get(severity, []):
+            for issue in issues_by_severity.get(severity, []):
                 all_issues.append(HealthIssue(
                     issue_type=issue.issue_type,
                     severity=issue.severity,
@@ -390,13 +402,76 @@ def filter_issues_for_module(all_issues: List[HealthIssue], code_pattern: str, d
     return module_issues
 
 
+class ModuleIssueIndex:
+    """
+    Prefix trie from module code/docs paths to module names.
+
+    Matches exactly what filter_issues_for_module does per module (string
+    prefix for `**` code patterns and docs paths, fnmatch otherwise), but
+    assigns every issue in one pass over its path instead of testing it
+    against each module.
+    """
+
+    def __init__(self):
+        self._root: Dict[str, Any] = {}
+        self._globs: List[Tuple[str, str]] = []
+
+    def add(self, module_name: str, code_pattern: str, docs_path: str) -> None:
+        if code_pattern:
+            if "**" in code_pattern:
+                self._insert(code_pattern.split("**")[0].rstrip("/"), module_name)
+            else:
+                self._globs.append((code_pattern, module_name))
+        if docs_path:
+            self._insert(docs_path.rstrip('/'), module_name)
+
+    def _insert(self, prefix: str, module_name: str) -> None:
+        node = self._root
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        node.setdefault(None, []).append(module_name)
+
+    def modules_for(self, path: str) -> List[str]:
+        """Modules whose code or docs prefix matches `path`, each once."""
+        found = list(self._root.get(None, []))
+        node = self._root
+        for ch in path:
+            node = node.get(ch)
+            if node is None:
+                break
+            found.extend(node.get(None, []))
+        found.extend(name for pattern, name in self._globs if _path_matches_glob(path, pattern))
+        return list(dict.fromkeys(found))
+
+    def group(self, issues: List[HealthIssue]) -> Dict[str, List[HealthIssue]]:
+        """Issues per module name, in the original issue order."""
+        grouped: Dict[str, List[HealthIssue]] = {}
+        for issue in issues:
+            for name in self.modules_for(issue.path):
+                grouped.setdefault(name, []).append(issue)
+        return grouped
+
+
 # =============================================================================
 # MODULE STATUS BUILDING
 # =============================================================================
 
-def get_module_status(project_dir: Path, module_name: str, all_issues: List[HealthIssue] = None) -> ModuleStatus:
-    """Get detailed status for a specific module."""
-    modules = load_modules_yaml(project_dir)
+def get_module_status(
+    project_dir: Path,
+    module_name: str,
+    all_issues: List[HealthIssue] = None,
+    modules: Optional[Dict[str, Any]] = None,
+    module_issues: Optional[List[HealthIssue]] = None,
+) -> ModuleStatus:
+    """
+    Get detailed status for a specific module.
+
+    `modules` (parsed modules.yaml) and `module_issues` (this module's
+    issues, already filtered) let callers that build many statuses parse
+    the YAML and match issues once.
+    """
+    if modules is None:
+        modules = load_modules_yaml(project_dir)
     status = ModuleStatus(name=module_name)
 
     if module_name in modules:
@@ -427,7 +502,9 @@ def get_module_status(project_dir: Path, module_name: str, all_issues: List[Heal
                 status.sync_status, status.sync_summary, status.sync_updated = extract_sync_details(status.doc_chain.sync)
 
         # Get health issues (use provided list or fetch)
-        if all_issues is not None:
+        if module_issues is not None:
+            status.health_issues = list(module_issues)
+        elif all_issues is not None:
             # Filter from provided list
             status.health_issues = filter_issues_for_module(
                 all_issues, status.code_pattern, status.docs_path
@@ -440,14 +517,22 @@ def get_module_status(project_dir: Path, module_name: str, all_issues: List[Heal
     return status
 
 
-def get_all_modules_status(project_dir: Path) -> Tuple[List[ModuleStatus], List[HealthIssue]]:
+def get_all_modules_status(project_dir: Path, refresh: bool = False) -> Tuple[List[ModuleStatus], List[HealthIssue]]:
     """Get status for all modules and all health issues."""
     modules = load_modules_yaml(project_dir)
-    all_issues = get_all_health_issues(project_dir)
+    all_issues = get_all_health_issues(project_dir, refresh=refresh)
+
+    index = ModuleIssueIndex()
+    for name, mod_config in modules.items():
+        index.add(name, mod_config.get("code", ""), mod_config.get("docs", ""))
+    grouped = index.group(all_issues)
 
     statuses = []
     for name in sorted(modules.keys()):
-        status = get_module_status(project_dir, name, all_issues)
+        status = get_module_status(
+            project_dir, name, all_issues,
+            modules=modules, module_issues=grouped.get(name, []),
+        )
         statuses.append(status)
 
     return statuses, all_issues
@@ -785,7 +870,12 @@ def format_global_status(statuses: List[ModuleStatus], all_issues: List[HealthIs
 # MAIN COMMAND
 # =============================================================================
 
-def status_command(project_dir: Path, module_name: Optional[str] = None, verbose: bool = False) -> int:
+def status_command(
+    project_dir: Path,
+    module_name: Optional[str] = None,
+    verbose: bool = False,
+    refresh: bool = False,
+) -> int:
     """
     Main status command entry point.
 
@@ -793,6 +883,7 @@ def status_command(project_dir: Path, module_name: Optional[str] = None, verbose
         project_dir: Project root directory
         module_name: Optional specific module to show
         verbose: Show detailed information
+        refresh: Re-run doctor even if a fresh persisted result exists
 
     Returns:
         Exit code (0 = success)
@@ -810,7 +901,7 @@ def status_command(project_dir: Path, module_name: Optional[str] = None, verbose
 
     if module_name:
         # Single module status
-        all_issues = get_all_health_issues(project_dir)
+        all_issues = get_all_health_issues(project_dir, refresh=refresh)
         status = get_module_status(project_dir, module_name, all_issues)
 
         if not status.exists_in_yaml:
@@ -825,7 +916,7 @@ def status_command(project_dir: Path, module_name: Optional[str] = None, verbose
         print(format_module_status(status, verbose=verbose))
     else:
         # Global status
-        statuses, all_issues = get_all_modules_status(project_dir)
+        statuses, all_issues = get_all_modules_status(project_dir, refresh=refresh)
         if not statuses:
             print(f"{C.YELLOW}No modules defined in modules.yaml{C.RESET}")
             return 1
@@ -0,0 +1,219 @@
+"""
+Indexed trace analytics for .ngram/traces.
+
+Trace entries are appended to .ngram/traces/YYYY-MM-DD.jsonl. Next to each
+day file, summary/YYYY-MM-DD.json holds rolling counts for that day:
+
+    {"version": 1, "offset": <bytes of the jsonl already counted>,
+     "entries": N, "by_file": {...}, "by_action": {...},
+     "sessions": {...}, "by_day": {...}}
+
+A query streams only the bytes past `offset` (normally none for past days)
+and merges the per-day counts, so a year of traces costs one small JSON
+load per day instead of parsing every entry. A day file that shrank is
+re-counted from scratch.
+
+Writes go through TraceWriter, which buffers entries and appends them with
+one write per flush (at BUFFER_SIZE entries and at interpreter exit).
+
+Contains:
+- TraceWriter: Buffered appends to the day files
+- DaySummary: Rolling counts for one day file
+- summarize_traces: Merged counts over the last N days
+- summary_path: Summary file for a day file
+
+DOCS: docs/protocol/features/BEHAVIORS_Agent_Trace_Logging.md
+"""
+
+import atexit
+import json
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+TRACES_DIR = Path(".ngram") / "traces"
+SUMMARY_DIR = "summary"
+SUMMARY_VERSION = 1
+BUFFER_SIZE = 64
+
+
+def traces_dir(target_dir: Path) -> Path:
+    return target_dir / TRACES_DIR
+
+
+def trace_days(target_dir: Path, days: int) -> Iterator[Path]:
+    """Day files whose date is within the last `days` days, oldest first."""
+    directory = traces_dir(target_dir)
+    if not directory.exists():
+        return
+    cutoff = datetime.now() - timedelta(days=days)
+    for trace_file in sorted(directory.glob("*.jsonl")):
+        try:
+            file_date = datetime.strptime(trace_file.stem, "%Y-%m-%d")
+        except ValueError:
+            continue
+        if file_date >= cutoff:
+            yield trace_file
+
+
+# =============================================================================
+# BUFFERED WRITES
+# =============================================================================
+
+class TraceWriter:
+    """Buffers trace entries per day file and appends them in one write."""
+
+    def __init__(self, buffer_size: int = BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self._pending: Dict[Path, List[str]] = {}
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def write(self, trace_file: Path, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._pending.setdefault(trace_file, []).append(json.dumps(entry) + "\n")
+            self._count += 1
+            if self._count >= self.buffer_size:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        pending, self._pending, self._count = self._pending, {}, 0
+        for trace_file, lines in pending.items():
+            try:
+                trace_file.parent.mkdir(parents=True, exist_ok=True)
+                # One append per file keeps lines whole across processes
+                with open(trace_file, "a") as f:
+                    f.write("".join(lines))
+            except OSError:
+                continue
+
+
+_writer = TraceWriter()
+atexit.register(_writer.flush)
+
+
+def get_trace_writer() -> TraceWriter:
+    return _writer
+
+
+# =============================================================================
+# PER-DAY SUMMARIES
+# =============================================================================
+
+@dataclass
+class DaySummary:
+    """Rolling counts for one day file."""
+    offset: int = 0
+    entries: int = 0
+    by_file: Dict[str, int] = field(default_factory=dict)
+    by_action: Dict[str, int] = field(default_factory=dict)
+    sessions: Dict[str, int] = field(default_factory=dict)
+    by_day: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        self.entries += 1
+        file_path = entry.get("file", "unknown")
+        action = entry.get("action", "unknown")
+        self.by_file[file_path] = self.by_file.get(file_path, 0) + 1
+        self.by_action[action] = self.by_action.get(action, 0) + 1
+        session = entry.get("session")
+        if session:
+            self.sessions[session] = self.sessions.get(session, 0) + 1
+        ts = entry.get("ts", "")
+        if ts:
+            day = ts[:10]  # YYYY-MM-DD
+            self.by_day[day] = self.by_day.get(day, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"version": SUMMARY_VERSION, **self.__dict__}
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["DaySummary"]:
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        if data.pop("version", None) != SUMMARY_VERSION:
+            return None
+        try:
+            return cls(**data)
+        except TypeError:
+            return None
+
+
+def summary_path(trace_file: Path) -> Path:
+    return trace_file.parent / SUMMARY_DIR / f"{trace_file.stem}.json"
+
+
+def summarize_day(trace_file: Path) -> DaySummary:
+    """Bring a day's summary up to date with its jsonl file and return it."""
+    path = summary_path(trace_file)
+    summary = DaySummary.load(path) or DaySummary()
+    try:
+        size = trace_file.stat().st_size
+    except OSError:
+        return summary
+    if size == summary.offset:
+        return summary
+    if size < summary.offset:
+        summary = DaySummary()  # rewritten or truncated
+
+    with open(trace_file, "rb") as f:
+        f.seek(summary.offset)
+        tail = f.read()
+    # Only count complete lines; a partial last line is picked up next time
+    complete = tail[:tail.rfind(b"\n") + 1]
+    for line in complete.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            summary.add(json.loads(line))
+        except ValueError:
+            continue
+    summary.offset += len(complete)
+
+    try:
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(summary.to_dict()))
+        tmp.replace(path)
+    except OSError:
+        pass
+    return summary
+
+
+def summarize_traces(target_dir: Path, days: int = 7) -> Dict[str, Any]:
+    """Summary statistics over the last N days, in analyze_traces() format."""
+    get_trace_writer().flush()
+
+    total = 0
+    by_file: Counter = Counter()
+    by_action: Counter = Counter()
+    sessions = set()
+    by_day: Dict[str, int] = {}
+    for trace_file in trace_days(target_dir, days):
+        summary = summarize_day(trace_file)
+        total += summary.entries
+        by_file.update(summary.by_file)
+        by_action.update(summary.by_action)
+        sessions.update(summary.sessions)
+        for day, count in summary.by_day.items():
+            by_day[day] = by_day.get(day, 0) + count
+
+    if not total:
+        return {"total": 0, "sessions": 0, "by_file": {}, "by_action": {}}
+    return {
+        "total": total,
+        "sessions": len(sessions),
+        "by_file": dict(by_file.most_common(20)),
+        "by_action": dict(by_action),
+        "by_day": by_day,
+    }
@@ -102,6 +102,8 @@ class NgramApp(App if TEXTUAL_AVAILABLE else object):
         self._doctor_last_refresh = 0.0
         self._doctor_refresh_interval = 120.0
         self._doctor_refresh_inflight = False
+        self._live_doctor = None
+        self._live_doctor_unsubscribe = None
 
     def compose(self) -> ComposeResult:
         """Compose the TUI layout."""
@@ -311,18 +313,31 @@ class NgramApp(App if TEXTUAL_AVAILABLE else object):
             manager.add_message(f"[red]Startup error: {e}[/]")
             self.log_error(f"Health check failed: {e}")
 
+    def _get_live_doctor(self):
+        """Shared live doctor; file changes refresh the DOCTOR tab."""
+        if self._live_doctor is None:
+            from ..doctor_live import get_live_doctor
+
+            self._live_doctor = get_live_doctor(self.target_dir)
+            self._live_doctor_unsubscribe = self._live_doctor.subscribe(self._on_doctor_diff)
+        return self._live_doctor
+
+    def _on_doctor_diff(self, diff) -> None:
+        """Called on the live doctor's thread when issues changed."""
+        if not self.state.running:
+            return
+        try:
+            self.call_from_thread(self._refresh_doctor_tab, True)
+        except RuntimeError:
+            pass  # App not running (startup or shutdown)
+
     async def _load_doctor_data(self) -> tuple:
-        """Load doctor data in executor."""
-        from ..doctor import run_doctor
-        from ..doctor_files import load_doctor_config
+        """Load doctor data from the live doctor (waits for its first evaluation)."""
         import asyncio
 
         loop = asyncio.get_event_loop()
-        config = load_doctor_config(self.target_dir)
-        result = await loop.run_in_executor(
-            None,
-            lambda: run_doctor(self.target_dir, config)
-        )
+        live = self._get_live_doctor()
+        result = await loop.run_in_executor(None, live.result)
 
         score = result.get("score", 50) if isinstance(result, dict) else 50
         issues_dict = result.get("issues", {}) if isinstance(result, dict) else {}
@@ -529,7 +544,10 @@ class NgramApp(App if TEXTUAL_AVAILABLE else object):
             self._doctor_refresh_inflight = False
 
     async def _run_doctor_async(self) -> dict:
-        """Run doctor check asynchronously."""
+        """Run a full doctor check (with graph sync) asynchronously.
+
+        Explicit /doctor runs; the DOCTOR tab reads the live doctor instead.
+        """
         import asyncio
         from ..doctor import run_doctor
         from ..doctor_files import load_doctor_config
@@ -646,6 +664,8 @@ class NgramApp(App if TEXTUAL_AVAILABLE else object):
     async def action_quit(self) -> None:
         """Quit the application."""
         self.state.running = False
+        if self._live_doctor_unsubscribe:
+            self._live_doctor_unsubscribe()
         # Stop PTY if running
         if self.claude_pty and self.claude_pty.is_running:
             await self.claude_pty.stop()
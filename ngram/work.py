@@ -12,7 +12,6 @@ import subprocess
 import sys
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from threading import Lock
 from typing import List, Dict, Any, Optional
@@ -22,6 +21,7 @@ from .doctor_types import DoctorConfig
 from .work_instructions import get_issue_instructions
 from .work_report import generate_llm_report, generate_final_report
 from .agent_cli import build_agent_command, normalize_agent
+from .work_scheduler import WorkScheduler, Worktrees
 from .work_core import (
     ISSUE_PRIORITY,
     AGENT_SYMBOLS,
@@ -119,8 +119,9 @@ def spawn_work_agent(
     escalation_decisions: Optional[List['EscalationDecision']] = None,
     agent_symbol: str = "→",
     agent_provider: str = "codex",
+    state_dir: Optional[Path] = None,
 ) -> WorkResult:
-    """Spawn a work agent to fix a single issue."""
+    """Spawn a work agent to fix a single issue (config saved under `state_dir`, default `target_dir`)."""
     agent_provider = normalize_agent(agent_provider)
 
     instructions = get_issue_instructions(issue, target_dir)
@@ -180,6 +181,7 @@ def spawn_work_agent(
         agent_provider=agent_provider,
         max_verification_retries=3,
         membrane_query=None,  # TODO: Connect to membrane MCP
+        state_dir=state_dir,
     ))
 
 
@@ -339,8 +341,8 @@ def work_command(
     completed_count = [0]  # Use list to allow modification in nested function
     manager_responses: List[str] = []  # Track manager responses for report
 
-    def run_work(issue_tuple, config: DoctorConfig, escalation_decisions=None): # Added config
-        """Run a single work in a thread."""
+    def run_work(issue_tuple, config: DoctorConfig, escalation_decisions=None, work_dir: Optional[Path] = None): # Added config
+        """Run a single work in a thread (in `work_dir`, e.g. its own worktree, if given)."""
         idx, issue = issue_tuple
         github_issue_num = github_mapping.get(issue.path)
 
@@ -360,13 +362,14 @@ def work_command(
 
         result = spawn_work_agent(
             issue,
-            target_dir,
+            work_dir or target_dir,
             config, # Pass config
             dry_run=False,
             github_issue_number=github_issue_num,
             escalation_decisions=escalation_decisions,
             agent_symbol=agent_sym,
             agent_provider=agent_provider,
+            state_dir=target_dir,
         )
 
         with print_lock:
@@ -501,24 +504,29 @@ def work_command(
         print(f"  Running {len(other_issues)} works with {active_workers} parallel agents...")
         print()
 
-        with ThreadPoolExecutor(max_workers=parallel) as executor:
-            futures = {
-                executor.submit(run_work, issue_tuple): issue_tuple[1]
-                for issue_tuple in other_issues
-            }
+        # Overlapping issues run one at a time; the rest run in their own worktrees
+        scheduler = WorkScheduler(
+            run=lambda issue_tuple, work_dir: run_work(issue_tuple, config, work_dir=work_dir),
+            workers=parallel,
+            target_dir=target_dir,
+            worktrees=Worktrees.for_repo(target_dir),
+        )
 
-            for future in as_completed(futures):
-                result = future.result()
-                work_results.append(result)
+        def on_result(result):
+            # Log for manager context
+            log_entry = f"[{result.issue_type}] {result.target_path}: {'SUCCESS' if result.success else 'FAILED'}"
+            recent_logs.append(log_entry)
 
-                # Log for manager context
-                log_entry = f"[{result.issue_type}] {result.target_path}: {'SUCCESS' if result.success else 'FAILED'}"
-                recent_logs.append(log_entry)
+            # Check for manager input periodically
+            manager_response = check_for_manager_input(recent_logs, target_dir, agent_provider)
+            if manager_response:
+                manager_responses.append(manager_response)
+                if "STOP WORKS" in manager_response:
+                    print(f"\n  {Colors.BOLD}Manager requested stop. Finishing running works.{Colors.RESET}")
+                    scheduler.stop()
 
-                # Check for manager input periodically
-                manager_response = check_for_manager_input(recent_logs, target_dir, agent_provider)
-                if manager_response:
-                    manager_responses.append(manager_response)
+        work_results.extend(scheduler.run(other_issues, on_result=on_result))
+        print(f"  {Colors.DIM}{scheduler.stats.format_line()}{Colors.RESET}")
     else:
         # Sequential execution with more verbose output
         for i, issue in other_issues:
@@ -29,6 +29,7 @@ from .doctor_types import DoctorConfig
 from .doctor_files import save_doctor_config
 from .work_verification import (
     verify_completion,
+    VerificationCache,
     format_verification_feedback,
     all_passed,
     get_failed_membrane_protocols,
@@ -636,9 +637,14 @@ async def spawn_work_agent_async(
     session_dir: Optional[Path] = None,
     agent_symbol: Optional[str] = None,
     agent_provider: str = "codex",
+    state_dir: Optional[Path] = None,
 ) -> WorkResult:
     """
     Async version of spawn_work_agent for TUI integration.
+
+    `state_dir` is the project whose `.ngram/config.yaml` records model
+    fallbacks; it defaults to `target_dir` and differs when the agent works
+    in a throwaway worktree.
     """
     # Handle ESCALATION decisions
     if issue.issue_type == "ESCALATION" and escalation_decisions:
@@ -798,7 +804,7 @@ async def spawn_work_agent_async(
                 logger.warning(f"Rate limit hit for Gemini. Falling back to {GEMINI_FALLBACK_MODEL} and retrying.")
                 current_gemini_model = GEMINI_FALLBACK_MODEL
                 config.gemini_model_fallback_status[fallback_key] = current_gemini_model
-                save_doctor_config(target_dir, config)
+                save_doctor_config(state_dir or target_dir, config)
                 continue
 
             duration = time.time() - start_time
@@ -880,6 +886,7 @@ async def spawn_work_agent_with_verification_async(
     max_verification_retries: int = 3,
     membrane_query: Optional[Callable] = None,
     use_graph_agents: bool = True,
+    state_dir: Optional[Path] = None,
 ) -> WorkResult:
     """
     Spawn work agent with mandatory verification and retry on failure.
@@ -906,6 +913,7 @@ async def spawn_work_agent_with_verification_async(
         max_verification_retries: Max retries on verification failure
         membrane_query: Optional membrane query function
         use_graph_agents: Whether to use graph-based agent selection/status
+        state_dir: Project that keeps `.ngram/config.yaml` (defaults to target_dir)
 
     Returns:
         WorkResult with verification info
@@ -932,6 +940,8 @@ async def spawn_work_agent_with_verification_async(
     retry_count = 0
     last_result = None
     continue_feedback = ""
+    # Retries reuse command results whose input files the agent left alone
+    verification_cache = VerificationCache()
 
     try:
         while retry_count <= max_verification_retries:
@@ -958,6 +968,7 @@ async def spawn_work_agent_with_verification_async(
                 session_dir=session_dir,
                 agent_symbol=agent_symbol,
                 agent_provider=agent_provider,
+                state_dir=state_dir,
             )
 
             # Capture git HEAD after
@@ -980,6 +991,7 @@ async def spawn_work_agent_with_verification_async(
                 head_before=head_before,
                 head_after=head_after,
                 membrane_query=membrane_query,
+                cache=verification_cache,
             )
 
             if all_passed(verification_results):
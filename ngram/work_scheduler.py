@@ -0,0 +1,388 @@
+"""
+Conflict-aware scheduling for parallel work agents.
+
+Each issue gets a footprint: the path it targets plus the module that
+owns it (modules.yaml `code` glob or `docs` directory). Issues whose
+footprints overlap — one path inside the other, or a shared module — are
+never run at the same time; they run one after another in queue order.
+Everything else runs concurrently, up to the pool size.
+
+In a git checkout every agent gets its own `git worktree` on a throwaway
+branch, so agents never see each other's half-written files. When an
+agent finishes, its commits are cherry-picked onto the main checkout in
+completion order and the worktree is removed; agent state under
+`.ngram/agents` is copied back first. A pick that conflicts leaves the
+branch in place for a manual merge. If the main checkout has uncommitted
+changes when the run starts, no worktrees are made: agents wouldn't see
+those edits and their commits couldn't be picked onto them, so they share
+`target_dir` instead, as they do outside git, and only the footprint
+serialization applies. Changes made during the run still stop a pick and
+keep the branch.
+
+The scheduler reports agent utilization (busy agent-seconds over
+slots x wall time) and how long each issue waited in the queue, which is
+what sizing `--parallel` needs.
+
+DOCS: docs/cli/core/ALGORITHM_CLI_Command_Execution_Logic/ALGORITHM_Overview.md
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .doctor_tasks import get_module_for_path, load_modules_yaml
+
+# Untracked files agents expect to find in their checkout
+CONTEXT_FILES = (".ngram/CLAUDE.md",)
+
+# Agent state written inside a worktree, copied back before it is removed
+STATE_DIRS = (".ngram/agents",)
+
+BRANCH_PREFIX = "ngram-work"
+
+
+# =============================================================================
+# FOOTPRINTS
+# =============================================================================
+
+def _normalize(path: str, target_dir: Path) -> str:
+    """Repo-relative posix path; "" means the whole project."""
+    candidate = Path(str(path or "").strip())
+    if candidate.is_absolute():
+        try:
+            candidate = candidate.relative_to(target_dir)
+        except ValueError:
+            pass
+    text = candidate.as_posix().strip("/")
+    return "" if text in (".", "") else text
+
+
+def _nested(a: str, b: str) -> bool:
+    return a == b or not a or not b or b.startswith(a + "/") or a.startswith(b + "/")
+
+
+@dataclass(frozen=True)
+class Footprint:
+    """Paths and modules an issue's agent is expected to touch."""
+    paths: FrozenSet[str] = frozenset()
+    modules: FrozenSet[str] = frozenset()
+
+    def overlaps(self, other: "Footprint") -> bool:
+        if self.modules & other.modules:
+            return True
+        return any(_nested(a, b) for a in self.paths for b in other.paths)
+
+
+def _module_for(path: str, modules: Dict[str, Any], target_dir: Path) -> Optional[str]:
+    module = get_module_for_path(path, modules, target_dir)
+    if module != "orphan":
+        return module
+    if not path:
+        return None
+    for module_id, module_data in modules.items():
+        if not isinstance(module_data, dict):
+            continue
+        docs = str(module_data.get("docs", "") or "").strip("/")
+        if docs and _nested(docs, path):
+            return module_id
+    return None
+
+
+def issue_footprint(issue, modules: Dict[str, Any], target_dir: Path) -> Footprint:
+    """Footprint of a DoctorIssue: its path and, if mapped, its module."""
+    path = _normalize(issue.path, target_dir)
+    module = _module_for(path, modules, target_dir)
+    return Footprint(
+        paths=frozenset([path]),
+        modules=frozenset([module]) if module else frozenset(),
+    )
+
+
+# =============================================================================
+# WORKTREES
+# =============================================================================
+
+def _git(cwd: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
+
+
+@dataclass
+class Checkout:
+    """One agent's worktree."""
+    path: Path
+    branch: str
+    base: str
+
+
+class Worktrees:
+    """Throwaway `git worktree` checkouts of one repository."""
+
+    def __init__(self, repo_dir: Path, root: Optional[Path] = None):
+        self.repo_dir = Path(repo_dir)
+        self.root = Path(root) if root else Path(tempfile.mkdtemp(prefix="ngram-worktrees-"))
+        self._lock = threading.Lock()  # git serializes worktree/index updates anyway
+        self._live: Dict[str, Checkout] = {}
+
+    @classmethod
+    def for_repo(cls, repo_dir: Path) -> Optional["Worktrees"]:
+        """Worktrees for `repo_dir`, or None if it is not a git checkout with a commit."""
+        try:
+            head = _git(Path(repo_dir), "rev-parse", "--verify", "HEAD")
+        except (OSError, subprocess.SubprocessError):
+            return None
+        if head.returncode != 0:
+            return None
+        return cls(repo_dir)
+
+    def checkout(self, name: str) -> Optional[Checkout]:
+        """New worktree at the main checkout's HEAD; None if git refuses."""
+        with self._lock:
+            base = _git(self.repo_dir, "rev-parse", "HEAD").stdout.strip()
+            branch = f"{BRANCH_PREFIX}/{name}-{base[:8]}-{time.monotonic_ns() % 10**6}"
+            path = self.root / branch.replace("/", "-")
+            added = _git(self.repo_dir, "worktree", "add", "-q", "-b", branch, str(path), base)
+        if added.returncode != 0:
+            return None
+        checkout = Checkout(path=path, branch=branch, base=base)
+        self._live[branch] = checkout
+        for rel in CONTEXT_FILES:
+            src, dst = self.repo_dir / rel, path / rel
+            if src.exists() and not dst.exists():
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy(src, dst)
+        return checkout
+
+    def has_uncommitted_changes(self) -> bool:
+        """True if tracked files in the main checkout differ from HEAD (or git can't tell)."""
+        status = _git(self.repo_dir, "status", "--porcelain", "--untracked-files=no")
+        return status.returncode != 0 or bool(status.stdout.strip())
+
+    def merge_back(self, checkout: Checkout) -> Optional[str]:
+        """Cherry-pick the checkout's new commits onto the main checkout; error text on failure."""
+        with self._lock:
+            commits = _git(self.repo_dir, "rev-list", f"{checkout.base}..{checkout.branch}").stdout.split()
+            if not commits:
+                return None
+            if self.has_uncommitted_changes():
+                return "main checkout has uncommitted changes"
+            picked = _git(self.repo_dir, "cherry-pick", f"{checkout.base}..{checkout.branch}")
+            if picked.returncode == 0:
+                return None
+            _git(self.repo_dir, "cherry-pick", "--abort")
+        lines = (picked.stderr or picked.stdout).strip().splitlines()
+        return lines[-1] if lines else f"git cherry-pick exited {picked.returncode}"
+
+    def remove(self, checkout: Checkout, keep_branch: bool = False) -> None:
+        """Drop the worktree (after copying agent state back) and, unless kept, its branch."""
+        for rel in STATE_DIRS:
+            src = checkout.path / rel
+            if src.is_dir():
+                shutil.copytree(src, self.repo_dir / rel, dirs_exist_ok=True)
+        with self._lock:
+            _git(self.repo_dir, "worktree", "remove", "--force", str(checkout.path))
+            if not keep_branch:
+                _git(self.repo_dir, "branch", "-D", checkout.branch)
+            self._live.pop(checkout.branch, None)
+
+    def close(self) -> None:
+        """Remove every checkout still around (e.g. after an agent raised)."""
+        for checkout in list(self._live.values()):
+            self.remove(checkout)
+        shutil.rmtree(self.root, ignore_errors=True)
+        with self._lock:
+            _git(self.repo_dir, "worktree", "prune")
+
+
+# =============================================================================
+# SCHEDULER
+# =============================================================================
+
+@dataclass
+class SchedulerStats:
+    """Pool sizing numbers for one scheduler run."""
+    workers: int
+    wall_seconds: float = 0.0
+    busy_seconds: float = 0.0
+    queue_waits: List[float] = field(default_factory=list)
+    deferred: int = 0        # issues held back at least once by an overlapping footprint
+    isolated: int = 0        # issues run in their own worktree
+    merge_failures: int = 0
+    kept_branches: List[str] = field(default_factory=list)  # left for a manual merge
+    shared_checkout: Optional[str] = None  # why agents ran in target_dir instead of worktrees
+
+    @property
+    def utilization(self) -> float:
+        capacity = self.workers * self.wall_seconds
+        return self.busy_seconds / capacity if capacity > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        waits = self.queue_waits
+        return {
+            "workers": self.workers,
+            "issues": len(waits),
+            "wall_seconds": round(self.wall_seconds, 3),
+            "busy_seconds": round(self.busy_seconds, 3),
+            "utilization": round(self.utilization, 3),
+            "avg_queue_wait": round(sum(waits) / len(waits), 3) if waits else 0.0,
+            "max_queue_wait": round(max(waits), 3) if waits else 0.0,
+            "deferred": self.deferred,
+            "isolated": self.isolated,
+            "merge_failures": self.merge_failures,
+            "kept_branches": list(self.kept_branches),
+            "shared_checkout": self.shared_checkout,
+        }
+
+    def format_line(self) -> str:
+        data = self.to_dict()
+        line = (
+            f"Agents {data['utilization']:.0%} busy across {self.workers} slots, "
+            f"queue wait avg {data['avg_queue_wait']:.1f}s / max {data['max_queue_wait']:.1f}s"
+        )
+        if self.deferred:
+            line += f", {self.deferred} held back by overlap"
+        if self.merge_failures:
+            line += f", {self.merge_failures} merge failure(s)"
+        if self.kept_branches:
+            line += f" (merge by hand: {', '.join(self.kept_branches)})"
+        if self.shared_checkout:
+            line += f"; no worktrees, {self.shared_checkout}"
+        return line
+
+
+@dataclass
+class _Job:
+    item: Any
+    footprint: Footprint
+    queued_at: float
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    deferred: bool = False
+    checkout: Optional[Checkout] = None
+
+
+class WorkScheduler:
+    """
+    Runs `run(item, work_dir)` for each (idx, issue) item.
+
+    Items with overlapping footprints run in queue order, one at a time;
+    the rest fill the pool. Results come back in completion order.
+    """
+
+    def __init__(
+        self,
+        run: Callable[[Any, Path], Any],
+        workers: int,
+        target_dir: Path,
+        worktrees: Optional[Worktrees] = None,
+        footprint: Optional[Callable[[Any], Footprint]] = None,
+    ):
+        self.run_item = run
+        self.workers = max(1, workers)
+        self.target_dir = Path(target_dir)
+        self.worktrees = worktrees
+        if footprint is None:
+            modules = load_modules_yaml(self.target_dir)
+            footprint = lambda issue: issue_footprint(issue, modules, self.target_dir)
+        self.footprint = footprint
+        self.stats = SchedulerStats(workers=self.workers)
+        self._stopped = False
+
+    def stop(self) -> None:
+        """Start no further items; running ones finish and merge."""
+        self._stopped = True
+
+    def _ready(self, pending: List[_Job], running: Iterable[_Job]) -> List[_Job]:
+        """Pending jobs that overlap nothing running and nothing queued ahead of them."""
+        blocked = [job.footprint for job in running]
+        ready = []
+        for job in pending:
+            if any(job.footprint.overlaps(other) for other in blocked):
+                if not job.deferred:
+                    job.deferred = True
+                    self.stats.deferred += 1
+            else:
+                ready.append(job)
+            blocked.append(job.footprint)
+        return ready
+
+    def _work(self, job: _Job) -> Any:
+        job.started_at = time.monotonic()
+        try:
+            if self.worktrees is not None:
+                idx = job.item[0] if isinstance(job.item, tuple) else id(job.item)
+                job.checkout = self.worktrees.checkout(str(idx))
+            work_dir = job.checkout.path if job.checkout else self.target_dir
+            return self.run_item(job.item, work_dir)
+        finally:
+            job.finished_at = time.monotonic()
+
+    def _merge(self, job: _Job, result: Any) -> None:
+        if job.checkout is None:
+            return
+        self.stats.isolated += 1
+        keep_branch = False
+        try:
+            if getattr(result, "success", True):
+                error = self.worktrees.merge_back(job.checkout)
+                if error:
+                    # The agent's commits stay on their branch for a manual merge
+                    keep_branch = True
+                    self.stats.merge_failures += 1
+                    self.stats.kept_branches.append(job.checkout.branch)
+                    if hasattr(result, "success"):
+                        result.success = False
+                        result.error = f"Merge failed: {error}; commits kept on branch {job.checkout.branch}"
+        finally:
+            self.worktrees.remove(job.checkout, keep_branch=keep_branch)
+
+    def run(self, items: Iterable[Tuple[int, Any]], on_result: Optional[Callable[[Any], None]] = None) -> List[Any]:
+        started = time.monotonic()
+        pending = [
+            _Job(item=item, footprint=self.footprint(item[1]), queued_at=started)
+            for item in items
+        ]
+        running: Dict[Any, _Job] = {}
+        results: List[Any] = []
+
+        if self.worktrees is not None and self.worktrees.has_uncommitted_changes():
+            # Checked once, before any agent runs, rather than failing each merge
+            self.stats.shared_checkout = "main checkout has uncommitted changes"
+            self.worktrees.close()
+            self.worktrees = None
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="work") as pool:
+            try:
+                while running or (pending and not self._stopped):
+                    if not self._stopped:
+                        for job in self._ready(pending, running.values()):
+                            if len(running) >= self.workers:
+                                break
+                            pending.remove(job)
+                            running[pool.submit(self._work, job)] = job
+
+                    done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                    for future in sorted(done, key=lambda f: running[f].finished_at):
+                        job = running.pop(future)
+                        self.stats.busy_seconds += job.finished_at - job.started_at
+                        self.stats.queue_waits.append(job.started_at - job.queued_at)
+                        result = future.result()
+                        self._merge(job, result)
+                        results.append(result)
+                        if on_result is not None:
+                            on_result(result)
+            finally:
+                self.stats.wall_seconds = time.monotonic() - started
+                if self.worktrees is not None:
+                    # Let in-flight agents finish before their checkouts go away
+                    pool.shutdown(wait=True)
+                    self.worktrees.close()
+
+        return results
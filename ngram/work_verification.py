@@ -8,6 +8,11 @@ Verifies agent work before marking complete:
 
 On failure: restarts agent with --continue and detailed feedback.
 
+Independent checks run concurrently. Command results are memoized by
+(command, content hash of the files it reads) in a VerificationCache that
+lives across retries, so a retry only re-runs the commands whose inputs
+the agent's new diff changed.
+
 LOOP PROTECTION:
 - Max retries per issue (default: 3)
 - Max total retries per session (default: 10)
@@ -17,12 +22,15 @@ LOOP PROTECTION:
 DOCS: docs/membrane/VALIDATION_Completion_Verification.md
 """
 
+import hashlib
 import re
 import subprocess
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable, Set
+from typing import Any, Dict, List, Optional, Callable, Set, Tuple
 
 from .doctor_types import DoctorIssue
 
@@ -32,6 +40,10 @@ MAX_RETRIES_PER_ISSUE = 3
 MAX_TOTAL_SESSION_RETRIES = 10
 OSCILLATION_DETECTION_WINDOW = 5  # Check last N results for oscillation
 
+# Checks run concurrently on this many threads
+VERIFY_WORKERS = 4
+COMMAND_TIMEOUT = 120
+
 
 @dataclass
 class VerificationSession:
@@ -107,6 +119,9 @@ class VerificationCheck:
     # For command checks
     command: Optional[str] = None
     expect_exit_code: int = 0
+    # Files the command depends on ({path}, {test_path} substituted);
+    # None means never reuse an earlier result
+    reads: Optional[List[str]] = None
 
 
 @dataclass
@@ -121,6 +136,88 @@ class VerificationResult:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class CommandOutcome:
+    """What one command run produced."""
+    returncode: int
+    stdout: str = ""
+    stderr: str = ""
+
+
+def _fingerprint(paths: List[str], target_dir: Path) -> Tuple[Tuple[str, str], ...]:
+    """Content hash per path (directories hash every file under them)."""
+    prints = []
+    for rel in sorted(set(paths)):
+        full = target_dir / rel
+        digest = hashlib.sha1()
+        if full.is_file():
+            digest.update(full.read_bytes())
+        elif full.is_dir():
+            for child in sorted(full.rglob("*")):
+                if child.is_file() and "__pycache__" not in child.parts:
+                    digest.update(child.relative_to(full).as_posix().encode())
+                    digest.update(child.read_bytes())
+        else:
+            prints.append((rel, "missing"))
+            continue
+        prints.append((rel, digest.hexdigest()))
+    return tuple(prints)
+
+
+class VerificationCache:
+    """
+    Command outcomes keyed by (command, cwd, hash of the files it reads).
+
+    Shared by every verification attempt of one work session. Concurrent
+    requests for the same key run the command once. Only passing outcomes
+    are kept: a failure may come from a file outside `reads` (a conftest, a
+    dependency), so the next attempt always re-runs it. Timeouts and errors
+    are not kept either.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple, Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def run(
+        self,
+        command: str,
+        target_dir: Path,
+        reads: Optional[List[str]],
+        expect_exit_code: int = 0,
+    ) -> Tuple[CommandOutcome, bool]:
+        """Outcome of `command`, and whether it came from the cache."""
+        if reads is None:
+            return _execute_command(command, target_dir), False
+
+        key = (command, str(target_dir), _fingerprint(reads, target_dir))
+        with self._lock:
+            future = self._entries.get(key)
+            owner = future is None
+            if owner:
+                future = self._entries[key] = Future()
+                self.misses += 1
+            else:
+                self.hits += 1
+        if not owner:
+            return future.result(), True
+
+        try:
+            outcome = _execute_command(command, target_dir)
+        except BaseException as e:
+            with self._lock:
+                self._entries.pop(key, None)
+            future.set_exception(e)
+            raise
+        if outcome.returncode != expect_exit_code:
+            with self._lock:
+                self._entries.pop(key, None)
+        future.set_result(outcome)
+        return outcome, False
+
+
 # Verification checks by issue type
 VERIFICATION_CHECKS: Dict[str, List[VerificationCheck]] = {
     "UNDOCUMENTED": [
@@ -239,6 +336,7 @@ VERIFICATION_CHECKS: Dict[str, List[VerificationCheck]] = {
             check_type="command",
             description="Tests pass",
             command="pytest {test_path} -v --tb=short",
+            reads=["{path}", "{test_path}"],
             action_on_fail="Fix failing tests",
         ),
         VerificationCheck(
@@ -262,6 +360,7 @@ VERIFICATION_CHECKS: Dict[str, List[VerificationCheck]] = {
             check_type="command",
             description="Tests pass",
             command="pytest {test_path} -v --tb=short",
+            reads=["{path}", "{test_path}"],
             action_on_fail="Fix failing tests",
         ),
     ],
@@ -278,6 +377,7 @@ VERIFICATION_CHECKS: Dict[str, List[VerificationCheck]] = {
             check_type="command",
             description="Module imports successfully",
             command="python -c 'import {module}'",
+            reads=["{path}"],
             action_on_fail="Fix import paths",
         ),
         VerificationCheck(
@@ -285,6 +385,7 @@ VERIFICATION_CHECKS: Dict[str, List[VerificationCheck]] = {
             check_type="command",
             description="Tests pass after refactoring",
             command="pytest {test_path} -v --tb=short",
+            reads=["{path}", "{test_path}"],
             action_on_fail="Update tests for new structure",
         ),
         VerificationCheck(
@@ -308,6 +409,7 @@ VERIFICATION_CHECKS: Dict[str, List[VerificationCheck]] = {
             check_type="command",
             description="Tests pass",
             command="pytest {test_path} -v --tb=short",
+            reads=["{path}", "{test_path}"],
             action_on_fail="Fix tests",
         ),
         VerificationCheck(
@@ -459,6 +561,7 @@ def _run_command_check(
     check: VerificationCheck,
     issue: DoctorIssue,
     target_dir: Path,
+    cache: Optional[VerificationCache] = None,
 ) -> VerificationResult:
     """Run a command-based verification check."""
     if not check.command:
@@ -477,14 +580,12 @@ def _run_command_check(
     )
 
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            cwd=target_dir,
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
+        if cache is not None:
+            result, cached = cache.run(
+                command, target_dir, _format_reads(check, issue, target_dir), check.expect_exit_code
+            )
+        else:
+            result, cached = _execute_command(command, target_dir), False
         passed = result.returncode == check.expect_exit_code
 
         if passed:
@@ -501,6 +602,7 @@ def _run_command_check(
             details={
                 "stdout": result.stdout[:500] if result.stdout else "",
                 "stderr": result.stderr[:500] if result.stderr else "",
+                "cached": cached,
             },
         )
 
@@ -522,6 +624,25 @@ def _run_command_check(
         )
 
 
+def _execute_command(command: str, target_dir: Path) -> CommandOutcome:
+    result = subprocess.run(
+        command,
+        shell=True,
+        cwd=target_dir,
+        capture_output=True,
+        text=True,
+        timeout=COMMAND_TIMEOUT,
+    )
+    return CommandOutcome(result.returncode, result.stdout or "", result.stderr or "")
+
+
+def _format_reads(check: VerificationCheck, issue: DoctorIssue, target_dir: Path) -> Optional[List[str]]:
+    if check.reads is None:
+        return None
+    values = {"path": issue.path, "test_path": _find_test_path(issue.path, target_dir)}
+    return [r.format(**values) for r in check.reads]
+
+
 def _run_membrane_check(
     check: VerificationCheck,
     issue: DoctorIssue,
@@ -831,49 +952,63 @@ def _path_to_module(path: str) -> str:
     return module
 
 
+def _run_check(
+    check: VerificationCheck,
+    issue: DoctorIssue,
+    target_dir: Path,
+    membrane_query: Optional[Callable],
+    cache: Optional[VerificationCache],
+) -> VerificationResult:
+    if check.check_type == "file":
+        return _run_file_check(check, issue, target_dir)
+    if check.check_type == "command":
+        return _run_command_check(check, issue, target_dir, cache)
+    if check.check_type == "membrane":
+        return _run_membrane_check(check, issue, target_dir, membrane_query)
+    return VerificationResult(
+        check_name=check.name,
+        check_type=check.check_type,
+        passed=False,
+        message=f"Unknown check type: {check.check_type}",
+    )
+
+
 def verify_completion(
     issue: DoctorIssue,
     target_dir: Path,
     head_before: Optional[str] = None,
     head_after: Optional[str] = None,
     membrane_query: Optional[Callable] = None,
+    cache: Optional[VerificationCache] = None,
 ) -> List[VerificationResult]:
     """
     Run all verification checks for an issue type.
 
+    Checks run concurrently; results keep the order of the checks.
+
     Args:
         issue: The doctor issue being verified
         target_dir: Project root directory
         head_before: Git HEAD before work
         head_after: Git HEAD after work
         membrane_query: Optional function to query membrane/graph
+        cache: Command results from earlier attempts, reused while the
+            files each command reads are unchanged
 
     Returns:
         List of verification results
     """
-    results = []
-
     # Get issue-specific checks
     checks = VERIFICATION_CHECKS.get(issue.issue_type, [])
 
     # Add global checks
     all_checks = checks + GLOBAL_CHECKS
 
-    for check in all_checks:
-        if check.check_type == "file":
-            result = _run_file_check(check, issue, target_dir)
-        elif check.check_type == "command":
-            result = _run_command_check(check, issue, target_dir)
-        elif check.check_type == "membrane":
-            result = _run_membrane_check(check, issue, target_dir, membrane_query)
-        else:
-            result = VerificationResult(
-                check_name=check.name,
-                check_type=check.check_type,
-                passed=False,
-                message=f"Unknown check type: {check.check_type}",
-            )
-        results.append(result)
+    with ThreadPoolExecutor(max_workers=VERIFY_WORKERS, thread_name_prefix="verify") as pool:
+        results = list(pool.map(
+            lambda check: _run_check(check, issue, target_dir, membrane_query, cache),
+            all_checks,
+        ))
 
     # Special check: git commit
     if head_before and head_after:
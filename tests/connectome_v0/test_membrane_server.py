@@ -0,0 +1,149 @@
+"""
+Tests for the membrane MCP server's request dispatcher
+
+Tests concurrent JSON-RPC handling without a graph or real tools:
+- A slow call does not hold up later requests; responses match by id
+- Calls to one tool are capped at its concurrency limit
+- Cancelled requests and notifications get no response
+- Concurrent agent_spawn calls never run the same agent twice
+"""
+
+import asyncio
+import io
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "tools" / "mcp"))
+
+import membrane_server
+from membrane_server import MembraneServer, RequestDispatcher
+from ngram.agent_spawn import SpawnResult
+
+
+class FakeServer:
+    """handle_request that sleeps for params.arguments.delay seconds."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+        self.handled = []
+
+    def handle_request(self, request):
+        params = request.get("params") or {}
+        name = params.get("name", request.get("method"))
+        with self.lock:
+            self.active[name] = self.active.get(name, 0) + 1
+            self.peak[name] = max(self.peak.get(name, 0), self.active[name])
+        time.sleep((params.get("arguments") or {}).get("delay", 0))
+        with self.lock:
+            self.active[name] -= 1
+            self.handled.append(request["id"])
+        return {"jsonrpc": "2.0", "id": request["id"], "result": name}
+
+
+def _call(request_id, name, delay=0.0):
+    return json.dumps({
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": name, "arguments": {"delay": delay}},
+    })
+
+
+def _serve(lines, **kwargs):
+    server = FakeServer()
+    stdout = io.StringIO()
+    dispatcher = RequestDispatcher(server, **kwargs)
+    asyncio.run(dispatcher.serve(io.StringIO("\n".join(lines) + "\n"), stdout))
+    responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    return server, responses
+
+
+def test_slow_call_does_not_block_later_requests():
+    started = time.perf_counter()
+    _, responses = _serve([
+        _call(1, "slow", delay=0.3),
+        json.dumps({"jsonrpc": "2.0", "id": 2, "method": "tools/list"}),
+        _call(3, "fast", delay=0.05),
+        "{not json",
+    ])
+
+    assert time.perf_counter() - started < 0.5
+    assert [r["id"] for r in responses][-2:] == [3, 1]
+    by_id = {r["id"]: r for r in responses}
+    assert by_id[None]["error"]["code"] == -32700
+    assert {i: by_id[i]["result"] for i in (1, 2, 3)} == {1: "slow", 2: "tools/list", 3: "fast"}
+
+
+def test_per_tool_concurrency_limit():
+    lines = [_call(i, "agent_spawn", delay=0.05) for i in range(4)]
+    lines += [_call(10 + i, "other", delay=0.05) for i in range(4)]
+    server, responses = _serve(lines, limits={"agent_spawn": 2})
+
+    assert len(responses) == 8
+    assert server.peak == {"agent_spawn": 2, "other": 4}
+
+
+def test_cancelled_and_notifications_get_no_response():
+    cancel = json.dumps({
+        "jsonrpc": "2.0",
+        "method": "notifications/cancelled",
+        "params": {"requestId": 2},
+    })
+    initialized = json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"})
+    server, responses = _serve(
+        [_call(1, "tool", delay=0.1), _call(2, "tool", delay=0.1), cancel, initialized],
+        limits={"tool": 1},
+    )
+
+    assert [r["id"] for r in responses] == [1]
+    # Request 2 was still queued on the tool limit, so it never ran
+    assert server.handled == [1]
+
+
+class FakeAgentGraph:
+    def get_all_agents(self):
+        return []
+
+    def upsert_issue_narrative(self, **kwargs):
+        return None
+
+    def upsert_task_narrative(self, **kwargs):
+        return None
+
+
+def test_concurrent_spawns_claim_agent_once(monkeypatch):
+    running = []
+
+    async def fake_spawn(agent_id, **kwargs):
+        running.append(agent_id)
+        await asyncio.sleep(0.1)
+        return SpawnResult(success=True, agent_id=agent_id, output="")
+
+    monkeypatch.setattr(membrane_server, "spawn_work_agent", fake_spawn)
+    server = MembraneServer.__new__(MembraneServer)
+    server.agent_graph = FakeAgentGraph()
+    server.target_dir = Path(".")
+    server._spawning = set()
+    server._spawn_lock = threading.Lock()
+
+    args = {"agent_id": "agent_fixer", "issue_type": "STALE_SYNC", "path": "docs"}
+    texts = []
+    threads = [
+        threading.Thread(target=lambda: texts.append(server._tool_agent_spawn(dict(args))["content"][0]["text"]))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert running == ["agent_fixer"]
+    assert sum("already running" in t for t in texts) == 1
+    # Released once the spawn finishes
+    server._tool_agent_spawn(dict(args))
+    assert running == ["agent_fixer", "agent_fixer"]
@@ -0,0 +1,83 @@
+"""
+Tests for ngram CLI cold start
+
+Tests the lazy subcommand registry:
+- Hook-invoked commands stay under the import-time budget
+- Heavy dependencies are not imported at startup
+- Lazy stand-ins resolve to the real entry points
+
+DOCS: docs/ngram_cli_core/PATTERNS_ngram_cli_core.md
+"""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from ngram import cli
+from ngram.import_budget import (
+    HEAVY_MODULES,
+    HOOK_BUDGET_MS,
+    HOOK_COMMANDS,
+    measure_command,
+    parse_importtime,
+)
+
+
+class TestImportBudget:
+    """Cold-start budget for the hook path."""
+
+    @pytest.mark.parametrize("command", [None, *HOOK_COMMANDS])
+    def test_hook_commands_under_budget(self, command):
+        report = measure_command(command)
+
+        heavy = [m for m in HEAVY_MODULES if report.imported(m)]
+        assert heavy == [], f"{report.statement} imports {heavy}"
+        assert report.total_ms < HOOK_BUDGET_MS
+
+    def test_subcommand_modules_not_imported_by_cli(self):
+        report = measure_command(None)
+
+        for name in ("ngram.doctor", "ngram.work", "ngram.repo_overview", "ngram.symbol_extractor"):
+            assert not report.imported(name)
+
+    def test_help_does_not_import_subcommands(self):
+        code = (
+            "import sys; sys.argv = ['ngram', '--help']\n"
+            "from ngram.cli import main\n"
+            "try:\n    main()\nexcept SystemExit:\n    pass\n"
+            "print('loaded=' + ','.join(m for m in sys.modules if m in ('ngram.doctor', 'ngram.work', 'yaml')))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip().splitlines()[-1] == "loaded="
+
+
+class TestLazyRegistry:
+    """Lazy stand-ins and re-exports."""
+
+    def test_every_entry_point_resolves(self):
+        for name, (module_name, attr) in cli._LAZY_COMMANDS.items():
+            module = importlib.import_module(module_name, "ngram")
+            assert callable(getattr(module, attr)), name
+
+    def test_every_subcommand_has_an_entry(self):
+        assert set(cli._SUBCOMMAND_ENTRY.values()) <= set(cli._LAZY_COMMANDS)
+
+    def test_legacy_reexports(self):
+        from ngram.cli import ClusterMetrics
+        from ngram.cluster_metrics import ClusterMetrics as real
+
+        assert ClusterMetrics is real
+
+
+def test_parse_importtime_depth():
+    entries = parse_importtime(
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       100 |        100 |     json.decoder\n"
+        "import time:       200 |        300 |   json\n"
+    )
+    assert [(e.module, e.depth, e.cumulative_us) for e in entries] == [
+        ("json.decoder", 2, 100),
+        ("json", 1, 300),
+    ]
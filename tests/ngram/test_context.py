@@ -0,0 +1,94 @@
+"""
+Tests for ngram context
+
+Tests the dependency map behind `ngram context`:
+- Each file, import and docs folder is resolved once per invocation
+- Nodes are recorded at their shortest import distance
+- --depth all follows imports through the whole package
+- Doc content is only read when printed
+
+DOCS: docs/cli/core/PATTERNS_Why_CLI_Over_Copy.md
+"""
+
+import argparse
+
+import pytest
+
+import ngram.context
+from ngram.cli import _context_depth
+from ngram.context import ContextResolver, build_dependency_map, print_module_context
+
+
+@pytest.fixture
+def project(tmp_path):
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    # a -> b -> c -> d -> e, plus a shortcut a -> c
+    (pkg / "a.py").write_text("# DOCS: docs/pkg/a\nimport pkg.b\nimport pkg.c\nimport json\n")
+    (pkg / "b.py").write_text("import pkg.c\nimport json\n")
+    (pkg / "c.py").write_text("import pkg.d\n")
+    (pkg / "d.py").write_text("import pkg.e\n")
+    (pkg / "e.py").write_text("x = 1\n")
+    docs = tmp_path / "docs" / "pkg" / "a"
+    docs.mkdir(parents=True)
+    (docs / "PATTERNS_A.md").write_text("# Patterns for a\n")
+    (docs / "SYNC_A.md").write_text("# Sync for a\n")
+    return tmp_path
+
+
+def _names(dep_map):
+    return {node["file"].rsplit("/", 1)[-1]: node["depth"] for node in dep_map["nodes"].values()}
+
+
+def test_nodes_recorded_at_shortest_distance(project):
+    dep_map = build_dependency_map(project, project / "pkg" / "a.py", depth=2)
+
+    # c is one hop away via the shortcut, so d is still within depth 2
+    assert _names(dep_map) == {"a.py": 0, "b.py": 1, "c.py": 1, "d.py": 2}
+    assert dep_map["nodes"][str(project / "pkg" / "a.py")]["doc_count"] == 2
+
+
+def test_depth_all_reaches_whole_package(project):
+    dep_map = build_dependency_map(project, project / "pkg" / "a.py", depth=None)
+
+    assert _names(dep_map)["e.py"] == 3
+
+
+def test_lookups_memoized_per_invocation(project, monkeypatch):
+    parsed, docs_lookups = [], []
+    real_parse, real_docs = ngram.context.parse_imports, ngram.context.find_module_docs
+    monkeypatch.setattr(ngram.context, "parse_imports", lambda fp: parsed.append(fp.name) or real_parse(fp))
+    monkeypatch.setattr(
+        ngram.context, "find_module_docs",
+        lambda target, fp: docs_lookups.append(fp.name) or real_docs(target, fp),
+    )
+
+    resolver = ContextResolver(project)
+    build_dependency_map(project, project / "pkg" / "a.py", depth=None, resolver=resolver)
+
+    assert sorted(parsed) == ["a.py", "b.py", "c.py", "d.py", "e.py"]
+    assert sorted(docs_lookups) == ["a.py", "b.py", "c.py", "d.py", "e.py"]
+    # `json` is unresolvable from pkg/ and is only probed once
+    assert [k for k in resolver._resolved if k[1] == "json"] == [(project / "pkg", "json")]
+
+
+def test_docs_read_only_when_printed(project, monkeypatch, capsys):
+    monkeypatch.setattr(ngram.context, "log_trace", lambda *args, **kwargs: None)
+    read = []
+    real_read = ngram.context.Path.read_text
+    monkeypatch.setattr(ngram.context.Path, "read_text", lambda self, *a, **k: read.append(self.name) or real_read(self, *a, **k))
+
+    build_dependency_map(project, project / "pkg" / "a.py", depth=None)
+    assert not any(name.endswith(".md") for name in read)
+
+    assert print_module_context(project, project / "pkg" / "a.py", depth=None)
+    out = capsys.readouterr().out
+    assert "# Patterns for a" in out and "# Sync for a" in out
+    assert "**Transitive imports:** 2 file(s), 0 with docs" in out
+
+
+def test_context_depth_arg():
+    assert _context_depth("all") is None
+    assert _context_depth("3") == 3
+    with pytest.raises(argparse.ArgumentTypeError):
+        _context_depth("-1")
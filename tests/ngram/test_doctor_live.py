@@ -0,0 +1,133 @@
+"""
+Tests for the live doctor service
+
+Tests the file-watch driven doctor behind the TUI and MCP server:
+- Changed paths map to the checks that read that kind of file
+- Re-evaluation runs only affected checks and diffs the issue set
+- The polling watcher reports changed files, not ignored ones
+- A started service pushes diffs to subscribers as files change
+
+DOCS: docs/cli/core/PATTERNS_Why_CLI_Over_Copy.md
+"""
+
+import threading
+from collections import Counter
+
+import pytest
+
+import ngram.doctor as doctor
+import ngram.doctor_live as live_mod
+from ngram.doctor_live import LiveDoctor, PollingWatcher, affected_checks
+from ngram.doctor_types import DoctorConfig, DoctorIssue
+
+
+def test_affected_checks_by_path_kind():
+    code = affected_checks(["ngram/cli.py"])
+    docs = affected_checks(["docs/cli/SYNC_CLI.md"])
+
+    assert "stub_impl" in code and "stub_impl" not in docs
+    assert "placeholder_docs" in docs and "placeholder_docs" not in code
+    assert affected_checks(["logs/run.log"]) == ["recent_log_errors"]
+    assert affected_checks(["a.py", "modules.yaml"]) is None
+    assert len(code) < len(doctor.DOCTOR_CHECKS)
+
+
+@pytest.fixture
+def fake_checks(monkeypatch):
+    calls = Counter()
+
+    def marker_check(name, suffix, marker, issue_type):
+        def check(target_dir, config):
+            calls[name] += 1
+            return [
+                DoctorIssue(issue_type=issue_type, severity="warning",
+                            path=p.relative_to(target_dir).as_posix(), message=marker)
+                for p in sorted(target_dir.rglob(f"*{suffix}"))
+                if marker in p.read_text()
+            ]
+        return (name, check)
+
+    checks = [
+        marker_check("stub_impl", ".py", "TODO", "STUB_IMPL"),
+        marker_check("placeholder_docs", ".md", "TBD", "PLACEHOLDER"),
+    ]
+    monkeypatch.setattr(doctor, "DOCTOR_CHECKS", checks)
+    monkeypatch.setattr(live_mod, "DOCTOR_CHECKS", checks)
+    return calls
+
+
+def test_refresh_reruns_only_affected_checks(tmp_path, fake_checks):
+    (tmp_path / "a.py").write_text("# TODO\n")
+    (tmp_path / "README.md").write_text("TBD\n")
+    service = LiveDoctor(tmp_path, config=DoctorConfig())
+    diffs = []
+    service.subscribe(diffs.append)
+
+    first = service.result()
+    assert first["summary"]["warning"] == 2
+    assert fake_checks == {"stub_impl": 1, "placeholder_docs": 1}
+
+    (tmp_path / "b.py").write_text("# TODO\n")
+    (tmp_path / "a.py").write_text("done\n")
+    diff = service.refresh(["a.py", "b.py"])
+
+    assert fake_checks == {"stub_impl": 2, "placeholder_docs": 1}
+    assert [i.path for i in diff.added] == ["b.py"]
+    assert [i.path for i in diff.removed] == ["a.py"]
+    assert diff.score == diff.previous_score == 94
+
+    # Nothing changed for subscribers: no push
+    assert service.refresh(["a.py"]).empty
+    assert len(diffs) == 2
+    assert service.stats["checks_skipped"] == 2
+
+    # Config files re-run everything
+    service.refresh([".ngram/doctor-ignore.yaml"])
+    assert fake_checks["placeholder_docs"] == 2
+
+
+def test_polling_watcher_reports_changes(tmp_path):
+    (tmp_path / "keep.py").write_text("x\n")
+    (tmp_path / "gone.md").write_text("x\n")
+    (tmp_path / ".ngram" / "state").mkdir(parents=True)
+    watcher = PollingWatcher(tmp_path, DoctorConfig().ignore, interval=0.01)
+    watcher.start()
+
+    (tmp_path / "new.py").write_text("x\n")
+    (tmp_path / "gone.md").unlink()
+    (tmp_path / ".ngram" / "state" / "doctor_result.json").write_text("{}")
+    (tmp_path / ".ngram" / "state" / "SYNC_Project_State.md").write_text("x\n")
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "new.pyc").write_text("x")
+
+    assert watcher.poll(timeout=1) == {"new.py", "gone.md", ".ngram/state/SYNC_Project_State.md"}
+    assert watcher.poll(timeout=1) == set()
+
+
+def test_running_service_pushes_diffs(tmp_path, fake_checks):
+    (tmp_path / "a.py").write_text("ok\n")
+    pushed = threading.Event()
+    seen = []
+
+    def on_diff(diff):
+        seen.append(diff)
+        if diff.added:
+            pushed.set()
+
+    service = LiveDoctor(
+        tmp_path,
+        config=DoctorConfig(),
+        watcher=PollingWatcher(tmp_path, [], interval=0.02),
+    )
+    service.subscribe(on_diff)
+    service.start()
+    try:
+        assert service.result(timeout=5)["score"] == 100
+        (tmp_path / "a.py").write_text("# TODO\n")
+        assert pushed.wait(timeout=5)
+    finally:
+        service.stop()
+
+    assert seen[-1].changed_paths == ["a.py"]
+    assert service.result()["summary"]["warning"] == 1
+    assert fake_checks["placeholder_docs"] == 1
@@ -0,0 +1,133 @@
+"""
+Tests for the single-pass marker scanner
+
+Tests the shared scan behind solve-markers and the marker doctor checks:
+- All families are matched with priority, title and resolved status
+- Binary, log and ignored files are skipped
+- Cached hits are reused until the content hash changes
+- Doctor checks and solve-markers report from the same scan
+- A doctor run walks the tree once for both marker checks
+
+DOCS: docs/cli/core/PATTERNS_Why_CLI_Over_Copy.md
+"""
+
+import os
+
+import pytest
+
+from ngram import doctor
+from ngram.doctor_checks_content import doctor_check_legacy_markers, doctor_check_special_markers
+from ngram.doctor_types import DoctorConfig
+from ngram.marker_scanner import MARKER_CACHE_PATH, match_markers, scan_markers
+from ngram.solve_escalations import _find_markers_in_files
+
+ESCALATION = """\
+# Notes
+<!-- @ngram:escalation
+title: "Pick a storage backend"
+priority: high
+-->
+
+""" + "Background. " * 50 + """
+<!-- @ngram:escalation
+status: resolved
+-->
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".ngram" / "state").mkdir(parents=True)
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "NOTES.md").write_text(ESCALATION)
+    (tmp_path / "docs" / "OLD.md").write_text("## GAPS / IDEAS / QUESTIONS\n- [ ] migrate\n- IDEA: cache\n")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("# @ngram:todo\n# priority: 2\nx = 1\n")
+    (tmp_path / "src" / "blob.bin").write_bytes(b"\x00@ngram:todo")
+    (tmp_path / "run.log").write_text("@ngram:escalation\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.js").write_text("// @ngram:todo\n")
+    return tmp_path
+
+
+def test_match_markers_families():
+    hits = match_markers(ESCALATION + "- QUESTION: which one?\n")
+
+    assert [(h.family, h.line) for h in hits] == [
+        ("ESCALATION", 2), ("ESCALATION", 8), ("LEGACY_QUESTION", 11),
+    ]
+    first, second, _ = hits
+    assert (first.priority, first.title, first.resolved) == (8, "Pick a storage backend", False)
+    assert second.resolved and second.priority is None
+    assert first.snippet.startswith("@ngram:escalation\ntitle:")
+
+
+def test_scan_skips_binary_logs_and_ignored(project):
+    scan = scan_markers(project, DoctorConfig())
+
+    assert sorted(scan.markers) == ["docs/NOTES.md", "docs/OLD.md", "src/app.py"]
+    assert "src/blob.bin" not in scan.files
+    notes = scan.markers["docs/NOTES.md"]
+    assert notes.unresolved("ESCALATION") == 1
+    assert notes.priority("ESCALATION") == 8
+    assert notes.tags("ESCALATION") == ["@ngram:escalation"]
+
+
+def test_cache_reused_until_content_changes(project):
+    config = DoctorConfig()
+    first = scan_markers(project, config)
+    assert (project / MARKER_CACHE_PATH).exists()
+    assert first.cache_hits == 0
+
+    second = scan_markers(project, config)
+    assert second.files_read == 0
+    assert second.cache_hits == len(second.files) + 1  # + the binary file
+    assert second.markers == first.markers
+
+    # Touched but unchanged: re-read, hash matches, hits reused
+    app = project / "src" / "app.py"
+    stat = app.stat()
+    os.utime(app, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    third = scan_markers(project, config)
+    assert third.files_read == 1
+    assert third.markers == first.markers
+
+    app.write_text("x = 1\n")
+    fourth = scan_markers(project, config)
+    assert "src/app.py" not in fourth.markers
+
+
+def test_checks_report_from_scan(project):
+    config = DoctorConfig()
+
+    special = doctor_check_special_markers(project, config)
+    assert [(i.issue_type, i.path, i.severity) for i in special] == [
+        ("ESCALATION", "docs/NOTES.md", "critical"),
+        ("TODO", "src/app.py", "info"),
+    ]
+    assert special[0].message == "Pick a storage backend (priority: 8)"
+
+    legacy = doctor_check_legacy_markers(project, config)
+    assert sorted(i.details["marker_type"] for i in legacy if i.issue_type == "LEGACY_MARKER") == [
+        "GAPS_SECTION", "LEGACY_IDEA", "LEGACY_TODO",
+    ]
+
+    assert _find_markers_in_files(project, "ESCALATION") == [
+        (-8, -1, "docs/NOTES.md", "ESCALATION", "Pick a storage backend"),
+    ]
+    assert _find_markers_in_files(project, "TODO") == [(-2, -1, "src/app.py", "TODO", "")]
+
+
+def test_doctor_run_scans_once(project, monkeypatch):
+    walks = []
+
+    def counting_scan(target_dir, config):
+        walks.append(target_dir)
+        return scan_markers(target_dir, config)
+
+    monkeypatch.setattr(doctor, "scan_markers", counting_scan)
+    by_check = doctor.run_doctor_checks(project, DoctorConfig(), doctor.MARKER_CHECKS)
+
+    assert len(walks) == 1
+    assert [i.path for i in by_check["special_markers"]] == ["docs/NOTES.md", "src/app.py"]
+    assert any(i.issue_type == "LEGACY_MARKER" for i in by_check["legacy_markers"])
@@ -0,0 +1,157 @@
+"""
+Tests for ngram refactor
+
+Tests the bulk reference rewrite behind `ngram refactor`:
+- Replacements compose across moves and match longest-first
+- A batch moves everything, then rewrites references in one pass
+- Later lines may move paths inside a directory an earlier line moved
+- A failing batch line never leaves moved paths unreferenced
+- --dry-run reports counts without touching the tree
+- Rewritten files keep their permissions
+
+DOCS: docs/cli/core/PATTERNS_Why_CLI_Over_Copy.md
+"""
+
+import stat
+from pathlib import Path
+
+import pytest
+
+import ngram.refactor as refactor
+import ngram.refactor_rewrite as rewrite
+from ngram.refactor import _run_batch_actions, refactor_rename
+from ngram.refactor_rewrite import ReplacementSet, rewrite_references
+
+
+@pytest.fixture
+def posts(monkeypatch):
+    calls = []
+    monkeypatch.setattr(refactor, "_run_post_refactor_workflow", lambda target: calls.append(target))
+    return calls
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "docs" / "alpha").mkdir(parents=True)
+    (tmp_path / "docs" / "alpha" / "PATTERNS_Alpha.md").write_text("# Alpha\nSee docs/beta/SYNC_Beta.md\n")
+    (tmp_path / "docs" / "beta").mkdir()
+    (tmp_path / "docs" / "beta" / "SYNC_Beta.md").write_text("# Beta\nSee docs/alpha/PATTERNS_Alpha.md\n")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text('"""\nDOCS: docs/alpha/PATTERNS_Alpha.md\n"""\n')
+    (tmp_path / "modules.yaml").write_text("modules:\n  alpha:\n    docs: docs/alpha/\n")
+    return tmp_path
+
+
+def test_replacements_compose_and_match_longest_first():
+    replacements = ReplacementSet()
+    replacements.extend([("docs/a", "docs/b"), ("docs/a/", "docs/b/")])
+    replacements.add("docs/b", "docs/c")
+    replacements.add("docs/a/x.md", "docs/z.md")
+
+    text, counts = replacements.apply("docs/a docs/a/x.md docs/a/y.md docs/b")
+
+    assert text == "docs/c docs/z.md docs/c/y.md docs/c"
+    assert counts == {"docs/a": 1, "docs/a/x.md": 1, "docs/a/": 1, "docs/b": 1}
+
+
+def test_move_does_not_rewrite_its_own_target():
+    replacements = ReplacementSet([("docs/x", "docs/x/sub"), ("docs/x/", "docs/x/sub/")])
+
+    assert replacements.apply("docs/x/a.md")[0] == "docs/x/sub/a.md"
+
+
+def test_batch_rewrites_in_one_pass(project, posts, monkeypatch):
+    passes = []
+    real = refactor.rewrite_references
+    monkeypatch.setattr(refactor, "rewrite_references", lambda *a, **k: passes.append(1) or real(*a, **k))
+    filelist = project / "moves.txt"
+    filelist.write_text("# moves\nrename docs/alpha docs/gamma\nmove docs/beta/SYNC_Beta.md docs/gamma/SYNC_Beta.md\n")
+
+    _run_batch_actions(project, filelist, None, skip_existing=False, overwrite=True)
+
+    assert passes == [1]
+    assert posts == [project]
+    assert not (project / "docs" / "alpha").exists()
+    assert (project / "docs" / "gamma" / "SYNC_Beta.md").read_text() == "# Beta\nSee docs/gamma/PATTERNS_Alpha.md\n"
+    assert (project / "docs" / "gamma" / "PATTERNS_Alpha.md").read_text() == "# Alpha\nSee docs/gamma/SYNC_Beta.md\n"
+    assert "docs/gamma/PATTERNS_Alpha.md" in (project / "src" / "a.py").read_text()
+    assert (project / "modules.yaml").read_text() == "modules:\n  alpha:\n    docs: docs/gamma/\n"
+
+
+def test_batch_moves_out_of_a_moved_directory(project, posts):
+    filelist = project / "moves.txt"
+    filelist.write_text("rename docs/alpha docs/gamma\nmove docs/gamma/PATTERNS_Alpha.md docs/delta/PATTERNS_Alpha.md\n")
+
+    replacements = ReplacementSet([("docs/alpha", "docs/gamma"), ("docs/alpha/", "docs/gamma/")])
+    replacements.add("docs/gamma/PATTERNS_Alpha.md", "docs/delta/PATTERNS_Alpha.md")
+    assert replacements.apply("docs/alpha/PATTERNS_Alpha.md docs/alpha/x.md")[0] == (
+        "docs/delta/PATTERNS_Alpha.md docs/gamma/x.md"
+    )
+
+    _run_batch_actions(project, filelist, None, skip_existing=False, overwrite=False, dry_run=True)
+    assert (project / "docs" / "alpha").exists()
+
+    _run_batch_actions(project, filelist, None, skip_existing=False, overwrite=False)
+
+    assert (project / "docs" / "delta" / "PATTERNS_Alpha.md").exists()
+    assert (project / "docs" / "beta" / "SYNC_Beta.md").read_text() == "# Beta\nSee docs/delta/PATTERNS_Alpha.md\n"
+    assert "docs/delta/PATTERNS_Alpha.md" in (project / "src" / "a.py").read_text()
+
+
+def test_batch_checks_every_line_before_moving(project, posts):
+    filelist = project / "moves.txt"
+    filelist.write_text("rename docs/alpha docs/gamma\nmove docs/missing docs/other\n")
+
+    with pytest.raises(FileNotFoundError, match="Line 2"):
+        _run_batch_actions(project, filelist, None, skip_existing=False, overwrite=True)
+
+    assert (project / "docs" / "alpha").exists() and not (project / "docs" / "gamma").exists()
+    assert posts == []
+
+
+def test_failed_move_still_rewrites_applied_moves(project, posts):
+    (project / "docs" / "delta").mkdir()
+    filelist = project / "moves.txt"
+    filelist.write_text("rename docs/alpha docs/gamma\nrename docs/beta docs/delta\n")
+
+    with pytest.raises(FileExistsError):
+        _run_batch_actions(project, filelist, None, skip_existing=False, overwrite=False)
+
+    assert (project / "docs" / "gamma" / "PATTERNS_Alpha.md").exists()
+    assert (project / "docs" / "beta" / "SYNC_Beta.md").read_text() == "# Beta\nSee docs/gamma/PATTERNS_Alpha.md\n"
+    assert "docs/gamma/PATTERNS_Alpha.md" in (project / "src" / "a.py").read_text()
+    assert posts == []
+
+
+def test_dry_run_touches_nothing(project, posts, capsys):
+    before = {p: p.read_text() for p in project.rglob("*") if p.is_file()}
+
+    assert refactor_rename(project, Path("docs/alpha"), Path("docs/gamma"), dry_run=True)
+
+    assert {p: p.read_text() for p in project.rglob("*") if p.is_file()} == before
+    assert posts == []
+    out = capsys.readouterr().out
+    assert "Would update references in 3 of" in out
+    assert "docs/alpha/ → docs/gamma/: 3 occurrence(s)" in out
+
+
+def test_rewrite_is_atomic_and_keeps_mode(tmp_path, monkeypatch):
+    script = tmp_path / "run.sh"
+    script.write_text("cat docs/old.md\n")
+    script.chmod(0o755)
+    (tmp_path / "notes.md").write_text("docs/old.md\n")
+
+    def fail_on_notes(path, text):
+        if path.name == "notes.md":
+            raise OSError("disk full")
+        real_write(path, text)
+
+    real_write = rewrite.write_atomic
+    monkeypatch.setattr(rewrite, "write_atomic", fail_on_notes)
+    report = rewrite_references(tmp_path, ReplacementSet([("docs/old.md", "docs/new.md")]))
+
+    assert script.read_text() == "cat docs/new.md\n"
+    assert stat.S_IMODE(script.stat().st_mode) == 0o755
+    assert (tmp_path / "notes.md").read_text() == "docs/old.md\n"
+    assert set(report.errors) == {"notes.md"}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["notes.md", "run.sh"]
@@ -0,0 +1,124 @@
+"""
+Tests for ngram overview
+
+Tests per-file facts behind the repository map:
+- One read per file gives the same facts as the individual extractors
+- Facts are reused by (path, mtime, size) across runs
+- All maps from one generate_and_save share the cache
+
+DOCS: docs/cli/core/IMPLEMENTATION_CLI_Code_Architecture/overview/IMPLEMENTATION_Overview.md
+"""
+
+import os
+
+import pytest
+
+import ngram.repo_overview_facts as facts_module
+from ngram.doctor_types import DoctorConfig
+from ngram.repo_overview import (
+    build_file_tree,
+    extract_code_definitions,
+    extract_docs_ref,
+    extract_markdown_code_refs,
+    extract_markdown_doc_refs,
+    extract_markdown_sections,
+    generate_and_save,
+)
+from ngram.repo_overview_facts import FACT_CACHE_PATH, FactCache
+from ngram.repo_overview_formatters import _format_size
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".ngram" / "state").mkdir(parents=True)
+    src = tmp_path / "src" / "app"
+    src.mkdir(parents=True)
+    (src / "main.py").write_text(
+        '"""\nMain.\n\nDOCS: docs/app/PATTERNS_App.md\n"""\n'
+        "import app.util\nimport json\n\nclass Runner:\n    async def run(self):\n        pass\n\ndef main():\n    pass\n"
+    )
+    (src / "util.py").write_text("def helper():\n    return 1\n")
+    (src / "view.tsx").write_text("export function View() {}\nexport const useThing = () => 1\n")
+    (src / "blob.dat").write_bytes(b"\x00\x01\x02")
+    docs = tmp_path / "docs" / "app"
+    docs.mkdir(parents=True)
+    (docs / "PATTERNS_App.md").write_text(
+        "# App\n## Design\n### Detail\nSee `src/app/main.py` and [sync](../other/SYNC_Other.md).\n"
+    )
+    return tmp_path
+
+
+def _files(node):
+    if node.type == "file":
+        yield node
+    for child in node.children:
+        yield from _files(child)
+
+
+def test_facts_match_individual_extractors(project):
+    config = DoctorConfig()
+    tree = build_file_tree(project, config)
+    files = {f.path: f for f in _files(tree)}
+
+    assert "src/app/blob.dat" not in files
+    for rel, info in files.items():
+        path = project / rel
+        assert info.chars == path.stat().st_size
+        if info.language == "markdown":
+            assert info.sections == extract_markdown_sections(path)
+            assert info.code_refs == extract_markdown_code_refs(path)
+            assert info.doc_refs == extract_markdown_doc_refs(path)
+        else:
+            assert info.functions == extract_code_definitions(path)
+            assert info.docs_ref == extract_docs_ref(path, config.docs_ref_search_chars)
+
+    main = files["src/app/main.py"]
+    assert main.imports == ["app/util"]
+    assert main.functions == ["class Runner", "async def run()", "def main()"]
+
+
+def test_fact_cache_keyed_by_mtime_and_size(project):
+    config = DoctorConfig()
+    build_file_tree(project, config)
+    assert (project / FACT_CACHE_PATH).exists()
+
+    cache = FactCache(project, config.docs_ref_search_chars)
+    first = build_file_tree(project, config, fact_cache=cache)
+    assert cache.misses == 0 and cache.hits == 5  # 4 text files + the binary
+
+    util = project / "src" / "app" / "util.py"
+    util.write_text("def helper():\n    return 1\n\ndef other():\n    pass\n")
+    stat = util.stat()
+    os.utime(util, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cache = FactCache(project, config.docs_ref_search_chars)
+    second = build_file_tree(project, config, fact_cache=cache)
+    assert cache.misses == 1
+
+    def functions(tree):
+        return {f.path: f.functions for f in _files(tree)}["src/app/util.py"]
+
+    assert functions(first) == ["def helper()"]
+    assert functions(second) == ["def helper()", "def other()"]
+
+
+def test_generate_and_save_shares_one_cache(project, monkeypatch):
+    reads = []
+    real = facts_module.read_file_facts
+    monkeypatch.setattr(facts_module, "read_file_facts", lambda p, *a: reads.append(p.name) or real(p, *a))
+
+    main_map = generate_and_save(project, min_size=0, top_files=0)
+
+    assert main_map == project / "map.md"
+    # The docs map also lists the root map written just before it
+    assert "map.md" not in main_map.read_text().split("\n", 1)[1]
+    assert "map.md" in (project / "docs" / "map.md").read_text()
+    assert (project / "map_src.md").exists()
+    # Every source file is read once across the root, docs and src maps
+    assert sorted(n for n in reads if not n.startswith("map")) == [
+        "PATTERNS_App.md", "blob.dat", "main.py", "util.py", "view.tsx",
+    ]
+
+    # On a re-run the docs map lists the root map as just rewritten
+    generate_and_save(project, min_size=0, top_files=0)
+    size = _format_size(main_map.stat().st_size)
+    assert f"map.md ({size})" in (project / "docs" / "map.md").read_text()
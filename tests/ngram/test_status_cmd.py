@@ -0,0 +1,139 @@
+"""
+Tests for ngram status
+
+Tests the single doctor run behind `ngram status`:
+- Module issue index matches per-module filtering
+- Persisted doctor results are reused while fresh
+- Status for all modules runs doctor at most once
+
+DOCS: docs/cli/core/IMPLEMENTATION_CLI_Code_Architecture.md
+"""
+
+import os
+
+import pytest
+
+import ngram.doctor
+from ngram.doctor_cache import load_fresh_doctor_result, save_doctor_result
+from ngram.doctor_types import DoctorConfig, DoctorIssue
+from ngram.status_cmd import (
+    HealthIssue,
+    ModuleIssueIndex,
+    filter_issues_for_module,
+    get_all_modules_status,
+)
+
+MODULES = {
+    "doctor": {"code": "ngram/doctor**", "docs": "docs/cli/doctor/"},
+    "cli": {"code": "ngram/**", "docs": "docs/cli/"},
+    "engine": {"code": "engine/**/*.py", "docs": "docs/engine"},
+    "single": {"code": "tools/*.py", "docs": ""},
+    "everything": {"code": "**", "docs": ""},
+}
+
+PATHS = [
+    "ngram/doctor.py", "ngram/doctor_files.py", "ngram/cli.py", "docs/cli/doctor/SYNC.md",
+    "docs/cli/core/PATTERNS.md", "engine/physics/tick.py", "docs/engine/x.md",
+    "tools/run.py", "tools/sub/run.py", "", "README.md",
+]
+
+
+def _issue(path, severity="warning"):
+    return DoctorIssue(issue_type="MONOLITH", severity=severity, path=path, message="m")
+
+
+class TestModuleIssueIndex:
+    def test_matches_per_module_filter(self):
+        issues = [HealthIssue("MONOLITH", "warning", p, "m") for p in PATHS]
+        index = ModuleIssueIndex()
+        for name, cfg in MODULES.items():
+            index.add(name, cfg["code"], cfg["docs"])
+
+        grouped = index.group(issues)
+
+        for name, cfg in MODULES.items():
+            assert grouped.get(name, []) == filter_issues_for_module(issues, cfg["code"], cfg["docs"]), name
+
+
+class TestDoctorCache:
+    def test_fresh_until_tree_changes(self, tmp_path):
+        (tmp_path / ".ngram" / "state").mkdir(parents=True)
+        src = tmp_path / "a.py"
+        src.write_text("x = 1\n")
+        config = DoctorConfig()
+        results = {"issues": {"critical": [], "warning": [_issue("a.py")], "info": []}}
+
+        save_doctor_result(tmp_path, results, config)
+        loaded = load_fresh_doctor_result(tmp_path, config)
+        assert [i.path for i in loaded["warning"]] == ["a.py"]
+
+        # State files written after the save do not invalidate it
+        (tmp_path / ".ngram" / "state" / "SYNC_Project_Health.md").write_text("report")
+        assert load_fresh_doctor_result(tmp_path, config) is not None
+
+        stat = src.stat()
+        os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert load_fresh_doctor_result(tmp_path, config) is None
+
+    def test_project_sync_edit_invalidates(self, tmp_path):
+        state = tmp_path / ".ngram" / "state"
+        state.mkdir(parents=True)
+        (state / "SYNC_Project_State.md").write_text("LAST_UPDATED: 2025-01-01\n")
+        config = DoctorConfig()
+        save_doctor_result(tmp_path, {"issues": {}}, config)
+
+        # Doctor's own caches don't count; the SYNC docs checks read do
+        (state / "marker_cache.json").write_text("{}")
+        assert load_fresh_doctor_result(tmp_path, config) is not None
+        (state / "SYNC_Project_State.md").write_text("LAST_UPDATED: 2026-10-19\n")
+        assert load_fresh_doctor_result(tmp_path, config) is None
+
+    def test_rename_invalidates(self, tmp_path):
+        (tmp_path / ".ngram" / "state").mkdir(parents=True)
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "a.py").write_text("x = 1\n")
+        config = DoctorConfig()
+        save_doctor_result(tmp_path, {"issues": {"warning": [_issue("a.py")]}}, config)
+
+        # Same file count, same newest mtime, different tree
+        os.replace(tmp_path / "a.py", tmp_path / "pkg" / "a.py")
+        assert load_fresh_doctor_result(tmp_path, config) is None
+
+    def test_expired(self, tmp_path):
+        (tmp_path / ".ngram" / "state").mkdir(parents=True)
+        save_doctor_result(tmp_path, {"issues": {}}, DoctorConfig())
+        assert load_fresh_doctor_result(tmp_path, DoctorConfig(), max_age_seconds=-1) is None
+
+
+class TestStatusRunsDoctorOnce:
+    @pytest.fixture
+    def project(self, tmp_path):
+        pytest.importorskip("yaml")
+        (tmp_path / ".ngram" / "state").mkdir(parents=True)
+        lines = []
+        for i in range(30):
+            (tmp_path / f"mod{i}").mkdir()
+            lines += [f"mod{i}:", f"  code: mod{i}/**", f"  docs: docs/mod{i}/"]
+        (tmp_path / "modules.yaml").write_text("\n".join(lines) + "\n")
+        return tmp_path
+
+    def test_single_doctor_run_then_cache(self, project, monkeypatch):
+        calls = []
+
+        def fake_run_doctor(target_dir, config, sync_graph=True):
+            calls.append(sync_graph)
+            return {"issues": {"critical": [_issue("mod3/big.py", "critical")], "warning": [], "info": []}}
+
+        monkeypatch.setattr(ngram.doctor, "run_doctor", fake_run_doctor)
+
+        statuses, _ = get_all_modules_status(project)
+        assert calls == [False]
+        by_name = {s.name: s for s in statuses}
+        assert [i.path for i in by_name["mod3"].health_issues] == ["mod3/big.py"]
+        assert by_name["mod4"].health_issues == []
+
+        get_all_modules_status(project)
+        assert len(calls) == 1  # persisted result reused
+
+        get_all_modules_status(project, refresh=True)
+        assert len(calls) == 2
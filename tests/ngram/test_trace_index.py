@@ -0,0 +1,118 @@
+"""
+Tests for indexed trace analytics
+
+Tests the per-day trace summaries behind print_trace_summary:
+- Summaries give the same counts as analyzing every entry
+- Appended entries are counted incrementally, partial lines later
+- Truncated day files are re-counted
+- log_trace buffers writes until flushed
+
+DOCS: docs/protocol/features/BEHAVIORS_Agent_Trace_Logging.md
+"""
+
+import json
+import random
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from ngram.context import analyze_traces, clear_traces, log_trace, read_traces
+from ngram.trace_index import TRACES_DIR, get_trace_writer, summarize_day, summarize_traces, summary_path
+
+
+def _write_day(target, day, entries):
+    path = target / TRACES_DIR / f"{day:%Y-%m-%d}.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+    return path
+
+
+def _entries(day, n, rng):
+    return [
+        {
+            "ts": f"{day:%Y-%m-%d}T10:00:00",
+            "action": rng.choice(["read", "context", "view-load"]),
+            "file": f"docs/f{rng.randrange(40)}.md",
+            "via": "direct",
+            **({"session": f"s{rng.randrange(9)}"} if rng.random() < 0.7 else {}),
+        }
+        for _ in range(n)
+    ]
+
+
+@pytest.fixture
+def traces(tmp_path):
+    rng = random.Random(3)
+    today = datetime.now()
+    for offset in range(10):
+        day = today - timedelta(days=offset)
+        _write_day(tmp_path, day, _entries(day, 25, rng))
+    return tmp_path
+
+
+def test_summary_matches_full_analysis(traces):
+    for days in (1, 7, 30):
+        assert summarize_traces(traces, days) == analyze_traces(read_traces(traces, days))
+
+    assert summarize_traces(traces / "missing") == analyze_traces([])
+
+
+def test_incremental_and_partial_lines(traces):
+    today = datetime.now()
+    day_file = _write_day(traces, today, [])
+    before = summarize_day(day_file)
+
+    _write_day(traces, today, _entries(today, 3, random.Random(1)))
+    with open(day_file, "a") as f:
+        f.write('{"ts": "partial')
+    after = summarize_day(day_file)
+    assert after.entries == before.entries + 3
+    assert after.offset == day_file.stat().st_size - len('{"ts": "partial')
+
+    with open(day_file, "a") as f:
+        f.write('", "action": "read", "file": "x"}\n')
+    assert summarize_day(day_file).entries == before.entries + 4
+
+    day_file.write_text(json.dumps({"ts": "x", "file": "y"}) + "\n")
+    assert summarize_day(day_file).entries == 1
+
+
+def test_log_trace_buffers_until_flush(tmp_path):
+    log_trace(tmp_path, "read", "docs/a.md", session="s1")
+    log_trace(tmp_path, "read", "docs/a.md", session="s1")
+    day_file = tmp_path / TRACES_DIR / f"{datetime.now():%Y-%m-%d}.jsonl"
+    assert not day_file.exists() or day_file.read_text() == ""
+
+    summary = summarize_traces(tmp_path, days=1)  # flushes first
+    assert summary["by_file"] == {"docs/a.md": 2}
+    assert summary["sessions"] == 1
+    assert len(day_file.read_text().splitlines()) == 2
+
+
+def test_clear_removes_summaries(tmp_path):
+    old = _write_day(tmp_path, datetime.now() - timedelta(days=40), [{"ts": "x", "file": "a"}])
+    summarize_day(old)
+    assert summary_path(old).exists()
+
+    assert clear_traces(tmp_path, before_days=30) == 1
+    assert not summary_path(old).exists()
+
+
+def test_year_of_traces_queries_fast(tmp_path):
+    rng = random.Random(7)
+    today = datetime.now()
+    for offset in range(365):
+        day = today - timedelta(days=offset)
+        _write_day(tmp_path, day, _entries(day, 50, rng))
+    get_trace_writer().flush()
+
+    summarize_traces(tmp_path, days=366)  # builds the summaries once
+    start = time.perf_counter()
+    summary = summarize_traces(tmp_path, days=366)
+    elapsed = time.perf_counter() - start
+
+    assert summary["total"] == 365 * 50
+    assert elapsed < 0.5
@@ -0,0 +1,201 @@
+"""
+Tests for the parallel work-agent scheduler
+
+Tests the scheduler behind `ngram work --parallel`:
+- Footprints overlap on nested paths or a shared module
+- Overlapping issues never run at the same time; others fill the pool
+- Agents commit in their own worktree; commits land on the main checkout
+- A commit that no longer applies fails the result instead of the run
+  and stays on its branch for a manual merge
+
+DOCS: docs/cli/core/ALGORITHM_CLI_Command_Execution_Logic/ALGORITHM_Overview.md
+"""
+
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from ngram.work_scheduler import Footprint, WorkScheduler, Worktrees, issue_footprint
+
+MODULES = {
+    "cli": {"code": "ngram/cli*.py", "docs": "docs/cli/"},
+    "physics": {"code": "engine/physics/**", "docs": "docs/physics/"},
+}
+
+
+@dataclass
+class Issue:
+    path: str
+
+
+@dataclass
+class Result:
+    target_path: str
+    success: bool = True
+    error: Optional[str] = None
+
+
+def test_footprints(tmp_path):
+    def fp(path):
+        return issue_footprint(Issue(path), MODULES, tmp_path)
+
+    assert fp("ngram/cli.py").modules == {"cli"}
+    assert fp("docs/cli/PATTERNS.md").modules == {"cli"}
+    assert fp(str(tmp_path / "engine/physics/tick.py")).paths == {"engine/physics/tick.py"}
+
+    assert fp("ngram/cli.py").overlaps(fp("docs/cli/PATTERNS.md"))  # same module
+    assert fp("tools/a").overlaps(fp("tools/a/b.py"))  # nested paths
+    assert fp(".").overlaps(fp("tools/x.py"))  # whole project
+    assert not fp("tools/a.py").overlaps(fp("tools/ab.py"))
+    assert not fp("ngram/cli.py").overlaps(fp("engine/physics/tick.py"))
+
+
+def test_overlapping_issues_are_serialized(tmp_path):
+    active, overlaps_seen, peak = set(), [], [0]
+    lock = threading.Lock()
+
+    def run(item, work_dir):
+        idx, issue = item
+        with lock:
+            if any(MODULES_OF[other] & MODULES_OF[idx] for other in active):
+                overlaps_seen.append(idx)
+            active.add(idx)
+            peak[0] = max(peak[0], len(active))
+        time.sleep(0.05)
+        with lock:
+            active.discard(idx)
+        return Result(issue.path)
+
+    paths = ["ngram/cli.py", "ngram/cli_args.py", "engine/physics/a.py", "tools/x.py", "docs/cli/A.md"]
+    items = list(enumerate((Issue(p) for p in paths), 1))
+    footprints = {idx: issue_footprint(issue, MODULES, tmp_path) for idx, issue in items}
+    MODULES_OF = {idx: fp.modules for idx, fp in footprints.items()}
+    by_path = {issue.path: footprints[idx] for idx, issue in items}
+
+    scheduler = WorkScheduler(run, workers=4, target_dir=tmp_path, footprint=lambda i: by_path[i.path])
+    results = scheduler.run(items)
+
+    assert sorted(r.target_path for r in results) == sorted(paths)
+    assert overlaps_seen == []
+    assert peak[0] == 3  # the three cli issues take turns
+    stats = scheduler.stats.to_dict()
+    assert stats["deferred"] == 2
+    assert stats["issues"] == 5 and stats["max_queue_wait"] >= 0.1
+    assert 0 < stats["utilization"] <= 1
+
+
+def _git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "dev@example.com")
+    _git(repo, "config", "user.name", "dev")
+    (repo / "shared.txt").write_text("base\n")
+    (repo / ".ngram").mkdir()
+    (repo / ".ngram" / "CLAUDE.md").write_text("context\n")  # untracked
+    _git(repo, "add", "shared.txt")
+    _git(repo, "commit", "-q", "-m", "base")
+    return repo
+
+
+def test_worktree_commits_merge_back(repo):
+    seen_dirs = []
+
+    def run(item, work_dir):
+        idx, issue = item
+        seen_dirs.append(work_dir)
+        assert (work_dir / ".ngram" / "CLAUDE.md").read_text() == "context\n"
+        if issue.path == "shared.txt":
+            (work_dir / "shared.txt").write_text(f"edited by {idx}\n")
+        else:
+            (work_dir / issue.path).write_text(f"{idx}\n")
+        _git(work_dir, "add", issue.path)
+        _git(work_dir, "commit", "-q", "-m", f"fix {issue.path}")
+        agent_dir = work_dir / ".ngram" / "agents" / "work" / f"agent-{idx}"
+        agent_dir.mkdir(parents=True)
+        (agent_dir / "ISSUE.md").write_text(issue.path)
+        return Result(issue.path)
+
+    # Distinct footprints, but two agents edit the same file anyway
+    items = [(1, Issue("a.txt")), (2, Issue("b.txt")), (3, Issue("shared.txt")), (4, Issue("shared.txt"))]
+    footprints = {1: "a", 2: "b", 3: "c", 4: "d"}
+    order = iter(footprints.values())
+    scheduler = WorkScheduler(
+        run,
+        workers=4,
+        target_dir=repo,
+        worktrees=Worktrees.for_repo(repo),
+        footprint=lambda issue: Footprint(paths=frozenset([next(order)])),
+    )
+    results = scheduler.run(items)
+
+    assert all(d != repo for d in seen_dirs)
+    assert (repo / "a.txt").read_text() == "1\n" and (repo / "b.txt").read_text() == "2\n"
+    shared = [r for r in results if r.target_path == "shared.txt"]
+    assert sorted(r.success for r in shared) == [False, True]
+    error = [r.error for r in shared if not r.success][0]
+    assert error.startswith("Merge failed")
+    assert len(_git(repo, "log", "--oneline").splitlines()) == 4
+    assert _git(repo, "status", "--porcelain") == "?? .ngram/\n"
+    assert len(list((repo / ".ngram" / "agents" / "work").iterdir())) == 4
+
+    # Worktrees are gone; only the conflicting branch is kept, with its commit
+    assert _git(repo, "worktree", "list").count("\n") == 1
+    kept = scheduler.stats.kept_branches
+    assert len(kept) == 1 and kept[0] in error
+    assert _git(repo, "branch", "--list", "ngram-work/*").split() == kept
+    assert _git(repo, "log", "-1", "--format=%s", kept[0]) == "fix shared.txt\n"
+    assert not scheduler.worktrees.root.exists()
+    assert scheduler.stats.isolated == 4 and scheduler.stats.merge_failures == 1
+
+
+def test_dirty_main_checkout_shares_target_dir(repo):
+    (repo / "shared.txt").write_text("uncommitted\n")
+    seen_dirs = []
+
+    def run(item, work_dir):
+        seen_dirs.append(work_dir)
+        assert (work_dir / "shared.txt").read_text() == "uncommitted\n"
+        return Result(item[1].path)
+
+    scheduler = WorkScheduler(run, workers=2, target_dir=repo, worktrees=Worktrees.for_repo(repo))
+    results = scheduler.run([(1, Issue("a.txt")), (2, Issue("b.txt"))])
+
+    assert seen_dirs == [repo, repo] and all(r.success for r in results)
+    assert "uncommitted changes" in scheduler.stats.format_line()
+    assert scheduler.stats.isolated == 0
+    assert _git(repo, "worktree", "list").count("\n") == 1
+
+
+def test_checkout_dirtied_during_run_is_not_picked_onto(repo):
+    def run(item, work_dir):
+        (work_dir / "a.txt").write_text("agent\n")
+        _git(work_dir, "add", "a.txt")
+        _git(work_dir, "commit", "-q", "-m", "fix a.txt")
+        (repo / "shared.txt").write_text("uncommitted\n")
+        return Result("a.txt")
+
+    scheduler = WorkScheduler(run, workers=1, target_dir=repo, worktrees=Worktrees.for_repo(repo))
+    [result] = scheduler.run([(1, Issue("a.txt"))])
+
+    assert not result.success and "uncommitted changes" in result.error
+    assert (repo / "shared.txt").read_text() == "uncommitted\n"
+    assert not (repo / "a.txt").exists()
+    assert _git(repo, "branch", "--list", "ngram-work/*").split() == scheduler.stats.kept_branches
+
+
+def test_outside_git_runs_in_target_dir(tmp_path):
+    assert Worktrees.for_repo(tmp_path) is None
+
+    scheduler = WorkScheduler(lambda item, work_dir: work_dir, workers=2, target_dir=tmp_path)
+    assert scheduler.run([(1, Issue("a.py")), (2, Issue("b.py"))]) == [tmp_path, tmp_path]
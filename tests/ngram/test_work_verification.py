@@ -0,0 +1,116 @@
+"""
+Tests for work completion verification
+
+Tests how verify_completion runs its checks:
+- Independent checks run concurrently, results keep check order
+- Command results are reused while the files they read are unchanged
+- Changing a read file re-runs only the commands that read it
+- Failed commands are never reused
+
+DOCS: docs/membrane/VALIDATION_Completion_Verification.md
+"""
+
+import time
+
+import pytest
+
+import ngram.work_verification as verification
+from ngram.doctor_types import DoctorIssue
+from ngram.work_verification import VerificationCache, VerificationCheck, verify_completion
+
+
+def _command(name, command, reads=None):
+    return VerificationCheck(
+        name=name,
+        check_type="command",
+        description=name,
+        action_on_fail=f"fix {name}",
+        command=command,
+        reads=reads,
+    )
+
+
+@pytest.fixture
+def checks(monkeypatch):
+    registry = {}
+    monkeypatch.setattr(verification, "VERIFICATION_CHECKS", registry)
+    monkeypatch.setattr(verification, "GLOBAL_CHECKS", [])
+    return registry
+
+
+def _issue(path="pkg/mod.py"):
+    return DoctorIssue(issue_type="TEST", severity="warning", path=path, message="m")
+
+
+def test_checks_run_concurrently_in_order(tmp_path, checks):
+    checks["TEST"] = [
+        _command("first", "sleep 0.3 && exit 0"),
+        VerificationCheck(name="exists", check_type="file", description="exists", action_on_fail="create"),
+        _command("second", "sleep 0.3 && exit 3"),
+    ]
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("x = 1\n")
+
+    started = time.perf_counter()
+    results = verify_completion(_issue(), tmp_path, head_before="a", head_after="b")
+
+    assert time.perf_counter() - started < 0.55
+    assert [r.check_name for r in results] == ["first", "exists", "second", "git_commit_new"]
+    assert [r.passed for r in results] == [True, True, False, True]
+    assert results[2].message == "FAIL: second (exit code 3)"
+
+
+def test_retry_reruns_only_commands_whose_reads_changed(tmp_path, checks):
+    checks["TEST"] = [
+        _command("tests_pass", "echo tests >> runs.log", reads=["{path}", "{test_path}"]),
+        _command("other_module", "echo other >> runs.log", reads=["other/"]),
+        _command("uncached", "echo uncached >> runs.log"),
+    ]
+    for rel in ("pkg/mod.py", "tests/pkg/test_mod.py", "other/a.py"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("v1\n")
+    cache = VerificationCache()
+
+    def runs():
+        return sorted((tmp_path / "runs.log").read_text().split())
+
+    first = verify_completion(_issue(), tmp_path, cache=cache)
+    assert [r.details["cached"] for r in first] == [False, False, False]
+
+    second = verify_completion(_issue(), tmp_path, cache=cache)
+    assert [r.details["cached"] for r in second] == [True, True, False]
+    assert runs() == ["other", "tests", "uncached", "uncached"]
+
+    # The agent's next attempt edits the test file only
+    (tmp_path / "tests" / "pkg" / "test_mod.py").write_text("v2\n")
+    third = verify_completion(_issue(), tmp_path, cache=cache)
+    assert [r.details["cached"] for r in third] == [False, True, False]
+    assert runs().count("tests") == 2 and runs().count("other") == 1
+    assert (cache.hits, cache.misses) == (3, 3)
+
+
+def test_failures_are_not_cached(tmp_path, checks):
+    checks["TEST"] = [
+        _command("tests_pass", "echo run >> runs.log; test -f conftest.py", reads=["{path}"]),
+    ]
+    cache = VerificationCache()
+
+    assert not verify_completion(_issue(), tmp_path, cache=cache)[0].passed
+    # The fix lands outside the command's reads
+    (tmp_path / "conftest.py").write_text("")
+    retry = verify_completion(_issue(), tmp_path, cache=cache)[0]
+
+    assert retry.passed and not retry.details["cached"]
+    assert verify_completion(_issue(), tmp_path, cache=cache)[0].details["cached"]
+    assert (tmp_path / "runs.log").read_text() == "run\nrun\n"
+
+
+def test_identical_commands_share_one_run(tmp_path, checks):
+    checks["TEST"] = [
+        _command("a", "sleep 0.2; echo run >> runs.log", reads=["{path}"]),
+        _command("b", "sleep 0.2; echo run >> runs.log", reads=["{path}"]),
+    ]
+    results = verify_completion(_issue("missing.py"), tmp_path, cache=VerificationCache())
+
+    assert sorted(r.details["cached"] for r in results) == [False, True]
+    assert (tmp_path / "runs.log").read_text() == "run\n"
@@ -9,6 +9,11 @@ Tools:
   - membrane_continue: Continue with an answer
   - membrane_abort: Abort a session
 
+Requests are handled concurrently: each JSON-RPC request runs as its own
+task, tool calls are limited per tool (TOOL_CONCURRENCY), responses are
+written as they complete (clients match them by id), and
+`notifications/cancelled` cancels an in-flight request.
+
 Usage:
   Run as MCP server (stdio):
     python tools/mcp/membrane_server.py
@@ -29,6 +34,9 @@ import asyncio
 import sys
 import json
 import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -39,8 +47,7 @@ sys.path.insert(0, str(project_root))
 from engine.connectome import ConnectomeRunner
 from ngram.agent_graph import AgentGraph, ISSUE_TO_POSTURE, POSTURE_TO_AGENT_ID
 from ngram.agent_spawn import spawn_work_agent, spawn_agent_for_issue
-from ngram.doctor import run_doctor
-from ngram.doctor_types import DoctorConfig
+from ngram.doctor_live import get_live_doctor
 
 logging.basicConfig(
     level=logging.INFO,
@@ -49,6 +56,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger("membrane")
 
+# Max concurrent calls per tool; unlisted tools get DEFAULT_TOOL_CONCURRENCY
+TOOL_CONCURRENCY = {
+    "agent_spawn": 2,   # each runs an agent subprocess for minutes
+    "doctor_check": 1,  # answered from one shared live doctor
+}
+DEFAULT_TOOL_CONCURRENCY = 8
+
+# Handler threads (graph connections come from the shared pool in graph_connections)
+MAX_WORKERS = 16
+
 # =============================================================================
 # MCP PROTOCOL IMPLEMENTATION
 # =============================================================================
@@ -61,7 +78,8 @@ class MembraneServer:
         self.connectomes_dir = connectomes_dir or (project_root / "protocols")
         self.target_dir = project_root
 
-        # Try to get graph connections if available
+        # Try to get graph connections if available; they share the process-wide
+        # pooled client, so every handler thread draws from one bounded pool
         try:
             from engine.physics.graph import GraphOps, GraphQueries
             self.graph_ops = GraphOps(graph_name="ngram")
@@ -74,13 +92,29 @@ class MembraneServer:
 
         # Initialize agent graph for work agent management
         try:
-            self.agent_graph = AgentGraph(graph_name="ngram")
+            self.agent_graph = AgentGraph(
+                graph_name="ngram",
+                graph_ops=self.graph_ops,
+                graph_queries=self.graph_queries,
+            )
             self.agent_graph.ensure_agents_exist()
             logger.info("Agent graph initialized")
         except Exception as e:
             logger.warning(f"No agent graph: {e}")
             self.agent_graph = AgentGraph(graph_name="ngram")  # Fallback mode
 
+        # Live doctor is started by the first doctor_check; diffs pile up between calls
+        self.live_doctor = None
+        self._doctor_diffs = deque(maxlen=100)
+
+        # Membrane sessions are not thread-safe; tool calls otherwise run concurrently
+        self._runner_lock = threading.Lock()
+
+        # Agents claimed by an agent_spawn call in this process; spawns run
+        # concurrently, so the availability check and the claim are one step
+        self._spawning: set = set()
+        self._spawn_lock = threading.Lock()
+
         self.runner = ConnectomeRunner(
             graph_ops=self.graph_ops,
             graph_queries=self.graph_queries,
@@ -184,7 +218,7 @@ class MembraneServer:
                 },
                 {
                     "name": "doctor_check",
-                    "description": "Run doctor health checks and return issues with assigned agents.",
+                    "description": "Current doctor health issues (kept fresh by a file-watching doctor) with assigned agents and changes since the last call.",
                     "inputSchema": {
                         "type": "object",
                         "properties": {
@@ -315,7 +349,8 @@ class MembraneServer:
         if not membrane_name:
             return {"content": [{"type": "text", "text": "Error: 'membrane' is required"}]}
 
-        response = self.runner.start(membrane_name, initial_context=context)
+        with self._runner_lock:
+            response = self.runner.start(membrane_name, initial_context=context)
         return self._format_response(response)
 
     def _tool_continue(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -326,7 +361,8 @@ class MembraneServer:
         if not session_id:
             return {"content": [{"type": "text", "text": "Error: 'session_id' is required"}]}
 
-        response = self.runner.continue_session(session_id, answer)
+        with self._runner_lock:
+            response = self.runner.continue_session(session_id, answer)
         return self._format_response(response)
 
     def _tool_abort(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -336,7 +372,8 @@ class MembraneServer:
         if not session_id:
             return {"content": [{"type": "text", "text": "Error: 'session_id' is required"}]}
 
-        response = self.runner.abort(session_id)
+        with self._runner_lock:
+            response = self.runner.abort(session_id)
         return self._format_response(response)
 
     def _tool_list(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -358,8 +395,13 @@ class MembraneServer:
         path_filter = args.get("path")
 
         try:
-            config = DoctorConfig()
-            result = run_doctor(self.target_dir, config)
+            if self.live_doctor is None:
+                self.live_doctor = get_live_doctor(self.target_dir)
+                self.live_doctor.subscribe(self._doctor_diffs.append)
+                self.live_doctor.result()
+                self._doctor_diffs.clear()  # the first evaluation is not a change
+            result = self.live_doctor.result() or {}
+            changes = self._drain_doctor_diffs()
             # Extract issues from all categories
             issues = []
             for category_issues in result.get("issues", {}).values():
@@ -375,12 +417,12 @@ class MembraneServer:
             issues = [i for i in issues if i.issue_type in allowed_types]
 
             if not issues:
-                return {"content": [{"type": "text", "text": "No issues found."}]}
+                return {"content": [{"type": "text", "text": changes + "No issues found."}]}
 
             # Get available agents
             available_agents = {a.id: a for a in self.agent_graph.get_available_agents()}
 
-            lines = [f"Found {len(issues)} issues:\n"]
+            lines = [changes + f"Found {len(issues)} issues:\n"]
             for idx, issue in enumerate(issues):
                 # Determine assigned agent
                 posture = ISSUE_TO_POSTURE.get(issue.issue_type, "fixer")
@@ -400,6 +442,27 @@ class MembraneServer:
             logger.exception("Doctor check failed")
             return {"content": [{"type": "text", "text": f"Error running doctor: {e}"}]}
 
+    def _drain_doctor_diffs(self) -> str:
+        """Net issue changes pushed by the live doctor since the last doctor_check."""
+        added: Dict[tuple, Any] = {}
+        removed: Dict[tuple, Any] = {}
+        while self._doctor_diffs:
+            diff = self._doctor_diffs.popleft()
+            for issue in diff.removed:
+                key = (issue.issue_type, issue.path, issue.message)
+                if added.pop(key, None) is None:
+                    removed[key] = issue
+            for issue in diff.added:
+                key = (issue.issue_type, issue.path, issue.message)
+                if removed.pop(key, None) is None:
+                    added[key] = issue
+        if not added and not removed:
+            return ""
+        lines = ["Since last check:"]
+        lines += [f"  + [{i.severity.upper()}] {i.issue_type} {i.path}" for i in added.values()]
+        lines += [f"  - resolved {i.issue_type} {i.path}" for i in removed.values()]
+        return "\n".join(lines) + "\n\n"
+
     def _tool_agent_list(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """List all agents and their status."""
         agents = self.agent_graph.get_all_agents()
@@ -576,8 +639,7 @@ class MembraneServer:
             agent_id = f"agent_{posture}"
 
         # Check if agent is available
-        agents = {a.id: a for a in self.agent_graph.get_all_agents()}
-        if agent_id in agents and agents[agent_id].status == "running":
+        if not self._claim_agent(agent_id):
             return {"content": [{"type": "text", "text": f"Error: {agent_id} is already running. Choose another agent or wait."}]}
 
         posture = agent_id.replace("agent_", "")
@@ -615,7 +677,8 @@ Please investigate and fix this issue. Follow the project's coding standards and
 
         # Actually spawn and run the agent
         try:
-            spawn_result = asyncio.get_event_loop().run_until_complete(
+            # Runs on a dispatcher worker thread, which has no event loop of its own
+            spawn_result = asyncio.run(
                 spawn_work_agent(
                     agent_id=agent_id,
                     prompt=prompt,
@@ -672,6 +735,23 @@ Please investigate and fix this issue. Follow the project's coding standards and
         except Exception as e:
             logger.exception("Agent spawn failed")
             return {"content": [{"type": "text", "text": f"Error executing agent: {e}"}]}
+        finally:
+            self._release_agent(agent_id)
+
+    def _claim_agent(self, agent_id: str) -> bool:
+        """Claim `agent_id` for one spawn; False if it is already running here or per the graph."""
+        with self._spawn_lock:
+            if agent_id in self._spawning:
+                return False
+            agents = {a.id: a for a in self.agent_graph.get_all_agents()}
+            if agent_id in agents and agents[agent_id].status == "running":
+                return False
+            self._spawning.add(agent_id)
+            return True
+
+    def _release_agent(self, agent_id: str) -> None:
+        with self._spawn_lock:
+            self._spawning.discard(agent_id)
 
     def _tool_agent_status(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Get or set agent status."""
@@ -778,31 +858,111 @@ Please investigate and fix this issue. Follow the project's coding standards and
         }
 
 
-def main():
-    """Run the MCP server on stdio."""
-    server = MembraneServer()
-    logger.info("Membrane MCP server started")
-
-    # Read JSON-RPC messages from stdin
-    for line in sys.stdin:
+class RequestDispatcher:
+    """
+    Serves JSON-RPC lines from stdin concurrently.
+
+    Each request becomes an asyncio task that runs `server.handle_request`
+    on a worker thread, gated by a per-tool semaphore for tools/call.
+    Responses are written as they complete; the id matches them to
+    requests. Notifications get no response. `notifications/cancelled`
+    cancels the named request: its response is dropped (a handler already
+    running on a thread finishes in the background).
+    """
+
+    def __init__(
+        self,
+        server: Any,
+        max_workers: int = MAX_WORKERS,
+        limits: Optional[Dict[str, int]] = None,
+    ):
+        self.server = server
+        self.limits = TOOL_CONCURRENCY if limits is None else limits
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp")
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[Any, asyncio.Task] = {}
+        self._stdout = sys.stdout
+
+    def _semaphore(self, request: Dict[str, Any]) -> Optional[asyncio.Semaphore]:
+        if request.get("method") != "tools/call":
+            return None
+        name = (request.get("params") or {}).get("name", "")
+        if name not in self._semaphores:
+            self._semaphores[name] = asyncio.Semaphore(self.limits.get(name, DEFAULT_TOOL_CONCURRENCY))
+        return self._semaphores[name]
+
+    def _write(self, response: Dict[str, Any]) -> None:
+        # Only the event loop thread writes, so lines never interleave
+        self._stdout.write(json.dumps(response) + "\n")
+        self._stdout.flush()
+
+    async def _handle(self, request: Dict[str, Any]) -> None:
+        request_id = request.get("id")
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore(request)
+        try:
+            if semaphore is None:
+                response = await loop.run_in_executor(self.executor, self.server.handle_request, request)
+            else:
+                async with semaphore:
+                    response = await loop.run_in_executor(self.executor, self.server.handle_request, request)
+        except asyncio.CancelledError:
+            logger.info(f"Request {request_id} cancelled")
+            return
+        self._write(response)
+
+    def dispatch(self, line: str) -> Optional[asyncio.Task]:
+        """Start handling one input line; returns its task, if any."""
         line = line.strip()
         if not line:
-            continue
-
+            return None
         try:
             request = json.loads(line)
-            response = server.handle_request(request)
-            print(json.dumps(response), flush=True)
         except json.JSONDecodeError as e:
-            error_response = {
+            self._write({
                 "jsonrpc": "2.0",
                 "id": None,
                 "error": {
                     "code": -32700,
                     "message": f"Parse error: {e}"
                 }
-            }
-            print(json.dumps(error_response), flush=True)
+            })
+            return None
+
+        if "id" not in request:
+            if request.get("method") == "notifications/cancelled":
+                task = self._in_flight.get((request.get("params") or {}).get("requestId"))
+                if task is not None:
+                    task.cancel()
+            return None
+
+        request_id = request["id"]
+        task = asyncio.get_running_loop().create_task(self._handle(request))
+        self._in_flight[request_id] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(request_id, None))
+        return task
+
+    async def serve(self, stdin=None, stdout=None) -> None:
+        """Dispatch lines until EOF, then wait for in-flight requests."""
+        stdin = stdin or sys.stdin
+        self._stdout = stdout or sys.stdout
+        loop = asyncio.get_running_loop()
+        # Blocking stdin reads stay off both the loop and the handler pool
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcp-stdin") as reader:
+            while True:
+                line = await loop.run_in_executor(reader, stdin.readline)
+                if not line:
+                    break
+                self.dispatch(line)
+        await asyncio.gather(*list(self._in_flight.values()), return_exceptions=True)
+        self.executor.shutdown(wait=False)
+
+
+def main():
+    """Run the MCP server on stdio."""
+    server = MembraneServer()
+    logger.info("Membrane MCP server started")
+    asyncio.run(RequestDispatcher(server).serve())
 
 
 if __name__ == "__main__":